@@ -0,0 +1,31 @@
+"""Build step: fingerprint and precompress everything under static/.
+
+Writes static/manifest.json (asset path → content-hashed name) and .gz /
+.br siblings for text assets.  Run once per image build — the app serves
+fingerprinted URLs with immutable cache headers when the manifest exists.
+
+Usage:
+    python scripts/build_static.py [STATIC_DIR]
+
+Brotli variants require the optional ``brotli`` package
+(``pip install '.[static]'``); gzip variants are always written.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from pinwheel.api.static_assets import build_static_assets
+from pinwheel.config import PROJECT_ROOT
+
+
+def main() -> None:
+    static_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else PROJECT_ROOT / "static"
+    manifest = build_static_assets(static_dir)
+    for original, fingerprinted in sorted(manifest.items()):
+        print(f"{original} -> {fingerprinted}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Compact the logs of seasons archived before log compaction existed.
+
+``archive_season`` now moves a season's governance events, reports and AI
+usage rows into compressed ``season_log_archives`` rows. Seasons archived
+earlier still have their rows in the hot tables; this script compacts
+every season that has a ``season_archives`` row.
+
+Safe to run multiple times (idempotent): already-compacted seasons only
+have rows written since their last compaction folded in.
+
+Usage:
+    # Dry run (default — shows hot row counts, changes nothing):
+    python scripts/compact_season_logs.py
+
+    # Apply changes:
+    python scripts/compact_season_logs.py --apply
+
+    # On Fly.io production:
+    flyctl ssh console -C "python scripts/compact_season_logs.py --apply"
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+
+from sqlalchemy import func, select
+
+from pinwheel.db.engine import create_engine, get_session
+from pinwheel.db.log_archive import ARCHIVED_LOGS
+from pinwheel.db.repository import Repository
+
+
+async def compact_season_logs(apply: bool = False) -> None:
+    db_url = os.environ.get("DATABASE_URL")
+    if not db_url:
+        print("ERROR: DATABASE_URL not set.")
+        sys.exit(1)
+
+    engine = create_engine(db_url)
+
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        archives = await repo.get_all_archives()
+        print(f"Archived seasons: {len(archives)}")
+
+        total = 0
+        for archive in archives:
+            counts: dict[str, int] = {}
+            for log_type, model in ARCHIVED_LOGS.items():
+                column = model.season_id  # type: ignore[attr-defined]
+                stmt = select(func.count()).select_from(model).where(column == archive.season_id)
+                counts[log_type] = (await session.execute(stmt)).scalar_one()
+            rows = sum(counts.values())
+            if rows == 0:
+                continue
+
+            action = "COMPACTING" if apply else "WOULD COMPACT"
+            detail = ", ".join(f"{k}={v}" for k, v in counts.items())
+            print(f"  {action} {archive.season_name} ({archive.season_id}): {detail}")
+            if apply:
+                await repo.compact_season_logs(archive.season_id)
+            total += rows
+
+        if apply and total > 0:
+            await session.commit()
+
+        print()
+        print(f"{'Compacted' if apply else 'Would compact'}: {total} rows")
+
+        if not apply and total > 0:
+            print("\nRun with --apply to move these rows into season log archives.")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    apply = "--apply" in sys.argv
+    asyncio.run(compact_season_logs(apply=apply))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""Load-test the round AI phase against the local stub LLM server.
+
+Seeds a throwaway league, starts ``pinwheel.ai.stub_server`` in-process (or
+uses ``--base-url``), points the shared AI client pool at it and drives
+``step_round`` for N rounds with a non-empty API key, so every AI call goes
+through the real HTTP client, SDK retries, concurrency pool, job scheduler
+and usage accounting.  Prints p50/p95/max for each round phase and the
+stub's request/fault counters.
+
+Usage:
+    python scripts/load_test_ai_phase.py --rounds 10 --teams 8 --governors 12
+    python scripts/load_test_ai_phase.py --latency-p50-ms 2000 --latency-p95-ms 9000 \\
+        --overload-rate 0.1 --max-concurrency 4
+    python scripts/load_test_ai_phase.py --base-url http://127.0.0.1:8765  # external stub
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import math
+import statistics
+import sys
+import tempfile
+from contextlib import AsyncExitStack
+from pathlib import Path
+
+from pinwheel.ai.client import ai_clients
+from pinwheel.ai.jobs import ai_jobs
+from pinwheel.ai.stub_server import add_stub_arguments, serve_stub, stub_config_from_args
+from pinwheel.core.game_loop import step_round
+from pinwheel.core.scheduler import generate_round_robin
+from pinwheel.db.engine import create_engine, get_session
+from pinwheel.db.models import Base
+from pinwheel.db.repository import Repository
+
+PHASES = ("simulate_and_govern", "ai_generation", "persist_and_finalize", "total")
+ARCHETYPES = ("sharpshooter", "playmaker", "enforcer", "wildcard")
+
+
+def _attributes(team: int, slot: int) -> dict[str, int]:
+    base = 35 + (team * 7 + slot * 11) % 25
+    return {
+        "scoring": base + 10,
+        "passing": base,
+        "defense": base - 5,
+        "speed": base + 5,
+        "stamina": base,
+        "iq": base + 5,
+        "ego": 30,
+        "chaotic_alignment": 30,
+        "fate": 30,
+    }
+
+
+async def seed_league(engine: object, teams: int, governors: int, rounds: int) -> str:
+    """Create a season with *teams* teams, enough schedule for *rounds*, and governors.
+
+    Governors are made "active" with one ``vote.cast`` event each, so every
+    round also generates their private reports.
+    """
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        league = await repo.create_league("Load Test League")
+        season = await repo.create_season(league.id, "Load Test Season")
+        team_ids: list[str] = []
+        for t in range(teams):
+            team = await repo.create_team(
+                season.id, f"Load Team {t + 1}", venue={"name": f"Arena {t + 1}", "capacity": 5000}
+            )
+            team_ids.append(team.id)
+            for slot in range(3):
+                await repo.create_hooper(
+                    team_id=team.id,
+                    season_id=season.id,
+                    name=f"Hooper {t + 1}-{slot + 1}",
+                    archetype=ARCHETYPES[(t + slot) % len(ARCHETYPES)],
+                    attributes=_attributes(t, slot),
+                )
+        cycles = math.ceil(rounds / max(teams - 1, 1)) + 1
+        for m in generate_round_robin(team_ids, num_rounds=cycles):
+            await repo.create_schedule_entry(
+                season_id=season.id,
+                round_number=m.round_number,
+                matchup_index=m.matchup_index,
+                home_team_id=m.home_team_id,
+                away_team_id=m.away_team_id,
+            )
+        for g in range(governors):
+            await repo.append_event(
+                event_type="vote.cast",
+                aggregate_id=f"load-vote-{g}",
+                aggregate_type="vote",
+                season_id=season.id,
+                payload={"vote": "yes", "weight": 1.0},
+                governor_id=f"load-gov-{g}",
+                team_id=team_ids[g % teams],
+            )
+    return season.id
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (no interpolation — fine for a handful of rounds)."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def format_report(timings: list[dict[str, float]]) -> str:
+    lines = [f"{'phase':<22} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10} {'mean ms':>10}"]
+    for phase in PHASES:
+        values = [t[phase] for t in timings if phase in t]
+        if not values:
+            continue
+        lines.append(
+            f"{phase:<22} {percentile(values, 50):>10.1f} {percentile(values, 95):>10.1f} "
+            f"{max(values):>10.1f} {statistics.fmean(values):>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+async def run(args: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite+aiosqlite:///{Path(tmp) / 'load_test.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        season_id = await seed_league(engine, args.teams, args.governors, args.rounds)
+
+        async with AsyncExitStack() as stack:
+            stub = None
+            base_url = args.base_url
+            if not base_url:
+                base_url, stub = await stack.enter_async_context(
+                    serve_stub(stub_config_from_args(args))
+                )
+            ai_clients.configure(max_concurrency=args.max_concurrency, base_url=base_url)
+            ai_jobs.configure(
+                initial_window=min(args.initial_window, args.max_concurrency),
+                max_window=args.max_concurrency,
+            )
+            print(f"Stub LLM at {base_url}; {args.teams} teams, {args.governors} governors")
+
+            timings: list[dict[str, float]] = []
+            try:
+                for round_number in range(1, args.rounds + 1):
+                    async with get_session(engine) as session:
+                        result = await step_round(
+                            Repository(session), season_id, round_number, api_key="stub-key"
+                        )
+                    if not result.games:
+                        print(f"Round {round_number}: no games scheduled, stopping")
+                        break
+                    timings.append(result.phase_timings_ms)
+                    print(
+                        f"Round {round_number}: {len(result.games)} games, "
+                        f"{len(result.reports)} reports, "
+                        f"ai={result.phase_timings_ms['ai_generation']:.0f}ms"
+                    )
+            finally:
+                await ai_clients.aclose()
+        await engine.dispose()
+
+    if not timings:
+        print("No rounds ran.")
+        return 1
+    print()
+    print(format_report(timings))
+    if stub is not None:
+        s = stub.stats
+        print()
+        print(
+            f"stub requests={s.requests} streamed={s.streamed} "
+            f"rate_limited={s.rate_limited} overloaded={s.overloaded} "
+            f"output_tokens={s.output_tokens}"
+        )
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--teams", type=int, default=8)
+    parser.add_argument("--governors", type=int, default=8)
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument("--initial-window", type=int, default=4)
+    parser.add_argument("--base-url", default="", help="Use an already running stub server")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show pinwheel INFO logs")
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -16,24 +16,15 @@ import json
 import logging
 from typing import Literal
 
-import anthropic
-import httpx
 from pydantic import BaseModel, ConfigDict, Field
 
-# Module-level client cache for connection reuse
-_client_cache: dict[str, anthropic.AsyncAnthropic] = {}
+from pinwheel.ai.client import PooledAIClient, get_ai_client
+from pinwheel.ai.response_cache import cached_create
 
-_CLASSIFIER_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
 
-
-def _get_client(api_key: str) -> anthropic.AsyncAnthropic:
-    """Return a cached AsyncAnthropic client for connection reuse."""
-    if api_key not in _client_cache:
-        _client_cache[api_key] = anthropic.AsyncAnthropic(
-            api_key=api_key,
-            timeout=_CLASSIFIER_TIMEOUT,
-        )
-    return _client_cache[api_key]
+def _get_client(api_key: str) -> PooledAIClient:
+    """Return the shared-pool client for classifier calls."""
+    return get_ai_client(api_key, "classifier")
 
 logger = logging.getLogger(__name__)
 
@@ -86,13 +77,15 @@ async def classify_injection(
     season_id: str = "",
     round_number: int | None = None,
     db_session: object | None = None,
+    bypass_cache: bool = False,
 ) -> ClassificationResult:
     """Classify proposal text as legitimate, suspicious, or injection.
 
     Uses Claude Haiku for fast, cheap classification (~100ms, ~$0.001).
     Returns ClassificationResult. On any error, defaults to legitimate
     with a note (fail-open -- the downstream interpreter has its own
-    injection detection).
+    injection detection). Identical texts are served from the response
+    cache unless ``bypass_cache``.
     """
     from pinwheel.ai.usage import (
         cacheable_system,
@@ -105,7 +98,11 @@ async def classify_injection(
     try:
         client = _get_client(api_key)
         async with track_latency() as timing:
-            response = await client.messages.create(
+            response = await cached_create(
+                client,
+                "classifier",
+                bypass=bypass_cache,
+                validate=json.loads,
                 model=CLASSIFIER_MODEL,
                 max_tokens=200,
                 system=cacheable_system(CLASSIFIER_PROMPT),
@@ -0,0 +1,260 @@
+"""Shared Anthropic client manager — one pooled HTTP client for every AI call.
+
+Most AI call sites used to build a fresh ``anthropic.AsyncAnthropic`` per
+call, paying a new TCP + TLS handshake on each of the ~15 calls a round
+makes.  The manager owns a single HTTP client (keep-alive, HTTP/2 when the
+optional ``h2`` package is installed) and hands out SDK clients that share
+it.
+
+* **Per-call-type profiles** — timeout and SDK retry budget per call type
+  (``CALL_PROFILES``).  The interpreter and codegen council keep
+  ``max_retries=0`` because they run their own app-level retry loops.
+* **Global concurrency limit** — every ``messages.create`` from every call
+  type takes a slot from one semaphore, so a burst of commentary calls
+  cannot starve the interpreter and we stay under the API's concurrency
+  limits.  SDK retries happen inside the slot.
+* **Overload feedback** — a 429 / 529 that escapes the SDK's retries is
+  reported to the round job scheduler (``pinwheel.ai.jobs``).
+* **Streaming** — ``messages.stream`` holds its slot for the life of the
+  stream, like ``create``.
+* **Base URL** — ``configure(base_url=...)`` points every client at another
+  Anthropic-compatible endpoint, e.g. the local stub server
+  (``pinwheel.ai.stub_server``) used for load tests.
+
+Usage:
+    client = get_ai_client(api_key, "report")
+    response = await client.messages.create(...)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import anthropic
+
+from pinwheel.ai.jobs import is_overload, note_overload
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+KEEPALIVE_EXPIRY_SECONDS = 60.0  # SDK default is 5s — shorter than the gap between round phases
+
+
+@dataclass(frozen=True)
+class CallProfile:
+    """Timeout and SDK retry budget for one kind of AI call."""
+
+    timeout: anthropic.Timeout
+    max_retries: int = 2
+
+
+_FAST = anthropic.Timeout(10.0, connect=3.0)
+_STANDARD = anthropic.Timeout(60.0, connect=5.0)
+_LONG_FORM = anthropic.Timeout(120.0, connect=5.0)
+
+CALL_PROFILES: dict[str, CallProfile] = {
+    # Proposal interpretation — app-level retry loop, so no SDK retries.
+    "interpreter": CallProfile(_STANDARD, max_retries=0),
+    "classifier": CallProfile(_FAST),
+    "council": CallProfile(_STANDARD, max_retries=0),
+    "report": CallProfile(_LONG_FORM),
+    "commentary": CallProfile(_LONG_FORM),
+    "search": CallProfile(_STANDARD),
+    "series_banner": CallProfile(_FAST),
+    "eval": CallProfile(_LONG_FORM),
+}
+_DEFAULT_PROFILE = CallProfile(_STANDARD)
+
+
+class _LimitedMessages:
+    """``client.messages`` proxy whose ``create`` and ``stream`` hold a global slot."""
+
+    def __init__(self, messages: Any, manager: AIClientManager) -> None:
+        self._messages = messages
+        self._manager = manager
+
+    async def create(self, *args: Any, **kwargs: Any) -> Any:
+        async with self._manager.slot():
+            try:
+                return await self._messages.create(*args, **kwargs)
+            except Exception as exc:
+                # Feeds the round job scheduler's AIMD window (see ai/jobs.py).
+                if is_overload(exc):
+                    note_overload()
+                raise
+
+    @asynccontextmanager
+    async def stream(self, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+        """``messages.stream`` holding the slot until the stream is closed."""
+        async with self._manager.slot():
+            try:
+                async with self._messages.stream(*args, **kwargs) as stream:
+                    yield stream
+            except Exception as exc:
+                if is_overload(exc):
+                    note_overload()
+                raise
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._messages, name)
+
+
+class PooledAIClient:
+    """An ``AsyncAnthropic`` on the shared pool, with concurrency-limited ``messages``."""
+
+    def __init__(self, client: anthropic.AsyncAnthropic, manager: AIClientManager) -> None:
+        self.raw = client
+        self.messages = _LimitedMessages(client.messages, manager)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.raw, name)
+
+
+async def _close_quietly(http: Any) -> None:
+    """``aclose()`` a replaced HTTP client; its connections may outlive their loop."""
+    try:
+        await http.aclose()
+    except (RuntimeError, OSError):
+        logger.debug("ai_client_pool_close_failed", exc_info=True)
+
+
+def _http_library() -> Any:
+    """The HTTP package the installed SDK is built on (``httpx`` or a successor)."""
+    http_client_base = anthropic.DefaultAsyncHttpxClient.__mro__[1]
+    return sys.modules[http_client_base.__module__.partition(".")[0]]
+
+
+class AIClientManager:
+    """Owns the pooled HTTP client and caches SDK clients per (key, call type)."""
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> None:
+        self.max_concurrency = max_concurrency
+        self.base_url = ""
+        self.in_flight = 0
+        self._http: Any = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._clients: dict[tuple, PooledAIClient] = {}
+        self._closing: set[asyncio.Task[None]] = set()
+
+    def configure(self, max_concurrency: int, base_url: str = "") -> None:
+        """Apply settings; takes effect for the next pool that is built.
+
+        An empty *base_url* keeps the SDK default (``ANTHROPIC_BASE_URL`` or
+        the public API).
+        """
+        if max_concurrency != self.max_concurrency or base_url != self.base_url:
+            self.max_concurrency = max_concurrency
+            self.base_url = base_url
+            self._reset()
+
+    def _detach(self) -> tuple[Any, asyncio.AbstractEventLoop | None]:
+        """Forget the current pool; return its HTTP client and owning loop."""
+        http, loop = self._http, self._loop
+        self._http = None
+        self._semaphore = None
+        self._loop = None
+        self._clients.clear()
+        return http, loop
+
+    def _reset(self) -> None:
+        http, loop = self._detach()
+        if http is not None:
+            self._close_replaced(http, loop)
+
+    def _close_replaced(self, http: Any, loop: asyncio.AbstractEventLoop | None) -> None:
+        """Close a replaced pool's HTTP client so its sockets are not leaked.
+
+        The close runs on the pool's own loop while that loop is running
+        elsewhere, otherwise on the current loop, otherwise synchronously.
+        """
+        try:
+            running: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if loop is not None and loop is not running and loop.is_running():
+            asyncio.run_coroutine_threadsafe(_close_quietly(http), loop)
+        elif running is not None:
+            task = running.create_task(_close_quietly(http))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        else:
+            owner = loop if loop is not None and not loop.is_closed() else None
+            if owner is not None:
+                owner.run_until_complete(_close_quietly(http))
+            else:
+                asyncio.run(_close_quietly(http))
+
+    def _ensure_pool(self) -> asyncio.Semaphore:
+        # Pooled connections and the semaphore belong to the loop that
+        # created them; a new loop (tests, a restarted worker) gets fresh ones.
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if self._http is not None and self._semaphore is not None and self._loop is loop:
+            return self._semaphore
+        self._reset()
+        http2 = importlib.util.find_spec("h2") is not None
+        limits = _http_library().Limits(
+            max_connections=self.max_concurrency * 2,
+            max_keepalive_connections=self.max_concurrency,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        )
+        self._http = anthropic.DefaultAsyncHttpxClient(limits=limits, http2=http2)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._loop = loop
+        logger.info(
+            "ai_client_pool_created http2=%s max_concurrency=%d", http2, self.max_concurrency
+        )
+        return self._semaphore
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one global concurrency slot for the duration of the block."""
+        async with self._ensure_pool():
+            self.in_flight += 1
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+
+    def client(self, api_key: str, call_type: str) -> PooledAIClient:
+        """Return the shared-pool SDK client for *api_key* and *call_type*."""
+        self._ensure_pool()
+        profile = CALL_PROFILES.get(call_type, _DEFAULT_PROFILE)
+        # Keyed on the SDK class as well so a patched class in tests is honoured.
+        key = (anthropic.AsyncAnthropic, api_key, call_type)
+        if key not in self._clients:
+            sdk_client = anthropic.AsyncAnthropic(
+                api_key=api_key,
+                base_url=self.base_url or None,
+                http_client=self._http,
+                timeout=profile.timeout,
+                max_retries=profile.max_retries,
+            )
+            self._clients[key] = PooledAIClient(sdk_client, self)
+        return self._clients[key]
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client (app shutdown)."""
+        http, _loop = self._detach()
+        if http is not None:
+            await http.aclose()
+        if self._closing:
+            await asyncio.gather(*self._closing)
+
+
+ai_clients = AIClientManager()
+
+
+def get_ai_client(api_key: str, call_type: str) -> PooledAIClient:
+    """Shared-pool Anthropic client for one kind of AI call."""
+    return ai_clients.client(api_key, call_type)
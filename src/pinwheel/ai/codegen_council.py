@@ -15,8 +15,9 @@ import logging
 from datetime import UTC, datetime
 
 import anthropic
-import httpx
 
+from pinwheel.ai.client import PooledAIClient, get_ai_client
+from pinwheel.ai.response_cache import cached_create
 from pinwheel.core.codegen import CodegenASTValidator, compute_code_hash
 from pinwheel.models.codegen import (
     CodegenEffectSpec,
@@ -27,21 +28,10 @@ from pinwheel.models.codegen import (
 
 logger = logging.getLogger(__name__)
 
-_COUNCIL_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
 
-# Module-level client cache (shared with interpreter.py pattern)
-_council_client_cache: dict[str, anthropic.AsyncAnthropic] = {}
-
-
-def _get_council_client(api_key: str) -> anthropic.AsyncAnthropic:
-    """Return a cached AsyncAnthropic client for council calls."""
-    if api_key not in _council_client_cache:
-        _council_client_cache[api_key] = anthropic.AsyncAnthropic(
-            api_key=api_key,
-            timeout=_COUNCIL_TIMEOUT,
-            max_retries=0,
-        )
-    return _council_client_cache[api_key]
+def _get_council_client(api_key: str) -> PooledAIClient:
+    """Return the shared-pool client for council calls (no SDK retries)."""
+    return get_ai_client(api_key, "council")
 
 
 # ---------------------------------------------------------------------------
@@ -247,17 +237,34 @@ async def generate_codegen_effect(
 # ---------------------------------------------------------------------------
 # Reviewers
 # ---------------------------------------------------------------------------
+#
+# Reviews of the same code are deterministic enough to cache: /rerun-council
+# re-reviews stored code, so identical requests come from the response cache
+# unless ``bypass_cache`` is set.
+
+
+def _validate_review_json(text: str) -> None:
+    """Response-cache validator: only replies that parse as JSON are stored."""
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1].rsplit("```", 1)[0].strip()
+    json.loads(text)
 
 
 async def review_security(
     code: str,
     api_key: str,
     model: str = "claude-opus-4-6",
+    bypass_cache: bool = False,
 ) -> ReviewVerdict:
     """Run security review on generated code."""
     client = _get_council_client(api_key)
 
-    response = await client.messages.create(
+    response = await cached_create(
+        client,
+        "council.security",
+        bypass=bypass_cache,
+        validate=_validate_review_json,
         model=model,
         max_tokens=2048,
         system=CODEGEN_SECURITY_REVIEW_SYSTEM,
@@ -284,6 +291,7 @@ async def review_gameplay(
     proposal_text: str,
     api_key: str,
     model: str = "claude-opus-4-6",
+    bypass_cache: bool = False,
 ) -> ReviewVerdict:
     """Run gameplay review on generated code."""
     client = _get_council_client(api_key)
@@ -293,7 +301,11 @@ async def review_gameplay(
         f"Generated code:\n```python\n{code}\n```"
     )
 
-    response = await client.messages.create(
+    response = await cached_create(
+        client,
+        "council.gameplay",
+        bypass=bypass_cache,
+        validate=_validate_review_json,
         model=model,
         max_tokens=2048,
         system=CODEGEN_GAMEPLAY_REVIEW_SYSTEM,
@@ -327,6 +339,7 @@ async def review_adversarial(
     security_result: ReviewVerdict,
     api_key: str,
     model: str = "claude-opus-4-6",
+    bypass_cache: bool = False,
 ) -> ReviewVerdict:
     """Run adversarial (red team) review on generated code."""
     client = _get_council_client(api_key)
@@ -339,7 +352,11 @@ async def review_adversarial(
         f"Security concerns: {security_result.rationale}"
     )
 
-    response = await client.messages.create(
+    response = await cached_create(
+        client,
+        "council.adversarial",
+        bypass=bypass_cache,
+        validate=_validate_review_json,
         model=model,
         max_tokens=2048,
         system=CODEGEN_ADVERSARIAL_REVIEW_SYSTEM,
@@ -379,6 +396,7 @@ async def review_existing_code(
     api_key: str,
     proposal_id: str = "",
     model: str = "claude-opus-4-6",
+    bypass_cache: bool = False,
 ) -> CouncilReview:
     """AST-validate and council-review EXISTING code — no generation.
 
@@ -407,15 +425,17 @@ async def review_existing_code(
         )
 
     # Security + Gameplay reviews in parallel
-    security_task = review_security(code, api_key, model)
-    gameplay_task = review_gameplay(code, proposal_text, api_key, model)
+    security_task = review_security(code, api_key, model, bypass_cache=bypass_cache)
+    gameplay_task = review_gameplay(
+        code, proposal_text, api_key, model, bypass_cache=bypass_cache,
+    )
     security_verdict, gameplay_verdict = await asyncio.gather(
         security_task, gameplay_task,
     )
 
     # Adversarial review (gets security results as context)
     adversarial_verdict = await review_adversarial(
-        code, proposal_text, security_verdict, api_key, model,
+        code, proposal_text, security_verdict, api_key, model, bypass_cache=bypass_cache,
     )
 
     # Aggregate — all three must approve
@@ -440,6 +460,7 @@ async def run_council_review(
     proposal_text: str,
     api_key: str,
     model: str = "claude-opus-4-6",
+    bypass_cache: bool = False,
 ) -> tuple[CodegenEffectSpec | None, CouncilReview]:
     """Full council pipeline: generate → validate → review → verdict.
 
@@ -480,7 +501,7 @@ async def run_council_review(
     # Steps 2-5: validate and review the generated code
     review = await review_existing_code(
         code, proposal_text, api_key,
-        proposal_id=proposal_id, model=model,
+        proposal_id=proposal_id, model=model, bypass_cache=bypass_cache,
     )
 
     if not review.consensus:
@@ -11,11 +11,21 @@ Two modes:
 from __future__ import annotations
 
 import logging
+import re
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 import anthropic
 
+from pinwheel.ai.client import get_ai_client
+from pinwheel.ai.prompt_prefix import build_layered_prompt
+from pinwheel.ai.token_budget import REQUIRED, Section, fit_sections
 from pinwheel.core.drama import annotate_drama
-from pinwheel.core.narrative import NarrativeContext, format_narrative_for_prompt
+from pinwheel.core.narrative import (
+    NarrativeContext,
+    format_narrative_for_prompt,
+    format_narrative_layers,
+)
 from pinwheel.models.game import GameResult
 from pinwheel.models.rules import RuleSet
 from pinwheel.models.team import Team
@@ -127,6 +137,49 @@ def trim_to_last_sentence(text: str) -> str:
     return stripped[: last_end + 1]
 
 
+# A sentence is complete once its terminal punctuation (plus any closing
+# quote or bracket) is followed by whitespace.
+_SENTENCE_END_RE = re.compile(r"[.!?][\"')\]\u201d]*(?=\s)")
+
+
+def completed_sentences(text: str) -> str:
+    """The prefix of *text* up to its last finished sentence ("" if none)."""
+    last_end = 0
+    for match in _SENTENCE_END_RE.finditer(text):
+        last_end = match.end()
+    return text[:last_end]
+
+
+async def _stream_commentary(
+    client: Any,
+    request: dict[str, Any],
+    on_partial: Callable[[str], Awaitable[None]],
+) -> Any:
+    """Stream a commentary response, reporting text as sentences complete.
+
+    ``on_partial`` receives the commentary so far, cut at the last finished
+    sentence, each time a new sentence finishes. A failing callback stops
+    the partial updates but never the generation. Returns the final message.
+    """
+    text = ""
+    published = 0
+    notify = True
+    async with client.messages.stream(**request) as stream:
+        async for delta in stream.text_stream:
+            text += delta
+            if not notify:
+                continue
+            complete = completed_sentences(text)
+            if len(complete) > published:
+                published = len(complete)
+                try:
+                    await on_partial(complete)
+                except Exception:  # Last-resort handler — arbitrary callback, unknown errors
+                    logger.exception("commentary_partial_callback_failed")
+                    notify = False
+        return await stream.get_final_message()
+
+
 _SCORING_PARAMS = {"three_point_value", "two_point_value", "free_throw_value"}
 
 
@@ -376,13 +429,26 @@ def _build_game_context(
     ruleset: RuleSet,
     playoff_context: str | None = None,
     narrative: NarrativeContext | None = None,
+    round_narrative_only: bool = False,
 ) -> str:
     """Build a concise context string for the AI from game data.
 
     When a NarrativeContext is provided, includes standings, streaks,
     head-to-head history, rule changes, and other dramatic context.
+    ``round_narrative_only`` leaves out the league facts and season-stable
+    context, for callers that put those in a cached system prefix.
+
+    The result is fitted to the ``commentary`` token budget: low-priority
+    sections (event chains, rosters, dramatic context) are dropped first
+    when a late-season game's context grows too large.
     """
-    lines = []
+    sections: list[Section] = []
+    lines: list[str] = []
+
+    def close_section(name: str, priority: int = REQUIRED) -> None:
+        if lines:
+            sections.append(Section(name, "\n".join(lines), priority))
+            lines.clear()
 
     if playoff_context:
         label = "SEMIFINAL" if playoff_context == "semifinal" else "CHAMPIONSHIP FINALS"
@@ -399,6 +465,7 @@ def _build_game_context(
 
     if ruleset.three_point_value != 3:
         lines.append(f"Three-pointers worth {ruleset.three_point_value} (rule change!)")
+    close_section("header")
 
     # Quarter-by-quarter flow — lets the AI narrate runs and comebacks
     if game_result.quarter_scores:
@@ -409,6 +476,7 @@ def _build_game_context(
                 label = "Elam period"
             qs_parts.append(f"{label} {qs.home_score}-{qs.away_score}")
         lines.append(f"Quarter scores ({home_team.name}-{away_team.name}): " + " | ".join(qs_parts))
+    close_section("quarter_scores", 2)
 
     # Game flow — lead changes and largest lead, from running scores
     lead_changes = 0
@@ -430,18 +498,21 @@ def _build_game_context(
             f"Game flow: {lead_changes} lead change{'s' if lead_changes != 1 else ''}, "
             f"largest lead {largest_lead} ({largest_lead_team or 'never separated'})"
         )
+    close_section("game_flow", 2)
 
     # Team strategies — the governors' declared direction for each side
     if game_result.home_strategy_summary:
         lines.append(f"{home_team.name} strategy: {game_result.home_strategy_summary}")
     if game_result.away_strategy_summary:
         lines.append(f"{away_team.name} strategy: {game_result.away_strategy_summary}")
+    close_section("strategies", 3)
 
     # Rosters — archetypes give the AI character to work with
     for team in (home_team, away_team):
         roster = ", ".join(f"{h.name} ({h.archetype})" for h in team.hoopers if h.is_starter)
         if roster:
             lines.append(f"{team.name}: {roster}")
+    close_section("rosters", 3)
 
     # Box scores — top performers
     lines.append("\nBox scores:")
@@ -453,6 +524,7 @@ def _build_game_context(
             f"  {bs.hooper_name} ({team_name}): "
             f"{bs.points}pts {bs.rebounds}reb {bs.assists}ast {bs.steals}stl {bs.turnovers}to"
         )
+    close_section("box_scores", 1)
 
     # Key moments sampled across the WHOLE game. The ending is guaranteed:
     # the last 4 notable plays (the finish, including any Elam possessions)
@@ -478,6 +550,7 @@ def _build_game_context(
                 f"  Q{p.quarter} #{p.possession_number}: {handler} {p.action} -> {p.result}"
                 f" ({p.points_scored}pts, score {p.home_score}-{p.away_score}){move_tag}"
             )
+    close_section("key_plays", 2)
 
     # Highlight chains (Phase 4): the micro engine records every possession
     # as an event chain. Commentary sees ONLY the summary rows above plus a
@@ -487,6 +560,7 @@ def _build_game_context(
     if highlight_lines:
         lines.append("\nHighlight possessions (event chains, drama-selected):")
         lines.extend(highlight_lines)
+    close_section("highlight_chains", 4)
 
     # The game-deciding play — the last score is the finish line
     last_score = next(
@@ -499,6 +573,7 @@ def _build_game_context(
             f"{last_score.points_scored} (final: {game_result.home_score}-"
             f"{game_result.away_score})"
         )
+    close_section("deciding_play", 1)
 
     # Named moves used during the game — context for richer commentary
     moves_used: set[str] = set()
@@ -507,12 +582,17 @@ def _build_game_context(
             moves_used.add(p.move_activated)
     if moves_used:
         lines.append(f"\nSignature moves activated: {', '.join(sorted(moves_used))}")
+    close_section("moves", 3)
 
     # Narrative context — standings, streaks, head-to-head, rule changes
     if narrative:
-        narrative_block = format_narrative_for_prompt(narrative)
+        if round_narrative_only:
+            narrative_block = format_narrative_layers(narrative)[1]
+        else:
+            narrative_block = format_narrative_for_prompt(narrative)
         if narrative_block:
             lines.append(f"\n--- Dramatic Context ---\n{narrative_block}")
+        close_section("dramatic_context", 3)
 
         # System-level threading — explicit callouts for AI to incorporate
         system_notes: list[str] = []
@@ -566,8 +646,9 @@ def _build_game_context(
             )
             for note in system_notes:
                 lines.append(f"  - {note}")
+            close_section("system_notes", 2)
 
-    return "\n".join(lines)
+    return fit_sections(sections, "commentary")
 
 
 async def generate_game_commentary(
@@ -581,15 +662,19 @@ async def generate_game_commentary(
     season_id: str = "",
     round_number: int | None = None,
     db_session: object | None = None,
+    on_partial: Callable[[str], Awaitable[None]] | None = None,
 ) -> str:
     """Generate AI-powered broadcaster commentary for a completed game.
 
     Uses Claude Sonnet for cost-effective high-volume generation.
     Falls back to the mock generator on API failure — players never see
     error text.
+
+    With ``on_partial`` the response is streamed and the callback receives
+    the commentary so far each time a sentence completes, so viewers see
+    the first lines long before the full call finishes.
     """
     from pinwheel.ai.usage import (
-        cacheable_system,
         extract_usage,
         record_ai_usage,
         track_latency,
@@ -598,22 +683,35 @@ async def generate_game_commentary(
     context = _build_game_context(
         game_result, home_team, away_team, ruleset, playoff_context,
         narrative=narrative,
+        round_narrative_only=True,
     )
     playoff_instructions = _PLAYOFF_COMMENTARY_INSTRUCTIONS.get(
         playoff_context or "", ""
     )
-    system = COMMENTARY_SYSTEM_PROMPT.format(playoff_instructions=playoff_instructions)
+    # League facts and season context are shared with the round's reports,
+    # so they lead the system prompt; the game itself is the uncached tail.
+    prompt = build_layered_prompt(
+        COMMENTARY_SYSTEM_PROMPT.format(playoff_instructions=playoff_instructions),
+        narrative=narrative,
+        ruleset=ruleset,
+        round_context=context,
+        round_narrative=False,
+    )
 
     model = "claude-sonnet-4-6"
+    request: dict[str, Any] = {
+        "model": model,
+        "max_tokens": 800,
+        "system": prompt.system_blocks(),
+        "messages": [{"role": "user", "content": prompt.user_message("Call this game:")}],
+    }
     try:
-        client = anthropic.AsyncAnthropic(api_key=api_key)
+        client = get_ai_client(api_key, "commentary")
         async with track_latency() as timing:
-            response = await client.messages.create(
-                model=model,
-                max_tokens=800,
-                system=cacheable_system(system),
-                messages=[{"role": "user", "content": f"Call this game:\n\n{context}"}],
-            )
+            if on_partial is None:
+                response = await client.messages.create(**request)
+            else:
+                response = await _stream_commentary(client, request, on_partial)
         text = response.content[0].text
         if response.stop_reason == "max_tokens":
             text = trim_to_last_sentence(text)
@@ -943,7 +1041,6 @@ async def generate_highlight_reel(
     One punchy sentence per game, plus overall round narrative.
     """
     from pinwheel.ai.usage import (
-        cacheable_system,
         extract_usage,
         record_ai_usage,
         track_latency,
@@ -981,30 +1078,24 @@ async def generate_highlight_reel(
             f"  {home} {hs} - {aws} {away}{elam} ({', '.join(detail_parts)})"
         )
 
-    context = "\n".join(lines)
-
-    # Add narrative context if available
-    if narrative:
-        narrative_block = format_narrative_for_prompt(narrative)
-        if narrative_block:
-            context += f"\n\n--- Dramatic Context ---\n{narrative_block}"
-
     playoff_instructions = _PLAYOFF_HIGHLIGHT_INSTRUCTIONS.get(
         playoff_context or "", ""
     )
-    system = HIGHLIGHT_REEL_SYSTEM_PROMPT.format(
-        playoff_instructions=playoff_instructions
+    prompt = build_layered_prompt(
+        HIGHLIGHT_REEL_SYSTEM_PROMPT.format(playoff_instructions=playoff_instructions),
+        narrative=narrative,
+        round_context="\n".join(lines),
     )
 
     model = "claude-sonnet-4-6"
     try:
-        client = anthropic.AsyncAnthropic(api_key=api_key)
+        client = get_ai_client(api_key, "commentary")
         async with track_latency() as timing:
             response = await client.messages.create(
                 model=model,
                 max_tokens=500,
-                system=cacheable_system(system),
-                messages=[{"role": "user", "content": f"Highlights:\n\n{context}"}],
+                system=prompt.system_blocks(),
+                messages=[{"role": "user", "content": prompt.user_message("Highlights:")}],
             )
         text = response.content[0].text
         if response.stop_reason == "max_tokens":
@@ -304,9 +304,13 @@ async def compute_governor_leverage(
     swing_count = 0
     proposals_with_outcome = set(outcome_map.keys())
 
+    votes_by_pid: dict[str, list] = {}
+    for v in all_votes:
+        votes_by_pid.setdefault(v.proposal_id or "", []).append(v)
+
     for pid in proposals_with_outcome:
         # Collect all votes for this proposal
-        pid_votes = [v for v in all_votes if v.payload.get("proposal_id") == pid]
+        pid_votes = votes_by_pid.get(pid, [])
         weighted_yes = sum(
             float(v.payload.get("weight", 1.0))
             for v in pid_votes
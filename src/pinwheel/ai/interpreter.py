@@ -17,10 +17,11 @@ import json
 import logging
 
 import anthropic
-import httpx
 from pydantic import BaseModel as PydanticBaseModel
 from pydantic import ValidationError
 
+from pinwheel.ai.client import PooledAIClient, get_ai_client
+from pinwheel.ai.response_cache import cached_create
 from pinwheel.models.governance import (
     EffectSpec,
     ProposalInterpretation,
@@ -43,26 +44,16 @@ def _parse_json_response(text: str, model_class: type[PydanticBaseModel]) -> Pyd
     data = json.loads(text)
     return model_class(**data)
 
-# Module-level client cache for connection reuse
-_client_cache: dict[str, anthropic.AsyncAnthropic] = {}
 
-_INTERPRETER_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+def _get_client(api_key: str) -> PooledAIClient:
+    """Return the shared-pool client for interpreter calls.
 
-
-def _get_client(api_key: str) -> anthropic.AsyncAnthropic:
-    """Return a cached AsyncAnthropic client for connection reuse.
-
-    SDK retries are disabled (max_retries=0) so that our app-level retry
-    loop is the only retry layer.  This prevents the SDK's built-in
-    back-off from silently eating the timeout budget on 429/overloaded.
+    SDK retries are disabled (max_retries=0, see ``ai.client.CALL_PROFILES``)
+    so that our app-level retry loop is the only retry layer.  This prevents
+    the SDK's built-in back-off from silently eating the timeout budget on
+    429/overloaded.
     """
-    if api_key not in _client_cache:
-        _client_cache[api_key] = anthropic.AsyncAnthropic(
-            api_key=api_key,
-            timeout=_INTERPRETER_TIMEOUT,
-            max_retries=0,
-        )
-    return _client_cache[api_key]
+    return get_ai_client(api_key, "interpreter")
 
 INTERPRETER_SYSTEM_PROMPT = """\
 You are the Constitutional Interpreter for Pinwheel Fates, a basketball governance game.
@@ -329,11 +320,13 @@ async def interpret_strategy(
     season_id: str = "",
     round_number: int | None = None,
     db_session: object | None = None,
+    bypass_cache: bool = False,
 ) -> TeamStrategy:
     """Use Claude to interpret natural language strategy into structured parameters.
 
     This is a sandboxed call — the AI sees only the sanitized strategy text and
     parameter definitions. Input is sanitized through the same pipeline as proposals.
+    Identical requests are served from the response cache unless ``bypass_cache``.
     """
     from pinwheel.ai.usage import (
         cacheable_system,
@@ -350,7 +343,11 @@ async def interpret_strategy(
     try:
         client = _get_client(api_key)
         async with track_latency() as timing:
-            response = await client.messages.create(
+            response = await cached_create(
+                client,
+                "interpreter.strategy",
+                bypass=bypass_cache,
+                validate=lambda text: _parse_json_response(text, TeamStrategy),
                 model=model,
                 max_tokens=300,
                 system=cacheable_system(STRATEGY_SYSTEM_PROMPT),
@@ -688,6 +685,11 @@ start fresh. Produce a complete interpretation — the player will only see your
 """
 
 
+def _validate_interpretation(text: str) -> None:
+    """Response-cache validator: only parseable interpretations are stored."""
+    _parse_json_response(text, ProposalInterpretation)
+
+
 async def _opus_escalate(
     raw_text: str,
     first_pass: ProposalInterpretation,
@@ -696,6 +698,7 @@ async def _opus_escalate(
     season_id: str = "",
     round_number: int | None = None,
     db_session: object | None = None,
+    bypass_cache: bool = False,
 ) -> ProposalInterpretation | None:
     """Escalate an uncertain interpretation to Opus for deeper analysis.
 
@@ -732,13 +735,13 @@ async def _opus_escalate(
 
     try:
         logger.info("Escalating to Opus for: %s", raw_text[:80])
-        opus_client = anthropic.AsyncAnthropic(
-            api_key=api_key,
-            timeout=httpx.Timeout(60.0, connect=5.0),
-            max_retries=0,
-        )
+        opus_client = _get_client(api_key)
         async with track_latency() as timing:
-            response = await opus_client.messages.create(
+            response = await cached_create(
+                opus_client,
+                "interpreter.v2.opus_escalation",
+                bypass=bypass_cache,
+                validate=_validate_interpretation,
                 model=opus_model,
                 max_tokens=4096,
                 system=cacheable_system(system),
@@ -784,12 +787,14 @@ async def interpret_proposal_v2(
     season_id: str = "",
     round_number: int | None = None,
     db_session: object | None = None,
+    bypass_cache: bool = False,
 ) -> ProposalInterpretation:
     """Use Claude to interpret a proposal into structured effects (v2).
 
     Two-tier interpretation: Sonnet interprets first (fast, cheap). If Sonnet
     is uncertain (clarification_needed or confidence < 0.5), Opus gets a
     second look with Sonnet's analysis. The player only sees the final result.
+    Every tier goes through the response cache unless ``bypass_cache``.
     """
     from pinwheel.ai.usage import (
         cacheable_system,
@@ -811,7 +816,11 @@ async def interpret_proposal_v2(
     for attempt in range(2):
         try:
             async with track_latency() as timing:
-                response = await client.messages.create(
+                response = await cached_create(
+                    client,
+                    "interpreter.v2",
+                    bypass=bypass_cache,
+                    validate=_validate_interpretation,
                     model=model,
                     max_tokens=4096,
                     system=cacheable_system(system),
@@ -854,6 +863,7 @@ async def interpret_proposal_v2(
                 season_id,
                 round_number,
                 db_session,
+                bypass_cache=bypass_cache,
             )
             if opus_result is not None:
                 return opus_result
@@ -882,13 +892,13 @@ async def interpret_proposal_v2(
     haiku_model = "claude-haiku-4-5-20251001"
     try:
         logger.info("Sonnet failed, trying Haiku for: %s", raw_text[:80])
-        haiku_client = anthropic.AsyncAnthropic(
-            api_key=api_key,
-            timeout=httpx.Timeout(60.0, connect=5.0),
-            max_retries=0,
-        )
+        haiku_client = _get_client(api_key)
         async with track_latency() as timing:
-            response = await haiku_client.messages.create(
+            response = await cached_create(
+                haiku_client,
+                "interpreter.v2.haiku_fallback",
+                bypass=bypass_cache,
+                validate=_validate_interpretation,
                 model=haiku_model,
                 max_tokens=4096,
                 system=cacheable_system(system),
@@ -926,6 +936,7 @@ async def interpret_proposal_v2(
                 season_id,
                 round_number,
                 db_session,
+                bypass_cache=bypass_cache,
             )
             if opus_result is not None:
                 return opus_result
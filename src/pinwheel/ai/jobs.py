@@ -0,0 +1,278 @@
+"""AI job scheduler for a round's generated content.
+
+``_phase_ai`` produces commentary per game, the highlight reel, league
+reports and one or more private reports per active governor.  Firing all of
+them in one unbounded ``asyncio.gather`` means a 429 / overloaded burst hits
+every call at once, and the public content players are waiting for competes
+with private reports nobody will read for hours.
+
+``AIJobScheduler.run(jobs)`` runs a batch of ``AIJob``s instead:
+
+* **Priorities** — jobs start in ``JobPriority`` order (public commentary,
+  then league reports, then private reports), FIFO within a priority.
+* **AIMD window** — at most ``window`` jobs run at once.  Every clean
+  completion grows the window by ``1 / window`` (about +1 per window-full);
+  a job that saw a 429 / 529 from the API halves it.  The window persists on
+  the scheduler, so the next round starts from what the last one learned.
+* **Deadlines** — each job has a deadline (per-priority default) measured
+  from submission.  A job that is still queued at its deadline never starts,
+  and a running job is cancelled; either way its ``fallback`` (the mock
+  generator) supplies the result.
+
+Overloads are reported by the client layer: ``_LimitedMessages.create`` calls
+``note_overload()``, which flags the job whose task made the request.
+
+Usage:
+    results = await ai_jobs.run([AIJob("commentary", JobPriority.COMMENTARY, run), ...])
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+OVERLOAD_STATUS_CODES = frozenset({429, 529})
+
+DEFAULT_INITIAL_WINDOW = 4.0
+DEFAULT_MAX_WINDOW = 8.0
+MIN_WINDOW = 1.0
+
+
+class JobPriority(IntEnum):
+    """Lower value starts first."""
+
+    COMMENTARY = 0  # Game commentary and highlight reel — what players see first
+    LEAGUE_REPORT = 1  # Simulation, governance, impact, state of the league
+    PRIVATE_REPORT = 2  # Per-governor private, leverage and behavioral reports
+
+
+DEFAULT_DEADLINES: dict[JobPriority, float] = {
+    JobPriority.COMMENTARY: 90.0,
+    JobPriority.LEAGUE_REPORT: 150.0,
+    JobPriority.PRIVATE_REPORT: 240.0,
+}
+
+
+@dataclass
+class AIJob:
+    """One unit of AI work.
+
+    ``run`` is a zero-argument coroutine factory so a job that expires in the
+    queue never creates a coroutine.  ``fallback`` is called (synchronously)
+    when the job misses its deadline; without one the result is the
+    ``TimeoutError``.
+    """
+
+    name: str
+    priority: JobPriority
+    run: Callable[[], Awaitable[Any]]
+    fallback: Callable[[], Any] | None = None
+    deadline: float | None = None  # seconds from submission; None = priority default
+
+
+@dataclass
+class _JobSignal:
+    """Per-job flags set from inside the job's task (see ``note_overload``)."""
+
+    overloaded: bool = False
+
+
+_current_signal: contextvars.ContextVar[_JobSignal | None] = contextvars.ContextVar(
+    "pinwheel_ai_job_signal", default=None
+)
+
+
+def is_overload(exc: BaseException) -> bool:
+    """True for rate-limit (429) and overloaded (529) API errors."""
+    return getattr(exc, "status_code", None) in OVERLOAD_STATUS_CODES
+
+
+def note_overload() -> None:
+    """Flag the currently running job as having hit a 429 / 529."""
+    signal = _current_signal.get()
+    if signal is not None:
+        signal.overloaded = True
+
+
+@dataclass(order=True)
+class _Entry:
+    priority: int
+    seq: int
+    job: AIJob = field(compare=False)
+    deadline_at: float = field(compare=False)
+    future: asyncio.Future[Any] = field(compare=False)
+    started: bool = field(default=False, compare=False)
+    task: asyncio.Task[None] | None = field(default=None, compare=False)
+
+
+class AIJobScheduler:
+    """Priority queue + AIMD concurrency window + per-job deadlines."""
+
+    def __init__(
+        self,
+        initial_window: float = DEFAULT_INITIAL_WINDOW,
+        max_window: float = DEFAULT_MAX_WINDOW,
+        deadlines: dict[JobPriority, float] | None = None,
+    ) -> None:
+        self.max_window = max(MIN_WINDOW, max_window)
+        self.window = min(max(MIN_WINDOW, initial_window), self.max_window)
+        self.deadlines = dict(DEFAULT_DEADLINES)
+        if deadlines:
+            self.deadlines.update(deadlines)
+        self.running = 0
+        self._queue: list[_Entry] = []
+        self._seq = itertools.count()
+        self._last_decrease = float("-inf")
+
+    def configure(
+        self,
+        initial_window: float,
+        max_window: float,
+        deadlines: dict[JobPriority, float] | None = None,
+    ) -> None:
+        """Apply settings (app startup)."""
+        self.max_window = max(MIN_WINDOW, max_window)
+        self.window = min(max(MIN_WINDOW, initial_window), self.max_window)
+        if deadlines:
+            self.deadlines.update(deadlines)
+
+    async def run(self, jobs: list[AIJob]) -> list[Any]:
+        """Run *jobs*; results in submission order, exceptions returned in place.
+
+        Like ``asyncio.gather(..., return_exceptions=True)``: one failing job
+        never cancels the others.  If the call itself is cancelled (round
+        timeout, shutdown), its running jobs are cancelled and its queued
+        ones dropped, so an abandoned round stops holding window slots and
+        making API calls.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        entries: list[_Entry] = []
+        timers: list[asyncio.TimerHandle] = []
+        for job in jobs:
+            future: asyncio.Future[Any] = loop.create_future()
+            deadline = job.deadline if job.deadline is not None else self.deadlines[job.priority]
+            entry = _Entry(int(job.priority), next(self._seq), job, now + deadline, future)
+            heapq.heappush(self._queue, entry)
+            # Settles the job if it is still queued when its deadline passes.
+            timers.append(loop.call_at(entry.deadline_at, self._expire_queued, entry))
+            entries.append(entry)
+        self._pump()
+        try:
+            return list(
+                await asyncio.gather(*(e.future for e in entries), return_exceptions=True)
+            )
+        finally:
+            for timer in timers:
+                timer.cancel()
+            self._abandon(entries)
+
+    def _abandon(self, entries: list[_Entry]) -> None:
+        """Cancel *entries* still running and drop those still queued."""
+        # A cancelled gather has already cancelled the futures it was waiting on
+        abandoned = [e for e in entries if not e.future.done() or e.future.cancelled()]
+        if not abandoned:
+            return
+        running = 0
+        for entry in abandoned:
+            if entry.task is not None and not entry.task.done():
+                entry.task.cancel()
+                running += 1
+            entry.future.cancel()
+        queued = {id(e) for e in abandoned if not e.started}
+        self._queue = [e for e in self._queue if id(e) not in queued]
+        heapq.heapify(self._queue)
+        logger.warning("ai_jobs_abandoned running=%d queued=%d", running, len(queued))
+
+    def _pump(self) -> None:
+        """Start queued jobs while the window has room."""
+        loop = asyncio.get_running_loop()
+        while self._queue and self.running < int(self.window):
+            entry = heapq.heappop(self._queue)
+            if entry.future.done():
+                continue
+            if loop.time() >= entry.deadline_at:
+                self._expire_queued(entry)
+                continue
+            entry.started = True
+            self.running += 1
+            entry.task = loop.create_task(self._execute(entry))
+            entry.task.add_done_callback(lambda _t: self._on_done())
+
+    def _expire_queued(self, entry: _Entry) -> None:
+        if entry.started or entry.future.done():
+            return
+        logger.warning(
+            "ai_job_expired_in_queue job=%s priority=%s",
+            entry.job.name,
+            entry.job.priority.name,
+        )
+        self._settle_timeout(entry)
+
+    def _on_done(self) -> None:
+        self.running -= 1
+        self._pump()
+
+    async def _execute(self, entry: _Entry) -> None:
+        loop = asyncio.get_running_loop()
+        # Each task runs in its own context copy, so this is visible only to this job.
+        signal = _JobSignal()
+        _current_signal.set(signal)
+        started = loop.time()
+        try:
+            result = await asyncio.wait_for(entry.job.run(), entry.deadline_at - started)
+        except TimeoutError:
+            logger.warning(
+                "ai_job_deadline_exceeded job=%s priority=%s",
+                entry.job.name,
+                entry.job.priority.name,
+            )
+            self._settle_timeout(entry)
+        except Exception as exc:  # Last-resort handler — surfaced to the caller as a result
+            if signal.overloaded or is_overload(exc):
+                self._decrease(started)
+            if not entry.future.done():
+                entry.future.set_exception(exc)
+        else:
+            if signal.overloaded:
+                self._decrease(started)
+            else:
+                self._increase()
+            if not entry.future.done():
+                entry.future.set_result(result)
+
+    def _settle_timeout(self, entry: _Entry) -> None:
+        if entry.future.done():
+            return
+        if entry.job.fallback is None:
+            entry.future.set_exception(TimeoutError(f"AI job {entry.job.name} missed deadline"))
+            return
+        try:
+            entry.future.set_result(entry.job.fallback())
+        except Exception as exc:  # Last-resort handler — a broken fallback is the job's error
+            entry.future.set_exception(exc)
+
+    def _increase(self) -> None:
+        self.window = min(self.max_window, self.window + 1.0 / self.window)
+
+    def _decrease(self, job_started: float) -> None:
+        # Only the first overload of a burst counts: jobs that were already in
+        # flight when the window shrank were admitted under the old window.
+        if job_started < self._last_decrease:
+            return
+        self._last_decrease = asyncio.get_running_loop().time()
+        previous = self.window
+        self.window = max(MIN_WINDOW, self.window / 2)
+        logger.warning("ai_job_window_decreased from=%.2f to=%.2f", previous, self.window)
+
+
+ai_jobs = AIJobScheduler()
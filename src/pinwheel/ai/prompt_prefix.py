@@ -0,0 +1,110 @@
+"""Layered system prompts ordered for prompt-cache reuse.
+
+Prompt caching reuses the longest request *prefix* that ends at a
+``cache_control`` breakpoint.  Our report and commentary prompts used to
+interleave per-round data with static league context, so the cacheable
+prefix was short and ``cache_read_tokens`` stayed low.
+
+``LayeredPrompt`` orders content from most static to most volatile:
+
+1. **bedrock** — the league primer and the ``LEAGUE FACTS`` derived from the
+   current ruleset.  Byte-identical for every call in a round, so
+   simulation, governance, private and commentary calls share it.
+2. **season** — rule changes in effect, active proposal effects and league
+   history.  Changes only when a governance tally enacts something.
+3. **persona** — the call type's instructions.  Stable across rounds.
+4. **round** — this round's data.  Sent in the user message, never cached.
+
+Each non-empty system layer ends with its own breakpoint (three at most;
+the API allows four), so a change in a later layer never invalidates the
+earlier ones.
+
+Usage:
+    prompt = build_layered_prompt(PERSONA, narrative=narrative, round_context=data)
+    system = prompt.system_blocks()
+    user = prompt.user_message("Generate a report for this round.")
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pinwheel.core.narrative import build_bedrock_facts, format_narrative_layers
+
+if TYPE_CHECKING:
+    from pinwheel.core.narrative import NarrativeContext
+    from pinwheel.models.rules import RuleSet
+
+LEAGUE_PRIMER = """\
+Pinwheel Fates is a 3v3 basketball league whose rules are governed by its players. \
+Governors propose rule changes, vote on them, and the simulation plays every game \
+under whatever rules the Floor has enacted. Teams field three hoopers at a time; \
+each hooper has an archetype and attributes that shape how they play. Rule changes \
+take effect at governance tallies and persist until changed again.
+
+Everything the league's AI writes follows one principle: the AI observes, humans decide. \
+Describe what happened and what the data reveals. Never tell governors what to do."""
+
+LEAGUE_FACTS_HEADER = "=== LEAGUE FACTS (do not contradict) ==="
+SEASON_CONTEXT_HEADER = "=== SEASON CONTEXT ==="
+
+
+def _block(text: str) -> dict[str, object]:
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+@dataclass
+class LayeredPrompt:
+    """A prompt split into cacheable system layers and a volatile tail."""
+
+    persona: str
+    bedrock: str = ""
+    season: str = ""
+    round: str = ""
+
+    def system_blocks(self) -> list[dict[str, object]]:
+        """System content blocks, most static first, one breakpoint per layer."""
+        bedrock = LEAGUE_PRIMER
+        if self.bedrock:
+            bedrock += f"\n\n{LEAGUE_FACTS_HEADER}\n{self.bedrock}"
+        blocks = [_block(bedrock)]
+        if self.season:
+            blocks.append(_block(f"{SEASON_CONTEXT_HEADER}\n{self.season}"))
+        blocks.append(_block(self.persona))
+        return blocks
+
+    def user_message(self, instruction: str) -> str:
+        """The instruction followed by this round's data."""
+        return f"{instruction}\n\n{self.round}" if self.round else instruction
+
+
+def build_layered_prompt(
+    persona: str,
+    *,
+    narrative: NarrativeContext | None = None,
+    ruleset: RuleSet | None = None,
+    round_context: str = "",
+    round_narrative: bool = True,
+) -> LayeredPrompt:
+    """Assemble a ``LayeredPrompt`` from a persona, narrative and round data.
+
+    Bedrock facts come from the narrative when it has them, else from
+    *ruleset*.  The narrative's per-round block is appended to
+    *round_context* as the usual ``Dramatic Context`` section unless
+    *round_narrative* is False (the caller only wants the shared prefix).
+    """
+    bedrock = ""
+    if narrative is not None and narrative.bedrock_facts:
+        bedrock = narrative.bedrock_facts
+    elif ruleset is not None:
+        bedrock = build_bedrock_facts(ruleset)
+
+    season = ""
+    round_text = round_context
+    if narrative is not None:
+        season, round_block = format_narrative_layers(narrative)
+        if round_block and round_narrative:
+            round_text = f"{round_text}\n\n--- Dramatic Context ---\n{round_block}".strip()
+
+    return LayeredPrompt(persona=persona, bedrock=bedrock, season=season, round=round_text)
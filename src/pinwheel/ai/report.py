@@ -19,6 +19,10 @@ from typing import TYPE_CHECKING
 
 import anthropic
 
+from pinwheel.ai.client import get_ai_client
+from pinwheel.ai.prompt_prefix import build_layered_prompt
+from pinwheel.ai.response_cache import cached_create
+from pinwheel.ai.token_budget import REQUIRED, estimate_tokens, fit_mapping
 from pinwheel.core.narrative import NarrativeContext, format_narrative_for_prompt
 from pinwheel.models.report import Report
 
@@ -479,11 +483,12 @@ async def compute_private_report_context(
         season_id=season_id,
         event_types=["vote.cast"],
     )
+    votes_by_pid: dict[str, list] = {}
+    for v in all_votes:
+        votes_by_pid.setdefault(v.proposal_id or "", []).append(v)
     swing_count = 0
     for pid, outcome in outcome_map.items():
-        pid_votes = [
-            v for v in all_votes if v.payload.get("proposal_id") == pid
-        ]
+        pid_votes = votes_by_pid.get(pid, [])
         gov_vote_in_pid = [
             v for v in pid_votes if v.governor_id == governor_id
         ]
@@ -662,7 +667,7 @@ The governance activity data follows in the user message.
 """
 
 PRIVATE_REPORT_PROMPT = """\
-You are generating a Private Mirror for governor "{governor_id}" in Pinwheel Fates.
+You are generating a Private Mirror for one governor in Pinwheel Fates.
 
 A private mirror reflects a governor's OWN behavior back to them. Only they see this.
 It helps them understand their patterns and blind spots without telling them what to do.
@@ -688,9 +693,7 @@ It helps them understand their patterns and blind spots without telling them wha
 If the governor has done nothing yet, say so briefly — do not pad with generic advice \
 or claim patterns from a single action.
 
-## Governor Activity
-
-{governor_data}
+The governor's ID and activity data follow in the user message.
 """
 
 
@@ -744,6 +747,58 @@ This is private — only they see it. Show them their pattern.
 """
 
 
+# Trim priorities for token budgets (see ai/token_budget.py). Keys not
+# listed are required; higher numbers are trimmed first.
+SYSTEM_CONTEXT_PRIORITIES: dict[str, int] = {
+    "standings_gap": 1,
+    "leader_team": 1,
+    "trailer_team": 1,
+    "recent_rule_changes": 2,
+    "streaks_summary": 3,
+}
+
+GOVERNANCE_CONTEXT_PRIORITIES: dict[str, int] = {
+    "blind_spots": 2,
+    "velocity": 2,
+    "parameter_clustering": 3,
+    "pairwise_voting_alignment": 3,
+}
+
+PRIVATE_CONTEXT_PRIORITIES: dict[str, int] = {
+    "blind_spots": 1,
+    "governor_proposal_categories": 2,
+    "voting_outcomes": 2,
+    "proposal_details": 2,
+    "league_proposal_categories": 3,
+    "league_rule_change_categories": 3,
+}
+
+
+def fit_system_context(round_data: dict, sys_ctx: dict[str, object]) -> dict[str, object]:
+    """Trim *sys_ctx* so the simulation report's round payload fits its budget.
+
+    The round data and the required context keys are never trimmed, so they
+    are the fixed cost; only what the optional keys add to the rendered
+    payload is measured against what is left.
+    """
+    required = {
+        k: v for k, v in sys_ctx.items() if SYSTEM_CONTEXT_PRIORITIES.get(k, REQUIRED) == REQUIRED
+    }
+
+    def rendered_tokens(ctx: object) -> int:
+        payload = {**round_data, "system_context": ctx}
+        return estimate_tokens(json.dumps(payload, indent=2, default=str))
+
+    fixed_tokens = rendered_tokens(required)
+    return fit_mapping(
+        sys_ctx,
+        SYSTEM_CONTEXT_PRIORITIES,
+        "report.simulation",
+        fixed_tokens=fixed_tokens,
+        measure=lambda ctx: rendered_tokens(ctx) - fixed_tokens,
+    )
+
+
 def build_system_context(
     round_data: dict,
     narrative: NarrativeContext | None,
@@ -901,22 +956,21 @@ async def generate_simulation_report(
     sys_ctx = build_system_context(round_data, narrative)
     enriched_data = dict(round_data)
     if sys_ctx:
-        enriched_data["system_context"] = sys_ctx
+        enriched_data["system_context"] = fit_system_context(round_data, sys_ctx)
 
     data_str = json.dumps(enriched_data, indent=2)
-    if narrative:
-        narrative_block = format_narrative_for_prompt(narrative)
-        data_str += f"\n\n--- Dramatic Context ---\n{narrative_block}"
+    prompt = build_layered_prompt(
+        SIMULATION_REPORT_PROMPT,
+        narrative=narrative,
+        round_context=f"## Current Round Data\n\n{data_str}",
+    )
     try:
         # The flagship round report runs on Opus — one call per round, and it's
-        # the product's voice. Volatile round data goes in the user message so
-        # the (cached) system prompt stays stable across rounds.
+        # the product's voice. League facts and season context sit in cached
+        # system layers; volatile round data goes in the user message.
         content = await _call_claude(
-            system=SIMULATION_REPORT_PROMPT,
-            user_message=(
-                "Generate a simulation report for this round.\n\n"
-                f"## Current Round Data\n\n{data_str}"
-            ),
+            system=prompt.system_blocks(),
+            user_message=prompt.user_message("Generate a simulation report for this round."),
             api_key=api_key,
             call_type="report.simulation",
             season_id=season_id,
@@ -980,17 +1034,19 @@ async def generate_governance_report(
     if blind_spots:
         enriched_data["blind_spots"] = blind_spots
 
+    enriched_data = fit_mapping(
+        enriched_data, GOVERNANCE_CONTEXT_PRIORITIES, "report.governance"
+    )
     data_str = json.dumps(enriched_data, indent=2)
-    if narrative:
-        narrative_block = format_narrative_for_prompt(narrative)
-        data_str += f"\n\n--- Dramatic Context ---\n{narrative_block}"
+    prompt = build_layered_prompt(
+        GOVERNANCE_REPORT_PROMPT,
+        narrative=narrative,
+        round_context=f"## Governance Activity\n\n{data_str}",
+    )
     try:
         content = await _call_claude(
-            system=GOVERNANCE_REPORT_PROMPT,
-            user_message=(
-                "Generate a governance report for this round.\n\n"
-                f"## Governance Activity\n\n{data_str}"
-            ),
+            system=prompt.system_blocks(),
+            user_message=prompt.user_message("Generate a governance report for this round."),
             api_key=api_key,
             call_type="report.governance",
             season_id=season_id,
@@ -1114,15 +1170,31 @@ async def generate_private_report(
     round_number: int,
     api_key: str,
     db_session: object | None = None,
+    narrative: NarrativeContext | None = None,
 ) -> Report:
-    """Generate a private report for a specific governor."""
+    """Generate a private report for a specific governor.
+
+    The persona is identical for every governor so it stays in the cached
+    prefix; the governor's identity and activity go in the user message.
+    *narrative* only contributes the shared league and season layers.
+    Long season histories are trimmed to the ``report.private`` budget.
+    """
+    activity = fit_mapping(governor_data, PRIVATE_CONTEXT_PRIORITIES, "report.private")
+    prompt = build_layered_prompt(
+        PRIVATE_REPORT_PROMPT,
+        narrative=narrative,
+        round_narrative=False,
+        round_context=(
+            f"## Governor\n\n{governor_id}\n\n"
+            f"## Governor Activity\n\n{json.dumps(activity, indent=2)}"
+        ),
+    )
     try:
         content = await _call_claude(
-            system=PRIVATE_REPORT_PROMPT.format(
-                governor_id=governor_id,
-                governor_data=json.dumps(governor_data, indent=2),
+            system=prompt.system_blocks(),
+            user_message=prompt.user_message(
+                f"Generate a private report for governor {governor_id}."
             ),
-            user_message=f"Generate a private report for governor {governor_id}.",
             api_key=api_key,
             call_type="report.private",
             season_id=season_id,
@@ -1144,7 +1216,7 @@ async def generate_private_report(
 
 
 async def _call_claude(
-    system: str,
+    system: str | list[dict[str, object]],
     user_message: str,
     api_key: str,
     call_type: str = "report",
@@ -1153,10 +1225,15 @@ async def _call_claude(
     db_session: object | None = None,
     model: str = "claude-sonnet-4-6",
     max_tokens: int = 1500,
+    bypass_cache: bool = False,
 ) -> str:
     """Make a Claude API call for report generation.
 
+    ``system`` is either a prompt string (sent as one cacheable block) or
+    prebuilt blocks from ``LayeredPrompt.system_blocks()``.
     When ``db_session`` is provided, records token usage to the AI usage log.
+    Identical requests are served from the response cache unless
+    ``bypass_cache`` is set.
 
     Raises ``anthropic.APIError`` on API failure — callers fall back to their
     mock generators so error text never reaches players.
@@ -1169,12 +1246,15 @@ async def _call_claude(
         track_latency,
     )
 
-    client = anthropic.AsyncAnthropic(api_key=api_key)
+    client = get_ai_client(api_key, "report")
     async with track_latency() as timing:
-        response = await client.messages.create(
+        response = await cached_create(
+            client,
+            call_type,
+            bypass=bypass_cache,
             model=model,
             max_tokens=max_tokens,
-            system=cacheable_system(system),
+            system=cacheable_system(system) if isinstance(system, str) else system,
             messages=[{"role": "user", "content": user_message}],
         )
     text = response.content[0].text
@@ -0,0 +1,275 @@
+"""Content-addressed response cache for deterministic AI calls.
+
+Admin reruns, rounds resumed after a crash, ``/rerun-council`` and the eval
+harness regularly resend the exact same request (model, system prompt,
+messages, output schema) to the API.  This cache stores the response text
+in a small SQLite file keyed by a SHA-256 of the canonical request, so an
+identical re-request returns immediately at zero token cost.
+
+* **Content-addressed** — the key is the hash of every ``messages.create``
+  argument; any change to a prompt, model or parameter is a miss.
+* **TTL** — entries older than ``ttl_seconds`` are ignored and purged.
+* **Size-bounded** — when the stored bytes exceed ``max_bytes`` the least
+  recently used entries are evicted.
+* **Validated writes** — callers pass ``validate`` (e.g. the JSON parser
+  for the interpreter) so an unparseable response is never cached.
+* **Bypass** — the wrapped functions take ``bypass_cache=True`` to force a
+  fresh call (the fresh response still refreshes the entry).
+
+The cache is off until ``response_cache.configure(path=...)`` is called at
+app startup; with no path, ``cached_create`` is a plain pass-through.
+
+Usage:
+    response = await cached_create(client, "classifier", model=..., messages=...)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 50_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ai_response_cache (
+    key TEXT PRIMARY KEY,
+    call_type TEXT NOT NULL,
+    model TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_ai_response_cache_last_used
+    ON ai_response_cache (last_used_at);
+"""
+
+
+@dataclass
+class _TextBlock:
+    text: str
+    type: str = "text"
+
+
+@dataclass
+class CachedResponse:
+    """Stand-in for an SDK ``Message`` served from the cache.
+
+    ``usage`` is None so ``extract_usage`` records zero tokens for the hit.
+    """
+
+    content: list[_TextBlock]
+    stop_reason: str | None
+    model: str
+    usage: None = None
+    cached: bool = field(default=True, init=False)
+
+
+def request_key(kwargs: dict[str, Any]) -> str:
+    """SHA-256 of the canonical JSON form of a ``messages.create`` request."""
+    canonical = json.dumps(kwargs, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _response_payload(response: Any) -> str | None:
+    """Serialize the parts of a response callers read; None if it has no text."""
+    blocks = [
+        block.text
+        for block in getattr(response, "content", None) or []
+        if isinstance(getattr(block, "text", None), str)
+    ]
+    if not blocks:
+        return None
+    stop_reason = getattr(response, "stop_reason", None)
+    model = getattr(response, "model", "")
+    return json.dumps(
+        {
+            "content": blocks,
+            "stop_reason": stop_reason if isinstance(stop_reason, str) else None,
+            "model": model if isinstance(model, str) else "",
+        }
+    )
+
+
+class ResponseCache:
+    """SQLite-backed response store. All I/O runs in a worker thread."""
+
+    def __init__(self) -> None:
+        self.path: str | None = None
+        self.ttl_seconds = DEFAULT_TTL_SECONDS
+        self.max_bytes = DEFAULT_MAX_BYTES
+        self.hits = 0
+        self.misses = 0
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def configure(
+        self,
+        path: str | None,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        """Apply settings (app startup). An empty *path* disables the cache."""
+        self.close()
+        self.path = path or None
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Caller holds self._lock.
+        if self._conn is None:
+            assert self.path is not None
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def _get(self, key: str) -> CachedResponse | None:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT payload, created_at FROM ai_response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            payload, created_at = row
+            if now - created_at > self.ttl_seconds:
+                conn.execute("DELETE FROM ai_response_cache WHERE key = ?", (key,))
+                conn.commit()
+                return None
+            conn.execute("UPDATE ai_response_cache SET last_used_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+        data = json.loads(payload)
+        return CachedResponse(
+            content=[_TextBlock(text) for text in data["content"]],
+            stop_reason=data.get("stop_reason"),
+            model=data.get("model", ""),
+        )
+
+    def _put(self, key: str, call_type: str, model: str, payload: str) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO ai_response_cache "
+                "(key, call_type, model, payload, size, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, call_type, model, payload, len(payload), now, now),
+            )
+            self._evict(conn, now)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute(
+            "DELETE FROM ai_response_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+        )
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM ai_response_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in conn.execute(
+            "SELECT key, size FROM ai_response_cache ORDER BY last_used_at"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM ai_response_cache WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        logger.info("ai_response_cache_evicted entries=%d bytes=%d", evicted, total)
+
+    async def get(self, key: str) -> CachedResponse | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def put(self, key: str, call_type: str, model: str, payload: str) -> None:
+        await asyncio.to_thread(self._put, key, call_type, model, payload)
+
+
+response_cache = ResponseCache()
+
+
+def resolve_cache_path(setting: str, database_url: str) -> str | None:
+    """Cache file for the ``pinwheel_ai_cache_path`` setting.
+
+    ``"off"`` disables the cache; ``""`` places it next to a file-based
+    SQLite database (and disables it for in-memory or non-SQLite databases).
+    """
+    if setting == "off":
+        return None
+    if setting:
+        return setting
+    from sqlalchemy.engine import make_url
+
+    url = make_url(database_url)
+    if not url.drivername.startswith("sqlite") or url.database in (None, "", ":memory:"):
+        return None
+    return str(Path(url.database).with_name("ai_response_cache.db"))
+
+
+async def cached_create(
+    client: Any,
+    call_type: str,
+    *,
+    bypass: bool = False,
+    validate: Callable[[str], object] | None = None,
+    **kwargs: Any,
+) -> Any:
+    """``client.messages.create(**kwargs)`` through the response cache.
+
+    *validate* is called with the first text block of a fresh response; if it
+    raises, the response is returned but not stored.  Cache I/O errors never
+    fail the call.
+    """
+    cache = response_cache
+    if not cache.enabled:
+        return await client.messages.create(**kwargs)
+
+    key = request_key(kwargs)
+    if not bypass:
+        try:
+            hit = await cache.get(key)
+        except sqlite3.Error as exc:
+            logger.warning("ai_response_cache_read_failed call_type=%s error=%s", call_type, exc)
+            hit = None
+        if hit is not None:
+            cache.hits += 1
+            logger.info("ai_response_cache_hit call_type=%s key=%s", call_type, key[:12])
+            return hit
+        cache.misses += 1
+
+    response = await client.messages.create(**kwargs)
+    payload = _response_payload(response)
+    if payload is None:
+        return response
+    if validate is not None:
+        try:
+            validate(json.loads(payload)["content"][0])
+        except Exception:  # Last-resort handler — any validation failure means don't cache
+            return response
+    try:
+        await cache.put(key, call_type, str(kwargs.get("model", "")), payload)
+    except sqlite3.Error as exc:
+        logger.warning("ai_response_cache_write_failed call_type=%s error=%s", call_type, exc)
+    return response
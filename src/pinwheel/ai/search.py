@@ -20,6 +20,7 @@ import anthropic
 from pydantic import BaseModel, model_validator
 from sqlalchemy.exc import SQLAlchemyError
 
+from pinwheel.ai.client import get_ai_client
 from pinwheel.db.models import HooperRow, TeamRow
 
 logger = logging.getLogger(__name__)
@@ -347,7 +348,7 @@ async def parse_query_ai(
 
     model = "claude-sonnet-4-6"
     try:
-        client = anthropic.AsyncAnthropic(api_key=api_key)
+        client = get_ai_client(api_key, "search")
         response = await client.messages.create(
             model=model,
             max_tokens=300,
@@ -1049,7 +1050,7 @@ async def format_response_ai(
 
     model = "claude-sonnet-4-6"
     try:
-        client = anthropic.AsyncAnthropic(api_key=api_key)
+        client = get_ai_client(api_key, "search")
         response = await client.messages.create(
             model=model,
             max_tokens=500,
@@ -0,0 +1,332 @@
+"""Similarity index over past interpreted proposals.
+
+Governors keep submitting near-identical proposals ("make threes worth 4",
+"3 pointers = 4 points") and each one used to pay a full
+``interpret_proposal_v2`` round trip, sometimes with an Opus escalation.
+This index remembers every confidently interpreted proposal of a season and
+answers near-duplicates locally, so ``/propose`` can show the cached
+interpretation for confirmation in milliseconds.
+
+* **Normalization** — lowercase, punctuation stripped, basketball synonyms
+  folded ("3 pointers", "threes", "3pt" → ``three``), number words turned
+  into digits, filler words dropped.
+* **Signatures** — character 4-gram shingles of the normalized text,
+  summarized as a 64-value MinHash signature and bucketed by LSH bands
+  (16 × 4) so a lookup only compares a handful of candidates.
+* **High-confidence gate** — a candidate is returned only when the exact
+  shingle Jaccard is at least ``SIMILARITY_THRESHOLD`` *and* both texts have
+  the same numbers and direction words ("worth 4" never matches "worth 5",
+  "increase" never matches "decrease").
+
+The index is built from ``proposal.submitted`` payloads (raw text plus the
+stored ``effects_v2``) and refreshed incrementally by event sequence number.
+Only confident, non-flagged V2 interpretations are indexed.
+
+Usage:
+    match = await proposal_index.lookup(repo, season_id, text, ruleset)
+    if match is not None:
+        interpretation = match.interpretation
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from pinwheel.models.governance import EffectSpec, ProposalInterpretation
+
+if TYPE_CHECKING:
+    from pinwheel.db.repository import Repository
+    from pinwheel.models.rules import RuleSet
+
+logger = logging.getLogger(__name__)
+
+SHINGLE_SIZE = 4
+NUM_HASHES = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_HASHES // BANDS
+SIMILARITY_THRESHOLD = 0.8
+MIN_INDEXED_CONFIDENCE = 0.7
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _hash_coefficients() -> list[tuple[int, int]]:
+    """Deterministic (a, b) pairs for the MinHash permutations."""
+    coefficients: list[tuple[int, int]] = []
+    for i in range(NUM_HASHES):
+        digest = hashlib.blake2b(f"pinwheel-minhash-{i}".encode(), digest_size=16).digest()
+        a = int.from_bytes(digest[:8], "big") % _MERSENNE_PRIME or 1
+        b = int.from_bytes(digest[8:], "big") % _MERSENNE_PRIME
+        coefficients.append((a, b))
+    return coefficients
+
+
+_COEFFICIENTS = _hash_coefficients()
+
+# Longest phrases first so "three point shots" wins over "three".
+_SYNONYMS: list[tuple[str, str]] = [
+    (r"three[ -]?point(?:er)?s?(?: shots?| field goals?)?", "three"),
+    (r"3[ -]?point(?:er)?s?(?: shots?| field goals?)?", "three"),
+    (r"3[ -]?pt(?:rs?|s)?", "three"),
+    (r"threes|3s", "three"),
+    (r"two[ -]?point(?:er)?s?(?: shots?| field goals?)?", "two"),
+    (r"2[ -]?point(?:er)?s?(?: shots?| field goals?)?", "two"),
+    (r"free[ -]?throws?|fts?", "freethrow"),
+    (r"shot[ -]?clock", "shotclock"),
+    (r"mid[ -]?range(?: shots?| jumpers?)?", "midrange"),
+    (r"lay[ -]?ups?|at[ -]the[ -]rim|rim shots?", "rim"),
+]
+_SYNONYM_RES = [(re.compile(rf"\b(?:{pattern})\b"), repl) for pattern, repl in _SYNONYMS]
+
+_NUMBER_WORDS = {
+    "zero": "0",
+    "one": "1",
+    "four": "4",
+    "five": "5",
+    "six": "6",
+    "seven": "7",
+    "eight": "8",
+    "nine": "9",
+    "ten": "10",
+    "twelve": "12",
+    "fifteen": "15",
+    "twenty": "20",
+    "thirty": "30",
+    "double": "2x",
+    "triple": "3x",
+    "half": "0.5x",
+}
+
+_FILLER = frozenset({
+    "a", "an", "the", "make", "makes", "making", "should", "be", "is", "are", "to",
+    "worth", "equal", "equals", "count", "counts", "as", "now", "please", "we", "let",
+    "lets", "all", "point", "points", "pts", "value", "valued", "of", "so", "that", "it",
+    "i", "propose", "set", "change", "for",
+})
+
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?x?")
+
+# Words that flip a proposal's meaning while barely changing its shingles.
+_POLARITY = frozenset({
+    "increase", "decrease", "raise", "lower", "reduce", "more", "less", "fewer", "add",
+    "remove", "no", "not", "never", "don", "without", "only", "longer", "shorter",
+    "faster", "slower", "up", "down", "max", "min", "maximum", "minimum", "home", "away",
+    "offense", "defense", "winning", "losing", "trailing", "leading",
+})
+
+
+def normalize_proposal_text(text: str) -> str:
+    """Canonical form used for both exact and shingle matching."""
+    text = text.lower().replace("=", " equals ").replace("%", " percent ")
+    text = re.sub(r"[^\w\s.\-]", " ", text)
+    for pattern, repl in _SYNONYM_RES:
+        text = pattern.sub(repl, text)
+    words = []
+    for word in text.split():
+        word = word.strip(".-")
+        word = _NUMBER_WORDS.get(word, word)
+        if word and word not in _FILLER:
+            words.append(word)
+    return " ".join(words)
+
+
+def _key_tokens(normalized: str) -> tuple[str, ...]:
+    """Numbers and polarity words — these must match exactly for a near-duplicate."""
+    words = normalized.split()
+    keys = [w for w in words if _NUMBER_RE.fullmatch(w) or w in _POLARITY]
+    return tuple(sorted(keys))
+
+
+def _shingles(normalized: str) -> frozenset[str]:
+    padded = f" {normalized} "
+    if len(padded) <= SHINGLE_SIZE:
+        return frozenset({padded})
+    return frozenset(padded[i : i + SHINGLE_SIZE] for i in range(len(padded) - SHINGLE_SIZE + 1))
+
+
+def minhash_signature(shingles: frozenset[str]) -> tuple[int, ...]:
+    """MinHash signature: the minimum of each permuted shingle hash."""
+    hashed = [
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big") for s in shingles
+    ]
+    return tuple(
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashed) for a, b in _COEFFICIENTS
+    )
+
+
+def _bands(signature: tuple[int, ...]) -> list[tuple[int, tuple[int, ...]]]:
+    return [
+        (band, signature[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND])
+        for band in range(BANDS)
+    ]
+
+
+@dataclass
+class _Entry:
+    proposal_id: str
+    normalized: str
+    key_tokens: tuple[str, ...]
+    shingles: frozenset[str]
+    interpretation: ProposalInterpretation
+
+
+@dataclass
+class SimilarProposal:
+    """A past proposal whose interpretation can be reused."""
+
+    proposal_id: str
+    similarity: float
+    interpretation: ProposalInterpretation
+
+
+@dataclass
+class _SeasonIndex:
+    watermark: int = 0
+    entries: list[_Entry] = field(default_factory=list)
+    exact: dict[str, int] = field(default_factory=dict)
+    buckets: dict[tuple[int, tuple[int, ...]], list[int]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+
+    def add(self, entry: _Entry) -> None:
+        idx = len(self.entries)
+        self.entries.append(entry)
+        self.exact.setdefault(entry.normalized, idx)
+        for band_key in _bands(minhash_signature(entry.shingles)):
+            self.buckets[band_key].append(idx)
+
+
+def interpretation_from_payload(payload: dict) -> ProposalInterpretation | None:
+    """Rebuild a reusable interpretation from a ``proposal.submitted`` payload."""
+    if payload.get("proposal_type") == "repeal":
+        return None
+    effects = payload.get("effects_v2")
+    confidence = payload.get("interpretation_v2_confidence")
+    if not effects or confidence is None or confidence < MIN_INDEXED_CONFIDENCE:
+        return None
+    legacy = payload.get("interpretation") or {}
+    if legacy.get("injection_flagged") or legacy.get("clarification_needed"):
+        return None
+    try:
+        return ProposalInterpretation(
+            effects=[EffectSpec(**e) for e in effects],
+            impact_analysis=payload.get("interpretation_v2_impact", ""),
+            confidence=confidence,
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+class ProposalSimilarityIndex:
+    """Per-season index of interpreted proposals, refreshed from the event log."""
+
+    def __init__(self) -> None:
+        self._seasons: dict[str, _SeasonIndex] = {}
+
+    def clear(self) -> None:
+        self._seasons.clear()
+
+    def add(
+        self,
+        season_id: str,
+        proposal_id: str,
+        raw_text: str,
+        interpretation: ProposalInterpretation,
+    ) -> None:
+        """Index one interpreted proposal."""
+        normalized = normalize_proposal_text(raw_text)
+        if not normalized:
+            return
+        self._seasons.setdefault(season_id, _SeasonIndex()).add(
+            _Entry(
+                proposal_id=proposal_id,
+                normalized=normalized,
+                key_tokens=_key_tokens(normalized),
+                shingles=_shingles(normalized),
+                interpretation=interpretation,
+            )
+        )
+
+    async def refresh(self, repo: Repository, season_id: str) -> None:
+        """Index ``proposal.submitted`` events newer than the season's watermark."""
+        index = self._seasons.setdefault(season_id, _SeasonIndex())
+        events = await repo.get_events_by_type(
+            season_id, ["proposal.submitted"], after_sequence=index.watermark
+        )
+        for event in events:
+            index.watermark = max(index.watermark, event.sequence_number)
+            payload = event.payload or {}
+            interpretation = interpretation_from_payload(payload)
+            raw_text = payload.get("raw_text", "")
+            if interpretation is not None and raw_text:
+                self.add(season_id, payload.get("id", event.aggregate_id), raw_text, interpretation)
+
+    def find(self, season_id: str, raw_text: str) -> SimilarProposal | None:
+        """Best high-confidence match for *raw_text* among indexed proposals."""
+        index = self._seasons.get(season_id)
+        normalized = normalize_proposal_text(raw_text)
+        if index is None or not normalized:
+            return None
+
+        exact = index.exact.get(normalized)
+        if exact is not None:
+            entry = index.entries[exact]
+            return SimilarProposal(entry.proposal_id, 1.0, entry.interpretation)
+
+        key_tokens = _key_tokens(normalized)
+        shingles = _shingles(normalized)
+        candidates: set[int] = set()
+        for band_key in _bands(minhash_signature(shingles)):
+            candidates.update(index.buckets.get(band_key, ()))
+
+        best: SimilarProposal | None = None
+        for idx in candidates:
+            entry = index.entries[idx]
+            if entry.key_tokens != key_tokens:
+                continue
+            similarity = len(shingles & entry.shingles) / len(shingles | entry.shingles)
+            if similarity >= SIMILARITY_THRESHOLD and (
+                best is None or similarity > best.similarity
+            ):
+                best = SimilarProposal(entry.proposal_id, similarity, entry.interpretation)
+        return best
+
+    async def lookup(
+        self,
+        repo: Repository,
+        season_id: str,
+        raw_text: str,
+        ruleset: RuleSet,
+    ) -> SimilarProposal | None:
+        """Refresh the season's index and return a ready-to-confirm match.
+
+        The returned interpretation is a copy with ``old_value`` refreshed from
+        the current ruleset and the new proposal's text echoed back.
+        """
+        await self.refresh(repo, season_id)
+        match = self.find(season_id, raw_text)
+        if match is None:
+            return None
+        interpretation = match.interpretation.model_copy(deep=True)
+        for effect in interpretation.effects:
+            if effect.effect_type == "parameter_change" and effect.parameter:
+                current = getattr(ruleset, effect.parameter, None)
+                if isinstance(current, int | float | bool):
+                    effect.old_value = current
+        interpretation.original_text_echo = raw_text
+        logger.info(
+            "proposal_similarity_hit season=%s source=%s similarity=%.2f",
+            season_id,
+            match.proposal_id,
+            match.similarity,
+        )
+        return SimilarProposal(match.proposal_id, match.similarity, interpretation)
+
+
+proposal_index = ProposalSimilarityIndex()
@@ -0,0 +1,366 @@
+"""Deterministic Anthropic-compatible stub server for load-testing AI paths.
+
+The ``*_mock`` functions skip the HTTP client, SDK retries, timeouts, the
+concurrency pool and usage accounting, so they tell us nothing about how
+``_phase_ai`` behaves under real latency.  This stub speaks enough of the
+Messages API for every Pinwheel call site (``POST /v1/messages``, plain and
+streaming) and lets the real code path run against it:
+
+* **Latency** — sampled per request from a ``fixed``, ``uniform`` or
+  ``lognormal`` distribution given by its median and p95.  Streaming
+  responses pay it as time-to-first-token, then emit text at
+  ``stream_tokens_per_second``.
+* **Fault injection** — ``rate_limit_rate`` / ``overload_rate`` of requests
+  answer 429 ``rate_limit_error`` / 529 ``overloaded_error``, with a
+  ``retry-after`` header, so SDK retries and the AIMD job window engage.
+* **Prompt caching** — system prompts with ``cache_control`` are reported as
+  ``cache_creation_input_tokens`` the first time and
+  ``cache_read_input_tokens`` after that.
+* **Determinism** — the reply text depends only on the request body, and
+  each fault/latency draw on (seed, body, attempt number), so a run is
+  reproducible regardless of request interleaving.
+
+Point the app at it with ``PINWHEEL_AI_BASE_URL`` (or
+``ai_clients.configure(base_url=...)``) and any non-empty API key.
+
+Usage:
+    python -m pinwheel.ai.stub_server --port 8765 --latency-p50-ms 800 --overload-rate 0.05
+
+    async with serve_stub(StubConfig(seed=1)) as (base_url, stub):
+        ai_clients.configure(max_concurrency=8, base_url=base_url)
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import random
+from collections import Counter
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+logger = logging.getLogger(__name__)
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "lognormal")
+_Z95 = 1.6449  # standard normal 95th percentile
+
+_WORDS = (
+    "the", "Floor", "watched", "ball", "swing", "from", "corner", "to", "while",
+    "shot", "clock", "bled", "and", "Thorns", "leaned", "on", "a", "zone", "nobody",
+    "expected", "after", "rule", "change", "governors", "argued", "about", "for",
+    "three", "rounds", "Breakers", "answered", "with", "stretch", "of", "threes",
+    "that", "moved", "standings", "tilted", "vote", "hooper", "drove", "baseline",
+    "found", "open", "shooter", "crowd", "rose", "as", "Elam", "target", "came",
+    "into", "view",
+)
+
+
+@dataclass
+class StubConfig:
+    """Behaviour knobs for the stub server."""
+
+    latency: str = "lognormal"
+    latency_p50_ms: float = 800.0
+    latency_p95_ms: float = 3000.0
+    rate_limit_rate: float = 0.0
+    overload_rate: float = 0.0
+    retry_after_seconds: float = 1.0
+    stream_tokens_per_second: float = 80.0
+    min_words: int = 40
+    max_words: int = 160
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.latency not in LATENCY_DISTRIBUTIONS:
+            msg = f"latency must be one of {LATENCY_DISTRIBUTIONS}, got {self.latency!r}"
+            raise ValueError(msg)
+
+    def sample_latency_ms(self, rng: random.Random) -> float:
+        """One latency draw whose median and p95 match the configured values."""
+        median = max(self.latency_p50_ms, 0.0)
+        p95 = max(self.latency_p95_ms, median)
+        if self.latency == "fixed" or median == 0.0:
+            return median
+        if self.latency == "uniform":
+            half_width = (p95 - median) / 0.9
+            return max(0.0, rng.uniform(median - half_width, median + half_width))
+        sigma = math.log(p95 / median) / _Z95 if p95 > median else 0.0
+        return rng.lognormvariate(math.log(median), sigma)
+
+
+@dataclass
+class StubStats:
+    """Counters for a stub run."""
+
+    requests: int = 0
+    streamed: int = 0
+    rate_limited: int = 0
+    overloaded: int = 0
+    output_tokens: int = 0
+    by_model: Counter[str] = field(default_factory=Counter)
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _system_text(system: object) -> tuple[str, bool]:
+    """Flatten ``system`` to text; True when any block carries ``cache_control``."""
+    if isinstance(system, str):
+        return system, False
+    if isinstance(system, list):
+        texts = [b.get("text", "") for b in system if isinstance(b, dict)]
+        cached = any(isinstance(b, dict) and b.get("cache_control") for b in system)
+        return "\n".join(texts), cached
+    return "", False
+
+
+def reply_text(body_digest: str, max_tokens: int, config: StubConfig) -> str:
+    """Deterministic prose for a request, at most *max_tokens* words."""
+    rng = random.Random(body_digest)
+    n_words = min(max(1, max_tokens), rng.randint(config.min_words, config.max_words))
+    sentences: list[str] = []
+    remaining = n_words
+    while remaining > 0:
+        length = min(remaining, rng.randint(8, 16))
+        words = [rng.choice(_WORDS) for _ in range(length)]
+        sentences.append(" ".join(words).capitalize() + ".")
+        remaining -= length
+    return " ".join(sentences)
+
+
+class StubLLM:
+    """Request handler state: config, per-body attempt counters, cache keys, stats."""
+
+    def __init__(self, config: StubConfig | None = None) -> None:
+        self.config = config or StubConfig()
+        self.stats = StubStats()
+        self._attempts: Counter[str] = Counter()
+        self._cached_prefixes: set[str] = set()
+
+    def _usage(self, body: dict, output_tokens: int) -> dict[str, int]:
+        system, cacheable = _system_text(body.get("system"))
+        messages = json.dumps(body.get("messages", []), sort_keys=True)
+        system_tokens = _estimate_tokens(system) if system else 0
+        usage = {
+            "input_tokens": _estimate_tokens(messages),
+            "output_tokens": output_tokens,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0,
+        }
+        if not cacheable:
+            usage["input_tokens"] += system_tokens
+            return usage
+        prefix = hashlib.sha256(system.encode()).hexdigest()
+        if prefix in self._cached_prefixes:
+            usage["cache_read_input_tokens"] = system_tokens
+        else:
+            self._cached_prefixes.add(prefix)
+            usage["cache_creation_input_tokens"] = system_tokens
+        return usage
+
+    def _error(self, status: int, error_type: str) -> Response:
+        return JSONResponse(
+            {"type": "error", "error": {"type": error_type, "message": f"stub {error_type}"}},
+            status_code=status,
+            headers={"retry-after": f"{self.config.retry_after_seconds:g}"},
+        )
+
+    async def messages(self, request: Request) -> Response:
+        raw = await request.body()
+        try:
+            body = json.loads(raw)
+        except ValueError:
+            return self._error(400, "invalid_request_error")
+        # Canonical body without "stream", so a streamed request gets the same
+        # text as the plain one.
+        canonical = {k: v for k, v in body.items() if k != "stream"}
+        digest = hashlib.sha256(json.dumps(canonical, sort_keys=True).encode()).hexdigest()
+        attempt = self._attempts[digest]
+        self._attempts[digest] += 1
+        rng = random.Random(f"{self.config.seed}:{digest}:{attempt}")
+        self.stats.requests += 1
+        model = str(body.get("model", "stub-model"))
+        self.stats.by_model[model] += 1
+
+        fault = rng.random()
+        await asyncio.sleep(self.config.sample_latency_ms(rng) / 1000)
+        if fault < self.config.rate_limit_rate:
+            self.stats.rate_limited += 1
+            return self._error(429, "rate_limit_error")
+        if fault < self.config.rate_limit_rate + self.config.overload_rate:
+            self.stats.overloaded += 1
+            return self._error(529, "overloaded_error")
+
+        text = reply_text(digest, int(body.get("max_tokens", 1024)), self.config)
+        output_tokens = len(text.split())
+        self.stats.output_tokens += output_tokens
+        usage = self._usage(body, output_tokens)
+        message_id = f"msg_stub_{digest[:24]}"
+
+        if body.get("stream"):
+            self.stats.streamed += 1
+            return StreamingResponse(
+                self._stream(message_id, model, text, usage),
+                media_type="text/event-stream",
+            )
+        return JSONResponse(
+            {
+                "id": message_id,
+                "type": "message",
+                "role": "assistant",
+                "model": model,
+                "content": [{"type": "text", "text": text}],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": usage,
+            }
+        )
+
+    async def _stream(
+        self, message_id: str, model: str, text: str, usage: dict[str, int]
+    ) -> AsyncIterator[bytes]:
+        def event(name: str, data: dict) -> bytes:
+            return f"event: {name}\ndata: {json.dumps(data)}\n\n".encode()
+
+        yield event(
+            "message_start",
+            {
+                "type": "message_start",
+                "message": {
+                    "id": message_id,
+                    "type": "message",
+                    "role": "assistant",
+                    "model": model,
+                    "content": [],
+                    "stop_reason": None,
+                    "stop_sequence": None,
+                    "usage": {**usage, "output_tokens": 1},
+                },
+            },
+        )
+        yield event(
+            "content_block_start",
+            {
+                "type": "content_block_start",
+                "index": 0,
+                "content_block": {"type": "text", "text": ""},
+            },
+        )
+        words = text.split(" ")
+        chunk = 4
+        tokens_per_second = self.config.stream_tokens_per_second
+        delay = chunk / tokens_per_second if tokens_per_second > 0 else 0.0
+        for i in range(0, len(words), chunk):
+            piece = " ".join(words[i : i + chunk])
+            if i + chunk < len(words):
+                piece += " "
+            yield event(
+                "content_block_delta",
+                {
+                    "type": "content_block_delta",
+                    "index": 0,
+                    "delta": {"type": "text_delta", "text": piece},
+                },
+            )
+            if delay:
+                await asyncio.sleep(delay)
+        yield event("content_block_stop", {"type": "content_block_stop", "index": 0})
+        yield event(
+            "message_delta",
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                "usage": {"output_tokens": usage["output_tokens"]},
+            },
+        )
+        yield event("message_stop", {"type": "message_stop"})
+
+
+def create_stub_app(stub: StubLLM) -> Starlette:
+    """ASGI app serving *stub* at ``POST /v1/messages``."""
+    return Starlette(routes=[Route("/v1/messages", stub.messages, methods=["POST"])])
+
+
+@asynccontextmanager
+async def serve_stub(
+    config: StubConfig | None = None, host: str = "127.0.0.1", port: int = 0
+) -> AsyncIterator[tuple[str, StubLLM]]:
+    """Run the stub on a uvicorn server for the duration of the block.
+
+    Yields ``(base_url, stub)``; ``port=0`` picks a free port.
+    """
+    import uvicorn
+
+    stub = StubLLM(config)
+    server = uvicorn.Server(
+        uvicorn.Config(create_stub_app(stub), host=host, port=port, log_level="warning")
+    )
+    task = asyncio.create_task(server.serve())
+    try:
+        while not server.started:
+            if task.done():
+                task.result()  # surface bind errors
+            await asyncio.sleep(0.01)
+        bound_port = server.servers[0].sockets[0].getsockname()[1]
+        yield f"http://{host}:{bound_port}", stub
+    finally:
+        server.should_exit = True
+        await task
+
+
+def add_stub_arguments(parser: argparse.ArgumentParser) -> None:
+    """CLI flags for ``StubConfig`` (shared with the load-test harness)."""
+    defaults = StubConfig()
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default=defaults.latency)
+    parser.add_argument("--latency-p50-ms", type=float, default=defaults.latency_p50_ms)
+    parser.add_argument("--latency-p95-ms", type=float, default=defaults.latency_p95_ms)
+    parser.add_argument("--rate-limit-rate", type=float, default=defaults.rate_limit_rate)
+    parser.add_argument("--overload-rate", type=float, default=defaults.overload_rate)
+    parser.add_argument(
+        "--retry-after-seconds", type=float, default=defaults.retry_after_seconds
+    )
+    parser.add_argument(
+        "--stream-tokens-per-second", type=float, default=defaults.stream_tokens_per_second
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def stub_config_from_args(args: argparse.Namespace) -> StubConfig:
+    return StubConfig(
+        latency=args.latency,
+        latency_p50_ms=args.latency_p50_ms,
+        latency_p95_ms=args.latency_p95_ms,
+        rate_limit_rate=args.rate_limit_rate,
+        overload_rate=args.overload_rate,
+        retry_after_seconds=args.retry_after_seconds,
+        stream_tokens_per_second=args.stream_tokens_per_second,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Anthropic-compatible stub LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+    stub = StubLLM(stub_config_from_args(args))
+    print(f"Stub LLM listening on http://{args.host}:{args.port} — set PINWHEEL_AI_BASE_URL")
+    uvicorn.run(create_stub_app(stub), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
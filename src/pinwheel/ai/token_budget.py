@@ -0,0 +1,183 @@
+"""Token estimation and per-call-type context budgets.
+
+Context builders (``commentary._build_game_context``,
+``report.build_system_context``, ``report.compute_private_report_context``)
+grow all season: every rule change, streak and vote adds lines.  This
+module keeps each call's variable context under a target size:
+
+* **Estimation** — ``estimate_tokens`` approximates Claude's tokenizer
+  locally (words, number groups, punctuation, indentation runs).  It is
+  deterministic and within ~15% on our prompts, which is all a budget needs.
+* **Budgets** — ``CALL_BUDGETS`` gives, per call type, the target size of
+  the per-round context a builder contributes to the user message (the
+  cached system layers are not counted), like ``CALL_PROFILES`` does for
+  timeouts.
+* **Priorities** — text is split into named ``Section``s, dict context into
+  keys, each with a priority (``REQUIRED`` is never trimmed; higher numbers
+  go first).  Trimming is deterministic: lowest priority first, later
+  sections before earlier ones at equal priority.  For dict context, long
+  lists are first cut to their most recent ``LIST_FLOOR`` entries before
+  whole keys are dropped.
+
+Every trim is logged (``context_trimmed``) with the sections it removed.
+
+Usage:
+    text = fit_sections([Section("box_scores", box, 1), ...], "commentary")
+    data = fit_mapping(data, PRIVATE_CONTEXT_PRIORITIES, "report.private")
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+REQUIRED = 0
+LIST_FLOOR = 5
+
+CALL_BUDGETS: dict[str, int] = {
+    "commentary": 2500,
+    "report.simulation": 6000,
+    "report.governance": 6000,
+    "report.private": 3000,
+}
+DEFAULT_BUDGET = 4000
+
+# Letter runs, number groups (Claude splits long numbers into ~3 digits),
+# newline + indentation runs, and single punctuation marks. A space before
+# a word merges into the word's token, so bare spaces are not counted.
+_TOKEN_RE = re.compile(r"[^\W\d_]+|\d{1,3}|\n[ \t]*|[^\w\s]|_")
+_CHARS_PER_WORD_TOKEN = 6
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate Claude token count for *text*."""
+    count = 0
+    for match in _TOKEN_RE.finditer(text):
+        piece = match.group()
+        if piece[0].isalpha():
+            count += 1 + (len(piece) - 1) // _CHARS_PER_WORD_TOKEN
+        else:
+            count += 1
+    return count
+
+
+def budget_for(call_type: str) -> int:
+    """Target input tokens for *call_type*'s variable context."""
+    return CALL_BUDGETS.get(call_type, DEFAULT_BUDGET)
+
+
+@dataclass(frozen=True)
+class Section:
+    """A named block of prompt text with a trim priority (``REQUIRED`` = keep)."""
+
+    name: str
+    text: str
+    priority: int = REQUIRED
+
+
+def _log_trim(call_type: str, budget: int, before: int, after: int, trimmed: list[str]) -> None:
+    logger.info(
+        "context_trimmed call_type=%s budget=%d tokens_before=%d tokens_after=%d trimmed=%s",
+        call_type,
+        budget,
+        before,
+        after,
+        ",".join(trimmed),
+    )
+
+
+def fit_sections(
+    sections: list[Section],
+    call_type: str,
+    *,
+    budget: int | None = None,
+    fixed_tokens: int = 0,
+    separator: str = "\n",
+) -> str:
+    """Join *sections*, dropping low-priority ones until the text fits.
+
+    *fixed_tokens* accounts for prompt text outside the sections.  Required
+    sections are always kept, even if they alone exceed the budget.
+    """
+    limit = (budget if budget is not None else budget_for(call_type)) - fixed_tokens
+    kept = [s for s in sections if s.text]
+    costs = {id(s): estimate_tokens(s.text) + 1 for s in kept}
+    before = total = sum(costs.values())
+    if total <= limit:
+        return separator.join(s.text for s in kept)
+
+    order = sorted(
+        (i for i, s in enumerate(kept) if s.priority != REQUIRED),
+        key=lambda i: (-kept[i].priority, -i),
+    )
+    dropped: set[int] = set()
+    for i in order:
+        if total <= limit:
+            break
+        dropped.add(i)
+        total -= costs[id(kept[i])]
+
+    _log_trim(
+        call_type,
+        limit + fixed_tokens,
+        before,
+        total,
+        [kept[i].name for i in sorted(dropped)],
+    )
+    return separator.join(s.text for i, s in enumerate(kept) if i not in dropped)
+
+
+def _json_tokens(value: object) -> int:
+    return estimate_tokens(json.dumps(value, indent=2, default=str))
+
+
+def fit_mapping(
+    data: Mapping[str, object],
+    priorities: Mapping[str, int],
+    call_type: str,
+    *,
+    budget: int | None = None,
+    fixed_tokens: int = 0,
+    measure: Callable[[object], int] = _json_tokens,
+) -> dict[str, object]:
+    """Return a copy of *data* trimmed to fit the call type's budget.
+
+    Keys missing from *priorities* are required.  Lists are first cut to
+    their last ``LIST_FLOOR`` entries, then whole keys are dropped, both in
+    trim order.  *measure* sizes the rendered value (indented JSON).
+    """
+    limit = (budget if budget is not None else budget_for(call_type)) - fixed_tokens
+    result = dict(data)
+    before = total = measure(result)
+    if total <= limit:
+        return result
+
+    keys = list(result)
+    order = sorted(
+        (k for k in keys if priorities.get(k, REQUIRED) != REQUIRED),
+        key=lambda k: (-priorities[k], -keys.index(k)),
+    )
+    trimmed: list[str] = []
+    for key in order:
+        if total <= limit:
+            break
+        value = result[key]
+        if isinstance(value, list) and len(value) > LIST_FLOOR:
+            result[key] = value[-LIST_FLOOR:]
+            trimmed.append(f"{key}[-{LIST_FLOOR}:]")
+            total = measure(result)
+    for key in order:
+        if total <= limit:
+            break
+        del result[key]
+        trimmed = [t for t in trimmed if not t.startswith(f"{key}[")]
+        trimmed.append(key)
+        total = measure(result)
+
+    _log_trim(call_type, limit + fixed_tokens, before, total, trimmed)
+    return result
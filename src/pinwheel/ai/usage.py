@@ -1,8 +1,16 @@
 """AI usage tracking — record token counts and costs for every API call.
 
-Provides ``record_ai_usage()`` which inserts an ``AIUsageLogRow`` into the
-database. All AI call sites (report, commentary, interpreter, classifier)
-call this after each Anthropic API response.
+Provides ``record_ai_usage()`` which records an ``AIUsageLogRow``. All AI
+call sites (report, commentary, interpreter, classifier) call this after
+each Anthropic API response.
+
+While the app is running, rows go to ``usage_recorder`` — an in-memory
+buffer drained by a background task that bulk-inserts in its own short
+transaction — so usage bookkeeping never extends the caller's (possibly
+round-writing) transaction. Without a running recorder (scripts, tests)
+the row is added to the caller's session as before. Every call also feeds
+``usage_recorder.aggregates``, the in-process rolling totals shown live on
+``/admin/costs``.
 
 Also provides helpers for Messages API features:
 - ``cacheable_system()`` — wrap a system prompt for prompt caching
@@ -15,10 +23,14 @@ its rates.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy.exc import SQLAlchemyError
@@ -27,7 +39,7 @@ from pinwheel.db.models import AIUsageLogRow
 
 if TYPE_CHECKING:
     from pydantic import BaseModel
-    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 logger = logging.getLogger(__name__)
 
@@ -91,9 +103,208 @@ def compute_cost(
     return round(cost, 8)
 
 
+def cache_hit_rate(
+    input_tokens: int, cache_read_tokens: int, cache_creation_tokens: int = 0
+) -> float:
+    """Share of prompt tokens served from the prompt cache (0.0-1.0).
+
+    ``input_tokens`` excludes cached tokens, so the denominator is every
+    prompt token: uncached input, cache reads and cache writes.
+    """
+    total = input_tokens + cache_read_tokens + cache_creation_tokens
+    return cache_read_tokens / total if total else 0.0
+
+
+# ---------------------------------------------------------------------------
+# Buffered recorder
+# ---------------------------------------------------------------------------
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 2.0
+DEFAULT_BATCH_SIZE = 100
+MAX_BUFFERED_ROWS = 10_000
+AGGREGATE_WINDOW_MINUTES = 60
+
+
+@dataclass
+class UsageTotals:
+    """Summed usage for one call type."""
+
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    cost_usd: float = 0.0
+    latency_ms: float = 0.0
+
+    def add(self, row: AIUsageLogRow) -> None:
+        self.calls += 1
+        self.input_tokens += row.input_tokens
+        self.output_tokens += row.output_tokens
+        self.cache_read_tokens += row.cache_read_tokens
+        self.cache_creation_tokens += row.cache_creation_tokens
+        self.cost_usd += row.cost_usd
+        self.latency_ms += row.latency_ms
+
+    def merge(self, other: UsageTotals) -> None:
+        self.calls += other.calls
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cache_read_tokens += other.cache_read_tokens
+        self.cache_creation_tokens += other.cache_creation_tokens
+        self.cost_usd += other.cost_usd
+        self.latency_ms += other.latency_ms
+
+    @property
+    def cache_hit_rate(self) -> float:
+        return cache_hit_rate(
+            self.input_tokens, self.cache_read_tokens, self.cache_creation_tokens
+        )
+
+
+class UsageAggregates:
+    """Rolling per-call-type totals over the last ``window_minutes`` (per-minute buckets)."""
+
+    def __init__(self, window_minutes: int = AGGREGATE_WINDOW_MINUTES) -> None:
+        self.window_minutes = window_minutes
+        self._buckets: dict[int, dict[str, UsageTotals]] = {}
+
+    def add(self, row: AIUsageLogRow, now: float | None = None) -> None:
+        minute = int((now if now is not None else time.time()) // 60)
+        bucket = self._buckets.setdefault(minute, {})
+        bucket.setdefault(row.call_type, UsageTotals()).add(row)
+        self._prune(minute)
+
+    def _prune(self, current_minute: int) -> None:
+        oldest = current_minute - self.window_minutes + 1
+        for minute in [m for m in self._buckets if m < oldest]:
+            del self._buckets[minute]
+
+    def snapshot(self, now: float | None = None) -> dict[str, UsageTotals]:
+        """Totals per call type within the window."""
+        self._prune(int((now if now is not None else time.time()) // 60))
+        totals: dict[str, UsageTotals] = {}
+        for bucket in self._buckets.values():
+            for call_type, usage in bucket.items():
+                totals.setdefault(call_type, UsageTotals()).merge(usage)
+        return totals
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+
+# Copied when a failed batch is re-buffered (the originals belong to a dead session).
+_USAGE_COLUMNS = (
+    "id",
+    "call_type",
+    "model",
+    "input_tokens",
+    "output_tokens",
+    "cache_read_tokens",
+    "cache_creation_tokens",
+    "latency_ms",
+    "cost_usd",
+    "season_id",
+    "round_number",
+    "created_at",
+)
+
+
+class UsageRecorder:
+    """Buffers usage rows and bulk-inserts them off the request path.
+
+    ``start(engine)`` launches the drain task; rows are written every
+    ``flush_interval`` seconds, or sooner once ``batch_size`` are pending.
+    ``stop()`` cancels the task and flushes whatever is left.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.aggregates = UsageAggregates()
+        self._engine: AsyncEngine | None = None
+        self._buffer: list[AIUsageLogRow] = []
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def start(self, engine: AsyncEngine, flush_interval: float | None = None) -> None:
+        """Begin buffering; rows are written through *engine*."""
+        if flush_interval is not None:
+            self.flush_interval = flush_interval
+        self._engine = engine
+        self._wake = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._drain_loop())
+
+    def enqueue(self, row: AIUsageLogRow) -> None:
+        if len(self._buffer) >= MAX_BUFFERED_ROWS:
+            logger.warning("ai_usage_buffer_full dropped call_type=%s", row.call_type)
+            return
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size and self._wake is not None:
+            self._wake.set()
+
+    async def _drain_loop(self) -> None:
+        assert self._wake is not None
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception:  # Last-resort handler — the drain task must outlive any bad batch
+                logger.exception("ai_usage_drain_failed")
+
+    async def flush(self) -> int:
+        """Write every buffered row in one transaction. Returns the number written."""
+        if not self._buffer or self._engine is None:
+            return 0
+        from pinwheel.db.engine import get_session
+
+        rows, self._buffer = self._buffer, []
+        try:
+            async with get_session(self._engine) as session:
+                session.add_all(rows)
+        except SQLAlchemyError:
+            # Usage logging should never break anything; retry with the next batch.
+            logger.warning("ai_usage_flush_failed rows=%d", len(rows), exc_info=True)
+            room = MAX_BUFFERED_ROWS - len(self._buffer)
+            self._buffer[:0] = [
+                AIUsageLogRow(**{c: v for c in _USAGE_COLUMNS if (v := getattr(r, c)) is not None})
+                for r in rows[:room]
+            ]
+            return 0
+        return len(rows)
+
+    async def stop(self) -> None:
+        """Cancel the drain task and flush remaining rows (app shutdown)."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.flush()
+        self._engine = None
+        self._wake = None
+
+
+usage_recorder = UsageRecorder()
+
+
 async def record_ai_usage(
     *,
-    session: AsyncSession,
+    session: AsyncSession | None = None,
     call_type: str,
     model: str,
     input_tokens: int,
@@ -108,8 +319,9 @@ async def record_ai_usage(
 
     Parameters
     ----------
-    session : AsyncSession
-        The SQLAlchemy async session to use for the insert.
+    session : AsyncSession or None
+        Caller's session, used for the insert only when the buffered
+        recorder is not running.
     call_type : str
         Identifier for the call site, e.g. "report.simulation",
         "commentary.game", "interpreter.v2", "classifier".
@@ -127,7 +339,7 @@ async def record_ai_usage(
     Returns
     -------
     AIUsageLogRow
-        The inserted row.
+        The recorded row (not yet persisted when buffered).
     """
     cost = compute_cost(
         model, input_tokens, output_tokens, cache_read_tokens, cache_creation_tokens
@@ -161,7 +373,15 @@ async def record_ai_usage(
         cost_usd=cost,
         season_id=season_id,
         round_number=round_number,
+        # Set now, not at insert time — buffered rows are written later.
+        created_at=datetime.now(UTC),
     )
+    usage_recorder.aggregates.add(row)
+    if usage_recorder.running:
+        usage_recorder.enqueue(row)
+        return row
+    if session is None:
+        return row
     session.add(row)
     try:
         await session.flush()
@@ -8,18 +8,17 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy import func, select
 
-from pinwheel.ai.usage import PRICING
+from pinwheel.ai.usage import PRICING, cache_hit_rate, usage_recorder
 from pinwheel.api.deps import RepoDep
+from pinwheel.api.static_assets import make_templates
 from pinwheel.auth.deps import OptionalUser, admin_auth_context, check_admin_access
-from pinwheel.config import PROJECT_ROOT
 from pinwheel.db.models import AIUsageLogRow
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
-templates = Jinja2Templates(directory=str(PROJECT_ROOT / "templates"))
+templates = make_templates()
 
 
 async def _get_active_season_id(repo: RepoDep) -> str | None:
@@ -49,6 +48,7 @@ async def costs_dashboard(
     total_input_tokens = 0
     total_output_tokens = 0
     total_cache_read_tokens = 0
+    total_cache_creation_tokens = 0
     total_cost = 0.0
     avg_latency = 0.0
 
@@ -60,6 +60,7 @@ async def costs_dashboard(
             func.coalesce(func.sum(AIUsageLogRow.cache_read_tokens), 0),
             func.coalesce(func.sum(AIUsageLogRow.cost_usd), 0.0),
             func.coalesce(func.avg(AIUsageLogRow.latency_ms), 0.0),
+            func.coalesce(func.sum(AIUsageLogRow.cache_creation_tokens), 0),
         ).where(AIUsageLogRow.season_id == season_id)
         result = await session.execute(stmt)
         row = result.one()
@@ -69,6 +70,7 @@ async def costs_dashboard(
         total_cache_read_tokens = row[3] or 0
         total_cost = float(row[4] or 0.0)
         avg_latency = float(row[5] or 0.0)
+        total_cache_creation_tokens = row[6] or 0
 
     # --- Per-caller breakdown ---
     by_caller: list[dict] = []
@@ -82,6 +84,7 @@ async def costs_dashboard(
                 func.coalesce(func.sum(AIUsageLogRow.cache_read_tokens), 0),
                 func.coalesce(func.sum(AIUsageLogRow.cost_usd), 0.0),
                 func.coalesce(func.avg(AIUsageLogRow.latency_ms), 0.0),
+                func.coalesce(func.sum(AIUsageLogRow.cache_creation_tokens), 0),
             )
             .where(AIUsageLogRow.season_id == season_id)
             .group_by(AIUsageLogRow.call_type)
@@ -98,6 +101,7 @@ async def costs_dashboard(
                     "cache_read_tokens": row[4],
                     "cost_usd": float(row[5]),
                     "avg_latency_ms": round(float(row[6]), 1),
+                    "cache_hit_rate": cache_hit_rate(row[2], row[4], row[7]),
                 }
             )
 
@@ -137,9 +141,24 @@ async def costs_dashboard(
         avg_cost_per_round = total_cost / len(by_round)
 
     # --- Cache hit rate ---
-    cache_hit_rate = 0.0
-    if total_input_tokens > 0:
-        cache_hit_rate = total_cache_read_tokens / (total_input_tokens + total_cache_read_tokens)
+    overall_hit_rate = cache_hit_rate(
+        total_input_tokens, total_cache_read_tokens, total_cache_creation_tokens
+    )
+
+    # --- Live rolling totals (this process; includes rows not yet flushed) ---
+    live = usage_recorder.aggregates.snapshot()
+    live_by_caller = [
+        {
+            "call_type": call_type,
+            "count": totals.calls,
+            "input_tokens": totals.input_tokens,
+            "output_tokens": totals.output_tokens,
+            "cost_usd": totals.cost_usd,
+            "avg_latency_ms": round(totals.latency_ms / totals.calls, 1) if totals.calls else 0.0,
+            "cache_hit_rate": totals.cache_hit_rate,
+        }
+        for call_type, totals in sorted(live.items(), key=lambda kv: -kv[1].cost_usd)
+    ]
 
     # --- Pricing reference ---
     pricing_ref = [{"model": model, **rates} for model, rates in PRICING.items()]
@@ -157,10 +176,13 @@ async def costs_dashboard(
             "total_cost": total_cost,
             "avg_latency": round(avg_latency, 1),
             "avg_cost_per_round": avg_cost_per_round,
-            "cache_hit_rate": cache_hit_rate,
+            "cache_hit_rate": overall_hit_rate,
             "by_caller": by_caller,
             "by_round": by_round,
             "pricing_ref": pricing_ref,
+            "live_by_caller": live_by_caller,
+            "live_window_minutes": usage_recorder.aggregates.window_minutes,
+            "usage_pending": usage_recorder.pending,
             **admin_auth_context(request, current_user),
         },
     )
@@ -17,12 +17,12 @@ import time
 
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy import func, select
 
 from pinwheel.api.deps import RepoDep
+from pinwheel.api.static_assets import make_templates
 from pinwheel.auth.deps import OptionalUser, admin_auth_context, check_admin_access
-from pinwheel.config import PROJECT_ROOT, Settings
+from pinwheel.config import Settings
 from pinwheel.db.models import (
     AIUsageLogRow,
     GameResultRow,
@@ -33,7 +33,7 @@ from pinwheel.db.models import (
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
-templates = Jinja2Templates(directory=str(PROJECT_ROOT / "templates"))
+templates = make_templates()
 
 # Store app startup time for uptime calculation.
 _APP_START_TIME = time.monotonic()
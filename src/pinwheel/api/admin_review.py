@@ -9,15 +9,14 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from pinwheel.api.deps import RepoDep
+from pinwheel.api.static_assets import make_templates
 from pinwheel.auth.deps import OptionalUser, admin_auth_context, check_admin_access
-from pinwheel.config import PROJECT_ROOT
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
-templates = Jinja2Templates(directory=str(PROJECT_ROOT / "templates"))
+templates = make_templates()
 
 
 async def _get_active_season_id(repo: RepoDep) -> str | None:
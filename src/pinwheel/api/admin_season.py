@@ -8,18 +8,17 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy import func as sa_func
 from sqlalchemy import select
 
 from pinwheel.api.deps import RepoDep
+from pinwheel.api.static_assets import make_templates
 from pinwheel.auth.deps import OptionalUser, admin_auth_context, check_admin_access
-from pinwheel.config import PROJECT_ROOT
 from pinwheel.db.models import GameResultRow, TeamRow
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
-templates = Jinja2Templates(directory=str(PROJECT_ROOT / "templates"))
+templates = make_templates()
 
 
 @router.get("/season", response_class=HTMLResponse)
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import math
 
+from pinwheel.db.models import HOOPER_SEASON_TOTALS
 from pinwheel.models.constants import ATTRIBUTE_ORDER  # noqa: F401 — re-exported for callers
 
 __all__ = ["ATTRIBUTE_ORDER"]
@@ -135,26 +136,39 @@ def compute_season_averages(
     if not box_scores:
         return {}
 
-    games = len(box_scores)
-    total_pts = sum(bs.get("points", 0) for bs in box_scores)
-    total_ast = sum(bs.get("assists", 0) for bs in box_scores)
-    total_stl = sum(bs.get("steals", 0) for bs in box_scores)
-    total_to = sum(bs.get("turnovers", 0) for bs in box_scores)
+    totals = {key: sum(bs.get(key, 0) for bs in box_scores) for key in HOOPER_SEASON_TOTALS}
+    return season_averages_from_totals(totals, len(box_scores))
 
-    total_fgm = sum(bs.get("field_goals_made", 0) for bs in box_scores)
-    total_fga = sum(bs.get("field_goals_attempted", 0) for bs in box_scores)
-    total_3pm = sum(bs.get("three_pointers_made", 0) for bs in box_scores)
-    total_3pa = sum(bs.get("three_pointers_attempted", 0) for bs in box_scores)
-    total_ftm = sum(bs.get("free_throws_made", 0) for bs in box_scores)
-    total_fta = sum(bs.get("free_throws_attempted", 0) for bs in box_scores)
+
+def season_averages_from_totals(
+    totals: dict[str, int],
+    games: int,
+) -> dict[str, float | int]:
+    """Season averages from stat totals over *games* games.
+
+    Same keys and output as ``compute_season_averages``; used with the
+    per-season aggregate rows so callers needn't load every box score.
+    """
+    if games <= 0:
+        return {}
+
+    total_fga = totals.get("field_goals_attempted", 0)
+    total_3pa = totals.get("three_pointers_attempted", 0)
+    total_fta = totals.get("free_throws_attempted", 0)
 
     return {
-        "ppg": round(total_pts / games, 1),
-        "apg": round(total_ast / games, 1),
-        "spg": round(total_stl / games, 1),
-        "topg": round(total_to / games, 1),
-        "fg_pct": round(100 * total_fgm / total_fga, 1) if total_fga else 0.0,
-        "three_pct": round(100 * total_3pm / total_3pa, 1) if total_3pa else 0.0,
-        "ft_pct": round(100 * total_ftm / total_fta, 1) if total_fta else 0.0,
+        "ppg": round(totals.get("points", 0) / games, 1),
+        "apg": round(totals.get("assists", 0) / games, 1),
+        "spg": round(totals.get("steals", 0) / games, 1),
+        "topg": round(totals.get("turnovers", 0) / games, 1),
+        "fg_pct": round(100 * totals.get("field_goals_made", 0) / total_fga, 1)
+        if total_fga
+        else 0.0,
+        "three_pct": round(100 * totals.get("three_pointers_made", 0) / total_3pa, 1)
+        if total_3pa
+        else 0.0,
+        "ft_pct": round(100 * totals.get("free_throws_made", 0) / total_fta, 1)
+        if total_fta
+        else 0.0,
         "games_played": games,
     }
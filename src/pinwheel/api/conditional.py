@@ -0,0 +1,83 @@
+"""Conditional GET support (ETag / If-None-Match) for the JSON API.
+
+Polling clients and bots re-request boxscores, standings and rule histories
+that rarely change.  Each route derives a weak ETag from a *cheap version
+marker* — a game's ``created_at``, a season's latest governance
+``sequence_number``, a list of report IDs — and checks ``If-None-Match``
+before running its real queries.  A match short-circuits to ``304 Not
+Modified`` with no body.
+
+Routes whose data has no cheap marker (small, rarely-changing payloads) hash
+the serialized payload instead: the query still runs, but the transfer and
+client-side parsing are skipped.
+
+Usage:
+    not_modified = check_etag(request, response, (season_id, seq), CACHE_GOVERNANCE)
+    if not_modified is not None:
+        return not_modified
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from fastapi import Request, Response
+
+# Bump to invalidate every outstanding ETag when response shapes change.
+ETAG_SCHEMA_VERSION = 1
+
+# Cache-Control per route family.
+CACHE_IMMUTABLE = "public, max-age=86400"  # stored game results never change
+CACHE_TEAMS = "public, max-age=60"
+CACHE_ROUND = "public, max-age=15, must-revalidate"  # changes once per round
+CACHE_GOVERNANCE = "public, max-age=5, must-revalidate"  # changes on any vote
+CACHE_PRIVATE = "private, no-cache"
+
+
+def compute_etag(*parts: object) -> str:
+    """Build a weak ETag from arbitrary version-marker parts."""
+    raw = repr((ETAG_SCHEMA_VERSION, *parts)).encode()
+    return f'W/"{hashlib.sha256(raw).hexdigest()[:24]}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against *etag*."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == target for candidate in if_none_match.split(",")
+    )
+
+
+def check_etag(
+    request: Request,
+    response: Response,
+    version: tuple,
+    cache_control: str,
+) -> Response | None:
+    """Set ETag/Cache-Control on *response*; return a 304 if the client is current.
+
+    The ETag covers the request path and query string, so one marker can be
+    shared by several routes without collisions.
+    """
+    etag = compute_etag(request.url.path, str(request.url.query), *version)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+def check_payload_etag(
+    request: Request,
+    response: Response,
+    payload: object,
+    cache_control: str,
+) -> Response | None:
+    """Like ``check_etag`` but versioned by a hash of the response payload."""
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+    return check_etag(request, response, (digest,), cache_control)
@@ -37,6 +37,7 @@ ALLOWED_EVENT_TYPES: frozenset[str] = frozenset(
     {
         # Game lifecycle
         "game.completed",
+        "game.commentary",
         # Round lifecycle
         "round.completed",
         # Season lifecycle
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
+from pinwheel.api.conditional import CACHE_IMMUTABLE, CACHE_ROUND, check_etag
 from pinwheel.api.deps import RepoDep
 from pinwheel.core.scheduler import compute_standings
 
@@ -219,19 +220,42 @@ async def _build_bracket_data(repo: RepoDep) -> dict:
     }
 
 
-@router.get("/playoffs/bracket")
-async def get_playoff_bracket(repo: RepoDep) -> dict:
+@router.get("/playoffs/bracket", response_model=None)
+async def get_playoff_bracket(
+    request: Request, response: Response, repo: RepoDep
+) -> dict | Response:
     """Get structured playoff bracket data.
 
     Returns bracket with semifinals, finals, series records, and champion.
     """
+    season_row = await repo.get_active_season()
+    version: tuple = (None,)
+    if season_row:
+        version = (
+            season_row.id,
+            season_row.status,
+            *await repo.get_games_version(season_row.id),
+        )
+    not_modified = check_etag(request, response, version, CACHE_ROUND)
+    if not_modified is not None:
+        return not_modified
+
     bracket = await _build_bracket_data(repo)
     return {"data": bracket}
 
 
-@router.get("/{game_id}")
-async def get_game(game_id: str, repo: RepoDep) -> dict:
+@router.get("/{game_id}", response_model=None)
+async def get_game(
+    game_id: str, request: Request, response: Response, repo: RepoDep
+) -> dict | Response:
     """Get a game result by ID."""
+    created_at = await repo.get_game_created_at(game_id)
+    if created_at is None:
+        raise HTTPException(404, "Game not found")
+    not_modified = check_etag(request, response, (game_id, created_at), CACHE_IMMUTABLE)
+    if not_modified is not None:
+        return not_modified
+
     game = await repo.get_game_result(game_id)
     if not game:
         raise HTTPException(404, "Game not found")
@@ -251,9 +275,18 @@ async def get_game(game_id: str, repo: RepoDep) -> dict:
     }
 
 
-@router.get("/{game_id}/boxscore")
-async def get_boxscore(game_id: str, repo: RepoDep) -> dict:
+@router.get("/{game_id}/boxscore", response_model=None)
+async def get_boxscore(
+    game_id: str, request: Request, response: Response, repo: RepoDep
+) -> dict | Response:
     """Get box scores for a game."""
+    created_at = await repo.get_game_created_at(game_id)
+    if created_at is None:
+        raise HTTPException(404, "Game not found")
+    not_modified = check_etag(request, response, (game_id, created_at), CACHE_IMMUTABLE)
+    if not_modified is not None:
+        return not_modified
+
     game = await repo.get_game_result(game_id)
     if not game:
         raise HTTPException(404, "Game not found")
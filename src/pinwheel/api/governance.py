@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
+from pinwheel.api.conditional import CACHE_GOVERNANCE, check_etag, check_payload_etag
 from pinwheel.api.deps import RepoDep
 from pinwheel.models.governance import Proposal
 from pinwheel.models.rules import RuleSet
@@ -14,9 +15,16 @@ router = APIRouter(prefix="/api/governance", tags=["governance"])
 # --- Endpoints ---
 
 
-@router.get("/proposals")
-async def api_list_proposals(season_id: str, repo: RepoDep) -> dict:
+@router.get("/proposals", response_model=None)
+async def api_list_proposals(
+    season_id: str, request: Request, response: Response, repo: RepoDep
+) -> dict | Response:
     """List all proposals for a season."""
+    seq = await repo.get_latest_event_sequence(season_id)
+    not_modified = check_etag(request, response, (season_id, seq), CACHE_GOVERNANCE)
+    if not_modified is not None:
+        return not_modified
+
     events = await repo.get_events_by_type(
         season_id=season_id,
         event_types=["proposal.submitted"],
@@ -29,8 +37,10 @@ async def api_list_proposals(season_id: str, repo: RepoDep) -> dict:
     return {"data": [p.model_dump(mode="json") for p in proposals]}
 
 
-@router.get("/rules/current")
-async def api_current_rules(season_id: str, repo: RepoDep) -> dict:
+@router.get("/rules/current", response_model=None)
+async def api_current_rules(
+    season_id: str, request: Request, response: Response, repo: RepoDep
+) -> dict | Response:
     """Get the current ruleset for a season."""
     season = await repo.get_season(season_id)
     if not season:
@@ -47,17 +57,26 @@ async def api_current_rules(season_id: str, repo: RepoDep) -> dict:
         if current != default:
             changes[param] = {"current": current, "default": default}
 
-    return {
+    payload = {
         "data": {
             "ruleset": ruleset.model_dump(),
             "changes_from_default": changes,
         }
     }
+    not_modified = check_payload_etag(request, response, payload, CACHE_GOVERNANCE)
+    return not_modified if not_modified is not None else payload
 
 
-@router.get("/rules/history")
-async def api_rule_history(season_id: str, repo: RepoDep) -> dict:
+@router.get("/rules/history", response_model=None)
+async def api_rule_history(
+    season_id: str, request: Request, response: Response, repo: RepoDep
+) -> dict | Response:
     """Get all rule changes for a season."""
+    seq = await repo.get_latest_event_sequence(season_id)
+    not_modified = check_etag(request, response, (season_id, seq), CACHE_GOVERNANCE)
+    if not_modified is not None:
+        return not_modified
+
     events = await repo.get_events_by_type(
         season_id=season_id,
         event_types=["rule.enacted"],
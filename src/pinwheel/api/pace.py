@@ -123,6 +123,8 @@ async def advance_round(
             presentation_mode="replay",
             game_interval_seconds=game_gap_seconds,
             quarter_replay_seconds=quarter_seconds,
+            presentation_tick_seconds=settings.pinwheel_presentation_tick_seconds,
+            defer_evals=settings.pinwheel_eval_jobs,
         )
     )
 
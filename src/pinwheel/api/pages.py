@@ -2,20 +2,34 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from typing import TYPE_CHECKING
+
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
+from jinja2 import Template
+from markupsafe import Markup
 
 from pinwheel.api.charts import (
     axis_lines,
     compute_grid_rings,
     compute_season_averages,
     polygon_points,
+    season_averages_from_totals,
     spider_chart_data,
 )
 from pinwheel.api.deps import RepoDep
+from pinwheel.api.static_assets import make_templates
 from pinwheel.auth.deps import OptionalUser, SessionUser
-from pinwheel.config import APP_VERSION, PROJECT_ROOT, Settings
+from pinwheel.config import APP_VERSION, Settings
+from pinwheel.core.fragment_cache import fragment_cache
+from pinwheel.core.governance import get_proposal_effects_v2
+from pinwheel.core.impact_preview import (
+    candidate_rules,
+    impact_previews,
+    load_scenario,
+    previewable,
+)
 from pinwheel.core.narrate import (
     extract_event_context,
     narrate_event,
@@ -35,9 +49,13 @@ from pinwheel.core.schedule_times import (
     group_into_slots,
 )
 from pinwheel.core.scheduler import compute_standings
-from pinwheel.models.governance import Proposal
+from pinwheel.db.models import HOOPER_SEASON_TOTALS
+from pinwheel.models.governance import EffectSpec, Proposal, RuleInterpretation
 from pinwheel.models.rules import DEFAULT_RULESET, RuleSet
 
+if TYPE_CHECKING:
+    from pinwheel.db.models import BoxScoreRow, HooperRow, SeasonRow, TeamRow
+
 router = APIRouter(tags=["pages"])
 
 
@@ -64,7 +82,7 @@ def _get_slot_start_times(
         return []
 
 
-templates = Jinja2Templates(directory=str(PROJECT_ROOT / "templates"))
+templates = make_templates()
 
 
 def _light_safe(hex_color: str) -> str:
@@ -112,6 +130,47 @@ def _prose_to_html(text: str) -> str:
 templates.env.filters["prose"] = _prose_to_html
 
 
+# Streaming renders: templates emit ``{{ stream_flush }}`` where the page has a
+# natural break (e.g. after the header and box score) so the browser can
+# start painting before slow sections are rendered.  Outside a streamed
+# render the marker is an inert HTML comment.
+STREAM_FLUSH = Markup("<!--stream-flush-->")
+STREAM_CHUNK_CHARS = 16_384
+templates.env.globals["stream_flush"] = STREAM_FLUSH
+_stream_env = templates.env.overlay(enable_async=True)
+
+
+async def _render_chunks(template: Template, context: dict) -> AsyncIterator[str]:
+    """Render *template* incrementally, flushing at markers and size limits."""
+    buffer: list[str] = []
+    size = 0
+    async for piece in template.generate_async(context):
+        while STREAM_FLUSH in piece:
+            before, piece = piece.split(STREAM_FLUSH, 1)
+            buffer.append(before)
+            yield "".join(buffer)
+            buffer, size = [], 0
+        buffer.append(piece)
+        size += len(piece)
+        if size >= STREAM_CHUNK_CHARS:
+            yield "".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def _stream_template(request: Request, template_name: str, context: dict) -> StreamingResponse:
+    """Streaming counterpart of ``templates.TemplateResponse``.
+
+    Lazy values in *context* (generators) are consumed while the response is
+    being sent, so they must not touch the request's DB session.
+    """
+    return StreamingResponse(
+        _render_chunks(_stream_env.get_template(template_name), {"request": request, **context}),
+        media_type="text/html",
+    )
+
+
 def _auth_context(request: Request, current_user: SessionUser | None) -> dict:
     """Build auth-related template context available on every page."""
     settings = request.app.state.settings
@@ -130,6 +189,25 @@ def _auth_context(request: Request, current_user: SessionUser | None) -> dict:
     }
 
 
+async def _cached_page_context[T](
+    repo: RepoDep,
+    season_id: str | None,
+    template: str,
+    build: Callable[[], Awaitable[T]],
+    variant: tuple = (),
+) -> T:
+    """Serve a page's DB-derived context from the fragment cache.
+
+    Keyed on the season's ``(latest round, presented games)`` marker plus
+    *template* and *variant*; see ``pinwheel.core.fragment_cache``.  Without
+    a season there is nothing to key on, so the context is built directly.
+    """
+    if not season_id:
+        return await build()
+    marker = await repo.get_round_marker(season_id)
+    return await fragment_cache.get_or_build(season_id, marker, template, build, variant)
+
+
 async def _get_active_season_id(repo: RepoDep) -> str | None:
     """Get the active season ID (most recent non-terminal)."""
     row = await repo.get_active_season()
@@ -293,11 +371,9 @@ async def _generate_series_description(
     )
 
     try:
-        import anthropic
-        import httpx
+        from pinwheel.ai.client import get_ai_client
 
-        _timeout = httpx.Timeout(10.0, connect=3.0)
-        client = anthropic.AsyncAnthropic(api_key=api_key, timeout=_timeout)
+        client = get_ai_client(api_key, "series_banner")
         response = await client.messages.create(
             model="claude-haiku-4-5-20251001",
             max_tokens=100,
@@ -705,9 +781,8 @@ def _compute_what_changed(
     return result
 
 
-@router.get("/", response_class=HTMLResponse)
-async def home_page(request: Request, repo: RepoDep, current_user: OptionalUser) -> HTMLResponse:
-    """Home page — living dashboard for the league."""
+async def _build_home_context(request: Request, repo: RepoDep) -> dict:
+    """DB-derived home page context — cached per round by ``_cached_page_context``."""
     season_id, season_name = await _get_active_season(repo)
     latest_report = None
     standings = []
@@ -1070,6 +1145,18 @@ async def home_page(request: Request, repo: RepoDep, current_user: OptionalUser)
         "post_hot_players": post_hot_players,
         "what_changed_signals": what_changed_signals,
     }
+    return ctx
+
+
+@router.get("/", response_class=HTMLResponse)
+async def home_page(request: Request, repo: RepoDep, current_user: OptionalUser) -> HTMLResponse:
+    """Home page — living dashboard for the league."""
+    ctx = await _cached_page_context(
+        repo,
+        await _get_active_season_id(repo),
+        "pages/home.html",
+        lambda: _build_home_context(request, repo),
+    )
     return templates.TemplateResponse(
         request,
         "pages/home.html",
@@ -1088,13 +1175,24 @@ async def what_changed_partial(request: Request, repo: RepoDep) -> HTMLResponse:
     if not season_id:
         return HTMLResponse("")
 
+    html = await _cached_page_context(
+        repo,
+        season_id,
+        "partials/what-changed",
+        lambda: _render_what_changed(repo, season_id),
+    )
+    return HTMLResponse(html)
+
+
+async def _render_what_changed(repo: RepoDep, season_id: str) -> str:
+    """Build the what-changed fragment HTML (empty string when nothing to show)."""
     standings = await _get_standings(repo, season_id)
 
     # Find current round
     current_round = await repo.get_latest_round_number(season_id) or 0
 
     if current_round <= 0:
-        return HTMLResponse("")
+        return ""
 
     season_phase = await _get_season_phase(repo, season_id)
     all_games = await repo.get_all_games(season_id)
@@ -1220,7 +1318,7 @@ async def what_changed_partial(request: Request, repo: RepoDep) -> HTMLResponse:
     )
 
     if not what_changed_signals:
-        return HTMLResponse("")
+        return ""
 
     # Build HTML fragment
     is_fallback = len(what_changed_signals) == 1 and what_changed_signals[0].startswith("Latest:")
@@ -1237,7 +1335,7 @@ async def what_changed_partial(request: Request, repo: RepoDep) -> HTMLResponse:
         ' hx-swap="outerHTML">'
         f"{items_html}</div>"
     )
-    return HTMLResponse(html)
+    return html
 
 
 @router.get("/play", response_class=HTMLResponse)
@@ -1375,6 +1473,60 @@ async def play_page(request: Request, repo: RepoDep, current_user: OptionalUser)
 async def arena_page(request: Request, repo: RepoDep, current_user: OptionalUser) -> HTMLResponse:
     """The Arena — show recent rounds' games (newest first)."""
     season_id = await _get_active_season_id(repo)
+    ctx = await _cached_page_context(
+        repo,
+        season_id,
+        "pages/arena.html",
+        lambda: _build_arena_context(request, repo, season_id),
+    )
+
+    # Build live_round from PresentationState if presentation is active.
+    # Never cached — it changes with every presented possession.
+    from pinwheel.core.presenter import PresentationState
+
+    live_round = None
+    pstate: PresentationState = request.app.state.presentation_state
+    if pstate.is_active and pstate.live_games:
+        live_round = {
+            "round_number": pstate.current_round,
+            "games": [
+                {
+                    "game_index": gs.game_index,
+                    "home_team_name": gs.home_team_name,
+                    "away_team_name": gs.away_team_name,
+                    "home_score": gs.home_score,
+                    "away_score": gs.away_score,
+                    "quarter": gs.quarter,
+                    "game_clock": gs.game_clock,
+                    "status": gs.status,
+                    "recent_plays": gs.recent_plays[-20:],
+                    "home_leader": gs.home_leader,
+                    "away_leader": gs.away_leader,
+                    "home_color": gs.home_team_color,
+                    "home_color2": gs.home_team_color2,
+                    "away_color": gs.away_team_color,
+                    "away_color2": gs.away_team_color2,
+                    "series_context": gs.series_context,
+                }
+                for gs in pstate.live_games.values()
+            ],
+        }
+
+    settings: Settings = request.app.state.settings
+    return templates.TemplateResponse(
+        request,
+        "pages/arena.html",
+        {
+            **ctx,
+            "live_round": live_round,
+            "auto_advance": settings.pinwheel_auto_advance,
+            **_auth_context(request, current_user),
+        },
+    )
+
+
+async def _build_arena_context(request: Request, repo: RepoDep, season_id: str | None) -> dict:
+    """DB-derived arena context (recent rounds, upcoming slots) — cached per round."""
     rounds: list[dict] = []
 
     if season_id:
@@ -1530,37 +1682,6 @@ async def arena_page(request: Request, repo: RepoDep, current_user: OptionalUser
                         and sg.round_number <= g["round_number"]
                     )
 
-    # Build live_round from PresentationState if presentation is active
-    from pinwheel.core.presenter import PresentationState
-
-    live_round = None
-    pstate: PresentationState = request.app.state.presentation_state
-    if pstate.is_active and pstate.live_games:
-        live_round = {
-            "round_number": pstate.current_round,
-            "games": [
-                {
-                    "game_index": gs.game_index,
-                    "home_team_name": gs.home_team_name,
-                    "away_team_name": gs.away_team_name,
-                    "home_score": gs.home_score,
-                    "away_score": gs.away_score,
-                    "quarter": gs.quarter,
-                    "game_clock": gs.game_clock,
-                    "status": gs.status,
-                    "recent_plays": gs.recent_plays[-20:],
-                    "home_leader": gs.home_leader,
-                    "away_leader": gs.away_leader,
-                    "home_color": gs.home_team_color,
-                    "home_color2": gs.home_team_color2,
-                    "away_color": gs.away_team_color,
-                    "away_color2": gs.away_team_color2,
-                    "series_context": gs.series_context,
-                }
-                for gs in pstate.live_games.values()
-            ],
-        }
-
     # Upcoming time slots — group all unplayed games into slots
     # where no team plays twice (simultaneous tip-off).
     upcoming_rounds: list[dict] = []
@@ -1633,21 +1754,13 @@ async def arena_page(request: Request, repo: RepoDep, current_user: OptionalUser
         season_status = season.status if season else ""
         arena_round = await repo.get_latest_round_number(season_id) or 0
 
-    settings: Settings = request.app.state.settings
-    return templates.TemplateResponse(
-        request,
-        "pages/arena.html",
-        {
-            "active_page": "arena",
-            "rounds": rounds,
-            "live_round": live_round,
-            "upcoming_rounds": upcoming_rounds,
-            "auto_advance": settings.pinwheel_auto_advance,
-            "season_status": season_status,
-            "arena_round": arena_round,
-            **_auth_context(request, current_user),
-        },
-    )
+    return {
+        "active_page": "arena",
+        "rounds": rounds,
+        "upcoming_rounds": upcoming_rounds,
+        "season_status": season_status,
+        "arena_round": arena_round,
+    }
 
 
 def _compute_standings_callouts(
@@ -1734,6 +1847,21 @@ async def standings_page(
 ) -> HTMLResponse:
     """Standings page with narrative context."""
     season_id = await _get_active_season_id(repo)
+    ctx = await _cached_page_context(
+        repo,
+        season_id,
+        "pages/standings.html",
+        lambda: _build_standings_context(repo, season_id),
+    )
+    return templates.TemplateResponse(
+        request,
+        "pages/standings.html",
+        {**ctx, **_auth_context(request, current_user)},
+    )
+
+
+async def _build_standings_context(repo: RepoDep, season_id: str | None) -> dict:
+    """DB-derived standings page context — cached per round."""
     standings: list[dict] = []
     season_phase = ""
     streaks: dict[str, int] = {}
@@ -1802,21 +1930,16 @@ async def standings_page(
                 team_names=team_names,
             )
 
-    return templates.TemplateResponse(
-        request,
-        "pages/standings.html",
-        {
-            "active_page": "standings",
-            "standings": standings,
-            "season_phase": season_phase,
-            "streaks": streaks,
-            "callouts": callouts,
-            "sos": sos,
-            "magic_numbers": magic_numbers,
-            "trajectory": trajectory,
-            **_auth_context(request, current_user),
-        },
-    )
+    return {
+        "active_page": "standings",
+        "standings": standings,
+        "season_phase": season_phase,
+        "streaks": streaks,
+        "callouts": callouts,
+        "sos": sos,
+        "magic_numbers": magic_numbers,
+        "trajectory": trajectory,
+    }
 
 
 def _compute_game_standings(
@@ -1851,11 +1974,58 @@ def _compute_game_standings(
     return compute_standings(prior_results)
 
 
+def _enrich_play(play: dict, hooper_names: dict[str, str]) -> dict:
+    """Add display names, narration and the expandable event chain to a stored play."""
+    handler_id = play.get("ball_handler_id", "")
+    def_id = play.get("defender_id", "")
+    reb_id = play.get("rebound_id", "")
+    enriched = {**play}
+    enriched["handler_id"] = handler_id
+    enriched["handler_name"] = hooper_names.get(handler_id, handler_id)
+    ev_ctx = extract_event_context(play.get("events"))
+    enriched["narration"] = narrate_play(
+        player=hooper_names.get(handler_id, handler_id),
+        defender=hooper_names.get(def_id, def_id),
+        action=play.get("action", ""),
+        result=play.get("result", ""),
+        points=play.get("points_scored", 0),
+        move=play.get("move_activated", ""),
+        rebounder=hooper_names.get(reb_id, reb_id) if reb_id else "",
+        is_offensive_rebound=play.get("is_offensive_rebound", False),
+        seed=play.get("possession_number", 0),
+        assist_id=play.get("assist_id", ""),
+        subtype=str(ev_ctx["subtype"]),
+        and_one=bool(ev_ctx["and_one"]),
+        blocked=bool(ev_ctx["blocked"]),
+        transition="transition" in (play.get("tags") or []),
+    )
+    # Expandable event chain (Phase 4): one narrated line per micro
+    # event, rendered behind a <details> expander on the game page.
+    raw_events = play.get("events") or []
+    poss_seed = play.get("possession_number", 0)
+    enriched["chain"] = [
+        narrate_event(ev, hooper_names, seed=poss_seed * 100 + i)
+        for i, ev in enumerate(raw_events[:32])
+    ]
+    return enriched
+
+
+def _iter_play_by_play(raw_plays: list[dict], hooper_names: dict[str, str]) -> Iterator[dict]:
+    """Narrate stored plays one at a time, as the template consumes them."""
+    for play in raw_plays:
+        yield _enrich_play(play, hooper_names)
+
+
 @router.get("/games/{game_id}", response_class=HTMLResponse)
 async def game_page(
     request: Request, game_id: str, repo: RepoDep, current_user: OptionalUser
-) -> HTMLResponse:
-    """Single game detail page."""
+) -> StreamingResponse:
+    """Single game detail page.
+
+    All DB work happens up front; the response then streams — header, game
+    context and box score first, then the play-by-play, narrated from the
+    stored log as it is written out.
+    """
     game = await repo.get_game_result(game_id)
     if not game or not game.presented:
         raise HTTPException(404, "Game not found")
@@ -1874,14 +2044,25 @@ async def game_page(
         (getattr(away_team, "color_secondary", None) or "#1a1a2e") if away_team else "#1a1a2e"
     )
 
+    # Resolve every hooper name in one query: both full rosters (defenders
+    # and rebounders appear in play-by-play without box score entries) plus
+    # any box score hoopers no longer on either roster.
+    hooper_names: dict[str, str] = {}
+    for t in (home_team, away_team):
+        if t:
+            for h in t.hoopers:
+                hooper_names[h.id] = h.name
+    unresolved = {bs.hooper_id for bs in game.box_scores} - hooper_names.keys()
+    if unresolved:
+        hooper_names.update(await repo.get_hooper_names(unresolved))
+
     # Box scores grouped by team
     home_players = []
     away_players = []
     for bs in game.box_scores:
-        h = await repo.get_hooper(bs.hooper_id)
         player = {
             "hooper_id": bs.hooper_id,
-            "hooper_name": h.name if h else bs.hooper_id,
+            "hooper_name": hooper_names.get(bs.hooper_id, bs.hooper_id),
             "points": bs.points,
             "field_goals_made": bs.field_goals_made,
             "field_goals_attempted": bs.field_goals_attempted,
@@ -1901,57 +2082,9 @@ async def game_page(
         (away_name, game.away_team_id, away_players, away_color),
     ]
 
-    # Build hooper-name cache from both teams' full rosters — covers defenders and
-    # rebounders who appear in play-by-play but may not have box score entries.
-    hooper_names: dict[str, str] = {}
-    for team_id in (game.home_team_id, game.away_team_id):
-        t = await repo.get_team(team_id)
-        if t:
-            for h in t.hoopers:
-                hooper_names[h.id] = h.name
-    # Fallback: individual lookups for any box score hoopers still unresolved.
-    for bs in game.box_scores:
-        if bs.hooper_id not in hooper_names:
-            h = await repo.get_hooper(bs.hooper_id)
-            if h:
-                hooper_names[bs.hooper_id] = h.name
-
-    # Play-by-play from stored data (JSON dicts), enriched with narration
+    # Play-by-play is narrated lazily while the response streams; see
+    # _iter_play_by_play and _stream_template.
     raw_plays = game.play_by_play or []
-    play_by_play = []
-    for play in raw_plays:
-        handler_id = play.get("ball_handler_id", "")
-        def_id = play.get("defender_id", "")
-        reb_id = play.get("rebound_id", "")
-        enriched = {**play}
-        enriched["handler_id"] = handler_id
-        enriched["handler_name"] = hooper_names.get(handler_id, handler_id)
-        ev_ctx = extract_event_context(play.get("events"))
-        enriched["narration"] = narrate_play(
-            player=hooper_names.get(handler_id, handler_id),
-            defender=hooper_names.get(def_id, def_id),
-            action=play.get("action", ""),
-            result=play.get("result", ""),
-            points=play.get("points_scored", 0),
-            move=play.get("move_activated", ""),
-            rebounder=hooper_names.get(reb_id, reb_id) if reb_id else "",
-            is_offensive_rebound=play.get("is_offensive_rebound", False),
-            seed=play.get("possession_number", 0),
-            assist_id=play.get("assist_id", ""),
-            subtype=str(ev_ctx["subtype"]),
-            and_one=bool(ev_ctx["and_one"]),
-            blocked=bool(ev_ctx["blocked"]),
-            transition="transition" in (play.get("tags") or []),
-        )
-        # Expandable event chain (Phase 4): one narrated line per micro
-        # event, rendered behind a <details> expander on the game page.
-        raw_events = play.get("events") or []
-        poss_seed = play.get("possession_number", 0)
-        enriched["chain"] = [
-            narrate_event(ev, hooper_names, seed=poss_seed * 100 + i)
-            for i, ev in enumerate(raw_events[:32])
-        ]
-        play_by_play.append(enriched)
 
     # Report for this round + game phase
     # Use the game's own season, not the active season (game may be from archived season)
@@ -2116,7 +2249,7 @@ async def game_page(
                     name = hooper_names.get(bs.hooper_id, bs.hooper_id)
                     game_significance.append(f"Season-high {bs.points} points for {name}")
 
-    return templates.TemplateResponse(
+    return _stream_template(
         request,
         "pages/game.html",
         {
@@ -2129,7 +2262,8 @@ async def game_page(
             "away_color": away_color,
             "away_color2": away_color2,
             "box_score_groups": box_score_groups,
-            "play_by_play": play_by_play,
+            "has_play_by_play": bool(raw_plays),
+            "play_by_play": _iter_play_by_play(raw_plays, hooper_names),
             "report": report,
             "commentary": commentary,
             "game_phase": game_phase,
@@ -2150,6 +2284,34 @@ async def team_page(
     if not team:
         raise HTTPException(404, "Team not found")
 
+    ctx = await _cached_page_context(
+        repo,
+        team.season_id,
+        "pages/team.html",
+        lambda: _build_team_context(repo, team),
+        variant=(team_id,),
+    )
+    followed_team_id = request.cookies.get("pinwheel_followed_team")
+
+    return templates.TemplateResponse(
+        request,
+        "pages/team.html",
+        {
+            **ctx,
+            "team": team,
+            "followed_team_id": followed_team_id,
+            **_auth_context(request, current_user),
+        },
+    )
+
+
+async def _build_team_context(repo: RepoDep, team: TeamRow) -> dict:
+    """DB-derived team page context — cached per round.
+
+    Holds only plain data: the ``team`` row itself is re-read per request.
+    """
+    team_id = team.id
+
     # Use the team's own season for contextual data (standings, governors,
     # strategy, league averages).  This ensures team pages remain fully
     # populated even when a newer season is active — e.g. when a user
@@ -2294,29 +2456,20 @@ async def team_page(
                 rule_change_rounds=rule_change_rounds,
             )
 
-    followed_team_id = request.cookies.get("pinwheel_followed_team")
-
-    return templates.TemplateResponse(
-        request,
-        "pages/team.html",
-        {
-            "active_page": "standings",
-            "team": team,
-            "hoopers": hoopers,
-            "governors": governors,
-            "team_standings": team_standings,
-            "standing_position": standing_position,
-            "league_name": league_name,
-            "team_strategy": team_strategy,
-            "grid_rings": grid_rings,
-            "axis_lines": axes,
-            "avg_points": avg_points,
-            "avg_poly": avg_poly,
-            "trajectory": trajectory,
-            "followed_team_id": followed_team_id,
-            **_auth_context(request, current_user),
-        },
-    )
+    return {
+        "active_page": "standings",
+        "hoopers": hoopers,
+        "governors": governors,
+        "team_standings": team_standings,
+        "standing_position": standing_position,
+        "league_name": league_name,
+        "team_strategy": team_strategy,
+        "grid_rings": grid_rings,
+        "axis_lines": axes,
+        "avg_points": avg_points,
+        "avg_poly": avg_poly,
+        "trajectory": trajectory,
+    }
 
 
 @router.get("/hoopers/{hooper_id}", response_class=HTMLResponse)
@@ -2331,45 +2484,101 @@ async def hooper_page(
     team = await repo.get_team(hooper.team_id)
     season_id = await _get_active_season_id(repo)
 
+    ctx = await _cached_page_context(
+        repo,
+        season_id,
+        "pages/hooper.html",
+        lambda: _build_hooper_context(repo, hooper, season_id),
+        variant=(hooper_id,),
+    )
+
+    # Check if current user is governor on this hooper's team (can edit bio)
+    can_edit_bio = False
+    if current_user and season_id:
+        enrollment = await repo.get_player_enrollment(current_user.discord_id, season_id)
+        if enrollment and enrollment[0] == hooper.team_id:
+            can_edit_bio = True
+
+    return templates.TemplateResponse(
+        request,
+        "pages/hooper.html",
+        {
+            **ctx,
+            "hooper": hooper,
+            "team": team,
+            "can_edit_bio": can_edit_bio,
+            **_auth_context(request, current_user),
+        },
+    )
+
+
+_CAREER_TOTALS = (
+    "points",
+    "assists",
+    "steals",
+    "turnovers",
+    "field_goals_made",
+    "field_goals_attempted",
+    "three_pointers_made",
+    "three_pointers_attempted",
+    "free_throws_made",
+    "free_throws_attempted",
+)
+
+
+async def _build_hooper_context(
+    repo: RepoDep, hooper: HooperRow, season_id: str | None
+) -> dict:
+    """DB-derived hooper profile context (game log, career) — cached per round.
+
+    Holds only plain data: the ``hooper`` and ``team`` rows are re-read per
+    request so bio edits show immediately.
+    """
     # Spider chart data
     league_avg = {}
     if season_id:
         league_avg = await repo.get_league_attribute_averages(season_id)
 
-    hooper_pts = spider_chart_data(hooper.attributes) if hooper.attributes else []
+    attributes = hooper.attributes
+    hooper_pts = spider_chart_data(attributes) if attributes else []
     avg_pts = spider_chart_data(league_avg) if league_avg else []
 
-    # Game log — grouped by season so current season shows game-level detail
-    # and past seasons collapse to aggregate rows.
+    # Game log — the current season shows game-level detail; every season
+    # (past ones included) collapses to the hooper_season_stats aggregate rows.
     # carry_over_teams creates new hooper IDs per season; we link across seasons
     # by name (the only stable identifier) to build a full career view.
-    from collections import defaultdict
-
     all_hoopers = await repo.get_hoopers_by_name(hooper.name)
-    games_by_season: dict[str, list] = defaultdict(list)
-    for h in all_hoopers:
-        for bs, game in await repo.get_box_scores_for_hooper(h.id):
-            games_by_season[game.season_id].append((bs, game))
-
     hooper_season_id: str = hooper.season_id or ""
-    current_entries = games_by_season.get(hooper_season_id, [])
+    current_entries = [
+        (bs, game)
+        for h in all_hoopers
+        if h.season_id == hooper_season_id
+        for bs, game in await repo.get_box_scores_for_hooper(h.id)
+        if game.season_id == hooper_season_id
+    ]
+
+    season_totals: dict[str, dict[str, int]] = {}
+    for row in await repo.get_hooper_season_stat_rows([h.id for h in all_hoopers]):
+        acc = season_totals.setdefault(row.season_id, {})
+        for key in ("games", *HOOPER_SEASON_TOTALS):
+            acc[key] = acc.get(key, 0) + getattr(row, key)
 
     # Season name for the game log header
     current_season_obj = await repo.get_season(hooper_season_id) if hooper_season_id else None
     current_season_name = current_season_obj.name if current_season_obj else "Current Season"
 
-    def _bs_to_dict(bs: object) -> dict:
+    def _bs_to_dict(bs: BoxScoreRow) -> dict:
         return {
-            "points": bs.points,  # type: ignore[attr-defined]
-            "assists": bs.assists,  # type: ignore[attr-defined]
-            "steals": bs.steals,  # type: ignore[attr-defined]
-            "turnovers": bs.turnovers,  # type: ignore[attr-defined]
-            "field_goals_made": bs.field_goals_made,  # type: ignore[attr-defined]
-            "field_goals_attempted": bs.field_goals_attempted,  # type: ignore[attr-defined]
-            "three_pointers_made": bs.three_pointers_made,  # type: ignore[attr-defined]
-            "three_pointers_attempted": bs.three_pointers_attempted,  # type: ignore[attr-defined]
-            "free_throws_made": bs.free_throws_made,  # type: ignore[attr-defined]
-            "free_throws_attempted": bs.free_throws_attempted,  # type: ignore[attr-defined]
+            "points": bs.points,
+            "assists": bs.assists,
+            "steals": bs.steals,
+            "turnovers": bs.turnovers,
+            "field_goals_made": bs.field_goals_made,
+            "field_goals_attempted": bs.field_goals_attempted,
+            "three_pointers_made": bs.three_pointers_made,
+            "three_pointers_attempted": bs.three_pointers_attempted,
+            "free_throws_made": bs.free_throws_made,
+            "free_throws_attempted": bs.free_throws_attempted,
         }
 
     # Build current-season game log, sorted by round number ascending.
@@ -2436,8 +2645,8 @@ async def hooper_page(
 
     # Career seasons — all seasons sorted chronologically by season.created_at.
     # Each entry has per-stat league-best flags so the template can bold leaders.
-    all_career_season_ids = list(games_by_season.keys())
-    season_obj_cache: dict[str, object] = {}
+    all_career_season_ids = list(season_totals.keys())
+    season_obj_cache: dict[str, SeasonRow] = {}
     for sid in all_career_season_ids:
         s = await repo.get_season(sid)
         if s:
@@ -2449,7 +2658,7 @@ async def hooper_page(
     sorted_career_ids = sorted(
         all_career_season_ids,
         key=lambda sid: (
-            season_obj_cache[sid].created_at  # type: ignore[attr-defined]
+            season_obj_cache[sid].created_at
             if sid in season_obj_cache
             else _dt.min.replace(tzinfo=UTC)
         ),
@@ -2462,53 +2671,38 @@ async def hooper_page(
 
     career_seasons: list[dict] = []
     for sid in sorted_career_ids:
-        entries = games_by_season[sid]
+        totals = season_totals[sid]
         s = season_obj_cache.get(sid)
         is_current = sid == hooper_season_id
-        avgs = compute_season_averages([_bs_to_dict(bs) for bs, _ in entries])
+        avgs = season_averages_from_totals(totals, totals["games"])
         leaders = career_league_leaders.get(sid, {})
-        entry: dict = {
-            "season_name": s.name if s else "Season",  # type: ignore[attr-defined]
-            "games_played": len(entries),
+        career_entry: dict = {
+            "season_name": s.name if s else "Season",
+            "games_played": totals["games"],
             "averages": avgs,
             "is_current": is_current,
         }
         for stat in _CAREER_STATS:
             lv = leaders.get(stat, 0)
             hv = avgs.get(stat, 0) if avgs else 0
-            entry[f"{stat}_is_league_best"] = lv > 0 and round(hv, 1) == round(lv, 1)
-        career_seasons.append(entry)
-
-    # Check if current user is governor on this hooper's team (can edit bio)
-    can_edit_bio = False
-    if current_user and season_id:
-        enrollment = await repo.get_player_enrollment(current_user.discord_id, season_id)
-        if enrollment and enrollment[0] == hooper.team_id:
-            can_edit_bio = True
+            career_entry[f"{stat}_is_league_best"] = lv > 0 and round(hv, 1) == round(lv, 1)
+        career_seasons.append(career_entry)
 
-    return templates.TemplateResponse(
-        request,
-        "pages/hooper.html",
-        {
-            "active_page": "standings",
-            "hooper": hooper,
-            "team": team,
-            "spider_points": hooper_pts,
-            "avg_points": avg_pts,
-            "grid_rings": compute_grid_rings(),
-            "axis_lines": axis_lines(),
-            "spider_poly": polygon_points(hooper_pts) if hooper_pts else "",
-            "avg_poly": polygon_points(avg_pts) if avg_pts else "",
-            "game_log": game_log,
-            "current_season_name": current_season_name,
-            "career_seasons": career_seasons,
-            "personal_bests": personal_bests,
-            "league_bests": league_bests,
-            "season_averages": season_averages,
-            "can_edit_bio": can_edit_bio,
-            **_auth_context(request, current_user),
-        },
-    )
+    return {
+        "active_page": "standings",
+        "spider_points": hooper_pts,
+        "avg_points": avg_pts,
+        "grid_rings": compute_grid_rings(),
+        "axis_lines": axis_lines(),
+        "spider_poly": polygon_points(hooper_pts) if hooper_pts else "",
+        "avg_poly": polygon_points(avg_pts) if avg_pts else "",
+        "game_log": game_log,
+        "current_season_name": current_season_name,
+        "career_seasons": career_seasons,
+        "personal_bests": personal_bests,
+        "league_bests": league_bests,
+        "season_averages": season_averages,
+    }
 
 
 @router.get("/hoopers/{hooper_id}/bio/edit", response_class=HTMLResponse)
@@ -2678,6 +2872,7 @@ async def governance_page(
             elif e.event_type in ("proposal.passed", "proposal.failed"):
                 outcomes[pid] = e.payload
 
+        missing_previews: list[tuple[str, RuleInterpretation | None, list[EffectSpec]]] = []
         votes_by_proposal: dict[str, dict] = {}
         for e in vote_events:
             pid = e.payload.get("proposal_id", "")
@@ -2714,6 +2909,14 @@ async def governance_page(
             # Vote tally (totals only — no individual votes)
             tally = votes_by_proposal.get(pid)
 
+            # Simulated next-round impact for proposals still on the ballot
+            impact = None
+            if status in ("submitted", "confirmed", "amended"):
+                impact = impact_previews.get(pid)
+                effects = get_proposal_effects_v2(p_data)
+                if impact is None and impact_previews.enabled and previewable(interp, effects):
+                    missing_previews.append((pid, interp, effects))
+
             proposals.append(
                 {
                     "id": pid,
@@ -2723,9 +2926,20 @@ async def governance_page(
                     "tier": p.tier,
                     "interpretation": interp,
                     "vote_tally": tally,
+                    "impact": impact,
                 }
             )
 
+        # Previews lost to a restart (or never run) are simulated in the
+        # background and appear on a later visit.
+        if missing_previews:
+            scenario = await load_scenario(repo, season_id)
+            if scenario is not None:
+                for pid, interp, effects in missing_previews:
+                    candidate = candidate_rules(scenario.ruleset, interp, effects)
+                    if candidate is not None:
+                        impact_previews.start(scenario, candidate, proposal_id=pid)
+
         rc_events = await repo.get_events_by_type(
             season_id=season_id,
             event_types=["rule.enacted"],
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, Request
-
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from pinwheel.api.conditional import (
+    CACHE_PRIVATE,
+    CACHE_ROUND,
+    check_etag,
+    check_payload_etag,
+)
 from pinwheel.api.deps import RepoDep
 from pinwheel.auth.deps import OptionalUser
 from pinwheel.config import Settings
@@ -11,14 +17,24 @@ from pinwheel.config import Settings
 router = APIRouter(prefix="/api/reports", tags=["reports"])
 
 
-@router.get("/round/{season_id}/{round_number}")
+@router.get("/round/{season_id}/{round_number}", response_model=None)
 async def get_round_reports(
     season_id: str,
     round_number: int,
+    request: Request,
+    response: Response,
     repo: RepoDep,
     report_type: str | None = None,
-) -> dict:
+) -> dict | Response:
     """Get all public reports for a round. Private reports are excluded."""
+    # Report IDs change when a report is stored; edits append a
+    # ``report.edited`` event, so the event sequence covers those.
+    report_ids = await repo.get_report_ids(season_id, round_number=round_number)
+    seq = await repo.get_latest_event_sequence(season_id)
+    not_modified = check_etag(request, response, (*report_ids, seq), CACHE_ROUND)
+    if not_modified is not None:
+        return not_modified
+
     rows = await repo.get_reports_for_round(season_id, round_number, report_type)
     # Filter out private reports from public endpoint
     public = [r for r in rows if r.report_type != "private"]
@@ -36,15 +52,16 @@ async def get_round_reports(
     }
 
 
-@router.get("/private/{season_id}/{governor_id}")
+@router.get("/private/{season_id}/{governor_id}", response_model=None)
 async def get_private_reports(
     request: Request,
+    response: Response,
     season_id: str,
     governor_id: str,
     repo: RepoDep,
     current_user: OptionalUser,
     round_number: int | None = None,
-) -> dict:
+) -> dict | Response:
     """Get private reports for a specific governor.
 
     Access control: requires an authenticated session whose player ID
@@ -69,7 +86,7 @@ async def get_private_reports(
             )
 
     rows = await repo.get_private_reports(season_id, governor_id, round_number)
-    return {
+    payload = {
         "data": [
             {
                 "id": r.id,
@@ -82,11 +99,23 @@ async def get_private_reports(
             for r in rows
         ]
     }
+    not_modified = check_payload_etag(request, response, payload, CACHE_PRIVATE)
+    return not_modified if not_modified is not None else payload
 
 
-@router.get("/latest/{season_id}")
-async def get_latest_reports(season_id: str, repo: RepoDep) -> dict:
+@router.get("/latest/{season_id}", response_model=None)
+async def get_latest_reports(
+    season_id: str, request: Request, response: Response, repo: RepoDep
+) -> dict | Response:
     """Get the most recent simulation and governance reports."""
+    report_ids = await repo.get_report_ids(season_id, report_types=["simulation", "governance"])
+    if report_ids:
+        seq = await repo.get_latest_event_sequence(season_id)
+        version = (len(report_ids), report_ids[0], seq)
+        not_modified = check_etag(request, response, version, CACHE_ROUND)
+        if not_modified is not None:
+            return not_modified
+
     sim = await repo.get_latest_report(season_id, "simulation")
     gov = await repo.get_latest_report(season_id, "governance")
 
@@ -34,6 +34,7 @@ async def create_season_endpoint(
     from a previous season. Teams, hoopers, and governor enrollments are
     carried over. Tokens are regenerated for all governors.
     """
+    from pinwheel.core.fragment_cache import invalidate_season
     from pinwheel.core.season import start_new_season
 
     try:
@@ -48,6 +49,11 @@ async def create_season_endpoint(
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     teams = await repo.get_teams_for_season(new_season.id)
+    # Closing the previous season tallied its last proposals; drop its cached
+    # pages once the request's session commits
+    previous_season_id = body.previous_season_id
+    if previous_season_id:
+        repo.after_commit(lambda: invalidate_season(previous_season_id))
 
     return {
         "data": {
@@ -2,23 +2,34 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 
+from pinwheel.api.conditional import CACHE_ROUND, check_etag
 from pinwheel.api.deps import RepoDep
 from pinwheel.core.scheduler import compute_standings
 
 router = APIRouter(prefix="/api", tags=["standings"])
 
 
-@router.get("/standings")
-async def get_standings(season_id: str, repo: RepoDep) -> dict:
+@router.get("/standings", response_model=None)
+async def get_standings(
+    season_id: str, request: Request, response: Response, repo: RepoDep
+) -> dict | Response:
     """Get current standings for a season.
 
     Fetches all game results in a single query (replaces the old
     loop over rounds 1-50 that issued one query per round).
     Team names are resolved in a second bulk query instead of one
     query per standing entry.
+
+    Conditional: the ETag tracks the season's game count and latest
+    ``created_at``, so unchanged standings return 304 without loading games.
     """
+    version = await repo.get_games_version(season_id)
+    not_modified = check_etag(request, response, version, CACHE_ROUND)
+    if not_modified is not None:
+        return not_modified
+
     games = await repo.get_all_games(season_id)
     all_results: list[dict] = [
         {
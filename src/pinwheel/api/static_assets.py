@@ -0,0 +1,269 @@
+"""Fingerprinted, precompressed static assets.
+
+Every page load used to revalidate ``pinwheel.css``, ``htmx.min.js`` and
+``sse.js`` (``?v=<git hash>`` only busts the cache, it does not make it
+long-lived) and nothing was served compressed.  Arena pages are opened by
+many viewers at once on every round start, so those round trips add up.
+
+Build step (``scripts/build_static.py``, run in the Docker image):
+
+* hash every file under ``static/`` and write ``static/manifest.json``
+  mapping ``css/pinwheel.css`` → ``css/pinwheel.<hash>.css``;
+* write ``.gz`` (and ``.br`` when the optional ``brotli`` package is
+  installed) variants next to each text asset.
+
+Serving (``FingerprintedStaticFiles``):
+
+* a fingerprinted URL whose hash matches the current content is served with
+  ``Cache-Control: public, max-age=31536000, immutable``;
+* plain or stale-hash URLs still work but must revalidate;
+* the best precomputed variant allowed by ``Accept-Encoding`` is chosen,
+  with ``Vary: Accept-Encoding``.
+
+Templates call ``static_url("css/pinwheel.css")``.  Without a built
+manifest (local development) hashes are computed on demand and refreshed
+whenever a file's mtime changes, so edited CSS shows up on reload.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import re
+from pathlib import Path
+
+import anyio
+from fastapi.staticfiles import StaticFiles
+from fastapi.templating import Jinja2Templates
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
+
+from pinwheel.config import PROJECT_ROOT
+
+try:
+    import brotli
+except ImportError:  # optional — gzip variants still work without it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+STATIC_URL_PREFIX = "/static/"
+HASH_LENGTH = 12
+
+CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+CACHE_REVALIDATE = "public, max-age=0, must-revalidate"
+
+# Only text formats benefit from compression; images/fonts are already packed.
+COMPRESSIBLE_SUFFIXES = frozenset({".css", ".js", ".svg", ".json", ".html", ".txt", ".map"})
+VARIANT_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+# Preference order when the client accepts several encodings.
+ENCODING_PREFERENCE = ("br", "gzip")
+
+_FINGERPRINT_RE = re.compile(
+    rf"^(?P<stem>.+)\.(?P<hash>[0-9a-f]{{{HASH_LENGTH}}})(?P<ext>\.[^./]+)$"
+)
+
+
+def fingerprint_path(rel_path: str, digest: str) -> str:
+    """Insert *digest* before the extension: ``css/a.css`` → ``css/a.<digest>.css``."""
+    stem, ext = os.path.splitext(rel_path)
+    return f"{stem}.{digest}{ext}"
+
+
+def split_fingerprint(rel_path: str) -> tuple[str, str | None]:
+    """Inverse of ``fingerprint_path``. Returns ``(original, hash)`` or ``(rel_path, None)``."""
+    match = _FINGERPRINT_RE.match(rel_path)
+    if not match:
+        return rel_path, None
+    return f"{match['stem']}{match['ext']}", match["hash"]
+
+
+def _hash_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:HASH_LENGTH]
+
+
+def _iter_source_assets(static_dir: Path) -> list[Path]:
+    """Every servable source file (skips the manifest and compressed variants)."""
+    suffixes = tuple(VARIANT_SUFFIXES.values())
+    return sorted(
+        p
+        for p in static_dir.rglob("*")
+        if p.is_file() and p.name != MANIFEST_NAME and not p.name.endswith(suffixes)
+    )
+
+
+def build_static_assets(static_dir: Path) -> dict[str, str]:
+    """Write ``manifest.json`` and compressed variants for every asset in *static_dir*.
+
+    Returns the manifest (relative path → fingerprinted relative path).
+    """
+    manifest: dict[str, str] = {}
+    for path in _iter_source_assets(static_dir):
+        rel = path.relative_to(static_dir).as_posix()
+        manifest[rel] = fingerprint_path(rel, _hash_file(path))
+        if path.suffix in COMPRESSIBLE_SUFFIXES:
+            _write_variants(path)
+
+    (static_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    logger.info("static_assets_built dir=%s assets=%d", static_dir, len(manifest))
+    return manifest
+
+
+def _write_variants(path: Path) -> None:
+    """Write ``.gz`` / ``.br`` siblings, skipping any that would not be smaller."""
+    raw = path.read_bytes()
+    variants = {".gz": gzip.compress(raw, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(raw, quality=11)
+    for suffix, data in variants.items():
+        target = path.with_name(path.name + suffix)
+        if len(data) < len(raw):
+            target.write_bytes(data)
+        elif target.exists():
+            target.unlink()
+
+
+class AssetManifest:
+    """Maps asset paths to their fingerprinted names.
+
+    Uses ``manifest.json`` when a build step produced one; otherwise hashes
+    files lazily and re-hashes when their mtime changes.
+    """
+
+    def __init__(self, static_dir: Path) -> None:
+        self.static_dir = static_dir
+        self._built: dict[str, str] | None = None
+        self._dev: dict[str, tuple[int, str]] = {}
+        manifest_path = static_dir / MANIFEST_NAME
+        if manifest_path.exists():
+            try:
+                self._built = json.loads(manifest_path.read_text())
+            except (OSError, ValueError):
+                logger.warning("static_manifest_unreadable path=%s", manifest_path)
+
+    def fingerprinted(self, rel_path: str) -> str | None:
+        """Fingerprinted relative path for *rel_path*, or None if the asset is unknown."""
+        if self._built is not None:
+            return self._built.get(rel_path)
+        path = self.static_dir / rel_path
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return None
+        cached = self._dev.get(rel_path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, fingerprint_path(rel_path, _hash_file(path)))
+            self._dev[rel_path] = cached
+        return cached[1]
+
+    def url(self, rel_path: str) -> str:
+        """Public URL for an asset; falls back to the plain path if unknown."""
+        rel_path = rel_path.lstrip("/")
+        return STATIC_URL_PREFIX + (self.fingerprinted(rel_path) or rel_path)
+
+
+_manifest: AssetManifest | None = None
+
+
+def get_manifest() -> AssetManifest:
+    """Process-wide manifest for ``PROJECT_ROOT / "static"``."""
+    global _manifest
+    if _manifest is None:
+        _manifest = AssetManifest(PROJECT_ROOT / "static")
+    return _manifest
+
+
+def static_url(rel_path: str) -> str:
+    """Jinja global: ``{{ static_url('css/pinwheel.css') }}``."""
+    return get_manifest().url(rel_path)
+
+
+def make_templates() -> Jinja2Templates:
+    """``Jinja2Templates`` over ``templates/`` with ``static_url`` registered.
+
+    Every router that renders pages builds its templates here, so base.html's
+    asset links resolve the same way everywhere.
+    """
+    templates = Jinja2Templates(directory=str(PROJECT_ROOT / "templates"))
+    templates.env.globals["static_url"] = static_url
+    return templates
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    """Encodings from an ``Accept-Encoding`` header, minus any with ``q=0``."""
+    accepted: set[str] = set()
+    for item in header.split(","):
+        name, _, params = item.strip().partition(";")
+        if not name.strip():
+            continue
+        q = params.strip().removeprefix("q=").strip() if params else "1"
+        try:
+            if float(q) <= 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(name.strip().lower())
+    return accepted
+
+
+class FingerprintedStaticFiles(StaticFiles):
+    """``StaticFiles`` that understands fingerprinted names and compressed variants."""
+
+    def __init__(self, *, directory: str, manifest: AssetManifest | None = None) -> None:
+        super().__init__(directory=directory)
+        self.manifest = manifest or AssetManifest(Path(directory))
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        rel = path.replace(os.sep, "/")
+        original, digest = split_fingerprint(rel)
+        immutable = False
+        if digest is not None:
+            current = self.manifest.fingerprinted(original)
+            if current is not None:
+                # Old hashes (from a page rendered before a deploy) still
+                # resolve to the current file, but must not be cached forever.
+                immutable = current == fingerprint_path(original, digest)
+                rel = original
+
+        response = await self._encoded_response(rel, scope)
+        if response is None:
+            response = await super().get_response(rel, scope)
+        response.headers["Cache-Control"] = CACHE_IMMUTABLE if immutable else CACHE_REVALIDATE
+        if os.path.splitext(rel)[1] in COMPRESSIBLE_SUFFIXES:
+            response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    async def _encoded_response(self, rel: str, scope: Scope) -> Response | None:
+        """Serve a precompressed sibling if one exists and the client accepts it."""
+        if scope["method"] not in ("GET", "HEAD"):
+            return None
+        if os.path.splitext(rel)[1] not in COMPRESSIBLE_SUFFIXES:
+            return None
+        request_headers = Headers(scope=scope)
+        accepted = _accepted_encodings(request_headers.get("accept-encoding", ""))
+        for encoding in ENCODING_PREFERENCE:
+            if encoding not in accepted:
+                continue
+            full_path, stat_result = await anyio.to_thread.run_sync(
+                self.lookup_path, rel + VARIANT_SUFFIXES[encoding]
+            )
+            if stat_result is None:
+                continue
+            media_type = mimetypes.guess_type(rel)[0] or "application/octet-stream"
+            response = FileResponse(
+                full_path,
+                stat_result=stat_result,
+                media_type=media_type,
+                headers={"Content-Encoding": encoding},
+            )
+            if self.is_not_modified(response.headers, request_headers):
+                return NotModifiedResponse(response.headers)
+            return response
+        return None
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
+from pinwheel.api.conditional import CACHE_TEAMS, check_payload_etag
 from pinwheel.api.deps import RepoDep
 
 router = APIRouter(prefix="/api/teams", tags=["teams"])
 
 
-@router.get("")
-async def list_teams(season_id: str, repo: RepoDep) -> dict:
+@router.get("", response_model=None)
+async def list_teams(
+    season_id: str, request: Request, response: Response, repo: RepoDep
+) -> dict | Response:
     """List all teams for a season."""
     teams = await repo.get_teams_for_season(season_id)
-    return {
+    payload = {
         "data": [
             {
                 "id": t.id,
@@ -26,15 +29,19 @@ async def list_teams(season_id: str, repo: RepoDep) -> dict:
             for t in teams
         ],
     }
+    not_modified = check_payload_etag(request, response, payload, CACHE_TEAMS)
+    return not_modified if not_modified is not None else payload
 
 
-@router.get("/{team_id}")
-async def get_team(team_id: str, repo: RepoDep) -> dict:
+@router.get("/{team_id}", response_model=None)
+async def get_team(
+    team_id: str, request: Request, response: Response, repo: RepoDep
+) -> dict | Response:
     """Get a single team with its hoopers."""
     team = await repo.get_team(team_id)
     if not team:
         raise HTTPException(404, "Team not found")
-    return {
+    payload = {
         "data": {
             "id": team.id,
             "name": team.name,
@@ -53,3 +60,5 @@ async def get_team(team_id: str, repo: RepoDep) -> dict:
             ],
         },
     }
+    not_modified = check_payload_etag(request, response, payload, CACHE_TEAMS)
+    return not_modified if not_modified is not None else payload
@@ -103,17 +103,52 @@ class Settings(BaseSettings):
     pinwheel_presentation_mode: str = "replay"  # "instant" or "replay"
     pinwheel_game_interval_seconds: int = 1800  # 30 min between games in replay mode
     pinwheel_quarter_replay_seconds: int = 300  # 5 min per quarter in replay mode
+    # Presenter scheduler tick — events from all games due in the same tick are batched
+    pinwheel_presentation_tick_seconds: float = 0.25
+    # Replay mode: start presenting right after simulation and run AI reports during replay
+    pinwheel_pipelined_rounds: bool = False
+    # Warm effect-registry cache: compare against a cold rebuild every N loads (0 = never)
+    pinwheel_effect_cache_verify_interval: int = 20
 
     # Governance
     pinwheel_governance_interval: int = 1  # Tally governance every N rounds
     pinwheel_admin_discord_id: str = ""  # Discord user ID for admin review notifications
+    # Governor membership cache (vote weights, token regen): reload after N seconds
+    pinwheel_membership_cache_ttl_seconds: float = 300.0
+    # Compacted-season log index: re-read season_log_archives after N seconds
+    pinwheel_log_archive_refresh_seconds: float = 60.0
+    # Proposal impact previews: seeds per matchup (0 = off) and worker processes (0 = in-thread)
+    pinwheel_preview_seeds: int = 32
+    pinwheel_preview_workers: int = 2
+    # How long /propose waits for the preview before showing the interpretation without it
+    pinwheel_preview_wait_seconds: float = 3.0
 
     # Seasons
     pinwheel_carry_forward_rules: bool = True  # Default: rules carry over between seasons
     pinwheel_offseason_window: int = 3600  # Offseason governance window in seconds
 
+    # AI client pool
+    pinwheel_ai_max_concurrency: int = 8  # Max in-flight Anthropic requests, all call types
+    # Anthropic-compatible endpoint override (e.g. the load-test stub); "" = SDK default
+    pinwheel_ai_base_url: str = ""
+    # Round AI job scheduler — AIMD window (capped at max_concurrency) and per-job deadlines
+    pinwheel_ai_job_initial_window: int = 4
+    pinwheel_ai_commentary_deadline_seconds: float = 90.0  # Commentary + highlight reel
+    pinwheel_ai_league_report_deadline_seconds: float = 150.0  # Sim/gov/impact/SOTL reports
+    pinwheel_ai_private_report_deadline_seconds: float = 240.0  # Per-governor reports
+    # AI response cache — "" = next to the SQLite database; "off" disables it
+    pinwheel_ai_cache_path: str = ""
+    pinwheel_ai_cache_ttl_seconds: int = 7 * 24 * 3600
+    pinwheel_ai_cache_max_bytes: int = 50_000_000
+    # AI usage log rows are buffered and bulk-inserted this often, off the caller's transaction
+    pinwheel_ai_usage_flush_seconds: float = 2.0
+
     # Evals
     pinwheel_evals_enabled: bool = True
+    # Scheduled rounds queue their evals as eval_jobs rows; a 60s worker tick runs them
+    pinwheel_eval_jobs: bool = True
+    pinwheel_eval_job_batch_size: int = 20
+    pinwheel_eval_job_max_attempts: int = 3
 
     # Codegen frontier
     # Router flag: escalate beyond-primitive proposals to the codegen council
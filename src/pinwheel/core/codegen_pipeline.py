@@ -92,8 +92,9 @@ async def _proposal_has_passed(repo: Repository, season_id: str, proposal_id: st
     passed_events = await repo.get_events_by_type(
         season_id=season_id,
         event_types=["proposal.passed"],
+        proposal_ids=[proposal_id],
     )
-    return any(ev.aggregate_id == proposal_id for ev in passed_events)
+    return bool(passed_events)
 
 
 async def _codegen_already_registered(
@@ -103,12 +104,9 @@ async def _codegen_already_registered(
     registered_events = await repo.get_events_by_type(
         season_id=season_id,
         event_types=["effect.registered"],
+        proposal_ids=[proposal_id],
     )
-    return any(
-        ev.payload.get("proposal_id") == proposal_id
-        and ev.payload.get("codegen_code_hash") == code_hash
-        for ev in registered_events
-    )
+    return any(ev.payload.get("codegen_code_hash") == code_hash for ev in registered_events)
 
 
 async def run_codegen_for_proposal(
@@ -5,13 +5,17 @@ Effects are stored as append-only governance events:
 - effect.expired — when an effect's lifetime ends
 - effect.repealed — when an effect is manually repealed via governance
 
-The registry is rebuilt from the event store at round start.
+The registry is rebuilt from the event store at round start. The game loop
+reads it through ``effect_registry_cache``, which keeps a warm per-season
+copy and only replays events newer than the last one it saw.
 """
 
 from __future__ import annotations
 
+import copy
 import logging
 import uuid
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from pinwheel.core.hooks import EffectLifetime, RegisteredEffect
@@ -111,6 +115,14 @@ class EffectRegistry:
         """Number of active effects."""
         return len(self._effects)
 
+    def copy(self) -> EffectRegistry:
+        """An independent registry holding deep copies of every effect."""
+        clone = EffectRegistry()
+        clone._effects = {
+            effect_id: copy.deepcopy(effect) for effect_id, effect in self._effects.items()
+        }
+        return clone
+
     def build_effects_summary(self) -> str:
         """Build a human-readable summary of active effects for report context."""
         if not self._effects:
@@ -373,30 +385,27 @@ async def load_effect_registry(
     """
     registry = EffectRegistry()
 
-    # Load all effect events
-    registered_events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["effect.registered"],
-    )
-    expired_events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["effect.expired"],
-    )
-    repealed_events = await repo.get_events_by_type(
+    # Load all effect events in one query; ``effect_id`` is the indexed
+    # column extracted from the payload (falling back to aggregate_id)
+    events = await repo.get_events_by_type(
         season_id=season_id,
-        event_types=["effect.repealed"],
+        event_types=_EFFECT_EVENT_TYPES,
     )
+    registered_events = [ev for ev in events if ev.event_type == "effect.registered"]
+    # Codegen lifecycle events, in chronological order so the latest admin
+    # decision wins (events come back ordered from the event store)
+    lifecycle_events = [ev for ev in events if ev.event_type.startswith("effect.codegen_")]
 
     # Build set of dead effect IDs
-    dead_ids: set[str] = set()
-    for ev in expired_events:
-        dead_ids.add(str(ev.payload.get("effect_id", ev.aggregate_id)))
-    for ev in repealed_events:
-        dead_ids.add(str(ev.payload.get("effect_id", ev.aggregate_id)))
+    dead_ids = {
+        ev.effect_id or ev.aggregate_id
+        for ev in events
+        if ev.event_type in ("effect.expired", "effect.repealed")
+    }
 
     # Register active effects
     for ev in registered_events:
-        effect_id = str(ev.payload.get("effect_id", ev.aggregate_id))
+        effect_id = ev.effect_id or ev.aggregate_id
         if effect_id in dead_ids:
             continue
         try:
@@ -405,18 +414,8 @@ async def load_effect_registry(
         except (ValueError, TypeError, KeyError):
             logger.exception("failed_to_load_effect id=%s", effect_id)
 
-    # Replay codegen lifecycle events in chronological order so the latest
-    # admin decision wins (events come back ordered from the event store).
-    lifecycle_events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=[
-            "effect.codegen_approved",
-            "effect.codegen_rejected",
-            "effect.codegen_disabled",
-        ],
-    )
     for ev in lifecycle_events:
-        effect_id = str(ev.payload.get("effect_id", ev.aggregate_id))
+        effect_id = ev.effect_id or ev.aggregate_id
         effect = registry.get_effect(effect_id)
         if effect is None:
             continue
@@ -438,6 +437,155 @@ async def load_effect_registry(
     return registry
 
 
+_EFFECT_EVENT_TYPES = [
+    "effect.registered",
+    "effect.expired",
+    "effect.repealed",
+    "effect.codegen_approved",
+    "effect.codegen_rejected",
+    "effect.codegen_disabled",
+]
+
+
+def _effect_state(registry: EffectRegistry) -> dict[str, dict[str, object]]:
+    """Comparable snapshot of a registry (serialized form plus codegen status)."""
+    return {
+        e.effect_id: {
+            **e.to_dict(),
+            "codegen_approval_status": e.codegen_approval_status,
+            "codegen_enabled": e.codegen_enabled,
+            "codegen_disabled_reason": e.codegen_disabled_reason,
+        }
+        for e in registry.get_all_active()
+    }
+
+
+@dataclass
+class _SeasonEffects:
+    registry: EffectRegistry = field(default_factory=EffectRegistry)
+    dead_ids: set[str] = field(default_factory=set)
+    watermark: int = 0
+    loads: int = 0
+
+
+class EffectRegistryCache:
+    """Warm per-season effect registries, refreshed by event sequence number.
+
+    ``load_effect_registry`` replays the season's whole effect history, so
+    round start used to grow with every expired or repealed effect. The
+    cache keeps the replayed state and applies only ``effect.*`` events
+    after the season's watermark (one indexed query), with the same rules
+    as the cold rebuild.
+
+    * **Copies** — ``get`` hands out a registry of copied effects; the round
+      ticks lifetimes and flips codegen flags on it freely. Those changes
+      reach the cache only through the events the round persists.
+    * **Invalidation** — admin approve/reject/activate/disable and repeal
+      call ``invalidate`` once their transaction commits, so the next
+      ``get`` rebuilds from scratch and can't re-cache the old state.
+    * **Consistency** — every ``verify_interval`` loads (0 = never) the warm
+      state is compared against a cold rebuild; a mismatch is logged
+      (``effect_cache_mismatch``) and the cold state replaces the cache.
+
+    Usage:
+        registry = await effect_registry_cache.get(repo, season_id)
+        effect_registry_cache.invalidate(season_id)
+    """
+
+    def __init__(self, verify_interval: int = 20) -> None:
+        self.verify_interval = verify_interval
+        self._seasons: dict[str, _SeasonEffects] = {}
+
+    def configure(self, verify_interval: int) -> None:
+        self.verify_interval = verify_interval
+
+    def invalidate(self, season_id: str) -> None:
+        """Drop a season's warm state; the next ``get`` replays all events."""
+        if self._seasons.pop(season_id, None) is not None:
+            logger.info("effect_cache_invalidated season=%s", season_id)
+
+    def clear(self) -> None:
+        self._seasons.clear()
+
+    def __contains__(self, season_id: str) -> bool:
+        """Whether *season_id* has warm state."""
+        return season_id in self._seasons
+
+    async def refresh(self, repo: Repository, season_id: str) -> None:
+        """Apply ``effect.*`` events newer than the season's watermark."""
+        state = self._seasons.setdefault(season_id, _SeasonEffects())
+        events = await repo.get_events_by_type(
+            season_id, _EFFECT_EVENT_TYPES, after_sequence=state.watermark
+        )
+        registry = state.registry
+        for ev in events:
+            state.watermark = max(state.watermark, ev.sequence_number)
+            effect_id = ev.effect_id or ev.aggregate_id
+            if ev.event_type == "effect.registered":
+                if effect_id in state.dead_ids:
+                    continue
+                try:
+                    registry.register(RegisteredEffect.from_dict(ev.payload))
+                except (ValueError, TypeError, KeyError):
+                    logger.exception("failed_to_load_effect id=%s", effect_id)
+            elif ev.event_type in ("effect.expired", "effect.repealed"):
+                state.dead_ids.add(effect_id)
+                registry.deregister(effect_id)
+            elif (effect := registry.get_effect(effect_id)) is not None:
+                if ev.event_type == "effect.codegen_approved":
+                    effect.codegen_approval_status = "approved"
+                elif ev.event_type == "effect.codegen_rejected":
+                    effect.codegen_approval_status = "rejected"
+                else:
+                    effect.codegen_enabled = False
+                    effect.codegen_disabled_reason = str(
+                        ev.payload.get("reason", "disabled")
+                    )
+
+    async def verify(self, repo: Repository, season_id: str) -> bool:
+        """Compare the warm state with a cold rebuild; adopt the rebuild on mismatch."""
+        await self.refresh(repo, season_id)
+        state = self._seasons[season_id]
+        cold = await load_effect_registry(repo, season_id)
+        if _effect_state(cold) == _effect_state(state.registry):
+            return True
+        logger.warning(
+            "effect_cache_mismatch season=%s warm=%d cold=%d",
+            season_id,
+            state.registry.count,
+            cold.count,
+        )
+        state.registry = cold
+        return False
+
+    async def get(self, repo: Repository, season_id: str) -> EffectRegistry:
+        """Current registry for *season_id*, as a copy the caller may mutate."""
+        state = self._seasons.get(season_id)
+        if (
+            state is not None
+            and self.verify_interval > 0
+            and state.loads > 0
+            and state.loads % self.verify_interval == 0
+        ):
+            await self.verify(repo, season_id)
+        else:
+            await self.refresh(repo, season_id)
+        state = self._seasons[season_id]
+        state.loads += 1
+
+        registry = state.registry.copy()
+        logger.info(
+            "effect_registry_loaded season=%s active_effects=%d watermark=%d",
+            season_id,
+            registry.count,
+            state.watermark,
+        )
+        return registry
+
+
+effect_registry_cache = EffectRegistryCache()
+
+
 async def approve_codegen_effect(
     repo: Repository,
     registry: EffectRegistry,
@@ -505,6 +653,7 @@ async def approve_codegen_effect(
                 },
             )
 
+    repo.after_commit(lambda: effect_registry_cache.invalidate(season_id))
     logger.info(
         "codegen_effect_approved id=%s admin=%s", effect_id, admin_id,
     )
@@ -537,6 +686,7 @@ async def reject_codegen_effect(
         season_id=season_id,
         payload={"effect_id": effect_id, "admin_id": admin_id, "reason": reason},
     )
+    repo.after_commit(lambda: effect_registry_cache.invalidate(season_id))
     logger.info(
         "codegen_effect_rejected id=%s admin=%s reason=%s",
         effect_id,
@@ -659,6 +809,7 @@ async def activate_custom_mechanic(
             "description": effect.description,
         },
     )
+    repo.after_commit(lambda: effect_registry_cache.invalidate(season_id))
 
     logger.info(
         "custom_mechanic_activated id=%s hook=%s",
@@ -697,6 +848,7 @@ async def repeal_effect(
             "proposal_id": proposal_id,
         },
     )
+    repo.after_commit(lambda: effect_registry_cache.invalidate(season_id))
 
     logger.info(
         "effect_repealed id=%s proposal=%s removed_from_registry=%s",
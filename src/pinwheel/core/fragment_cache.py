@@ -0,0 +1,142 @@
+"""Server-side fragment cache for expensive page contexts and HTMX partials.
+
+Page handlers recompute standings, streaks, trajectories and rule timelines
+from the DB on every hit, even though that data only changes when a round is
+persisted, a game finishes presenting, or governance tallies.  This cache
+memoises the DB-derived part of a page (a context dict or a rendered HTML
+fragment) keyed on:
+
+    (season_id, season generation, (latest round, presented games), template, variant)
+
+* ``latest round`` / ``presented games`` come from one cheap aggregate query
+  (``Repository.get_round_marker``) so a newly presented game invalidates
+  naturally.
+* ``season generation`` is bumped explicitly by ``invalidate_season`` —
+  called from round finalization and governance tallies for changes the
+  marker cannot see (reports, season status, enacted rules).
+* A short TTL bounds staleness for time-derived fields (upcoming slot
+  start times) and anything written outside those hooks.
+
+Concurrent misses on the same key are single-flighted: the first request
+builds, the rest await its result.  That is the point — a round announced in
+Discord sends a burst of identical requests at once.
+
+Cached values are shared across requests and must be treated as read-only.
+Never cache ORM rows or per-user data; handlers add those on top.
+
+Usage:
+    ctx = await fragment_cache.get_or_build(
+        season_id, marker, "pages/standings.html", build,
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 60.0
+DEFAULT_MAX_ENTRIES = 512
+
+
+class FragmentCache:
+    """In-process LRU + TTL cache for page fragments with per-season invalidation."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[tuple, asyncio.Future[Any]] = {}
+        self._generations: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def generation(self, season_id: str) -> int:
+        """Current invalidation generation for a season."""
+        return self._generations.get(season_id, 0)
+
+    def invalidate_season(self, season_id: str) -> None:
+        """Drop every cached fragment for *season_id* and bump its generation."""
+        self._generations[season_id] = self.generation(season_id) + 1
+        stale = [key for key in self._entries if key[0] == season_id]
+        for key in stale:
+            del self._entries[key]
+        logger.debug(
+            "fragment_cache_invalidated season=%s dropped=%d", season_id, len(stale)
+        )
+
+    def clear(self) -> None:
+        """Drop everything (tests, admin resets)."""
+        self._entries.clear()
+        self._generations.clear()
+
+    async def get_or_build[T](
+        self,
+        season_id: str,
+        marker: tuple,
+        template: str,
+        build: Callable[[], Awaitable[T]],
+        variant: tuple = (),
+    ) -> T:
+        """Return the cached fragment for this key, building it on a miss."""
+        key = (season_id, self.generation(season_id), marker, template, variant)
+        now = time.monotonic()
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]  # type: ignore[no-any-return]
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)  # type: ignore[no-any-return]
+
+        self.misses += 1
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await build()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Waiters re-raise; mark retrieved so an unwatched future does not warn.
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(value)
+        # Only store if nothing invalidated the season while we were building.
+        if key[1] == self.generation(season_id):
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+
+fragment_cache = FragmentCache()
+
+
+def invalidate_season(season_id: str) -> None:
+    """Invalidate all cached page fragments for a season.
+
+    Call after anything that changes what the public pages show for that
+    season without adding a game row: round finalization (reports, season
+    status), governance tallies (enacted rules), admin edits.
+    """
+    fragment_cache.invalidate_season(season_id)
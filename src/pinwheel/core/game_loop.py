@@ -14,12 +14,13 @@ or stepped manually for testing.
 
 from __future__ import annotations
 
-import asyncio
 import dataclasses
+import functools
 import hashlib
 import json
 import logging
 import time
+from collections.abc import Awaitable, Callable
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
@@ -40,6 +41,7 @@ from pinwheel.ai.insights import (
     generate_leverage_report,
     generate_leverage_report_mock,
 )
+from pinwheel.ai.jobs import AIJob, JobPriority, ai_jobs
 from pinwheel.ai.report import (
     compute_private_report_context,
     generate_governance_report,
@@ -61,8 +63,9 @@ from pinwheel.core.drama import (  # noqa: E501
     compute_drama_score,
     get_drama_summary,
 )
-from pinwheel.core.effects import EffectRegistry, load_effect_registry, persist_expired_effects
+from pinwheel.core.effects import EffectRegistry, effect_registry_cache, persist_expired_effects
 from pinwheel.core.event_bus import EventBus
+from pinwheel.core.fragment_cache import invalidate_season as invalidate_page_fragments
 from pinwheel.core.governance import (
     get_held_proposals,
     get_proposal_effects_v2,
@@ -70,6 +73,8 @@ from pinwheel.core.governance import (
     tally_governance_with_effects,
 )
 from pinwheel.core.hooks import HookContext, fire_effects
+from pinwheel.core.impact_preview import impact_previews
+from pinwheel.core.membership import membership_cache
 from pinwheel.core.meta import MetaStore
 from pinwheel.core.milestones import check_milestones
 from pinwheel.core.narrative import NarrativeContext, compute_narrative_context
@@ -93,7 +98,7 @@ from pinwheel.models.team import Hooper, Move, PlayerAttributes, Team, Venue, su
 logger = logging.getLogger(__name__)
 
 
-def _row_to_team(team_row: TeamRow) -> Team:
+def row_to_team(team_row: TeamRow) -> Team:
     """Convert a TeamRow + HooperRows to domain Team model."""
     # suppress_budget_check() bypasses budget validation for DB-persisted
     # hoopers that may predate the budget enforcement rule.
@@ -260,16 +265,14 @@ async def _get_playoff_series_record(
         for s in playoff_schedule
         if frozenset({s.home_team_id, s.away_team_id}) == pair
     }
-    all_games = await repo.get_all_games(season_id)
+    series_games = await repo.get_games_between_teams(
+        season_id, team_a_id, team_b_id, scheduled_rounds
+    )
 
     a_wins = 0
     b_wins = 0
     games = 0
-    for g in all_games:
-        if frozenset({g.home_team_id, g.away_team_id}) != pair:
-            continue
-        if g.round_number not in scheduled_rounds:
-            continue
+    for g in series_games:
         if before_round is not None and g.round_number >= before_round:
             continue
         games += 1
@@ -747,120 +750,51 @@ async def _run_evals(
     teams_cache: dict,
     api_key: str = "",
 ) -> None:
-    """Run automated evals after report generation. Non-blocking."""
-    from pinwheel.evals.behavioral import compute_report_impact_rate
-    from pinwheel.evals.grounding import GroundingContext, check_grounding
-    from pinwheel.evals.prescriptive import scan_prescriptive
-
-    # Build grounding context
-    team_data = [{"name": t.name} for t in teams_cache.values()]
-    hooper_data = []
-    for t in teams_cache.values():
-        for h in t.hoopers:
-            hooper_data.append({"name": h.name})
-    season = await repo.get_season(season_id)
-    ruleset_dict = (season.current_ruleset if season else None) or {}
-    context = GroundingContext(
-        team_names=[d["name"] for d in team_data],
-        agent_names=[d["name"] for d in hooper_data],
-        rule_params=list((ruleset_dict or {}).keys()),
-    )
-
-    for report in reports:
-        # Prescriptive scan
-        presc = scan_prescriptive(report.content, report.id, report.report_type)
-        await repo.store_eval_result(
-            season_id=season_id,
-            round_number=round_number,
-            eval_type="prescriptive",
-            eval_subtype=report.report_type,
-            score=float(presc.prescriptive_count),
-            details_json={
-                "report_id": report.id,
-                "report_type": report.report_type,
-                "count": presc.prescriptive_count,
-                "flagged": presc.flagged,
-            },
-        )
-
-        # Grounding check
-        grounding = check_grounding(report.content, context, report.id, report.report_type)
-        await repo.store_eval_result(
-            season_id=season_id,
-            round_number=round_number,
-            eval_type="grounding",
-            eval_subtype=report.report_type,
-            score=float(grounding.entities_found),
-            details_json={
-                "report_id": report.id,
-                "report_type": report.report_type,
-                "entities_expected": grounding.entities_expected,
-                "entities_found": grounding.entities_found,
-                "grounded": grounding.grounded,
-            },
-        )
+    """Run automated evals after report generation. Non-blocking.
 
-    # Behavioral shift (Report Impact Rate)
-    impact_rate = await compute_report_impact_rate(repo, season_id, round_number)
-    await repo.store_eval_result(
-        season_id=season_id,
-        round_number=round_number,
-        eval_type="behavioral",
-        eval_subtype="report_impact_rate",
-        score=impact_rate,
-        details_json={"report_impact_rate": impact_rate},
-    )
-
-    # Scenario flags
-    try:
-        from pinwheel.evals.flags import detect_all_flags
+    The governance evals share one ``SeasonEvalAggregates``, refreshed here
+    from only the events and games added since the previous round. Each eval
+    type is the same runner the out-of-band eval jobs use; one failing type
+    does not stop the rest.
+    """
+    from pinwheel.evals.aggregates import eval_aggregates
+    from pinwheel.evals.jobs import EVAL_JOB_TYPES, build_eval_payloads, run_eval
 
-        flags = await detect_all_flags(repo, season_id, round_number, game_summaries)
-        for flag in flags:
-            await repo.store_eval_result(
-                season_id=season_id,
-                round_number=round_number,
-                eval_type="flag",
-                eval_subtype=flag.flag_type,
-                score=1.0 if flag.severity == "critical" else 0.5,
-                details_json=flag.model_dump(mode="json"),
+    payloads = build_eval_payloads(reports, game_summaries, teams_cache)
+    aggregates = await eval_aggregates.get(repo, season_id, round_number)
+    for eval_type in EVAL_JOB_TYPES:
+        try:
+            await run_eval(
+                repo,
+                season_id,
+                round_number,
+                eval_type,
+                payloads.get(eval_type),
+                api_key=api_key,
+                aggregates=aggregates,
+            )
+        except Exception:  # Last-resort handler — AI (Anthropic) and DB errors
+            logger.exception(
+                "eval_failed season=%s round=%d type=%s", season_id, round_number, eval_type
             )
-    except SQLAlchemyError:
-        logger.exception("flag_detection_failed season=%s round=%d", season_id, round_number)
-
-    # GQI (Governance Quality Index)
-    try:
-        from pinwheel.evals.gqi import compute_gqi, store_gqi
 
-        gqi_result = await compute_gqi(repo, season_id, round_number)
-        await store_gqi(repo, season_id, round_number, gqi_result)
-        logger.info(
-            "gqi_computed season=%s round=%d composite=%.3f",
-            season_id,
-            round_number,
-            gqi_result.composite,
-        )
-    except (SQLAlchemyError, ValueError, TypeError):
-        logger.exception("gqi_computation_failed season=%s round=%d", season_id, round_number)
+    logger.info("evals_complete season=%s round=%d", season_id, round_number)
 
-    # Rule Evaluator (Opus-powered admin analysis)
-    try:
-        from pinwheel.evals.rule_evaluator import evaluate_rules, store_rule_evaluation
 
-        rule_eval = await evaluate_rules(repo, season_id, round_number, api_key=api_key)
-        await store_rule_evaluation(repo, season_id, round_number, rule_eval)
-        logger.info(
-            "rule_evaluation_complete season=%s round=%d experiments=%d",
-            season_id,
-            round_number,
-            len(rule_eval.suggested_experiments),
-        )
-    except Exception:  # Last-resort handler — AI (Anthropic) and DB errors
-        logger.exception(
-            "rule_evaluation_failed season=%s round=%d", season_id, round_number
-        )
-
-    logger.info("evals_complete season=%s round=%d", season_id, round_number)
+# Everything tally_pending_governance reads from the log, fetched in one query
+_TALLY_EVENT_TYPES = (
+    "proposal.confirmed",
+    "proposal.passed",
+    "proposal.failed",
+    "proposal.vetoed",
+    "proposal.first_tally_seen",
+    "proposal.submitted",
+    "proposal.amended",
+    "vote.cast",
+    "proposal.codegen_ready",
+    "effect.registered",
+    "rule.enacted",
+)
 
 
 async def tally_pending_governance(
@@ -883,6 +817,8 @@ async def tally_pending_governance(
     hooks around the governance tally for any registered effects.
     When ``skip_deferral`` is True, the minimum voting period is bypassed
     (used for season-close catch-up tallies).
+    Does not commit: the caller commits and then, when any tallies came
+    back, drops the season's cached page fragments.
     Returns (updated_ruleset, tallies, governance_data).
     """
     governance_data: dict = {"proposals": [], "votes": [], "rules_changed": []}
@@ -899,23 +835,25 @@ async def tally_pending_governance(
             )
             fire_effects("gov.pre", gov_pre_ctx, _gov_pre_effects)
 
-    # Gather confirmed proposals that haven't been resolved yet
-    confirmed_events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["proposal.confirmed"],
-    )
-    resolved_events = await repo.get_events_by_type(
+    # One read of every event type the tally needs, partitioned in memory
+    watermark = await repo.get_latest_event_sequence(season_id)
+    season_events = await repo.get_events_by_type(
         season_id=season_id,
-        event_types=["proposal.passed", "proposal.failed"],
+        event_types=list(_TALLY_EVENT_TYPES),
     )
-    resolved_ids = {e.aggregate_id for e in resolved_events}
+    events_by_type: dict[str, list] = {t: [] for t in _TALLY_EVENT_TYPES}
+    for ev in season_events:
+        events_by_type[ev.event_type].append(ev)
+
+    # Gather confirmed proposals that haven't been resolved yet
+    confirmed_events = events_by_type["proposal.confirmed"]
+    resolved_ids = {
+        e.aggregate_id
+        for e in events_by_type["proposal.passed"] + events_by_type["proposal.failed"]
+    }
 
     # Exclude vetoed proposals from tally
-    vetoed_events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["proposal.vetoed"],
-    )
-    vetoed_ids = {e.aggregate_id for e in vetoed_events}
+    vetoed_ids = {e.aggregate_id for e in events_by_type["proposal.vetoed"]}
 
     # Deduplicate: use proposal_id from payload, falling back to aggregate_id
     pending_proposal_ids: list[str] = []
@@ -932,11 +870,9 @@ async def tally_pending_governance(
     # ``proposal.first_tally_seen`` event and defer it to the next cycle.
     # Skipped when ``skip_deferral`` is True (season-close catch-up).
     if pending_proposal_ids and not skip_deferral:
-        first_seen_events = await repo.get_events_by_type(
-            season_id=season_id,
-            event_types=["proposal.first_tally_seen"],
-        )
-        already_seen_ids = {e.aggregate_id for e in first_seen_events}
+        already_seen_ids = {
+            e.aggregate_id for e in events_by_type["proposal.first_tally_seen"]
+        }
 
         deferred_ids: list[str] = []
         ready_ids: list[str] = []
@@ -947,14 +883,19 @@ async def tally_pending_governance(
                 ready_ids.append(pid)
 
         # Emit first_tally_seen for newly encountered proposals
+        await repo.append_events(
+            [
+                {
+                    "event_type": "proposal.first_tally_seen",
+                    "aggregate_id": pid,
+                    "aggregate_type": "proposal",
+                    "season_id": season_id,
+                    "payload": {"proposal_id": pid, "round_number": round_number},
+                }
+                for pid in deferred_ids
+            ]
+        )
         for pid in deferred_ids:
-            await repo.append_event(
-                event_type="proposal.first_tally_seen",
-                aggregate_id=pid,
-                aggregate_type="proposal",
-                season_id=season_id,
-                payload={"proposal_id": pid, "round_number": round_number},
-            )
             logger.info(
                 "proposal_deferred pid=%s round=%d season=%s",
                 pid,
@@ -971,12 +912,8 @@ async def tally_pending_governance(
 
     if pending_proposal_ids:
         # Reconstruct proposals from submitted events
-        submitted_events = await repo.get_events_by_type(
-            season_id=season_id,
-            event_types=["proposal.submitted"],
-        )
         effects_v2_by_proposal: dict[str, list[EffectSpec]] = {}
-        for se in submitted_events:
+        for se in events_by_type["proposal.submitted"]:
             p_data = se.payload
             pid = p_data.get("id", se.aggregate_id)
             if pid in seen_ids:
@@ -994,12 +931,8 @@ async def tally_pending_governance(
         # An amendment replaces the original interpretation on the ballot,
         # so a passing vote must enact the latest amendment — not the
         # originally submitted interpretation.
-        amended_events = await repo.get_events_by_type(
-            season_id=season_id,
-            event_types=["proposal.amended"],
-        )
         latest_amendment: dict[str, dict] = {}
-        for ae in amended_events:
+        for ae in events_by_type["proposal.amended"]:
             apid = str(ae.payload.get("proposal_id", ae.aggregate_id))
             latest_amendment[apid] = ae.payload
         for proposal in proposals:
@@ -1017,12 +950,8 @@ async def tally_pending_governance(
             effects_v2_by_proposal[proposal.id] = []
 
         # Gather votes for pending proposals
-        vote_events = await repo.get_events_by_type(
-            season_id=season_id,
-            event_types=["vote.cast"],
-        )
         votes_by_proposal: dict[str, list[Vote]] = {}
-        for ve in vote_events:
+        for ve in events_by_type["vote.cast"]:
             v_data = ve.payload
             pid = v_data.get("proposal_id", "")
             if pid in seen_ids:
@@ -1043,6 +972,7 @@ async def tally_pending_governance(
                 effects_v2_by_proposal=effects_v2_by_proposal,
                 codegen_auto_approve=_settings.pinwheel_codegen_auto_approve,
                 require_approval=_settings.pinwheel_rules_require_approval,
+                season_events=season_events,
             )
         else:
             new_ruleset, round_tallies = await tally_governance(
@@ -1055,6 +985,8 @@ async def tally_pending_governance(
                 require_approval=_settings.pinwheel_rules_require_approval,
             )
         tallies = round_tallies
+        # Tallied proposals are off the ballot; their previews are no longer shown
+        impact_previews.forget(t.proposal_id for t in tallies)
 
         # Approval gate: surface newly held proposals to the admin
         if event_bus is not None and _settings.pinwheel_rules_require_approval:
@@ -1077,10 +1009,13 @@ async def tally_pending_governance(
             t.model_dump(mode="json") for t in tallies if t.passed
         ]
 
-        # Enrich rules_changed with actual parameter change details
-        rule_enacted_events = await repo.get_events_by_type(
+        # Enrich rules_changed with actual parameter change details: the
+        # round's earlier enactments (e.g. admin-approved held proposals)
+        # came with the batch read, this tally's are past the watermark
+        rule_enacted_events = events_by_type["rule.enacted"] + await repo.get_events_by_type(
             season_id=season_id,
             event_types=["rule.enacted"],
+            after_sequence=watermark,
         )
         for rc_event in rule_enacted_events:
             if rc_event.payload.get("round_enacted") == round_number:
@@ -1150,13 +1085,13 @@ async def _phase_simulate_and_govern(
             if tid not in teams_cache:
                 row = await repo.get_team(tid)
                 if row:
-                    teams_cache[tid] = _row_to_team(row)
+                    teams_cache[tid] = row_to_team(row)
 
     # 3b. Load effect registry and meta store
     effect_registry: EffectRegistry | None = None
     meta_store: MetaStore | None = None
     try:
-        effect_registry = await load_effect_registry(repo, season_id)
+        effect_registry = await effect_registry_cache.get(repo, season_id)
         if effect_registry.count > 0:
             meta_store = MetaStore()
             # Load team meta from DB
@@ -1185,18 +1120,17 @@ async def _phase_simulate_and_govern(
     from pinwheel.models.team import TeamStrategy
 
     strategies: dict[str, TeamStrategy] = {}
-    for tid in teams_cache:
-        strat_events = await repo.get_events_by_type(
-            season_id=season_id,
-            event_types=["strategy.interpreted"],
-        )
-        for evt in reversed(strat_events):
-            if evt.payload.get("team_id") == tid:
-                try:
-                    strategies[tid] = TeamStrategy(**evt.payload.get("strategy", {}))
-                except (ValueError, TypeError):
-                    logger.warning("invalid_strategy_payload team=%s", tid)
-                break
+    strat_events = await repo.get_events_by_type(
+        season_id=season_id,
+        event_types=["strategy.interpreted"],
+        payload_team_ids=teams_cache.keys(),
+    )
+    latest_strategy = {evt.payload_team_id: evt for evt in strat_events}
+    for tid, evt in latest_strategy.items():
+        try:
+            strategies[tid] = TeamStrategy(**evt.payload.get("strategy", {}))
+        except (ValueError, TypeError):
+            logger.warning("invalid_strategy_payload team=%s", tid)
 
     # 4. Simulate games
     _PLAYOFF_PHASES = ("playoff", "semifinal", "finals")
@@ -1599,13 +1533,13 @@ async def _phase_simulate_and_govern(
 
         # Regenerate tokens for all enrolled governors
         regen_count = 0
+        membership = await membership_cache.get(repo, season_id)
         for team in teams_cache.values():
-            governors = await repo.get_governors_for_team(team.id, season_id)
-            for gov in governors:
+            for governor_id in membership.governors_on(team.id):
                 # Defaults from tokens.py: 2 PROPOSE, 2 AMEND, 2 BOOST per
                 # tally cycle (GAME_LOOP.md) — boost included, or it drains
                 # out of the economy permanently.
-                await regenerate_tokens(repo, gov.id, team.id, season_id)
+                await regenerate_tokens(repo, governor_id, team.id, season_id)
                 regen_count += 1
         if regen_count > 0:
             logger.info(
@@ -1760,11 +1694,21 @@ async def _phase_simulate_and_govern(
 async def _phase_ai(
     sim: _SimPhaseResult,
     api_key: str = "",
+    event_bus: EventBus | None = None,
+    suppress_spoiler_events: bool = False,
+    on_commentary: Callable[[dict], Awaitable[object]] | None = None,
 ) -> _AIPhaseResult:
     """Phase 2: Generate all AI content. No DB access needed.
 
     Makes all AI calls: commentary per game, highlight reel, simulation report,
     governance report, and private reports per active governor.
+
+    Live game commentary is streamed as a ``game.commentary`` event carrying
+    the text so far each time a sentence completes, then the full text with
+    ``final=True``. The events go to ``on_commentary`` when given — replay
+    mode passes the presentation's schedule, which holds each game's
+    commentary until that game has been presented — or otherwise straight
+    to the ``event_bus`` unless spoilers are suppressed.
     """
     commentaries: dict[str, str] = {}
     round_data: dict[str, object] = {
@@ -1835,13 +1779,70 @@ async def _phase_ai(
         else:
             narrative.effects_narrative = combined
 
-    # --- All AI calls below are independent and can run concurrently ---
-    # We build coroutines for each call, then execute them via asyncio.gather().
-    # Mock (sync) calls are wrapped in trivial coroutines for uniformity.
+    # --- All AI calls below are independent and run through the job scheduler ---
+    # Each call becomes an AIJob: the live generator when an API key is set
+    # (with the mock as its deadline fallback), otherwise the mock itself.
+    # The scheduler starts public commentary first, then league reports, then
+    # private reports, inside an AIMD concurrency window.
+
+    def _job(
+        name: str,
+        priority: JobPriority,
+        live: Callable[[], Awaitable[object]],
+        mock: Callable[[], object],
+    ) -> AIJob:
+        if api_key:
+            return AIJob(name, priority, live, fallback=mock)
+
+        async def _run_mock() -> object:
+            return mock()
+
+        return AIJob(name, priority, _run_mock)
+
+    all_jobs: list[AIJob] = []
 
     # -- Commentary per game --
+    commentary_sink = on_commentary
+    if commentary_sink is None and event_bus is not None and not suppress_spoiler_events:
+        commentary_sink = functools.partial(event_bus.publish, "game.commentary")
+
+    def _live_commentary(
+        game_index: int, result: GameResult, home: Team, away: Team
+    ) -> Callable[[], Awaitable[str]]:
+        generate = functools.partial(
+            generate_game_commentary, result, home, away, sim.ruleset, api_key,
+            playoff_context=sim.playoff_context,
+            narrative=narrative,
+        )
+        if commentary_sink is None:
+            return generate
+        sink = commentary_sink
+        summary = sim.game_summaries[game_index]
+        base_event = {
+            "game_index": game_index,
+            "game_id": summary.get("game_id", ""),
+            "game_row_id": summary.get("game_row_id", ""),
+            "round": sim.round_number,
+            "home_team_name": home.name,
+            "away_team_name": away.name,
+            "home_team_color": home.color,
+            "away_team_color": away.color,
+            "home_score": result.home_score,
+            "away_score": result.away_score,
+        }
+
+        async def _publish(text: str, final: bool = False) -> None:
+            await sink({**base_event, "commentary": text, "final": final})
+
+        async def _streamed() -> str:
+            text = await generate(on_partial=_publish)
+            await _publish(text, final=True)
+            return text
+
+        return _streamed
+
     commentary_game_ids: list[str] = []
-    commentary_coros: list[asyncio.Future[str]] = []
+    _commentary_start = len(all_jobs)
     for i, result in enumerate(sim.game_results):
         if i >= len(sim.game_summaries):
             break
@@ -1851,176 +1852,158 @@ async def _phase_ai(
         if not home or not away:
             continue
         commentary_game_ids.append(game_id)
-        if api_key:
-            commentary_coros.append(
-                generate_game_commentary(
-                    result, home, away, sim.ruleset, api_key,
+        all_jobs.append(
+            _job(
+                f"commentary:{game_id}",
+                JobPriority.COMMENTARY,
+                _live_commentary(i, result, home, away),
+                functools.partial(
+                    generate_game_commentary_mock, result, home, away,
                     playoff_context=sim.playoff_context,
                     narrative=narrative,
-                )
-            )
-        else:
-            # Wrap sync mock in a coroutine
-            _mock_commentary = generate_game_commentary_mock(
-                result, home, away,
-                playoff_context=sim.playoff_context,
-                narrative=narrative,
+                ),
             )
-
-            async def _wrap_commentary(c: str = _mock_commentary) -> str:
-                return c
-
-            commentary_coros.append(_wrap_commentary())
+        )
 
     # -- Highlight reel --
     async def _gen_highlight() -> str:
         if not sim.game_summaries:
             return ""
-        if api_key:
-            return await generate_highlight_reel(
-                sim.game_summaries, sim.round_number, api_key,
-                playoff_context=sim.playoff_context,
-                narrative=narrative,
-            )
+        return await generate_highlight_reel(
+            sim.game_summaries, sim.round_number, api_key,
+            playoff_context=sim.playoff_context,
+            narrative=narrative,
+        )
+
+    def _mock_highlight() -> str:
+        if not sim.game_summaries:
+            return ""
         return generate_highlight_reel_mock(
             sim.game_summaries, sim.round_number,
             playoff_context=sim.playoff_context,
             narrative=narrative,
         )
 
+    _highlight_idx = len(all_jobs)
+    all_jobs.append(_job("highlight_reel", JobPriority.COMMENTARY, _gen_highlight, _mock_highlight))
+
     # -- Simulation report --
-    async def _gen_sim_report() -> Report:
-        if api_key:
-            return await generate_simulation_report(
+    _sim_report_idx = len(all_jobs)
+    all_jobs.append(
+        _job(
+            "simulation_report",
+            JobPriority.LEAGUE_REPORT,
+            functools.partial(
+                generate_simulation_report,
                 round_data, sim.season_id, sim.round_number, api_key,
                 narrative=narrative,
-            )
-        return generate_simulation_report_mock(
-            round_data, sim.season_id, sim.round_number,
-            narrative=narrative,
+            ),
+            functools.partial(
+                generate_simulation_report_mock,
+                round_data, sim.season_id, sim.round_number,
+                narrative=narrative,
+            ),
         )
+    )
 
     # -- Governance report --
-    async def _gen_gov_report() -> Report:
-        if api_key:
-            return await generate_governance_report(
+    _gov_report_idx = len(all_jobs)
+    all_jobs.append(
+        _job(
+            "governance_report",
+            JobPriority.LEAGUE_REPORT,
+            functools.partial(
+                generate_governance_report,
                 sim.governance_data, sim.season_id, sim.round_number, api_key,
                 narrative=narrative,
-            )
-        return generate_governance_report_mock(
-            sim.governance_data, sim.season_id, sim.round_number,
-            narrative=narrative,
+            ),
+            functools.partial(
+                generate_governance_report_mock,
+                sim.governance_data, sim.season_id, sim.round_number,
+                narrative=narrative,
+            ),
         )
+    )
 
     # -- Private reports per governor --
     private_gov_ids: list[str] = list(sim.active_governor_ids)
-    private_coros: list[asyncio.Future[Report]] = []
+    _private_start = len(all_jobs)
     for gov_id in private_gov_ids:
         governor_data = sim.governor_activity.get(gov_id, {})
-        if api_key:
-            private_coros.append(
-                generate_private_report(
+        all_jobs.append(
+            _job(
+                f"private_report:{gov_id}",
+                JobPriority.PRIVATE_REPORT,
+                functools.partial(
+                    generate_private_report,
                     governor_data, gov_id, sim.season_id, sim.round_number, api_key,
-                )
-            )
-        else:
-            _mock_priv = generate_private_report_mock(
-                governor_data, gov_id, sim.season_id, sim.round_number,
+                    narrative=narrative,
+                ),
+                functools.partial(
+                    generate_private_report_mock,
+                    governor_data, gov_id, sim.season_id, sim.round_number,
+                ),
             )
-
-            async def _wrap_priv(r: Report = _mock_priv) -> Report:
-                return r
-
-            private_coros.append(_wrap_priv())
+        )
 
     # -- Impact validation report (only when rules changed) --
-    async def _gen_impact() -> Report | None:
-        if not sim.impact_validation_data:
-            return None
-        if api_key:
-            return await generate_impact_validation(
-                sim.impact_validation_data, sim.season_id, sim.round_number, api_key,
+    _impact_idx: int | None = None
+    if sim.impact_validation_data:
+        _impact_idx = len(all_jobs)
+        all_jobs.append(
+            _job(
+                "impact_validation",
+                JobPriority.LEAGUE_REPORT,
+                functools.partial(
+                    generate_impact_validation,
+                    sim.impact_validation_data, sim.season_id, sim.round_number, api_key,
+                ),
+                functools.partial(
+                    generate_impact_validation_mock,
+                    sim.impact_validation_data, sim.season_id, sim.round_number,
+                ),
             )
-        return generate_impact_validation_mock(
-            sim.impact_validation_data, sim.season_id, sim.round_number,
         )
 
     # -- Leverage reports per governor --
     leverage_gov_ids: list[str] = list(sim.governor_leverage_data.keys())
-    leverage_coros: list[asyncio.Future[Report]] = []
+    _leverage_start = len(all_jobs)
     for gov_id in leverage_gov_ids:
         lev_data = sim.governor_leverage_data[gov_id]
-        if api_key:
-            leverage_coros.append(
-                generate_leverage_report(
+        all_jobs.append(
+            _job(
+                f"leverage_report:{gov_id}",
+                JobPriority.PRIVATE_REPORT,
+                functools.partial(
+                    generate_leverage_report,
                     lev_data, gov_id, sim.season_id, sim.round_number, api_key,
-                )
-            )
-        else:
-            _mock_lev = generate_leverage_report_mock(
-                lev_data, gov_id, sim.season_id, sim.round_number,
+                ),
+                functools.partial(
+                    generate_leverage_report_mock,
+                    lev_data, gov_id, sim.season_id, sim.round_number,
+                ),
             )
-
-            async def _wrap_lev(r: Report = _mock_lev) -> Report:
-                return r
-
-            leverage_coros.append(_wrap_lev())
+        )
 
     # -- Behavioral reports per governor --
     behavioral_gov_ids: list[str] = list(sim.governor_behavioral_data.keys())
-    behavioral_coros: list[asyncio.Future[Report]] = []
+    _behavioral_start = len(all_jobs)
     for gov_id in behavioral_gov_ids:
         beh_data = sim.governor_behavioral_data[gov_id]
-        if api_key:
-            behavioral_coros.append(
-                generate_behavioral_report(
+        all_jobs.append(
+            _job(
+                f"behavioral_report:{gov_id}",
+                JobPriority.PRIVATE_REPORT,
+                functools.partial(
+                    generate_behavioral_report,
                     beh_data, gov_id, sim.season_id, sim.round_number, api_key,
-                )
-            )
-        else:
-            _mock_beh = generate_behavioral_report_mock(
-                beh_data, gov_id, sim.season_id, sim.round_number,
+                ),
+                functools.partial(
+                    generate_behavioral_report_mock,
+                    beh_data, gov_id, sim.season_id, sim.round_number,
+                ),
             )
-
-            async def _wrap_beh(r: Report = _mock_beh) -> Report:
-                return r
-
-            behavioral_coros.append(_wrap_beh())
-
-    # --- Execute all AI calls concurrently ---
-    # Gather commentary, highlight, sim_report, gov_report, impact, and all
-    # per-governor reports (private, leverage, behavioral) in a single gather.
-    # Each call is independent — they read shared data but don't write to it.
-
-    all_coros: list[asyncio.Future[str | Report | None]] = []  # type: ignore[type-arg]
-    # Track offsets into the results list for each category
-    _commentary_start = len(all_coros)
-    all_coros.extend(commentary_coros)  # type: ignore[arg-type]
-    _commentary_end = len(all_coros)
-
-    _highlight_idx = len(all_coros)
-    all_coros.append(_gen_highlight())  # type: ignore[arg-type]
-
-    _sim_report_idx = len(all_coros)
-    all_coros.append(_gen_sim_report())  # type: ignore[arg-type]
-
-    _gov_report_idx = len(all_coros)
-    all_coros.append(_gen_gov_report())  # type: ignore[arg-type]
-
-    _private_start = len(all_coros)
-    all_coros.extend(private_coros)  # type: ignore[arg-type]
-    _private_end = len(all_coros)
-
-    _impact_idx = len(all_coros)
-    all_coros.append(_gen_impact())  # type: ignore[arg-type]
-
-    _leverage_start = len(all_coros)
-    all_coros.extend(leverage_coros)  # type: ignore[arg-type]
-    _leverage_end = len(all_coros)
-
-    _behavioral_start = len(all_coros)
-    all_coros.extend(behavioral_coros)  # type: ignore[arg-type]
-    _behavioral_end = len(all_coros)
+        )
 
     # State of the League (every 7 rounds = one full round-robin)
     _sotl_idx: int | None = None
@@ -2044,27 +2027,32 @@ async def _phase_ai(
                 if abs(v) >= 2
             }
 
-        async def _gen_sotl() -> Report:
-            if api_key:
-                return await generate_state_of_the_league(
+        _sotl_idx = len(all_jobs)
+        all_jobs.append(
+            _job(
+                "state_of_the_league",
+                JobPriority.LEAGUE_REPORT,
+                functools.partial(
+                    generate_state_of_the_league,
                     _sotl_data,
                     sim.season_id,
                     sim.round_number,
                     api_key,
                     narrative=narrative,
-                )
-            return generate_state_of_the_league_mock(
-                _sotl_data,
-                sim.season_id,
-                sim.round_number,
-                narrative=narrative,
+                ),
+                functools.partial(
+                    generate_state_of_the_league_mock,
+                    _sotl_data,
+                    sim.season_id,
+                    sim.round_number,
+                    narrative=narrative,
+                ),
             )
+        )
 
-        _sotl_idx = len(all_coros)
-        all_coros.append(_gen_sotl())  # type: ignore[arg-type]
-
-    # return_exceptions=True so one failure doesn't cancel the rest
-    all_results = await asyncio.gather(*all_coros, return_exceptions=True)
+    # Failures come back in place (like gather's return_exceptions=True) so
+    # one failure doesn't cancel the rest.
+    all_results = await ai_jobs.run(all_jobs)
 
     # --- Unpack results ---
 
@@ -2138,15 +2126,16 @@ async def _phase_ai(
 
     # Impact validation report
     impact_report: Report | None = None
-    res_impact = all_results[_impact_idx]
-    if isinstance(res_impact, BaseException):
-        logger.exception(
-            "impact_validation_failed season=%s round=%d",
-            sim.season_id, sim.round_number,
-            exc_info=res_impact,
-        )
-    else:
-        impact_report = res_impact  # type: ignore[assignment]
+    if _impact_idx is not None:
+        res_impact = all_results[_impact_idx]
+        if isinstance(res_impact, BaseException):
+            logger.exception(
+                "impact_validation_failed season=%s round=%d",
+                sim.season_id, sim.round_number,
+                exc_info=res_impact,
+            )
+        else:
+            impact_report = res_impact  # type: ignore[assignment]
 
     # Leverage reports per governor
     leverage_reports: list[tuple[str, Report]] = []
@@ -2310,6 +2299,8 @@ async def _generate_series_reports(
                         {
                             "report_type": "series",
                             "series_type": "semifinal",
+                            "winner_id": winner_id,
+                            "loser_id": loser_id,
                             "winner_name": winner_name,
                             "loser_name": loser_name,
                             "excerpt": report.content[:200],
@@ -2413,6 +2404,8 @@ async def _generate_series_reports(
                     {
                         "report_type": "series",
                         "series_type": "finals",
+                        "winner_id": champion_id,
+                        "loser_id": loser_id,
                         "winner_name": winner_name,
                         "loser_name": loser_name,
                         "excerpt": report.content[:200],
@@ -2441,10 +2434,13 @@ async def _phase_persist_and_finalize(
     suppress_spoiler_events: bool = False,
     start_time: float | None = None,
     api_key: str = "",
+    defer_evals: bool = False,
 ) -> RoundResult:
     """Phase 3: Store AI outputs, run evals, handle season progression.
 
     Fast DB writes only — all slow AI calls already completed in Phase 2.
+    With ``defer_evals`` the evals are queued as eval jobs (committed with
+    the round) for ``tick_eval_jobs`` instead of run here.
     """
     reports: list[Report] = []
     deferred_report_events: list[dict] = []
@@ -2600,7 +2596,18 @@ async def _phase_persist_and_finalize(
         from pinwheel.config import Settings
 
         eval_settings = Settings()
-        if eval_settings.pinwheel_evals_enabled:
+        if eval_settings.pinwheel_evals_enabled and defer_evals:
+            from pinwheel.evals.jobs import enqueue_round_evals
+
+            await enqueue_round_evals(
+                repo,
+                sim.season_id,
+                sim.round_number,
+                reports,
+                sim.game_summaries,
+                sim.teams_cache,
+            )
+        elif eval_settings.pinwheel_evals_enabled:
             await _run_evals(
                 repo,
                 sim.season_id,
@@ -2924,6 +2931,9 @@ async def _phase_persist_and_finalize(
     if event_bus and not suppress_spoiler_events:
         await event_bus.publish("round.completed", round_completed_data)
 
+    # Reports, season status and standings changed — drop cached page fragments
+    invalidate_page_fragments(sim.season_id)
+
     return RoundResult(
         round_number=sim.round_number,
         games=sim.game_summaries,
@@ -2981,7 +2991,9 @@ async def step_round(
         return RoundResult(round_number=round_number, games=[], reports=[], tallies=[])
 
     phase2_start = time.perf_counter()
-    ai = await _phase_ai(sim, api_key)
+    ai = await _phase_ai(
+        sim, api_key, event_bus=event_bus, suppress_spoiler_events=suppress_spoiler_events
+    )
     phase2_ms = (time.perf_counter() - phase2_start) * 1000
     logger.info(
         "phase_timing phase=ai_generation season=%s round=%d duration_ms=%.1f",
@@ -3018,6 +3030,12 @@ async def step_round(
         phase3_ms,
         total_ms,
     )
+    result.phase_timings_ms = {
+        "simulate_and_govern": phase1_ms,
+        "ai_generation": phase2_ms,
+        "persist_and_finalize": phase3_ms,
+        "total": total_ms,
+    }
     return result
 
 
@@ -3029,6 +3047,9 @@ async def step_round_multisession(
     api_key: str = "",
     governance_interval: int = 1,
     suppress_spoiler_events: bool = False,
+    on_simulated: Callable[[RoundResult], Awaitable[None]] | None = None,
+    defer_evals: bool = False,
+    on_commentary: Callable[[dict], Awaitable[object]] | None = None,
 ) -> RoundResult:
     """Execute one round with separate DB sessions per phase.
 
@@ -3043,6 +3064,15 @@ async def step_round_multisession(
         Session 2 (~1-2s): store reports, run evals, season progression
            [LOCK RELEASED]
 
+    ``on_simulated`` is awaited right after Session 1 with a preliminary
+    ``RoundResult`` — games, row ids, teams and governance summary, but no
+    reports yet.  Pipelined replay uses it to start presenting while the AI
+    phase is still running, and passes ``on_commentary`` so the streamed
+    game commentary reaches that presentation (see ``_phase_ai``).
+
+    ``defer_evals`` queues the round's evals as background eval jobs
+    instead of running them in Session 2.
+
     The ``engine`` parameter is typed as ``object`` to avoid importing
     AsyncEngine at module level; callers pass an ``AsyncEngine`` instance.
     """
@@ -3064,7 +3094,10 @@ async def step_round_multisession(
             governance_interval=governance_interval,
             suppress_spoiler_events=suppress_spoiler_events,
         )
-    # Session closed — lock released
+    # Session closed — lock released. A tally changes proposals and rules on
+    # public pages, which must not wait out the AI phase to refresh.
+    if sim is not None and sim.tallies:
+        invalidate_page_fragments(season_id)
     phase1_ms = (time.perf_counter() - phase1_start) * 1000
     logger.info(
         "phase_timing phase=simulate_and_govern season=%s round=%d duration_ms=%.1f",
@@ -3076,9 +3109,31 @@ async def step_round_multisession(
     if sim is None:
         return RoundResult(round_number=round_number, games=[], reports=[], tallies=[])
 
+    if on_simulated is not None:
+        # game_summaries is shared, not copied: Phase 3 attaches commentary
+        # to these dicts, so an early presentation still picks it up.
+        await on_simulated(
+            RoundResult(
+                round_number=sim.round_number,
+                games=sim.game_summaries,
+                reports=[],
+                tallies=sim.tallies,
+                game_results=sim.game_results,
+                game_row_ids=sim.game_row_ids,
+                teams_cache=sim.teams_cache,
+                governance_summary=sim.governance_summary,
+            )
+        )
+
     # NO SESSION: AI calls (slow, 30-90s)
     phase2_start = time.perf_counter()
-    ai = await _phase_ai(sim, api_key)
+    ai = await _phase_ai(
+        sim,
+        api_key,
+        event_bus=event_bus,
+        suppress_spoiler_events=suppress_spoiler_events,
+        on_commentary=on_commentary,
+    )
     phase2_ms = (time.perf_counter() - phase2_start) * 1000
     logger.info(
         "phase_timing phase=ai_generation season=%s round=%d duration_ms=%.1f",
@@ -3099,8 +3154,11 @@ async def step_round_multisession(
             suppress_spoiler_events=suppress_spoiler_events,
             start_time=start,
             api_key=api_key,
+            defer_evals=defer_evals,
         )
-    # Session closed
+    # Session closed. Invalidate again now that the writes are committed, so a
+    # page built from pre-commit data during finalization is not kept.
+    invalidate_page_fragments(season_id)
     phase3_ms = (time.perf_counter() - phase3_start) * 1000
     total_ms = (time.perf_counter() - phase1_start) * 1000
     logger.info(
@@ -3119,6 +3177,12 @@ async def step_round_multisession(
         phase3_ms,
         total_ms,
     )
+    result.phase_timings_ms = {
+        "simulate_and_govern": phase1_ms,
+        "ai_generation": phase2_ms,
+        "persist_and_finalize": phase3_ms,
+        "total": total_ms,
+    }
     return result
 
 
@@ -3142,6 +3206,7 @@ class RoundResult:
         finals_matchup: dict | None = None,
         report_events: list[dict] | None = None,
         deferred_season_events: list[tuple[str, dict]] | None = None,
+        phase_timings_ms: dict[str, float] | None = None,
     ) -> None:
         self.round_number = round_number
         self.games = games
@@ -3158,6 +3223,7 @@ class RoundResult:
         self.finals_matchup = finals_matchup
         self.report_events = report_events or []
         self.deferred_season_events = deferred_season_events or []
+        self.phase_timings_ms = phase_timings_ms or {}
 
 
 # ---------------------------------------------------------------------------
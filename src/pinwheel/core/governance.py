@@ -42,6 +42,7 @@ REPEAL_TIER = 5
 
 if TYPE_CHECKING:
     from pinwheel.core.effects import EffectRegistry
+    from pinwheel.db.models import GovernanceEventRow
     from pinwheel.db.repository import Repository
 
 
@@ -759,6 +760,106 @@ def apply_rule_change(
 # --- Governance Tallying ---
 
 
+class EventBatch:
+    """Governance events collected during a tally and appended in one write.
+
+    ``flush`` is also called before any step that appends on its own
+    (effect registration, move grants, repeals), so sequence order matches
+    the order the events were produced in.
+    """
+
+    def __init__(self, repo: Repository) -> None:
+        self.repo = repo
+        self._events: list[dict] = []
+
+    def add(self, **event: object) -> None:
+        self._events.append(event)
+
+    async def flush(self) -> None:
+        if self._events:
+            events, self._events = self._events, []
+            await self.repo.append_events(events)
+
+
+def tally_proposals(
+    proposals: list[Proposal],
+    votes_by_proposal: dict[str, list[Vote]],
+    base_threshold: float,
+) -> list[tuple[Proposal, VoteTally]]:
+    """Tally every open proposal in one pass. Pure — no I/O.
+
+    Each threshold derives from the ruleset in force when the tally started,
+    not from rules enacted earlier in the same tally.
+    """
+    results: list[tuple[Proposal, VoteTally]] = []
+    for proposal in proposals:
+        if proposal.status not in ("confirmed", "amended", "submitted"):
+            continue
+        threshold = vote_threshold_for_tier(proposal.tier, base_threshold)
+        tally = tally_votes(votes_by_proposal.get(proposal.id, []), threshold)
+        tally.proposal_id = proposal.id
+        results.append((proposal, tally))
+    return results
+
+
+def _enact_rule_change(
+    batch: EventBatch,
+    ruleset: RuleSet,
+    interpretation: RuleInterpretation,
+    proposal_id: str,
+    season_id: str,
+    round_number: int,
+) -> RuleSet:
+    """Apply one rule change, recording ``rule.enacted`` or ``rule.rolled_back``."""
+    try:
+        ruleset, change = apply_rule_change(ruleset, interpretation, proposal_id, round_number)
+    except (ValidationError, ValueError):
+        payload: dict = {"reason": "validation_error", "proposal_id": proposal_id}
+        if interpretation.parameter:
+            payload["parameter"] = interpretation.parameter
+        batch.add(
+            event_type="rule.rolled_back",
+            aggregate_id=proposal_id,
+            aggregate_type="rule_change",
+            season_id=season_id,
+            payload=payload,
+        )
+        return ruleset
+    batch.add(
+        event_type="rule.enacted",
+        aggregate_id=proposal_id,
+        aggregate_type="rule_change",
+        season_id=season_id,
+        payload=change.model_dump(mode="json"),
+    )
+    return ruleset
+
+
+def _held_payload(
+    proposal: Proposal,
+    round_number: int,
+    v2_effects: list[EffectSpec],
+    repeal_target_id: str | None,
+) -> dict:
+    """Snapshot of what a held proposal would enact, for ``proposal.enactment_held``."""
+    return {
+        "proposal_id": proposal.id,
+        "tier": proposal.tier,
+        "round_number": round_number,
+        "governor_id": proposal.governor_id,
+        "team_id": proposal.team_id,
+        "raw_text": proposal.raw_text,
+        "token_cost": proposal.token_cost,
+        "interpretation": (
+            proposal.interpretation.model_dump(mode="json")
+            if proposal.interpretation
+            else None
+        ),
+        "effects_v2": [e.model_dump(mode="json") for e in v2_effects],
+        "repeal_target_effect_id": repeal_target_id,
+    }
+
+
 async def tally_governance(
     repo: Repository,
     season_id: str,
@@ -770,77 +871,42 @@ async def tally_governance(
 ) -> tuple[RuleSet, list[VoteTally]]:
     """Tally all pending proposals and enact passing rule changes.
 
-    Returns the updated ruleset and list of vote tallies.
+    Votes are tallied in one pass and every resulting event is appended in
+    a single write. Returns the updated ruleset and list of vote tallies.
     """
     tallies: list[VoteTally] = []
     ruleset = current_ruleset
+    batch = EventBatch(repo)
 
-    for proposal in proposals:
-        if proposal.status not in ("confirmed", "amended", "submitted"):
-            continue
-
-        votes = votes_by_proposal.get(proposal.id, [])
-        threshold = vote_threshold_for_tier(proposal.tier, current_ruleset.vote_threshold)
-        tally = tally_votes(votes, threshold)
-        tally.proposal_id = proposal.id
+    for proposal, tally in tally_proposals(
+        proposals, votes_by_proposal, current_ruleset.vote_threshold
+    ):
         tallies.append(tally)
 
         if tally.passed and require_approval:
-            await repo.append_event(
+            batch.add(
                 event_type="proposal.enactment_held",
                 aggregate_id=proposal.id,
                 aggregate_type="proposal",
                 season_id=season_id,
                 governor_id=proposal.governor_id,
-                payload={
-                    "proposal_id": proposal.id,
-                    "tier": proposal.tier,
-                    "round_number": round_number,
-                    "governor_id": proposal.governor_id,
-                    "team_id": proposal.team_id,
-                    "raw_text": proposal.raw_text,
-                    "token_cost": proposal.token_cost,
-                    "interpretation": (
-                        proposal.interpretation.model_dump(mode="json")
-                        if proposal.interpretation
-                        else None
-                    ),
-                    "effects_v2": [],
-                    "repeal_target_effect_id": None,
-                },
+                payload=_held_payload(proposal, round_number, [], None),
             )
         elif tally.passed and proposal.interpretation and proposal.interpretation.parameter:
-            # Enact rule
-            try:
-                ruleset, change = apply_rule_change(
-                    ruleset, proposal.interpretation, proposal.id, round_number
-                )
-                await repo.append_event(
-                    event_type="rule.enacted",
-                    aggregate_id=proposal.id,
-                    aggregate_type="rule_change",
-                    season_id=season_id,
-                    payload=change.model_dump(mode="json"),
-                )
-            except (ValidationError, ValueError):
-                await repo.append_event(
-                    event_type="rule.rolled_back",
-                    aggregate_id=proposal.id,
-                    aggregate_type="rule_change",
-                    season_id=season_id,
-                    payload={"reason": "validation_error", "proposal_id": proposal.id},
-                )
+            ruleset = _enact_rule_change(
+                batch, ruleset, proposal.interpretation, proposal.id, season_id, round_number
+            )
 
         # Record pass/fail
-        event_type = "proposal.passed" if tally.passed else "proposal.failed"
-        await repo.append_event(
-            event_type=event_type,
+        batch.add(
+            event_type="proposal.passed" if tally.passed else "proposal.failed",
             aggregate_id=proposal.id,
             aggregate_type="proposal",
             season_id=season_id,
             payload=tally.model_dump(mode="json"),
         )
 
+    await batch.flush()
     return ruleset, tallies
 
 
@@ -857,16 +923,21 @@ async def _enact_passed_proposal(
     codegen_auto_approve: bool,
     repeal_target_id: str | None,
     legacy_effects_fallback: list[EffectSpec] | None = None,
+    batch: EventBatch | None = None,
 ) -> RuleSet:
     """Enact a single passed proposal: parameter changes, v2 effects,
     move grants, custom-mechanic requests, and repeals.
 
     Shared by the tally (immediate enactment) and the admin approval gate
     (deferred enactment of a held proposal) so both paths stay identical.
-    Returns the (possibly) updated ruleset.
+    Events go to *batch* when given (the caller flushes); otherwise they are
+    appended before returning. Returns the (possibly) updated ruleset.
     """
     from pinwheel.core.effects import register_effects_for_proposal, repeal_effect
 
+    own_batch = batch is None
+    events = batch if batch is not None else EventBatch(repo)
+
     v2_param_effects = [
         e for e in v2_effects if e.effect_type == "parameter_change" and e.parameter
     ]
@@ -879,50 +950,14 @@ async def _enact_passed_proposal(
                 new_value=effect.new_value,
                 old_value=effect.old_value,
             )
-            try:
-                ruleset, change = apply_rule_change(
-                    ruleset, interp, proposal_id, round_number
-                )
-                await repo.append_event(
-                    event_type="rule.enacted",
-                    aggregate_id=proposal_id,
-                    aggregate_type="rule_change",
-                    season_id=season_id,
-                    payload=change.model_dump(mode="json"),
-                )
-            except (ValidationError, ValueError):
-                await repo.append_event(
-                    event_type="rule.rolled_back",
-                    aggregate_id=proposal_id,
-                    aggregate_type="rule_change",
-                    season_id=season_id,
-                    payload={
-                        "reason": "validation_error",
-                        "proposal_id": proposal_id,
-                        "parameter": effect.parameter,
-                    },
-                )
+            ruleset = _enact_rule_change(
+                events, ruleset, interp, proposal_id, season_id, round_number
+            )
     elif interpretation and interpretation.parameter:
         # Fallback: handle single parameter change via existing path
-        try:
-            ruleset, change = apply_rule_change(
-                ruleset, interpretation, proposal_id, round_number
-            )
-            await repo.append_event(
-                event_type="rule.enacted",
-                aggregate_id=proposal_id,
-                aggregate_type="rule_change",
-                season_id=season_id,
-                payload=change.model_dump(mode="json"),
-            )
-        except (ValidationError, ValueError):
-            await repo.append_event(
-                event_type="rule.rolled_back",
-                aggregate_id=proposal_id,
-                aggregate_type="rule_change",
-                season_id=season_id,
-                payload={"reason": "validation_error", "proposal_id": proposal_id},
-            )
+        ruleset = _enact_rule_change(
+            events, ruleset, interpretation, proposal_id, season_id, round_number
+        )
 
     # Non-parameter v2 effects (meta, hook, narrative, game-def, codegen)
     if effect_registry is not None:
@@ -934,6 +969,7 @@ async def _enact_passed_proposal(
         if not non_param_effects and legacy_effects_fallback:
             non_param_effects = legacy_effects_fallback
         if non_param_effects:
+            await events.flush()
             await register_effects_for_proposal(
                 repo=repo,
                 registry=effect_registry,
@@ -946,12 +982,15 @@ async def _enact_passed_proposal(
             )
 
     # Move grants
-    for mg in (e for e in v2_effects if e.effect_type == "move_grant"):
+    move_grants = [e for e in v2_effects if e.effect_type == "move_grant"]
+    if move_grants:
+        await events.flush()
+    for mg in move_grants:
         await _enact_move_grant(repo, season_id, mg)
 
     # Custom mechanics: request admin implementation
     for ce in (e for e in v2_effects if e.effect_type == "custom_mechanic"):
-        await repo.append_event(
+        events.add(
             event_type="effect.implementation_requested",
             aggregate_id=proposal_id,
             aggregate_type="effect",
@@ -975,6 +1014,7 @@ async def _enact_passed_proposal(
             # Governors should submit a new /propose to change the parameter.
             pass
         else:
+            await events.flush()
             await repeal_effect(
                 repo=repo,
                 registry=effect_registry,
@@ -983,6 +1023,8 @@ async def _enact_passed_proposal(
                 proposal_id=proposal_id,
             )
 
+    if own_batch:
+        await events.flush()
     return ruleset
 
 
@@ -997,6 +1039,7 @@ async def tally_governance_with_effects(
     effects_v2_by_proposal: dict[str, list[EffectSpec]] | None = None,
     codegen_auto_approve: bool = False,
     require_approval: bool = False,
+    season_events: list[GovernanceEventRow] | None = None,
 ) -> tuple[RuleSet, list[VoteTally]]:
     """Tally proposals and register effects for passing proposals.
 
@@ -1008,23 +1051,35 @@ async def tally_governance_with_effects(
     multiple parameter_change effects for a proposal, all are applied
     to the RuleSet.
 
-    Returns the updated ruleset and list of vote tallies.
+    ``season_events`` may carry the caller's already-loaded season events
+    (at least ``proposal.submitted``, ``proposal.codegen_ready`` and
+    ``effect.registered``); otherwise they are read in one query. Events
+    are buffered and appended in bulk, flushed early only around effect
+    registration. Returns the updated ruleset and list of vote tallies.
     """
 
     tallies: list[VoteTally] = []
     ruleset = current_ruleset
     _effects_v2_map = dict(effects_v2_by_proposal) if effects_v2_by_proposal else {}
+    if effect_registry is not None and season_events is None:
+        season_events = await repo.get_events_by_type(
+            season_id=season_id,
+            event_types=[
+                "proposal.submitted",
+                "proposal.codegen_ready",
+                "effect.registered",
+            ],
+        )
+    events_by_type: dict[str, list[GovernanceEventRow]] = {}
+    for ev in season_events or []:
+        events_by_type.setdefault(ev.event_type, []).append(ev)
 
     # Build a lookup of repeal target IDs from proposal submitted events.
     # Also backfill _effects_v2_map from submitted events for proposals
     # not already in the explicit map.
     repeal_targets: dict[str, str] = {}
     if effect_registry is not None:
-        submitted_events = await repo.get_events_by_type(
-            season_id=season_id,
-            event_types=["proposal.submitted"],
-        )
-        for se in submitted_events:
+        for se in events_by_type.get("proposal.submitted", []):
             pid = se.payload.get("id", se.aggregate_id)
             pid_str = str(pid)
             target_eid = se.payload.get("repeal_target_effect_id")
@@ -1044,15 +1099,9 @@ async def tally_governance_with_effects(
     # effects already registered — covers the council-finished-after-pass
     # ordering, where the pipeline registered it directly.
     if effect_registry is not None:
-        ready_events = await repo.get_events_by_type(
-            season_id=season_id,
-            event_types=["proposal.codegen_ready"],
-        )
+        ready_events = events_by_type.get("proposal.codegen_ready", [])
         if ready_events:
-            registered_events = await repo.get_events_by_type(
-                season_id=season_id,
-                event_types=["effect.registered"],
-            )
+            registered_events = events_by_type.get("effect.registered", [])
             registered_hashes = {
                 (
                     str(ev.payload.get("proposal_id", "")),
@@ -1084,14 +1133,10 @@ async def tally_governance_with_effects(
                 ):
                     existing.append(codegen_spec)
 
-    for proposal in proposals:
-        if proposal.status not in ("confirmed", "amended", "submitted"):
-            continue
-
-        votes = votes_by_proposal.get(proposal.id, [])
-        threshold = vote_threshold_for_tier(proposal.tier, current_ruleset.vote_threshold)
-        tally = tally_votes(votes, threshold)
-        tally.proposal_id = proposal.id
+    batch = EventBatch(repo)
+    for proposal, tally in tally_proposals(
+        proposals, votes_by_proposal, current_ruleset.vote_threshold
+    ):
         tallies.append(tally)
 
         if tally.passed:
@@ -1101,30 +1146,15 @@ async def tally_governance_with_effects(
                 # until the admin clears it. The payload snapshots exactly
                 # what would have been enacted (amendments already merged
                 # by the caller) so approval enacts without re-derivation.
-                await repo.append_event(
+                batch.add(
                     event_type="proposal.enactment_held",
                     aggregate_id=proposal.id,
                     aggregate_type="proposal",
                     season_id=season_id,
                     governor_id=proposal.governor_id,
-                    payload={
-                        "proposal_id": proposal.id,
-                        "tier": proposal.tier,
-                        "round_number": round_number,
-                        "governor_id": proposal.governor_id,
-                        "team_id": proposal.team_id,
-                        "raw_text": proposal.raw_text,
-                        "token_cost": proposal.token_cost,
-                        "interpretation": (
-                            proposal.interpretation.model_dump(mode="json")
-                            if proposal.interpretation
-                            else None
-                        ),
-                        "effects_v2": [
-                            e.model_dump(mode="json") for e in v2_effects
-                        ],
-                        "repeal_target_effect_id": repeal_targets.get(proposal.id),
-                    },
+                    payload=_held_payload(
+                        proposal, round_number, v2_effects, repeal_targets.get(proposal.id)
+                    ),
                 )
             else:
                 ruleset = await _enact_passed_proposal(
@@ -1140,18 +1170,19 @@ async def tally_governance_with_effects(
                     codegen_auto_approve=codegen_auto_approve,
                     repeal_target_id=repeal_targets.get(proposal.id),
                     legacy_effects_fallback=_extract_effects_from_proposal(proposal),
+                    batch=batch,
                 )
 
         # Record pass/fail
-        event_type = "proposal.passed" if tally.passed else "proposal.failed"
-        await repo.append_event(
-            event_type=event_type,
+        batch.add(
+            event_type="proposal.passed" if tally.passed else "proposal.failed",
             aggregate_id=proposal.id,
             aggregate_type="proposal",
             season_id=season_id,
             payload=tally.model_dump(mode="json"),
         )
 
+    await batch.flush()
     return ruleset, tallies
 
 
@@ -0,0 +1,490 @@
+"""Simulated impact previews for pending proposals.
+
+Governors vote on an interpretation (``three_point_value: 3 -> 4``) without
+seeing what it does to games.  A preview applies a proposal's rule changes
+to a copy of the current ``RuleSet`` (``apply_rule_change``, plus
+``GameDefinitionPatch.apply`` for game-definition effects), simulates the
+next round's matchups over a fixed set of seeds under both rule sets, and
+reports the differences: points and possessions per game, and each
+matchup's home win rate.
+
+Keeping dozens of open proposals inside one voting window:
+
+* Games run in a process pool (``workers``; 0 runs them in a thread).
+* Both arms use the same seeds, so the deltas aren't drowned in seed noise
+  and a few dozen seeds per matchup are enough.
+* The baseline arm depends only on the scenario (rules, rosters,
+  matchups), so it is simulated once and shared by every proposal.
+* Runs are keyed by the rules they simulate: identical changes share a
+  run, as do the ``/propose`` preview and the proposal once submitted.
+
+Only parameter changes and game-definition patches are simulated.  Hook,
+meta and narrative effects, team strategies and already-active effects
+are left out of both arms.
+
+Usage:
+    prepared = await prepare_preview(repo, season_id, interpretation, effects)
+    if prepared:
+        preview = await impact_previews.preview(*prepared, timeout=3.0)
+    impact_previews.get(proposal_id)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from pinwheel.core.governance import apply_rule_change
+from pinwheel.core.simulation import simulate_game
+from pinwheel.models.game_definition import GameDefinitionPatch, basketball_game_definition
+from pinwheel.models.governance import EffectSpec, RuleInterpretation
+from pinwheel.models.rules import RuleSet
+from pinwheel.models.team import Team
+
+if TYPE_CHECKING:
+    from pinwheel.db.repository import Repository
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEEDS = 32
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_ENTRIES = 128
+
+# (home score, away score, possessions) of one simulated game
+GameTotals = tuple[int, int, int]
+
+
+def _fingerprint(*parts: object) -> str:
+    body = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """What a preview simulates: the next round's matchups under the current rules."""
+
+    season_id: str
+    round_number: int
+    ruleset: RuleSet
+    matchups: tuple[tuple[Team, Team], ...]
+    key: str
+
+
+@dataclass(frozen=True)
+class Candidate:
+    """The rules a proposal would leave in force."""
+
+    ruleset: RuleSet
+    patches: tuple[dict, ...] = ()
+
+    @property
+    def key(self) -> str:
+        return _fingerprint(self.ruleset.model_dump(mode="json"), self.patches)
+
+
+@dataclass(frozen=True)
+class MatchupImpact:
+    """Home win rate of one matchup under the current and proposed rules."""
+
+    home_team: str
+    away_team: str
+    home_win_before: float
+    home_win_after: float
+
+    @property
+    def win_shift(self) -> float:
+        return self.home_win_after - self.home_win_before
+
+
+@dataclass(frozen=True)
+class ImpactPreview:
+    """Per-game averages of both arms over the same seeds."""
+
+    round_number: int
+    games: int
+    points_before: float
+    points_after: float
+    possessions_before: float
+    possessions_after: float
+    matchups: tuple[MatchupImpact, ...]
+
+    @property
+    def points_delta(self) -> float:
+        return self.points_after - self.points_before
+
+    @property
+    def pace_delta(self) -> float:
+        return self.possessions_after - self.possessions_before
+
+    @property
+    def biggest_swing(self) -> MatchupImpact | None:
+        return max(self.matchups, key=lambda m: abs(m.win_shift), default=None)
+
+
+def _simulatable(
+    interpretation: RuleInterpretation | None,
+    effects: list[EffectSpec] | None,
+) -> tuple[list[tuple[str, object]], list[dict]]:
+    """Parameter changes and game-definition patches; V2 effects win over legacy."""
+    changes: list[tuple[str, object]] = []
+    patches: list[dict] = []
+    for effect in effects or []:
+        if effect.effect_type == "parameter_change" and effect.parameter:
+            changes.append((effect.parameter, effect.new_value))
+        elif effect.effect_type == "modify_game_definition" and effect.game_def_patch:
+            patches.append(effect.game_def_patch)
+    if not effects and interpretation is not None and interpretation.parameter:
+        changes.append((interpretation.parameter, interpretation.new_value))
+    return changes, patches
+
+
+def previewable(
+    interpretation: RuleInterpretation | None = None,
+    effects: list[EffectSpec] | None = None,
+) -> bool:
+    """Whether the proposal has anything a preview can simulate."""
+    changes, patches = _simulatable(interpretation, effects)
+    return bool(changes or patches)
+
+
+def candidate_rules(
+    ruleset: RuleSet,
+    interpretation: RuleInterpretation | None = None,
+    effects: list[EffectSpec] | None = None,
+) -> Candidate | None:
+    """Apply a proposal's simulatable effects to *ruleset*.
+
+    Changes that fail validation are skipped. Returns None when nothing
+    simulatable is left.
+    """
+    changes, patches = _simulatable(interpretation, effects)
+    rules = ruleset
+    for parameter, value in changes:
+        try:
+            change = RuleInterpretation(parameter=parameter, new_value=value)
+            rules, _ = apply_rule_change(rules, change, proposal_id="", round_enacted=0)
+        except ValueError:
+            logger.info("impact_preview_change_skipped parameter=%s", parameter)
+
+    valid_patches: list[dict] = []
+    for patch in patches:
+        try:
+            GameDefinitionPatch(**patch)
+        except (ValueError, TypeError):
+            logger.info("impact_preview_patch_skipped patch=%s", patch)
+            continue
+        valid_patches.append(patch)
+
+    if rules == ruleset and not valid_patches:
+        return None
+    return Candidate(ruleset=rules, patches=tuple(valid_patches))
+
+
+async def load_scenario(repo: Repository, season_id: str) -> Scenario | None:
+    """The season's next unplayed round, or None when nothing is scheduled."""
+    from pinwheel.core.game_loop import row_to_team  # game_loop imports this module
+
+    season = await repo.get_season(season_id)
+    if season is None:
+        return None
+    round_number = (await repo.get_latest_round_number(season_id) or 0) + 1
+    schedule = await repo.get_schedule_for_round(season_id, round_number)
+    if not schedule:
+        return None
+
+    teams = {row.id: row_to_team(row) for row in await repo.get_teams_for_season(season_id)}
+    matchups = tuple(
+        (teams[entry.home_team_id], teams[entry.away_team_id])
+        for entry in schedule
+        if entry.home_team_id in teams and entry.away_team_id in teams
+    )
+    if not matchups:
+        return None
+    ruleset = RuleSet(**(season.current_ruleset or {}))
+    key = _fingerprint(
+        ruleset.model_dump(mode="json"),
+        [(home.model_dump(mode="json"), away.model_dump(mode="json")) for home, away in matchups],
+    )
+    return Scenario(
+        season_id=season_id,
+        round_number=round_number,
+        ruleset=ruleset,
+        matchups=matchups,
+        key=key,
+    )
+
+
+async def prepare_preview(
+    repo: Repository,
+    season_id: str,
+    interpretation: RuleInterpretation | None = None,
+    effects: list[EffectSpec] | None = None,
+) -> tuple[Scenario, Candidate] | None:
+    """Scenario and candidate rules for a proposal, or None if it can't be previewed."""
+    if not impact_previews.enabled or not previewable(interpretation, effects):
+        return None
+    scenario = await load_scenario(repo, season_id)
+    if scenario is None:
+        return None
+    candidate = candidate_rules(scenario.ruleset, interpretation, effects)
+    if candidate is None:
+        return None
+    return scenario, candidate
+
+
+def _simulate_seeds(
+    home: Team,
+    away: Team,
+    rules: RuleSet,
+    patches: tuple[dict, ...],
+    seeds: list[int],
+) -> list[GameTotals]:
+    """Pool worker: one matchup over *seeds* under *rules* (plus *patches*)."""
+    game_def = basketball_game_definition(rules)
+    for patch in patches:
+        game_def = GameDefinitionPatch(**patch).apply(game_def)
+    results: list[GameTotals] = []
+    for seed in seeds:
+        game = simulate_game(home, away, rules, seed, game_def=game_def)
+        results.append((game.home_score, game.away_score, game.total_possessions))
+    return results
+
+
+def summarize(
+    scenario: Scenario,
+    before: list[list[GameTotals]],
+    after: list[list[GameTotals]],
+) -> ImpactPreview:
+    """Average both arms (one list of games per matchup) into an ``ImpactPreview``."""
+
+    def mean(values: list[int]) -> float:
+        return sum(values) / max(len(values), 1)
+
+    def home_win_rate(games: list[GameTotals]) -> float:
+        return mean([1 if home > away else 0 for home, away, _ in games])
+
+    games_before = [g for matchup in before for g in matchup]
+    games_after = [g for matchup in after for g in matchup]
+    matchups = tuple(
+        MatchupImpact(
+            home_team=home.name,
+            away_team=away.name,
+            home_win_before=home_win_rate(matchup_before),
+            home_win_after=home_win_rate(matchup_after),
+        )
+        for (home, away), matchup_before, matchup_after in zip(
+            scenario.matchups, before, after, strict=True
+        )
+    )
+    return ImpactPreview(
+        round_number=scenario.round_number,
+        games=len(games_after),
+        points_before=mean([home + away for home, away, _ in games_before]),
+        points_after=mean([home + away for home, away, _ in games_after]),
+        possessions_before=mean([possessions for _, _, possessions in games_before]),
+        possessions_after=mean([possessions for _, _, possessions in games_after]),
+        matchups=matchups,
+    )
+
+
+class ImpactPreviewService:
+    """Runs previews in the background and caches them per proposal ID.
+
+    Arms are cached as tasks keyed by (scenario, rules, seeds), so callers
+    asking for the same run while it's in flight all await the one task.
+    Both caches are bounded (``max_entries`` previews, two arms each); a
+    run pushed out while still in flight is cancelled.
+    """
+
+    def __init__(
+        self,
+        seeds: int = DEFAULT_SEEDS,
+        workers: int = DEFAULT_WORKERS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self.seeds = seeds
+        self.workers = workers
+        self.max_entries = max_entries
+        self._executor: ProcessPoolExecutor | None = None
+        self._arms: OrderedDict[str, asyncio.Task[list[list[GameTotals]]]] = OrderedDict()
+        self._previews: OrderedDict[str, asyncio.Task[ImpactPreview]] = OrderedDict()
+        self._by_proposal: OrderedDict[str, str] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.seeds > 0
+
+    def configure(self, seeds: int, workers: int) -> None:
+        self.shutdown()
+        self.seeds = seeds
+        self.workers = workers
+
+    def get(self, proposal_id: str) -> ImpactPreview | None:
+        """The finished preview for *proposal_id*, if there is one."""
+        key = self._by_proposal.get(proposal_id)
+        task = self._previews.get(key) if key else None
+        if task is None or not task.done() or task.cancelled() or task.exception():
+            return None
+        return task.result()
+
+    def start(
+        self,
+        scenario: Scenario,
+        candidate: Candidate,
+        proposal_id: str = "",
+    ) -> asyncio.Task[ImpactPreview]:
+        """Schedule (or reuse) the preview run; remember it under *proposal_id*."""
+        key = _fingerprint(scenario.key, candidate.key, self.seeds)
+        task = _cached(self._previews, key)
+        if task is None:
+            task = asyncio.create_task(self._run(scenario, candidate))
+            _store(self._previews, key, task, self.max_entries)
+        if proposal_id:
+            self._by_proposal[proposal_id] = key
+            self._by_proposal.move_to_end(proposal_id)
+            while len(self._by_proposal) > self.max_entries:
+                self._by_proposal.popitem(last=False)
+        return task
+
+    def forget(self, proposal_ids: Iterable[str]) -> None:
+        """Drop the preview links of proposals that have left the ballot (tallied)."""
+        for proposal_id in proposal_ids:
+            self._by_proposal.pop(proposal_id, None)
+
+    async def preview(
+        self,
+        scenario: Scenario,
+        candidate: Candidate,
+        proposal_id: str = "",
+        timeout: float | None = None,
+    ) -> ImpactPreview | None:
+        """Wait up to *timeout* seconds for the preview; the run continues either way."""
+        task = self.start(scenario, candidate, proposal_id)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except TimeoutError:
+            return None
+        except asyncio.CancelledError:
+            # The run was evicted by newer previews; our own cancellation propagates
+            current = asyncio.current_task()
+            if not task.cancelled() or (current is not None and current.cancelling()):
+                raise
+            return None
+        except Exception:  # Simulation errors are logged; the vote goes on without a preview
+            logger.exception("impact_preview_failed round=%d", scenario.round_number)
+            return None
+
+    async def wait_idle(self) -> None:
+        """Wait until every preview started so far has finished (or failed)."""
+        await asyncio.gather(*self._previews.values(), return_exceptions=True)
+
+    def shutdown(self) -> None:
+        for task in [*self._previews.values(), *self._arms.values()]:
+            task.cancel()
+        self._previews.clear()
+        self._arms.clear()
+        self._by_proposal.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, scenario: Scenario, candidate: Candidate) -> ImpactPreview:
+        started = time.monotonic()
+        baseline = self._arm(scenario, Candidate(ruleset=scenario.ruleset))
+        proposed = self._arm(scenario, candidate)
+        before, after = await asyncio.gather(asyncio.shield(baseline), asyncio.shield(proposed))
+        preview = summarize(scenario, before, after)
+        logger.info(
+            "impact_preview_done season=%s round=%d games=%d points_delta=%.1f elapsed=%.2fs",
+            scenario.season_id,
+            scenario.round_number,
+            preview.games,
+            preview.points_delta,
+            time.monotonic() - started,
+        )
+        return preview
+
+    def _arm(self, scenario: Scenario, candidate: Candidate) -> asyncio.Task:
+        key = _fingerprint(scenario.key, candidate.key, self.seeds)
+        task = _cached(self._arms, key)
+        if task is None:
+            task = asyncio.create_task(self._simulate(scenario, candidate))
+            _store(self._arms, key, task, 2 * self.max_entries)
+        return task
+
+    async def _simulate(self, scenario: Scenario, candidate: Candidate) -> list[list[GameTotals]]:
+        """Every matchup over ``seeds`` seeds, split into one chunk per worker."""
+        loop = asyncio.get_running_loop()
+        executor = self._pool()
+        chunks = max(self.workers, 1)
+        seeds = list(range(self.seeds))
+        jobs = [
+            [
+                loop.run_in_executor(
+                    executor,
+                    _simulate_seeds,
+                    home,
+                    away,
+                    candidate.ruleset,
+                    candidate.patches,
+                    seeds[i::chunks],
+                )
+                for i in range(chunks)
+            ]
+            for home, away in scenario.matchups
+        ]
+        return [[g for part in await asyncio.gather(*parts) for g in part] for parts in jobs]
+
+    def _pool(self) -> ProcessPoolExecutor | None:
+        """The worker pool (spawned on first use); None runs games in a thread."""
+        if self.workers <= 0:
+            return None
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+
+def _cached(tasks: OrderedDict[str, asyncio.Task], key: str) -> asyncio.Task | None:
+    """A reusable task for *key*: in flight or succeeded, not failed or cancelled."""
+    task = tasks.get(key)
+    if task is None:
+        return None
+    if task.done() and (task.cancelled() or task.exception() is not None):
+        del tasks[key]
+        return None
+    tasks.move_to_end(key)
+    return task
+
+
+def _store(
+    tasks: OrderedDict[str, asyncio.Task], key: str, task: asyncio.Task, max_entries: int
+) -> None:
+    """Insert *task*, evicting the oldest entries beyond *max_entries*.
+
+    Finished entries go first; if in-flight runs alone overflow the cache,
+    the oldest of those are cancelled and dropped as well.
+    """
+    tasks[key] = task
+    excess = len(tasks) - max_entries
+    if excess <= 0:
+        return
+    finished = [k for k, t in tasks.items() if t.done()]
+    running = [k for k, t in tasks.items() if not t.done() and k != key]
+    for old in (finished + running)[:excess]:
+        tasks.pop(old).cancel()
+
+
+# Disabled (seeds=0) until main.lifespan configures it from settings.
+impact_previews = ImpactPreviewService(seeds=0)
@@ -0,0 +1,143 @@
+"""Season-scoped governor membership cache.
+
+Every Discord interaction resolves its governor (``get_governor``), every
+vote recounts the voter's team to compute its weight, and every tally
+round walks each team's governors to regenerate tokens.  Each did its own
+queries, so a burst of votes just before a tally became a query storm over
+data that only changes when someone joins.
+
+``membership_cache.get`` loads a season's enrolled governors (and team
+names) in one query and answers from memory:
+
+* governor -> team, Discord id -> governor
+* team -> governor ids, active count and vote weight
+
+Invalidation:
+
+* ``Repository.enroll_player`` invalidates the season joined and the one
+  left, immediately (for readers in the same transaction) and again after
+  commit (so a concurrent reader can't keep pre-commit rows).  Every
+  enrollment path — ``/join``, role healing, season carry-over, API or
+  scripts — goes through it.
+* A TTL bounds staleness for enrollments written by another process.
+* Callers treat a Discord-id miss as "maybe stale" and re-check the DB
+  before refusing (``discord.helpers.get_governor``).
+
+Usage:
+    membership = await membership_cache.get(repo, season_id)
+    weight = membership.vote_weight(team_id)
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from pinwheel.core.governance import compute_vote_weight
+
+if TYPE_CHECKING:
+    from pinwheel.db.repository import Repository
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300.0
+
+
+@dataclass(frozen=True)
+class Governor:
+    """One enrolled governor, as the cache knows them."""
+
+    player_id: str
+    discord_id: str
+    team_id: str
+
+
+@dataclass
+class SeasonMembership:
+    """Enrolled governors of one season, indexed both ways."""
+
+    season_id: str
+    by_player: dict[str, Governor] = field(default_factory=dict)
+    by_discord: dict[str, Governor] = field(default_factory=dict)
+    by_team: dict[str, list[str]] = field(default_factory=dict)
+    team_names: dict[str, str] = field(default_factory=dict)
+    loaded_at: float = 0.0
+
+    def add(self, governor: Governor) -> None:
+        self.by_player[governor.player_id] = governor
+        if governor.discord_id:
+            self.by_discord[governor.discord_id] = governor
+        self.by_team.setdefault(governor.team_id, []).append(governor.player_id)
+
+    def team_of(self, player_id: str) -> str | None:
+        governor = self.by_player.get(player_id)
+        return governor.team_id if governor else None
+
+    def governors_on(self, team_id: str) -> list[str]:
+        return self.by_team.get(team_id, [])
+
+    def active_count(self, team_id: str) -> int:
+        return len(self.by_team.get(team_id, ()))
+
+    def counts_by_team(self) -> dict[str, int]:
+        return {team_id: len(ids) for team_id, ids in self.by_team.items()}
+
+    def vote_weight(self, team_id: str) -> float:
+        """Weight of one vote from *team_id* (team total 1.0, split evenly)."""
+        return compute_vote_weight(self.active_count(team_id))
+
+
+async def load_membership(repo: Repository, season_id: str) -> SeasonMembership:
+    """Read a season's enrolled governors and team names from the DB."""
+    membership = SeasonMembership(season_id=season_id, loaded_at=time.monotonic())
+    for player in await repo.get_all_governors_for_season(season_id):
+        if player.team_id is None:
+            continue
+        membership.add(
+            Governor(
+                player_id=player.id,
+                discord_id=player.discord_id or "",
+                team_id=player.team_id,
+            )
+        )
+    for team in await repo.get_teams_for_season(season_id):
+        membership.team_names[team.id] = team.name
+    return membership
+
+
+class MembershipCache:
+    """Per-season ``SeasonMembership`` with explicit invalidation and a TTL."""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._seasons: dict[str, SeasonMembership] = {}
+
+    def configure(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._seasons.clear()
+
+    def invalidate(self, season_id: str) -> None:
+        if self._seasons.pop(season_id, None) is not None:
+            logger.info("membership_cache_invalidated season=%s", season_id)
+
+    def clear(self) -> None:
+        self._seasons.clear()
+
+    async def get(self, repo: Repository, season_id: str) -> SeasonMembership:
+        """The season's membership, loaded on first use or after expiry."""
+        cached = self._seasons.get(season_id)
+        if cached is not None and time.monotonic() - cached.loaded_at < self.ttl_seconds:
+            return cached
+        membership = await load_membership(repo, season_id)
+        self._seasons[season_id] = membership
+        logger.info(
+            "membership_cache_loaded season=%s governors=%d",
+            season_id,
+            len(membership.by_player),
+        )
+        return membership
+
+
+membership_cache = MembershipCache()
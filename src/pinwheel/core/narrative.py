@@ -106,7 +106,7 @@ class NarrativeContext:
     """Lightweight summaries of completed seasons from the archive."""
 
 
-def _build_bedrock_facts(ruleset: RuleSet) -> str:
+def build_bedrock_facts(ruleset: RuleSet) -> str:
     """Build verified structural facts about the league from the current ruleset.
 
     These facts appear at the top of every AI prompt and must not be contradicted.
@@ -345,7 +345,7 @@ async def compute_narrative_context(
 
     # --- Bedrock facts ---
     if ruleset is not None:
-        ctx.bedrock_facts = _build_bedrock_facts(ruleset)
+        ctx.bedrock_facts = build_bedrock_facts(ruleset)
 
     # --- Prior season memory ---
     try:
@@ -606,26 +606,10 @@ def _build_rules_narrative(
     return "; ".join(parts)
 
 
-def format_narrative_for_prompt(ctx: NarrativeContext) -> str:
-    """Format NarrativeContext as a text block suitable for AI prompt injection.
-
-    This produces a structured text summary that can be appended to
-    commentary, report, or any AI prompt to give the model dramatic context.
-
-    Args:
-        ctx: The narrative context to format.
-
-    Returns:
-        Multi-line string with all relevant narrative context.
-    """
+def _round_lines(ctx: NarrativeContext) -> list[str]:
+    """Phase, standings, matchups, hot players — changes every round."""
     lines: list[str] = []
 
-    # Bedrock facts at the TOP — ground truth the AI must not contradict
-    if ctx.bedrock_facts:
-        lines.append("=== LEAGUE FACTS (do not contradict) ===")
-        lines.append(ctx.bedrock_facts)
-        lines.append("")
-
     # Phase and arc
     if ctx.phase not in ("regular",):
         phase_labels = {
@@ -703,6 +687,13 @@ def format_narrative_for_prompt(ctx: NarrativeContext) -> str:
     if ctx.season_game_number > 0:
         lines.append(f"\nSeason game count: {ctx.season_game_number} games played so far")
 
+    return lines
+
+
+def _rules_lines(ctx: NarrativeContext) -> list[str]:
+    """Rule changes and active effects — stable between governance tallies."""
+    lines: list[str] = []
+
     # Rule changes
     if ctx.rules_narrative:
         lines.append(f"\nRule changes in effect: {ctx.rules_narrative}")
@@ -717,7 +708,12 @@ def format_narrative_for_prompt(ctx: NarrativeContext) -> str:
     if ctx.effects_narrative:
         lines.append(f"\nActive proposal effects:\n{ctx.effects_narrative}")
 
-    # Governance
+    return lines
+
+
+def _governance_lines(ctx: NarrativeContext) -> list[str]:
+    """Pending proposals and tally timing — changes every round."""
+    lines: list[str] = []
     if ctx.pending_proposals > 0:
         lines.append(
             f"\nGovernance: {ctx.pending_proposals} proposal(s) pending"
@@ -726,8 +722,12 @@ def format_narrative_for_prompt(ctx: NarrativeContext) -> str:
         lines.append("Governance window: OPEN this round")
     elif ctx.next_tally_round is not None:
         lines.append(f"Next governance tally: Round {ctx.next_tally_round}")
+    return lines
 
-    # Prior season memory
+
+def _history_lines(ctx: NarrativeContext) -> list[str]:
+    """Prior season memory — fixed for the whole season."""
+    lines: list[str] = []
     if ctx.prior_seasons:
         lines.append("\nLeague history:")
         for ps in ctx.prior_seasons:
@@ -745,5 +745,49 @@ def format_narrative_for_prompt(ctx: NarrativeContext) -> str:
             notable = ps.get("notable_rules")
             if notable and isinstance(notable, list):
                 lines.append(f"    Key rules: {', '.join(str(r) for r in notable)}")
+    return lines
+
+
+def format_narrative_for_prompt(ctx: NarrativeContext) -> str:
+    """Format NarrativeContext as a text block suitable for AI prompt injection.
+
+    This produces a structured text summary that can be appended to
+    commentary, report, or any AI prompt to give the model dramatic context.
+
+    Args:
+        ctx: The narrative context to format.
+
+    Returns:
+        Multi-line string with all relevant narrative context.
+    """
+    lines: list[str] = []
+
+    # Bedrock facts at the TOP — ground truth the AI must not contradict
+    if ctx.bedrock_facts:
+        lines.append("=== LEAGUE FACTS (do not contradict) ===")
+        lines.append(ctx.bedrock_facts)
+        lines.append("")
+
+    lines.extend(_round_lines(ctx))
+    lines.extend(_rules_lines(ctx))
+    lines.extend(_governance_lines(ctx))
+    lines.extend(_history_lines(ctx))
 
     return "\n".join(lines)
+
+
+def format_narrative_layers(ctx: NarrativeContext) -> tuple[str, str]:
+    """Split the narrative into a season-stable block and a per-round block.
+
+    The same content as ``format_narrative_for_prompt`` minus the bedrock
+    facts, ordered for prompt caching: rule changes, active effects and
+    league history only change at a governance tally, so they can sit in a
+    cached prompt prefix; standings, matchups and governance timing change
+    every round and belong in the uncached tail.
+
+    Returns:
+        ``(season_block, round_block)`` — either may be empty.
+    """
+    season = "\n".join(_rules_lines(ctx) + _history_lines(ctx)).strip()
+    round_ = "\n".join(_round_lines(ctx) + _governance_lines(ctx)).strip()
+    return season, round_
@@ -5,6 +5,12 @@ The presenter takes those results and drips possession-by-possession events thro
 the EventBus so the frontend receives them in real time via SSE.
 
 All games in a round run concurrently — the arena shows them side by side.
+Each game is described as a *timeline*: an async generator that publishes its
+next event(s) and then yields the wall-clock pause it wants before the next
+step.  ``present_round`` merges every game's timeline into one heap-ordered
+scheduler, so a round costs one sleeping coroutine no matter how many games
+it has, and events that land in the same tick go out as a single batch in a
+deterministic (due time, game index) order.
 
 The presenter also writes running state to ``PresentationState.live_games`` so
 the arena page can server-render current scores on every page load — no gap
@@ -18,8 +24,11 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import heapq
 import logging
-from collections.abc import Awaitable, Callable
+import math
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from dataclasses import dataclass, field
 
 from pinwheel.core.drama import (
@@ -76,6 +85,8 @@ class PresentationState:
     game_summaries: list[dict] = field(default_factory=list)
     name_cache: dict[str, str] = field(default_factory=dict)
     color_cache: dict[str, tuple[str, str]] = field(default_factory=dict)
+    # In-flight on_game_finished callbacks (referenced so they aren't GC'd)
+    callback_tasks: set[asyncio.Task[None]] = field(default_factory=set)
 
     def reset(self) -> None:
         """Reset state for a new presentation."""
@@ -101,6 +112,7 @@ async def present_round(
     on_game_finished: Callable[[int], Awaitable[None]] | None = None,
     game_summaries: list[dict] | None = None,
     skip_quarters: int = 0,
+    tick_seconds: float = 0.0,
 ) -> None:
     """Replay a round's games concurrently over real time via EventBus.
 
@@ -109,6 +121,9 @@ async def present_round(
     presentation is physically correct.  The *spacing* between rounds is
     handled by the APScheduler cron — not by this function.
 
+    Games are driven by a single merged-timeline scheduler (see
+    ``_run_merged_timelines``) rather than one coroutine per game.
+
     Args:
         game_results: Pre-computed game results from simulation.
         event_bus: EventBus instance for publishing events.
@@ -121,6 +136,9 @@ async def present_round(
         on_game_finished: Async callback invoked with game_index after each game finishes.
         game_summaries: Game summary dicts from step_round (for Discord notifications).
         skip_quarters: Number of quarters to fast-forward through (for resume after deploy).
+        tick_seconds: Scheduler tick granularity. Events due within the same
+            tick are emitted together in one batch. ``0`` means no batching —
+            every event fires at its exact due time.
     """
     if state.is_active:
         logger.warning(
@@ -140,8 +158,8 @@ async def present_round(
     state.live_games = {}
 
     try:
-        tasks = [
-            _present_full_game(
+        timelines = [
+            _full_game_timeline(
                 game_idx=idx,
                 game_result=gr,
                 total_games=len(game_results),
@@ -155,7 +173,8 @@ async def present_round(
             )
             for idx, gr in enumerate(game_results)
         ]
-        await asyncio.gather(*tasks)
+        await _run_merged_timelines(timelines, state, tick_seconds=tick_seconds)
+        await _drain_callbacks(state)
 
         # Derive playoff_context from game summaries for the round event
         _round_pc: str | None = None
@@ -174,9 +193,96 @@ async def present_round(
         )
 
     finally:
+        await _drain_callbacks(state)
         state.is_active = False
 
 
+async def _drain_callbacks(state: PresentationState) -> None:
+    """Wait for dispatched on_game_finished callbacks (errors already logged)."""
+    while state.callback_tasks:
+        await asyncio.gather(*state.callback_tasks, return_exceptions=True)
+
+
+def _dispatch_game_finished(
+    callback: Callable[[int], Awaitable[None]],
+    game_idx: int,
+    state: PresentationState,
+) -> None:
+    """Run *callback* as its own task so a slow one can't stall other timelines."""
+
+    async def run() -> None:
+        try:
+            await callback(game_idx)
+        except Exception:  # Last-resort handler — arbitrary callback, unknown error types
+            logger.exception("on_game_finished callback failed for game %d", game_idx)
+
+    task = asyncio.create_task(run(), name=f"game-finished-{game_idx}")
+    state.callback_tasks.add(task)
+    task.add_done_callback(state.callback_tasks.discard)
+
+
+async def _run_merged_timelines(
+    timelines: list[AsyncGenerator[float, None]],
+    state: PresentationState,
+    tick_seconds: float = 0.0,
+) -> None:
+    """Drive every game timeline from one heap-ordered scheduler.
+
+    Each timeline is advanced until it yields the delay before its next step;
+    the step is then pushed onto a heap keyed by ``(due, game_index)``.  Due
+    times are cumulative *virtual* offsets from the start of the round, so
+    publish latency never accumulates into drift.
+
+    With ``tick_seconds > 0`` due times are rounded up to the next tick
+    boundary and every timeline due in that tick is advanced in one batch
+    before the scheduler sleeps again.  The sleep wakes early on
+    ``state.cancel_event``.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    # (due_offset, game_index, timeline)
+    heap: list[tuple[float, int, AsyncGenerator[float, None]]] = [
+        (0.0, idx, timeline) for idx, timeline in enumerate(timelines)
+    ]
+    heapq.heapify(heap)
+
+    try:
+        while heap:
+            if state.cancel_event.is_set():
+                return
+
+            batch_due = _quantize(heap[0][0], tick_seconds)
+            wait = batch_due - (loop.time() - started)
+            if wait > 0:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(state.cancel_event.wait(), timeout=wait)
+                if state.cancel_event.is_set():
+                    return
+
+            # Pop the whole batch first so steps re-queued at this same tick
+            # (zero delays) run in the next batch, after their peers.
+            batch: list[tuple[float, int, AsyncGenerator[float, None]]] = []
+            while heap and _quantize(heap[0][0], tick_seconds) <= batch_due:
+                batch.append(heapq.heappop(heap))
+
+            for due, idx, timeline in batch:
+                try:
+                    delay = await anext(timeline)
+                except StopAsyncIteration:
+                    continue
+                heapq.heappush(heap, (due + max(delay, 0.0), idx, timeline))
+    finally:
+        for _, _, timeline in heap:
+            await timeline.aclose()
+
+
+def _quantize(due: float, tick_seconds: float) -> float:
+    """Round a due offset up to the next tick boundary (identity when tick is 0)."""
+    if tick_seconds <= 0:
+        return due
+    return math.ceil(due / tick_seconds - 1e-9) * tick_seconds
+
+
 def _compute_leaders(
     game_result: GameResult, names: dict[str, str]
 ) -> tuple[dict | None, dict | None]:
@@ -210,7 +316,39 @@ async def _present_full_game(
     on_game_finished: Callable[[int], Awaitable[None]] | None,
     skip_quarters: int = 0,
 ) -> None:
-    """Present a single game: starting event → possessions → finished event."""
+    """Present a single game on its own, sleeping between timeline steps."""
+    async for delay in _full_game_timeline(
+        game_idx,
+        game_result,
+        total_games,
+        event_bus,
+        state,
+        quarter_replay_seconds,
+        names,
+        colors,
+        on_game_finished,
+        skip_quarters=skip_quarters,
+    ):
+        await asyncio.sleep(delay)
+    await _drain_callbacks(state)
+
+
+async def _full_game_timeline(
+    game_idx: int,
+    game_result: GameResult,
+    total_games: int,
+    event_bus: EventBus,
+    state: PresentationState,
+    quarter_replay_seconds: int,
+    names: dict[str, str],
+    colors: dict[str, tuple[str, str]],
+    on_game_finished: Callable[[int], Awaitable[None]] | None,
+    skip_quarters: int = 0,
+) -> AsyncGenerator[float, None]:
+    """Timeline for a single game: starting event → possessions → finished event.
+
+    Yields the delay (seconds) to wait before the next step.
+    """
     if state.cancel_event.is_set():
         return
 
@@ -267,7 +405,7 @@ async def _present_full_game(
         },
     )
 
-    await _present_game(
+    async for delay in _game_timeline(
         game_idx,
         game_result,
         event_bus,
@@ -276,7 +414,8 @@ async def _present_full_game(
         names,
         colors,
         skip_quarters=skip_quarters,
-    )
+    ):
+        yield delay
 
     if state.cancel_event.is_set():
         return
@@ -324,13 +463,10 @@ async def _present_full_game(
     await event_bus.publish("presentation.game_finished", finished_data)
 
     if on_game_finished is not None:
-        try:
-            await on_game_finished(game_idx)
-        except Exception:  # Last-resort handler — arbitrary callback, unknown error types
-            logger.exception("on_game_finished callback failed for game %d", game_idx)
+        _dispatch_game_finished(on_game_finished, game_idx, state)
 
 
-async def _present_game(
+async def _game_timeline(
     game_idx: int,
     game_result: GameResult,
     event_bus: EventBus,
@@ -339,9 +475,11 @@ async def _present_game(
     names: dict[str, str],
     colors: dict[str, tuple[str, str]],
     skip_quarters: int = 0,
-) -> None:
+) -> AsyncGenerator[float, None]:
     """Drip a single game's possessions over real time with dramatic pacing.
 
+    Publishes one possession per step and yields the pause before the next.
+
     Pre-annotates the full game with ``annotate_drama()`` and uses per-possession
     delays instead of a flat delay. Dramatic moments get more time, routine
     moments get less, but the total quarter duration stays the same.
@@ -543,4 +681,4 @@ async def _present_game(
 
             await event_bus.publish("presentation.possession", play_dict)
 
-            await asyncio.sleep(delays[i])
+            yield delays[i]
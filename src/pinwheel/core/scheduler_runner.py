@@ -14,6 +14,7 @@ import json
 import logging
 import os
 import time
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from uuid import uuid4
 
@@ -23,7 +24,12 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncEngine
 
 from pinwheel.core.event_bus import EventBus
-from pinwheel.core.game_loop import step_round_multisession, tally_pending_governance
+from pinwheel.core.fragment_cache import invalidate_season as invalidate_page_fragments
+from pinwheel.core.game_loop import (
+    RoundResult,
+    step_round_multisession,
+    tally_pending_governance,
+)
 from pinwheel.core.presenter import PresentationState, present_round
 from pinwheel.db.engine import get_session
 from pinwheel.db.models import BotStateRow, GameResultRow, ScheduleRow
@@ -132,6 +138,86 @@ def _build_color_cache(teams_cache: dict) -> dict[str, tuple[str, str]]:
     return colors
 
 
+def _report_game_index(report_event: dict, game_results: list) -> int | None:
+    """Index of the game a report is about, or None for a round-level report.
+
+    Series recaps name the two teams; the matching game is the last one they
+    played this round (the one that decided the series).
+    """
+    teams = {report_event.get("winner_id"), report_event.get("loser_id")}
+    if None in teams:
+        return None
+    match = None
+    for idx, result in enumerate(game_results):
+        if {result.home_team_id, result.away_team_id} == teams:
+            match = idx
+    return match
+
+
+class _ReportSchedule:
+    """Publishes a round's reports and game commentary as the replay reaches them.
+
+    A report about one game goes out once that game has been presented;
+    round-level reports go out when the whole round has.  In pipelined mode
+    the reports arrive (``add``) while the replay is under way, so any whose
+    point has already passed are published immediately.
+
+    Streamed ``game.commentary`` events (``add_commentary``) follow the same
+    rule per game: held until the game has been presented, keeping only the
+    latest text, then passed straight through.
+    """
+
+    def __init__(self, event_bus: EventBus, game_results: list) -> None:
+        self.event_bus = event_bus
+        self.game_results = game_results
+        self.presented: set[int] = set()
+        self.round_done = False
+        self.pending: list[tuple[int | None, dict]] = []
+        self.held_commentary: dict[int, dict] = {}
+
+    async def add_commentary(self, commentary_event: dict) -> None:
+        game_index = commentary_event["game_index"]
+        if self.round_done or game_index in self.presented:
+            await self.event_bus.publish("game.commentary", commentary_event)
+        else:
+            # The text is cumulative, so only the newest one is worth sending
+            self.held_commentary[game_index] = commentary_event
+
+    async def add(self, report_events: list[dict]) -> None:
+        self.pending.extend(
+            (_report_game_index(rev, self.game_results), rev) for rev in report_events
+        )
+        await self._publish_due()
+
+    async def game_finished(self, game_index: int) -> None:
+        self.presented.add(game_index)
+        await self._publish_due()
+
+    async def round_finished(self) -> None:
+        self.round_done = True
+        await self._publish_due()
+
+    async def _publish_due(self) -> None:
+        shown = [
+            idx for idx in self.held_commentary if self.round_done or idx in self.presented
+        ]
+        for idx in shown:
+            await self.event_bus.publish("game.commentary", self.held_commentary.pop(idx))
+        due = [
+            rev
+            for idx, rev in self.pending
+            if self.round_done or (idx is not None and idx in self.presented)
+        ]
+        # Swap before publishing so concurrent callers never send a report twice
+        self.pending = [
+            (idx, rev)
+            for idx, rev in self.pending
+            if not (self.round_done or (idx is not None and idx in self.presented))
+        ]
+        for rev in due:
+            await self.event_bus.publish("report.generated", rev)
+
+
 async def _present_and_clear(
     engine: AsyncEngine,
     game_results: list,
@@ -141,14 +227,43 @@ async def _present_and_clear(
     quarter_replay_seconds: int = 300,
     name_cache: dict[str, str] | None = None,
     color_cache: dict[str, tuple[str, str]] | None = None,
-    on_game_finished: object = None,
+    on_game_finished: Callable[[int], Awaitable[None]] | None = None,
     game_summaries: list[dict] | None = None,
     skip_quarters: int = 0,
+    tick_seconds: float = 0.0,
     governance_summary: dict | None = None,
     report_events: list[dict] | None = None,
     deferred_season_events: list[tuple[str, dict]] | None = None,
+    round_finalized: asyncio.Future[RoundResult | None] | None = None,
+    reports: _ReportSchedule | None = None,
 ) -> None:
-    """Wrapper: run present_round, then clear the persisted state flag."""
+    """Wrapper: run present_round, then clear the persisted state flag.
+
+    Reports are published as the replay reaches them (see
+    ``_ReportSchedule``).  In pipelined mode the presentation starts before
+    the round's reports exist; ``round_finalized`` resolves to the finished
+    ``RoundResult`` (or ``None`` if the round failed) and its reports join
+    the schedule then.  Governance and deferred season events are published
+    once both the replay and the AI phase are done.  Pipelined mode passes
+    its own ``reports`` schedule, which the AI phase streams commentary into.
+    """
+    schedule = reports if reports is not None else _ReportSchedule(event_bus, game_results)
+
+    async def game_finished(game_index: int) -> None:
+        if on_game_finished is not None:
+            await on_game_finished(game_index)
+        await schedule.game_finished(game_index)
+
+    async def collect_reports() -> RoundResult | None:
+        if round_finalized is None:
+            await schedule.add(report_events or [])
+            return None
+        finalized = await round_finalized
+        if finalized is not None:
+            await schedule.add(finalized.report_events)
+        return finalized
+
+    collecting = asyncio.create_task(collect_reports())
     try:
         await present_round(
             game_results=game_results,
@@ -158,14 +273,18 @@ async def _present_and_clear(
             quarter_replay_seconds=quarter_replay_seconds,
             name_cache=name_cache,
             color_cache=color_cache,
-            on_game_finished=on_game_finished,
+            on_game_finished=game_finished,
             game_summaries=game_summaries,
             skip_quarters=skip_quarters,
+            tick_seconds=tick_seconds,
         )
     finally:
-        # Publish deferred report events after presentation finishes
-        for rev in report_events or []:
-            await event_bus.publish("report.generated", rev)
+        finalized = await collecting
+        if finalized is not None:
+            deferred_season_events = finalized.deferred_season_events
+
+        # Round-level reports (and any game whose replay was cut short)
+        await schedule.round_finished()
 
         # Publish governance notification after presentation finishes
         if governance_summary:
@@ -183,11 +302,87 @@ async def _present_and_clear(
         logger.info("presentation_state_cleared")
 
 
+async def _start_replay_presentation(
+    engine: AsyncEngine,
+    event_bus: EventBus,
+    presentation_state: PresentationState,
+    season_id: str,
+    round_result: RoundResult,
+    game_interval_seconds: int = 1800,
+    quarter_replay_seconds: int = 300,
+    presentation_tick_seconds: float = 0.0,
+    round_finalized: asyncio.Future[RoundResult | None] | None = None,
+    reports: _ReportSchedule | None = None,
+) -> bool:
+    """Launch the replay of *round_result* as a background task.
+
+    Returns False (and starts nothing) when there are no games or a
+    presentation is already running.
+    """
+    if not round_result.game_results or presentation_state.is_active:
+        return False
+
+    round_number = round_result.round_number
+    presentation_state.current_round = round_number
+
+    # Build name + color cache from teams_cache for human-readable events
+    name_cache = _build_name_cache(round_result.teams_cache)
+    color_cache = _build_color_cache(round_result.teams_cache)
+
+    # Create callback to mark games as presented in the DB
+    game_row_ids = round_result.game_row_ids
+
+    async def mark_presented(game_index: int) -> None:
+        async with get_session(engine) as mark_session:
+            mark_repo = Repository(mark_session)
+            if game_index < len(game_row_ids):
+                await mark_repo.mark_game_presented(game_row_ids[game_index])
+
+    # Persist start time so we can resume after deploy
+    await _persist_presentation_start(
+        engine,
+        season_id,
+        round_number,
+        round_result.game_row_ids,
+        quarter_replay_seconds,
+    )
+
+    asyncio.create_task(
+        _present_and_clear(
+            engine=engine,
+            game_results=round_result.game_results,
+            event_bus=event_bus,
+            state=presentation_state,
+            game_interval_seconds=game_interval_seconds,
+            quarter_replay_seconds=quarter_replay_seconds,
+            name_cache=name_cache,
+            color_cache=color_cache,
+            on_game_finished=mark_presented,
+            game_summaries=round_result.games,
+            tick_seconds=presentation_tick_seconds,
+            governance_summary=round_result.governance_summary,
+            report_events=round_result.report_events,
+            deferred_season_events=round_result.deferred_season_events,
+            round_finalized=round_finalized,
+            reports=reports,
+        )
+    )
+    logger.info(
+        "presentation_started season=%s round=%d games=%d pipelined=%s",
+        season_id,
+        round_number,
+        len(round_result.game_results),
+        round_finalized is not None,
+    )
+    return True
+
+
 async def resume_presentation(
     engine: AsyncEngine,
     event_bus: EventBus,
     presentation_state: PresentationState,
     quarter_replay_seconds: int = 300,
+    presentation_tick_seconds: float = 0.0,
 ) -> bool:
     """Check for an interrupted presentation and resume it if found.
 
@@ -371,6 +566,7 @@ async def resume_presentation(
             on_game_finished=mark_presented,
             game_summaries=game_summaries,
             skip_quarters=skip_quarters,
+            tick_seconds=presentation_tick_seconds,
         )
     )
 
@@ -392,6 +588,9 @@ async def tick_round(
     game_interval_seconds: int = 1800,
     quarter_replay_seconds: int = 300,
     governance_interval: int = 1,
+    presentation_tick_seconds: float = 0.0,
+    pipelined_rounds: bool = False,
+    defer_evals: bool = False,
 ) -> None:
     """Advance the active season by one round.
 
@@ -401,6 +600,13 @@ async def tick_round(
     * Calls ``step_round`` to execute simulation, governance, reports, and evals.
     * Commits on success; rolls back on error.
 
+    With ``pipelined_rounds`` in replay mode, the presentation starts as soon
+    as the games are simulated and stored; the AI phase runs while the games
+    replay, and its reports are published as the replay reaches them.
+
+    With ``defer_evals`` the round's evals are queued for ``tick_eval_jobs``
+    rather than run before the round returns.
+
     If no season exists the tick is silently skipped.
     All exceptions are caught and logged so the scheduler is never interrupted.
     """
@@ -426,6 +632,13 @@ async def tick_round(
         round_result = None
         season_id = ""
         next_round = 0
+        round_finalized: asyncio.Future[RoundResult | None] | None = None
+        on_simulated = None
+        on_commentary = None
+        presentation_started = False
+        # Season whose governance-only tally must reach public pages once the
+        # pre-flight session has committed
+        tallied_season_id: str | None = None
 
         # --- Pre-flight session: determine season state + next round number ---
         async with get_session(engine) as session:
@@ -538,6 +751,7 @@ async def tick_round(
                         "governance.window_closed",
                         governance_summary,
                     )
+                    tallied_season_id = season.id
                     logger.info(
                         "offseason_governance_tick season=%s tallies=%d",
                         season.id,
@@ -551,6 +765,7 @@ async def tick_round(
                         from pinwheel.core.season import close_offseason
 
                         await close_offseason(repo, season.id, event_bus=event_bus, api_key=api_key)
+                        tallied_season_id = season.id
                         logger.info(
                             "offseason_window_expired season=%s -> complete",
                             season.id,
@@ -566,6 +781,7 @@ async def tick_round(
                     from pinwheel.core.season import close_offseason
 
                     await close_offseason(repo, season.id, event_bus=event_bus, api_key=api_key)
+                    tallied_season_id = season.id
                     logger.info(
                         "offseason_no_deadline season=%s -> complete",
                         season.id,
@@ -614,6 +830,7 @@ async def tick_round(
                         "governance.window_closed",
                         governance_summary,
                     )
+                    tallied_season_id = season.id
                     logger.info(
                         "governance_only_tick season=%s tallies=%d",
                         season.id,
@@ -670,16 +887,64 @@ async def tick_round(
             next_round,
         )
 
+        # --- Pipelined replay: start presenting right after simulation ---
+        if (
+            pipelined_rounds
+            and presentation_mode == "replay"
+            and presentation_state is not None
+        ):
+            round_finalized = asyncio.get_running_loop().create_future()
+            pipelined_state = presentation_state
+            early_schedule: _ReportSchedule | None = None
+
+            async def present_early(preview: RoundResult) -> None:
+                nonlocal presentation_started, early_schedule
+                schedule = _ReportSchedule(event_bus, preview.game_results)
+                try:
+                    presentation_started = await _start_replay_presentation(
+                        engine,
+                        event_bus,
+                        pipelined_state,
+                        season_id,
+                        preview,
+                        game_interval_seconds=game_interval_seconds,
+                        quarter_replay_seconds=quarter_replay_seconds,
+                        presentation_tick_seconds=presentation_tick_seconds,
+                        round_finalized=round_finalized,
+                        reports=schedule,
+                    )
+                except SQLAlchemyError:
+                    # Don't abort the round — it is presented once finalized instead
+                    logger.exception("pipelined_presentation_start_error round=%d", next_round)
+                if presentation_started:
+                    early_schedule = schedule
+
+            async def stream_commentary(commentary_event: dict) -> None:
+                # Held per game until the replay has shown it
+                if early_schedule is not None:
+                    await early_schedule.add_commentary(commentary_event)
+
+            on_simulated = present_early
+            on_commentary = stream_commentary
+
         # --- Main phase: multi-session round (releases lock during AI calls) ---
-        round_result = await step_round_multisession(
-            engine,
-            season_id,
-            round_number=next_round,
-            event_bus=event_bus,
-            api_key=api_key,
-            governance_interval=governance_interval,
-            suppress_spoiler_events=(presentation_mode == "replay"),
-        )
+        try:
+            round_result = await step_round_multisession(
+                engine,
+                season_id,
+                round_number=next_round,
+                event_bus=event_bus,
+                api_key=api_key,
+                governance_interval=governance_interval,
+                suppress_spoiler_events=(presentation_mode == "replay"),
+                on_simulated=on_simulated,
+                defer_evals=defer_evals,
+                on_commentary=on_commentary,
+            )
+        finally:
+            # Release a presentation waiting on this round; None if it failed
+            if round_finalized is not None and not round_finalized.done():
+                round_finalized.set_result(round_result)
 
         # --- Post-round session: instant-mode presentation bookkeeping ---
         if presentation_mode != "replay" and round_result.game_results:
@@ -728,55 +993,17 @@ async def tick_round(
             presentation_mode == "replay"
             and presentation_state is not None
             and round_result is not None
-            and round_result.game_results
-            and not presentation_state.is_active
+            and not presentation_started
         ):
-            presentation_state.current_round = next_round
-
-            # Build name + color cache from teams_cache for human-readable events
-            name_cache = _build_name_cache(round_result.teams_cache)
-            color_cache = _build_color_cache(round_result.teams_cache)
-
-            # Create callback to mark games as presented in the DB
-            game_row_ids = round_result.game_row_ids
-
-            async def mark_presented(game_index: int) -> None:
-                async with get_session(engine) as mark_session:
-                    mark_repo = Repository(mark_session)
-                    if game_index < len(game_row_ids):
-                        await mark_repo.mark_game_presented(game_row_ids[game_index])
-
-            # Persist start time so we can resume after deploy
-            await _persist_presentation_start(
+            await _start_replay_presentation(
                 engine,
+                event_bus,
+                presentation_state,
                 season_id,
-                next_round,
-                round_result.game_row_ids,
-                quarter_replay_seconds,
-            )
-
-            asyncio.create_task(
-                _present_and_clear(
-                    engine=engine,
-                    game_results=round_result.game_results,
-                    event_bus=event_bus,
-                    state=presentation_state,
-                    game_interval_seconds=game_interval_seconds,
-                    quarter_replay_seconds=quarter_replay_seconds,
-                    name_cache=name_cache,
-                    color_cache=color_cache,
-                    on_game_finished=mark_presented,
-                    game_summaries=round_result.games,
-                    governance_summary=round_result.governance_summary,
-                    report_events=round_result.report_events,
-                    deferred_season_events=round_result.deferred_season_events,
-                )
-            )
-            logger.info(
-                "presentation_started season=%s round=%d games=%d",
-                season_id,
-                next_round,
-                len(round_result.game_results),
+                round_result,
+                game_interval_seconds=game_interval_seconds,
+                quarter_replay_seconds=quarter_replay_seconds,
+                presentation_tick_seconds=presentation_tick_seconds,
             )
 
         logger.info(
@@ -786,5 +1013,8 @@ async def tick_round(
         )
     except Exception:  # Last-resort handler — step_round, DB, AI, and event-bus errors
         logger.exception("tick_round_error")
+        tallied_season_id = None  # rolled back — nothing new to show
     finally:
+        if tallied_season_id:
+            invalidate_page_fragments(tallied_season_id)
         await _release_tick_lock(engine, machine_id)
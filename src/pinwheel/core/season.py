@@ -22,6 +22,7 @@ from datetime import UTC, datetime, timedelta
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
+from pinwheel.core.membership import membership_cache
 from pinwheel.core.scheduler import compute_standings, generate_round_robin
 from pinwheel.core.tokens import regenerate_tokens
 from pinwheel.db.models import SeasonArchiveRow
@@ -1135,7 +1136,6 @@ async def start_new_season(
         name=season_name,
         starting_ruleset=ruleset_data,
     )
-
     # 4. Carry over teams if there is a source season
     if source_season_id is None:
         # Fall back to the most recent season in this league (any status).
@@ -1297,14 +1297,14 @@ async def regenerate_all_governor_tokens(
         Number of governors who received tokens.
     """
     teams = await repo.get_teams_for_season(season_id)
+    membership = await membership_cache.get(repo, season_id)
     governor_count = 0
 
     for team in teams:
-        governors = await repo.get_governors_for_team(team.id, season_id)
-        for governor in governors:
+        for governor_id in membership.governors_on(team.id):
             await regenerate_tokens(
                 repo=repo,
-                governor_id=governor.id,
+                governor_id=governor_id,
                 team_id=team.id,
                 season_id=season_id,
             )
@@ -1324,13 +1324,16 @@ async def archive_season(
     season_id: str,
     api_key: str = "",
     event_bus: EventBus | None = None,
+    compact_logs: bool = True,
 ) -> SeasonArchiveRow:
     """Create an archive snapshot of a completed season.
 
     Gathers final standings, rule change history, game counts, proposal
     counts, and governor participation into an immutable archive row.
     Generates a season memorial (AI narratives + computed data) and stores
-    it on the archive row. Marks the season as completed.
+    it on the archive row. Marks the season as completed. Finally moves the
+    season's governance events, reports and AI usage rows out of the hot
+    tables into compressed log archives (reads fall back to them).
 
     Args:
         repo: Repository bound to an active session.
@@ -1338,6 +1341,7 @@ async def archive_season(
         api_key: Anthropic API key for AI narrative generation.
             If empty, uses mock narratives.
         event_bus: Optional event bus for publishing memorial events.
+        compact_logs: If False, leave the season's log rows in the hot tables.
 
     Returns:
         The created SeasonArchiveRow.
@@ -1474,4 +1478,14 @@ async def archive_season(
             },
         )
 
+    if compact_logs:
+        moved = await repo.compact_season_logs(season_id)
+        logger.info(
+            "season_logs_compacted season=%s events=%d reports=%d ai_usage=%d",
+            season_id,
+            moved.get("governance_events", 0),
+            moved.get("reports", 0),
+            moved.get("ai_usage_log", 0),
+        )
+
     return archive
@@ -21,7 +21,13 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
-from pinwheel.db.models import Base
+from pinwheel.db.models import (
+    EFFECT_ID_EVENT_TYPES,
+    HOOPER_SEASON_MAXIMA,
+    HOOPER_SEASON_TOTALS,
+    ROUND_BOX_STATS,
+    Base,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -84,7 +90,7 @@ async def get_session(engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]
 
 
 # ---------------------------------------------------------------------------
-# Auto-migration: detect and add missing columns at startup
+# Auto-migration: detect and add missing columns (and indexes) at startup
 # ---------------------------------------------------------------------------
 
 _SQLITE_TYPE_MAP: dict[str, str] = {
@@ -132,6 +138,127 @@ def _scalar_default_sql(column: object) -> str | None:
     return None
 
 
+_EFFECT_ID_TYPES_SQL = ", ".join(f"'{t}'" for t in EFFECT_ID_EVENT_TYPES)
+
+# SQL expressions that populate a newly added column on existing rows.
+# Each mirrors the Python-side extraction (``event_index_columns``).
+_COLUMN_BACKFILLS: dict[tuple[str, str], str] = {
+    ("governance_events", "proposal_id"): (
+        "COALESCE(NULLIF(json_extract(payload, '$.proposal_id'), ''), "
+        "CASE WHEN aggregate_type = 'proposal' THEN aggregate_id END)"
+    ),
+    ("governance_events", "effect_id"): (
+        "COALESCE(NULLIF(json_extract(payload, '$.effect_id'), ''), "
+        f"CASE WHEN event_type IN ({_EFFECT_ID_TYPES_SQL}) THEN aggregate_id END)"
+    ),
+    ("governance_events", "payload_team_id"): (
+        "NULLIF(json_extract(payload, '$.team_id'), '')"
+    ),
+}
+
+
+_ROUND_BOX_SUMS_SQL = ", ".join(f"SUM({c}) AS {c}" for c in ROUND_BOX_STATS)
+
+# INSERT ... SELECT statements that populate a derived table from its
+# source tables. ``{where}`` takes an optional ``g.season_id`` filter
+# (game_results is always aliased ``g``). Run when the table is empty (e.g.
+# just created on an existing database); afterwards the Repository keeps
+# the table current.
+_TABLE_BACKFILLS: dict[str, tuple[tuple[str, ...], str]] = {
+    "round_stats": (
+        ("game_results", "box_scores"),
+        "INSERT INTO round_stats (season_id, round_number, game_count, total_points, "
+        f"total_margin, total_possessions, elam_games, {', '.join(ROUND_BOX_STATS)}) "
+        "SELECT g.season_id, g.round_number, COUNT(*), SUM(g.home_score + g.away_score), "
+        "SUM(ABS(g.home_score - g.away_score)), SUM(g.total_possessions), "
+        "SUM(CASE WHEN g.elam_target IS NOT NULL THEN 1 ELSE 0 END), "
+        + ", ".join(f"COALESCE(SUM(b.{c}), 0)" for c in ROUND_BOX_STATS)
+        + " FROM game_results g LEFT JOIN "
+        f"(SELECT game_id, {_ROUND_BOX_SUMS_SQL} FROM box_scores GROUP BY game_id) b "
+        "ON b.game_id = g.id {where} GROUP BY g.season_id, g.round_number",
+    ),
+    "hooper_season_stats": (
+        ("game_results", "box_scores"),
+        "INSERT INTO hooper_season_stats (season_id, hooper_id, games, "
+        + ", ".join(HOOPER_SEASON_TOTALS)
+        + ", "
+        + ", ".join(f"max_{c}" for c in HOOPER_SEASON_MAXIMA)
+        + ") SELECT g.season_id, b.hooper_id, COUNT(*), "
+        + ", ".join(f"COALESCE(SUM(b.{c}), 0)" for c in HOOPER_SEASON_TOTALS)
+        + ", "
+        + ", ".join(f"COALESCE(MAX(b.{c}), 0)" for c in HOOPER_SEASON_MAXIMA)
+        + " FROM box_scores b JOIN game_results g ON b.game_id = g.id "
+        "{where} GROUP BY g.season_id, b.hooper_id",
+    ),
+}
+
+
+async def _backfill_empty_tables(conn: AsyncConnection) -> None:
+    """Populate empty derived tables listed in ``_TABLE_BACKFILLS``."""
+    result = await conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'"))
+    tables = {row[0] for row in result}
+    for table_name, (sources, backfill) in _TABLE_BACKFILLS.items():
+        if table_name not in tables or not tables.issuperset(sources):
+            continue
+        result = await conn.execute(text(f"SELECT 1 FROM {table_name} LIMIT 1"))
+        if result.first() is not None:
+            continue
+        result = await conn.execute(text(backfill.format(where="")))
+        if result.rowcount:
+            logger.info("auto_migrate: backfilled %s rows=%d", table_name, result.rowcount)
+
+
+async def rebuild_derived_table(
+    conn: AsyncConnection, table_name: str, season_id: str | None = None
+) -> int:
+    """Recompute a ``_TABLE_BACKFILLS`` table from its sources.
+
+    Rebuilds one season when *season_id* is given, otherwise every season.
+    Returns the number of rows written.
+    """
+    _sources, backfill = _TABLE_BACKFILLS[table_name]
+    if season_id is None:
+        await conn.execute(text(f"DELETE FROM {table_name}"))
+        result = await conn.execute(text(backfill.format(where="")))
+    else:
+        params = {"season_id": season_id}
+        await conn.execute(
+            text(f"DELETE FROM {table_name} WHERE season_id = :season_id"), params
+        )
+        result = await conn.execute(
+            text(backfill.format(where="WHERE g.season_id = :season_id")), params
+        )
+    return result.rowcount
+
+
+async def _create_missing_indexes(conn: AsyncConnection) -> int:
+    """Create model indexes that an existing database lacks.
+
+    ``create_all`` only builds indexes together with new tables, so an index
+    added to an existing table's model would otherwise never reach old
+    databases. Returns the number of indexes created.
+    """
+
+    def _create(sync_conn: object) -> int:
+        created = 0
+        for table in Base.metadata.tables.values():
+            existing = {
+                row[1]
+                for row in sync_conn.execute(  # type: ignore[union-attr]
+                    text(f"PRAGMA index_list({table.name})")
+                )
+            }
+            for index in table.indexes:
+                if index.name in existing:
+                    continue
+                index.create(sync_conn)  # type: ignore[arg-type]
+                logger.info("auto_migrate: created index %s", index.name)
+                created += 1
+        return created
+
+    return await conn.run_sync(_create)
+
+
 async def auto_migrate_schema(conn: AsyncConnection) -> int:
     """Compare ORM models against actual SQLite schema, add missing columns.
 
@@ -144,6 +271,9 @@ async def auto_migrate_schema(conn: AsyncConnection) -> int:
     4. For missing columns that are NOT NULL with no SQL default: log a
        warning and skip (unsafe to add — existing rows would violate the
        constraint).
+    5. Backfill added columns listed in ``_COLUMN_BACKFILLS`` (payload-
+       extracted columns), then create any missing model indexes.
+    6. Populate empty derived tables from ``_TABLE_BACKFILLS``.
 
     Returns the number of columns added.
     """
@@ -181,4 +311,18 @@ async def auto_migrate_schema(conn: AsyncConnection) -> int:
             logger.info("auto_migrate: added %s.%s", table_name, column.name)
             added += 1
 
+            backfill = _COLUMN_BACKFILLS.get((table_name, column.name))
+            if backfill is not None:
+                result = await conn.execute(
+                    text(f"UPDATE {table_name} SET {column.name} = {backfill}")
+                )
+                logger.info(
+                    "auto_migrate: backfilled %s.%s rows=%d",
+                    table_name,
+                    column.name,
+                    result.rowcount,
+                )
+
+    await _create_missing_indexes(conn)
+    await _backfill_empty_tables(conn)
     return added
@@ -0,0 +1,134 @@
+"""Compressed per-season archives of the append-only log tables.
+
+``governance_events``, ``reports`` and ``ai_usage_log`` grow with every
+round and are never pruned, so completed seasons kept slowing down scans
+of the live season.  At season close ``Repository.compact_season_logs``
+moves a season's rows into one ``season_log_archives`` row per table: the
+rows' columns as JSON, zlib-compressed.
+
+Reads stay unified: the season-scoped ``Repository`` readers (events by
+type/governor, reports by round/type, ...) merge archived rows back in as
+transient ORM objects, so history, memorial and governor pages don't know
+whether a season was compacted.
+
+``log_archives`` keeps two things per process:
+
+* the set of compacted season ids, so live-season reads pay no extra
+  query.  It is reloaded every ``refresh_seconds``, so a compaction run by
+  another process (``scripts/compact_season_logs.py``) shows up without a
+  restart;
+* a small LRU of decoded archives, since a history page reads the same
+  season several times per request.  A reload drops any whose archive's
+  row count changed.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime
+
+from pinwheel.db.models import AIUsageLogRow, Base, GovernanceEventRow, ReportRow
+
+ARCHIVED_LOGS: dict[str, type[Base]] = {
+    "governance_events": GovernanceEventRow,
+    "reports": ReportRow,
+    "ai_usage_log": AIUsageLogRow,
+}
+
+DEFAULT_DECODED_ENTRIES = 8
+DEFAULT_REFRESH_SECONDS = 60.0
+
+
+def encode_rows(model: type[Base], rows: list[Any]) -> bytes:
+    """Serialize ORM rows of *model* to compressed JSON."""
+    columns = [c.name for c in model.__table__.columns]
+    records = []
+    for row in rows:
+        values = []
+        for name in columns:
+            value = getattr(row, name)
+            values.append(value.isoformat() if isinstance(value, datetime) else value)
+        records.append(values)
+    body = json.dumps({"columns": columns, "rows": records}, separators=(",", ":"))
+    return zlib.compress(body.encode(), level=9)
+
+
+def decode_rows(model: type[Base], data: bytes) -> list[dict]:
+    """Inverse of ``encode_rows``: one column dict per archived row."""
+    body = json.loads(zlib.decompress(data))
+    table = model.__table__.columns
+    datetime_columns = {
+        name for name in body["columns"] if name in table and isinstance(table[name].type, DateTime)
+    }
+    records = []
+    for values in body["rows"]:
+        record = {name: value for name, value in zip(body["columns"], values, strict=True)}
+        for name in datetime_columns:
+            if record[name] is not None:
+                record[name] = datetime.fromisoformat(record[name])
+        records.append(record)
+    return records
+
+
+class LogArchiveIndex:
+    """Which seasons have archived logs, plus decoded archives (LRU)."""
+
+    def __init__(
+        self,
+        max_decoded: int = DEFAULT_DECODED_ENTRIES,
+        refresh_seconds: float = DEFAULT_REFRESH_SECONDS,
+    ) -> None:
+        self.max_decoded = max_decoded
+        self.refresh_seconds = refresh_seconds
+        self.seasons: set[str] | None = None
+        self._row_counts: dict[tuple[str, str], int] = {}
+        self._loaded_at = 0.0
+        self._decoded: OrderedDict[tuple[str, str], list[dict]] = OrderedDict()
+
+    def configure(self, refresh_seconds: float) -> None:
+        self.refresh_seconds = refresh_seconds
+
+    def needs_refresh(self) -> bool:
+        return (
+            self.seasons is None
+            or time.monotonic() - self._loaded_at >= self.refresh_seconds
+        )
+
+    def load(self, row_counts: dict[tuple[str, str], int]) -> None:
+        """Replace the index with a fresh read of ``(season, log type) -> row count``."""
+        for key in [k for k in self._decoded if row_counts.get(k) != self._row_counts.get(k)]:
+            del self._decoded[key]
+        self._row_counts = row_counts
+        self.seasons = {season_id for season_id, _log_type in row_counts}
+        self._loaded_at = time.monotonic()
+
+    def mark(self, season_id: str) -> None:
+        if self.seasons is not None:
+            self.seasons.add(season_id)
+        for key in [k for k in self._decoded if k[0] == season_id]:
+            del self._decoded[key]
+
+    def get_decoded(self, season_id: str, log_type: str) -> list[dict] | None:
+        records = self._decoded.get((season_id, log_type))
+        if records is not None:
+            self._decoded.move_to_end((season_id, log_type))
+        return records
+
+    def put_decoded(self, season_id: str, log_type: str, records: list[dict]) -> None:
+        self._decoded[(season_id, log_type)] = records
+        while len(self._decoded) > self.max_decoded:
+            self._decoded.popitem(last=False)
+
+    def clear(self) -> None:
+        self.seasons = None
+        self._row_counts = {}
+        self._decoded.clear()
+
+
+log_archives = LogArchiveIndex()
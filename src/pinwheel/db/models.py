@@ -18,6 +18,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
@@ -174,8 +175,142 @@ class BoxScoreRow(Base):
     )
 
 
+# Box-score columns summed into ``RoundStatsRow``
+ROUND_BOX_STATS = (
+    "field_goals_made",
+    "field_goals_attempted",
+    "three_pointers_made",
+    "three_pointers_attempted",
+    "free_throws_made",
+    "free_throws_attempted",
+)
+
+
+class RoundStatsRow(Base):
+    """League-wide totals for one round, kept current as results are stored.
+
+    ``store_game_result`` and ``store_box_score`` add to the round's row, so
+    before/after comparisons across rule changes sum a few rows instead of
+    rescanning every game and box score in the range.
+    """
+
+    __tablename__ = "round_stats"
+
+    season_id: Mapped[str] = mapped_column(ForeignKey("seasons.id"), primary_key=True)
+    round_number: Mapped[int] = mapped_column(Integer, primary_key=True)
+    game_count: Mapped[int] = mapped_column(Integer, default=0)
+    total_points: Mapped[int] = mapped_column(Integer, default=0)
+    total_margin: Mapped[int] = mapped_column(Integer, default=0)
+    total_possessions: Mapped[int] = mapped_column(Integer, default=0)
+    elam_games: Mapped[int] = mapped_column(Integer, default=0)
+    field_goals_made: Mapped[int] = mapped_column(Integer, default=0)
+    field_goals_attempted: Mapped[int] = mapped_column(Integer, default=0)
+    three_pointers_made: Mapped[int] = mapped_column(Integer, default=0)
+    three_pointers_attempted: Mapped[int] = mapped_column(Integer, default=0)
+    free_throws_made: Mapped[int] = mapped_column(Integer, default=0)
+    free_throws_attempted: Mapped[int] = mapped_column(Integer, default=0)
+
+
+# Box-score columns totalled in ``HooperSeasonStatsRow``
+HOOPER_SEASON_TOTALS = (
+    "points",
+    "field_goals_made",
+    "field_goals_attempted",
+    "three_pointers_made",
+    "three_pointers_attempted",
+    "free_throws_made",
+    "free_throws_attempted",
+    "assists",
+    "steals",
+    "turnovers",
+    "rebounds",
+    "blocks",
+)
+# Box-score columns whose single-game high is kept as ``max_<stat>``
+HOOPER_SEASON_MAXIMA = ("points", "assists", "steals", "rebounds")
+
+
+class HooperSeasonStatsRow(Base):
+    """One hooper's season totals, games played and single-game highs.
+
+    ``store_box_score`` keeps it current; ``Repository.rebuild_stat_aggregates``
+    recomputes it from box scores. Leaderboards and hooper pages read these
+    rows instead of aggregating box scores on demand.
+    """
+
+    __tablename__ = "hooper_season_stats"
+
+    season_id: Mapped[str] = mapped_column(ForeignKey("seasons.id"), primary_key=True)
+    hooper_id: Mapped[str] = mapped_column(ForeignKey("hoopers.id"), primary_key=True)
+    games: Mapped[int] = mapped_column(Integer, default=0)
+    points: Mapped[int] = mapped_column(Integer, default=0)
+    field_goals_made: Mapped[int] = mapped_column(Integer, default=0)
+    field_goals_attempted: Mapped[int] = mapped_column(Integer, default=0)
+    three_pointers_made: Mapped[int] = mapped_column(Integer, default=0)
+    three_pointers_attempted: Mapped[int] = mapped_column(Integer, default=0)
+    free_throws_made: Mapped[int] = mapped_column(Integer, default=0)
+    free_throws_attempted: Mapped[int] = mapped_column(Integer, default=0)
+    assists: Mapped[int] = mapped_column(Integer, default=0)
+    steals: Mapped[int] = mapped_column(Integer, default=0)
+    turnovers: Mapped[int] = mapped_column(Integer, default=0)
+    rebounds: Mapped[int] = mapped_column(Integer, default=0)
+    blocks: Mapped[int] = mapped_column(Integer, default=0)
+    max_points: Mapped[int] = mapped_column(Integer, default=0)
+    max_assists: Mapped[int] = mapped_column(Integer, default=0)
+    max_steals: Mapped[int] = mapped_column(Integer, default=0)
+    max_rebounds: Mapped[int] = mapped_column(Integer, default=0)
+
+    __table_args__ = (
+        Index("ix_hooper_season_stats_hooper", "hooper_id"),
+        Index("ix_hooper_season_stats_season_points", "season_id", "points"),
+    )
+
+
+# Effect events whose aggregate_id is the effect id when the payload has none
+EFFECT_ID_EVENT_TYPES = (
+    "effect.registered",
+    "effect.expired",
+    "effect.repealed",
+    "effect.codegen_approved",
+    "effect.codegen_rejected",
+    "effect.codegen_disabled",
+)
+
+
+def event_index_columns(
+    event_type: str,
+    aggregate_type: str,
+    aggregate_id: str,
+    payload: dict,
+) -> dict[str, str | None]:
+    """Indexed columns extracted from an event's payload.
+
+    ``proposal_id`` and ``effect_id`` follow the fallbacks readers already
+    apply (``payload.get("proposal_id", aggregate_id)`` for proposal
+    events). ``payload_team_id`` is the team the payload is about, which
+    may differ from the acting governor's ``team_id``.
+    """
+    proposal_id = payload.get("proposal_id")
+    if not proposal_id and aggregate_type == "proposal":
+        proposal_id = aggregate_id
+    effect_id = payload.get("effect_id")
+    if not effect_id and event_type in EFFECT_ID_EVENT_TYPES:
+        effect_id = aggregate_id
+    team_id = payload.get("team_id")
+    return {
+        "proposal_id": str(proposal_id) if proposal_id else None,
+        "effect_id": str(effect_id) if effect_id else None,
+        "payload_team_id": str(team_id) if team_id else None,
+    }
+
+
 class GovernanceEventRow(Base):
-    """Append-only governance event store. Source of truth for governance state."""
+    """Append-only governance event store. Source of truth for governance state.
+
+    ``proposal_id``, ``effect_id`` and ``payload_team_id`` are copies of
+    payload keys (see ``event_index_columns``) so hot lookups can use an
+    index instead of filtering payloads in Python.
+    """
 
     __tablename__ = "governance_events"
 
@@ -190,16 +325,24 @@ class GovernanceEventRow(Base):
     payload: Mapped[dict] = mapped_column(JSON, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(UTC))
     sequence_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    proposal_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    effect_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    payload_team_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
 
     __table_args__ = (
         Index("ix_gov_events_aggregate", "aggregate_type", "aggregate_id"),
         Index("ix_gov_events_season_round", "season_id", "round_number"),
         Index("ix_gov_events_type", "event_type"),
+        Index("ix_gov_events_season_type_seq", "season_id", "event_type", "sequence_number"),
+        Index("ix_gov_events_season_governor_type", "season_id", "governor_id", "event_type"),
+        Index("ix_gov_events_season_proposal", "season_id", "proposal_id"),
+        Index("ix_gov_events_season_effect", "season_id", "effect_id"),
+        Index("ix_gov_events_season_payload_team", "season_id", "payload_team_id"),
         # Sequence numbers are assigned per-season via SELECT MAX(); this
         # constraint enforces uniqueness at the DB level for fresh databases.
         # Existing databases will NOT get this constraint automatically because
-        # auto_migrate_schema() only adds missing columns, not constraints or
-        # indexes. Run a manual migration on existing DBs if needed:
+        # auto_migrate_schema() adds missing columns and indexes, not
+        # constraints. Run a manual migration on existing DBs if needed:
         #   CREATE UNIQUE INDEX IF NOT EXISTS uq_gov_events_season_seq
         #   ON governance_events (season_id, sequence_number);
         UniqueConstraint("season_id", "sequence_number", name="uq_gov_events_season_seq"),
@@ -307,6 +450,30 @@ class SeasonArchiveRow(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(UTC))
 
 
+class SeasonLogArchiveRow(Base):
+    """Compressed copy of one log table's rows for a compacted season.
+
+    ``log_type`` names the source table (see ``db.log_archive``); ``data``
+    is zlib-compressed JSON of the rows' columns.  ``max_sequence`` keeps
+    the highest archived event ``sequence_number`` so appends never reuse
+    one after the hot rows are deleted.
+    """
+
+    __tablename__ = "season_log_archives"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid)
+    season_id: Mapped[str] = mapped_column(ForeignKey("seasons.id"), nullable=False)
+    log_type: Mapped[str] = mapped_column(String(30), nullable=False)
+    row_count: Mapped[int] = mapped_column(Integer, default=0)
+    max_sequence: Mapped[int] = mapped_column(Integer, default=0)
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(UTC))
+
+    __table_args__ = (
+        UniqueConstraint("season_id", "log_type", name="uq_season_log_archives"),
+    )
+
+
 class AIUsageLogRow(Base):
     """Append-only log of every AI API call with token counts and cost."""
 
@@ -350,3 +517,32 @@ class EvalResultRow(Base):
         Index("ix_eval_results_season_round", "season_id", "round_number"),
         Index("ix_eval_results_type", "eval_type"),
     )
+
+
+class EvalJobRow(Base):
+    """Durable queue of out-of-band eval work, one row per (season, round, eval_type).
+
+    Round finalization enqueues; a scheduler tick claims pending rows, runs
+    the eval and stores its results in the same transaction that marks the
+    job done.
+    """
+
+    __tablename__ = "eval_jobs"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid)
+    season_id: Mapped[str] = mapped_column(ForeignKey("seasons.id"), nullable=False)
+    round_number: Mapped[int] = mapped_column(Integer, nullable=False)
+    eval_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    # pending | running | done | failed
+    status: Mapped[str] = mapped_column(String(20), default="pending")
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    last_error: Mapped[str] = mapped_column(Text, default="")
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(UTC))
+    started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("season_id", "round_number", "eval_type", name="uq_eval_jobs_key"),
+        Index("ix_eval_jobs_status", "status", "created_at"),
+    )
@@ -6,34 +6,66 @@ Game results and box scores are stored directly (immutable outputs).
 
 from __future__ import annotations
 
-from sqlalchemy import func, or_, select
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import case, delete, func, or_, select
+from sqlalchemy import event as orm_event
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from pinwheel.db.engine import rebuild_derived_table
+from pinwheel.db.log_archive import ARCHIVED_LOGS, decode_rows, encode_rows, log_archives
 from pinwheel.db.models import (
+    HOOPER_SEASON_MAXIMA,
+    HOOPER_SEASON_TOTALS,
+    ROUND_BOX_STATS,
     BotStateRow,
     BoxScoreRow,
+    EvalJobRow,
     EvalResultRow,
     GameResultRow,
     GovernanceEventRow,
     HooperRow,
+    HooperSeasonStatsRow,
     LeagueRow,
     PlayerRow,
     ReportRow,
+    RoundStatsRow,
     ScheduleRow,
     SeasonArchiveRow,
+    SeasonLogArchiveRow,
     SeasonRow,
     TeamRow,
+    event_index_columns,
 )
 from pinwheel.models.tokens import TokenBalance
 
 
+def _created_key(row: Any) -> datetime:
+    """Sort key for ``created_at`` that tolerates naive/aware mixes and None."""
+    created = row.created_at
+    return created.replace(tzinfo=None) if created else datetime.min
+
+
 class Repository:
     """Async repository for all database operations."""
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        """Run *callback* once this session's current transaction commits.
+
+        For in-process caches of committed data: invalidating only before
+        the commit lets a concurrent reader reload the old rows.
+        """
+        orm_event.listen(
+            self.session.sync_session, "after_commit", lambda _session: callback(), once=True
+        )
+
     # --- League / Season ---
 
     async def create_league(self, name: str) -> LeagueRow:
@@ -195,6 +227,15 @@ class Repository:
     async def get_hooper(self, hooper_id: str) -> HooperRow | None:
         return await self.session.get(HooperRow, hooper_id)
 
+    async def get_hooper_names(self, hooper_ids: Iterable[str]) -> dict[str, str]:
+        """Map hooper IDs to names in one query. Unknown IDs are omitted."""
+        ids = list(hooper_ids)
+        if not ids:
+            return {}
+        stmt = select(HooperRow.id, HooperRow.name).where(HooperRow.id.in_(ids))
+        result = await self.session.execute(stmt)
+        return {row.id: row.name for row in result.all()}
+
     async def get_hoopers_by_name(self, name: str) -> list[HooperRow]:
         """Return all hooper records across all seasons with this exact name.
 
@@ -249,6 +290,12 @@ class Repository:
             phase=phase,
         )
         self.session.add(row)
+        totals = await self._round_stats_row(season_id, round_number)
+        totals.game_count += 1
+        totals.total_points += home_score + away_score
+        totals.total_margin += abs(home_score - away_score)
+        totals.total_possessions += total_possessions
+        totals.elam_games += elam_target is not None
         await self.session.flush()
         return row
 
@@ -261,9 +308,113 @@ class Repository:
     ) -> BoxScoreRow:
         row = BoxScoreRow(game_id=game_id, hooper_id=hooper_id, team_id=team_id, **stats)
         self.session.add(row)
+        game = await self.session.get(GameResultRow, game_id)
+        if game is not None:
+            totals = await self._round_stats_row(game.season_id, game.round_number)
+            for column in ROUND_BOX_STATS:
+                setattr(totals, column, getattr(totals, column) + int(stats.get(column, 0)))
+            await self._bump_hooper_season_stats(game.season_id, hooper_id, stats)
+        await self.session.flush()
+        return row
+
+    async def _bump_hooper_season_stats(
+        self, season_id: str, hooper_id: str, stats: dict[str, int | float]
+    ) -> None:
+        """Add one game's *stats* to the hooper's ``HooperSeasonStatsRow``.
+
+        A single upsert that does the arithmetic in SQL, so concurrent
+        writers for the same hooper never overwrite each other's increments.
+        An already-loaded copy of the row is expired so it re-reads the sums.
+        """
+        table = HooperSeasonStatsRow
+        values: dict[str, Any] = {
+            "season_id": season_id,
+            "hooper_id": hooper_id,
+            "games": 1,
+            **{c: int(stats.get(c, 0)) for c in HOOPER_SEASON_TOTALS},
+            **{f"max_{c}": int(stats.get(c, 0)) for c in HOOPER_SEASON_MAXIMA},
+        }
+        stmt = sqlite_insert(table).values(**values)
+        increments: dict[str, Any] = {
+            c: getattr(table, c) + getattr(stmt.excluded, c)
+            for c in ("games", *HOOPER_SEASON_TOTALS)
+        }
+        highs: dict[str, Any] = {
+            f"max_{c}": func.max(getattr(table, f"max_{c}"), getattr(stmt.excluded, f"max_{c}"))
+            for c in HOOPER_SEASON_MAXIMA
+        }
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[table.season_id, table.hooper_id],
+                set_={**increments, **highs},
+            )
+        )
+        loaded = self.session.identity_map.get(
+            self.session.sync_session.identity_key(table, (season_id, hooper_id))
+        )
+        if loaded is not None:
+            self.session.expire(loaded)
+
+    async def rebuild_stat_aggregates(self, season_id: str | None = None) -> dict[str, int]:
+        """Recompute ``round_stats`` and ``hooper_season_stats`` from box scores.
+
+        One season when *season_id* is given, otherwise all. Returns rows
+        written per table.
+        """
         await self.session.flush()
+        conn = await self.session.connection()
+        written = {
+            table: await rebuild_derived_table(conn, table, season_id)
+            for table in ("round_stats", "hooper_season_stats")
+        }
+        # Drop identity-map copies of the old rows; other objects stay loaded.
+        for obj in list(self.session.identity_map.values()):
+            if isinstance(obj, (RoundStatsRow, HooperSeasonStatsRow)):
+                self.session.expunge(obj)
+        return written
+
+    async def _round_stats_row(self, season_id: str, round_number: int) -> RoundStatsRow:
+        """The round's ``RoundStatsRow`` (identity-map cached), created at zero if missing."""
+        row = await self.session.get(RoundStatsRow, (season_id, round_number))
+        if row is None:
+            row = RoundStatsRow(
+                season_id=season_id,
+                round_number=round_number,
+                game_count=0,
+                total_points=0,
+                total_margin=0,
+                total_possessions=0,
+                elam_games=0,
+                **dict.fromkeys(ROUND_BOX_STATS, 0),
+            )
+            self.session.add(row)
         return row
 
+    async def get_round_stats_totals(
+        self,
+        season_id: str,
+        round_start: int,
+        round_end: int,
+    ) -> dict[str, int]:
+        """Sum ``RoundStatsRow`` columns over an inclusive round range."""
+        columns = [
+            "game_count",
+            "total_points",
+            "total_margin",
+            "total_possessions",
+            "elam_games",
+            *ROUND_BOX_STATS,
+        ]
+        stmt = select(
+            *(func.coalesce(func.sum(getattr(RoundStatsRow, c)), 0) for c in columns)
+        ).where(
+            RoundStatsRow.season_id == season_id,
+            RoundStatsRow.round_number >= round_start,
+            RoundStatsRow.round_number <= round_end,
+        )
+        result = await self.session.execute(stmt)
+        return dict(zip(columns, (int(v) for v in result.one()), strict=True))
+
     async def get_game_result(self, game_id: str) -> GameResultRow | None:
         stmt = (
             select(GameResultRow)
@@ -311,6 +462,45 @@ class Repository:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_round_marker(self, season_id: str) -> tuple[int, int]:
+        """Return ``(latest_round, presented_game_count)`` for a season.
+
+        One aggregate over ``ix_game_results_season_round`` — a cheap version
+        marker for caches of page data that only changes when a round is
+        stored or a game finishes presenting.
+        """
+        presented = or_(
+            GameResultRow.presented.is_(True),
+            GameResultRow.presented.is_(None),
+        )
+        stmt = select(
+            func.coalesce(func.max(GameResultRow.round_number), 0),
+            func.coalesce(func.sum(case((presented, 1), else_=0)), 0),
+        ).where(GameResultRow.season_id == season_id)
+        result = await self.session.execute(stmt)
+        latest_round, presented_count = result.one()
+        return int(latest_round), int(presented_count)
+
+    async def get_game_created_at(self, game_id: str) -> datetime | None:
+        """Return a game's ``created_at`` without loading the row or box scores.
+
+        Game results are immutable once stored, so this doubles as the
+        game's version marker for conditional GETs.
+        """
+        stmt = select(GameResultRow.created_at).where(GameResultRow.id == game_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_games_version(self, season_id: str) -> tuple[int, datetime | None]:
+        """Return ``(game_count, latest created_at)`` for a season's games."""
+        stmt = select(
+            func.count(GameResultRow.id),
+            func.max(GameResultRow.created_at),
+        ).where(GameResultRow.season_id == season_id)
+        result = await self.session.execute(stmt)
+        count, latest = result.one()
+        return int(count), latest
+
     async def mark_game_presented(self, game_id: str) -> None:
         """Mark a game result as presented (visible to players)."""
         game = await self.session.get(GameResultRow, game_id)
@@ -327,59 +517,27 @@ class Repository:
         """Compute aggregate game stats for a range of rounds.
 
         Returns a dict with: game_count, avg_score, avg_margin,
-        three_point_pct, two_point_pct, avg_possessions, elam_activation_rate.
+        three_point_pct, field_goal_pct, free_throw_pct, avg_possessions,
+        elam_activation_rate. Summed from ``round_stats``.
         """
-        stmt = select(GameResultRow).where(
-            GameResultRow.season_id == season_id,
-            GameResultRow.round_number >= round_start,
-            GameResultRow.round_number <= round_end,
-        )
-        result = await self.session.execute(stmt)
-        games = list(result.scalars().all())
-
-        if not games:
+        t = await self.get_round_stats_totals(season_id, round_start, round_end)
+        game_count = t["game_count"]
+        if not game_count:
             return {"game_count": 0}
 
-        total_scores: list[int] = []
-        margins: list[int] = []
-        possessions: list[int] = []
-        elam_count = 0
-
-        for g in games:
-            total_scores.append(g.home_score)
-            total_scores.append(g.away_score)
-            margins.append(abs(g.home_score - g.away_score))
-            possessions.append(g.total_possessions)
-            if g.elam_target is not None:
-                elam_count += 1
-
-        # Box score aggregates for shooting percentages
-        box_stmt = (
-            select(BoxScoreRow)
-            .join(GameResultRow, BoxScoreRow.game_id == GameResultRow.id)
-            .where(
-                GameResultRow.season_id == season_id,
-                GameResultRow.round_number >= round_start,
-                GameResultRow.round_number <= round_end,
-            )
-        )
-        box_result = await self.session.execute(box_stmt)
-        box_scores = list(box_result.scalars().all())
+        def pct(made: int, attempted: int) -> float:
+            return made / attempted * 100 if attempted > 0 else 0
 
-        total_3pa = sum(getattr(bs, "three_pointers_attempted", 0) or 0 for bs in box_scores)
-        total_3pm = sum(getattr(bs, "three_pointers_made", 0) or 0 for bs in box_scores)
-        total_fga = sum(getattr(bs, "field_goals_attempted", 0) or 0 for bs in box_scores)
-        total_fgm = sum(getattr(bs, "field_goals_made", 0) or 0 for bs in box_scores)
-
-        game_count = len(games)
         return {
             "game_count": game_count,
-            "avg_score": sum(total_scores) / len(total_scores) if total_scores else 0,
-            "avg_margin": sum(margins) / len(margins) if margins else 0,
-            "three_point_pct": (total_3pm / total_3pa * 100) if total_3pa > 0 else 0,
-            "field_goal_pct": (total_fgm / total_fga * 100) if total_fga > 0 else 0,
-            "avg_possessions": sum(possessions) / len(possessions) if possessions else 0,
-            "elam_activation_rate": elam_count / game_count if game_count > 0 else 0,
+            # Per-team score: each game contributes a home and an away score
+            "avg_score": t["total_points"] / (2 * game_count),
+            "avg_margin": t["total_margin"] / game_count,
+            "three_point_pct": pct(t["three_pointers_made"], t["three_pointers_attempted"]),
+            "field_goal_pct": pct(t["field_goals_made"], t["field_goals_attempted"]),
+            "free_throw_pct": pct(t["free_throws_made"], t["free_throws_attempted"]),
+            "avg_possessions": t["total_possessions"] / game_count,
+            "elam_activation_rate": t["elam_games"] / game_count,
         }
 
     async def get_avg_total_game_score_for_rounds(
@@ -393,22 +551,29 @@ class Repository:
         Returns (avg_total_score, game_count).  If no games exist in the
         range, returns (0.0, 0).
         """
-        stmt = select(
-            func.count(GameResultRow.id),
-            func.avg(GameResultRow.home_score + GameResultRow.away_score),
-        ).where(
-            GameResultRow.season_id == season_id,
-            GameResultRow.round_number >= round_start,
-            GameResultRow.round_number <= round_end,
-        )
-        result = await self.session.execute(stmt)
-        row = result.one()
-        count: int = row[0] or 0
-        avg: float = float(row[1]) if row[1] is not None else 0.0
+        totals = await self.get_round_stats_totals(season_id, round_start, round_end)
+        count = totals["game_count"]
+        avg = totals["total_points"] / count if count else 0.0
         return avg, count
 
     # --- Governance Events (append-only) ---
 
+    async def _max_event_sequence(self) -> int:
+        """Highest sequence number ever assigned, compacted seasons included.
+
+        Compaction deletes the hot rows, so the hot table alone could hand
+        out a number an archived event already holds.
+        """
+        hot = select(func.coalesce(func.max(GovernanceEventRow.sequence_number), 0))
+        archived = select(func.coalesce(func.max(SeasonLogArchiveRow.max_sequence), 0)).where(
+            SeasonLogArchiveRow.log_type == "governance_events"
+        )
+        result = await self.session.execute(
+            select(hot.scalar_subquery(), archived.scalar_subquery())
+        )
+        hot_max, archived_max = result.one()
+        return max(int(hot_max), int(archived_max))
+
     async def append_event(
         self,
         event_type: str,
@@ -421,11 +586,7 @@ class Repository:
         team_id: str | None = None,
     ) -> GovernanceEventRow:
         # SQLite is single-writer, so concurrent sequence assignment is safe.
-        stmt = select(
-            func.coalesce(func.max(GovernanceEventRow.sequence_number), 0)
-        )
-        result = await self.session.execute(stmt)
-        seq = result.scalar_one() + 1
+        seq = await self._max_event_sequence() + 1
 
         row = GovernanceEventRow(
             event_type=event_type,
@@ -437,14 +598,57 @@ class Repository:
             governor_id=governor_id,
             team_id=team_id,
             sequence_number=seq,
+            **event_index_columns(event_type, aggregate_type, aggregate_id, payload),
         )
         self.session.add(row)
         await self.session.flush()
         return row
 
+    async def append_events(self, events: list[dict]) -> list[GovernanceEventRow]:
+        """Append several events with one sequence scan and one flush.
+
+        Each dict takes ``append_event``'s keyword arguments; sequence
+        numbers follow list order.
+        """
+        if not events:
+            return []
+        seq = await self._max_event_sequence()
+
+        rows = []
+        for offset, event in enumerate(events, start=1):
+            index_columns = event_index_columns(
+                event["event_type"],
+                event["aggregate_type"],
+                event["aggregate_id"],
+                event["payload"],
+            )
+            rows.append(
+                GovernanceEventRow(**event, **index_columns, sequence_number=seq + offset)
+            )
+        self.session.add_all(rows)
+        await self.session.flush()
+        return rows
+
+    async def get_latest_event_sequence(self, season_id: str) -> int:
+        """Highest governance ``sequence_number`` in a season (0 if none).
+
+        Served from the ``(season_id, sequence_number)`` unique index — a
+        cheap version marker for anything derived from the event log.
+        """
+        stmt = select(
+            func.coalesce(func.max(GovernanceEventRow.sequence_number), 0)
+        ).where(GovernanceEventRow.season_id == season_id)
+        result = await self.session.execute(stmt)
+        return int(result.scalar_one())
+
     async def get_events_for_aggregate(
-        self, aggregate_type: str, aggregate_id: str
+        self, aggregate_type: str, aggregate_id: str, season_id: str | None = None
     ) -> list[GovernanceEventRow]:
+        """Events of one aggregate, compacted seasons included.
+
+        Without *season_id* every season compacted in this database is
+        searched.
+        """
         stmt = (
             select(GovernanceEventRow)
             .where(
@@ -453,16 +657,42 @@ class Repository:
             )
             .order_by(GovernanceEventRow.sequence_number)
         )
+        if season_id is not None:
+            stmt = stmt.where(GovernanceEventRow.season_id == season_id)
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        rows: list[GovernanceEventRow] = list(result.scalars().all())
+        if season_id is not None:
+            seasons = [season_id]
+        else:
+            archived = await self.session.execute(
+                select(SeasonLogArchiveRow.season_id).where(
+                    SeasonLogArchiveRow.log_type == "governance_events"
+                )
+            )
+            seasons = list(archived.scalars().all())
+        for archived_season in sorted(seasons):
+            rows = await self._merge_archived(
+                archived_season,
+                "governance_events",
+                rows,
+                lambda e: e.aggregate_type == aggregate_type and e.aggregate_id == aggregate_id,
+                sort_key=lambda e: e.sequence_number,
+                compacted=season_id is None,
+            )
+        return rows
 
     async def get_events_by_type_and_governor(
         self,
         season_id: str,
         governor_id: str,
         event_types: list[str],
+        *,
+        proposal_ids: Iterable[str] | None = None,
     ) -> list[GovernanceEventRow]:
-        """Get events of specific types for a governor in a season."""
+        """Get events of specific types for a governor in a season.
+
+        ``proposal_ids`` narrows to those proposals via the extracted column.
+        """
         stmt = (
             select(GovernanceEventRow)
             .where(
@@ -472,25 +702,70 @@ class Repository:
             )
             .order_by(GovernanceEventRow.sequence_number)
         )
+        wanted = set(proposal_ids) if proposal_ids is not None else None
+        if wanted is not None:
+            stmt = stmt.where(GovernanceEventRow.proposal_id.in_(wanted))
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return await self._merge_archived(
+            season_id,
+            "governance_events",
+            list(result.scalars().all()),
+            lambda e: (
+                e.governor_id == governor_id
+                and e.event_type in event_types
+                and (wanted is None or e.proposal_id in wanted)
+            ),
+            sort_key=lambda e: e.sequence_number,
+        )
 
     async def get_events_by_type(
         self,
         season_id: str,
         event_types: list[str],
+        after_sequence: int = 0,
+        *,
+        proposal_ids: Iterable[str] | None = None,
+        effect_id: str | None = None,
+        payload_team_ids: Iterable[str] | None = None,
     ) -> list[GovernanceEventRow]:
-        """Get all events of specific types in a season."""
+        """Get all events of specific types in a season.
+
+        ``after_sequence`` skips events at or below that sequence number, for
+        callers that consume the log incrementally. ``proposal_ids``,
+        ``effect_id`` and ``payload_team_ids`` filter on the columns
+        extracted from the payload (see ``event_index_columns``).
+        """
         stmt = (
             select(GovernanceEventRow)
             .where(
                 GovernanceEventRow.season_id == season_id,
                 GovernanceEventRow.event_type.in_(event_types),
+                GovernanceEventRow.sequence_number > after_sequence,
             )
             .order_by(GovernanceEventRow.sequence_number)
         )
+        wanted = set(proposal_ids) if proposal_ids is not None else None
+        teams = set(payload_team_ids) if payload_team_ids is not None else None
+        if wanted is not None:
+            stmt = stmt.where(GovernanceEventRow.proposal_id.in_(wanted))
+        if effect_id is not None:
+            stmt = stmt.where(GovernanceEventRow.effect_id == effect_id)
+        if teams is not None:
+            stmt = stmt.where(GovernanceEventRow.payload_team_id.in_(teams))
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return await self._merge_archived(
+            season_id,
+            "governance_events",
+            list(result.scalars().all()),
+            lambda e: (
+                e.event_type in event_types
+                and e.sequence_number > after_sequence
+                and (wanted is None or e.proposal_id in wanted)
+                and (effect_id is None or e.effect_id == effect_id)
+                and (teams is None or e.payload_team_id in teams)
+            ),
+            sort_key=lambda e: e.sequence_number,
+        )
 
     async def get_events_by_governor(
         self,
@@ -507,7 +782,13 @@ class Repository:
             .order_by(GovernanceEventRow.sequence_number)
         )
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return await self._merge_archived(
+            season_id,
+            "governance_events",
+            list(result.scalars().all()),
+            lambda e: e.governor_id == governor_id,
+            sort_key=lambda e: e.sequence_number,
+        )
 
     async def get_governor_activity(self, governor_id: str, season_id: str) -> dict:
         """Get a governor's governance activity summary.
@@ -534,37 +815,31 @@ class Repository:
             event_types=["vote.cast"],
         )
 
-        # Get all outcome events to determine pass/fail for proposals
-        outcome_events = await self.get_events_by_type(
+        # Lifecycle events for just this governor's proposals (indexed lookup)
+        lifecycle_events = await self.get_events_by_type(
             season_id=season_id,
-            event_types=["proposal.passed", "proposal.failed"],
+            event_types=[
+                "proposal.passed",
+                "proposal.failed",
+                "proposal.confirmed",
+                "proposal.pending_review",
+                "proposal.rejected",
+                "proposal.vetoed",
+            ],
+            proposal_ids=[str(e.payload.get("id", e.aggregate_id)) for e in submitted_events],
         )
         outcomes: dict[str, str] = {}
-        for e in outcome_events:
-            pid = e.payload.get("proposal_id", e.aggregate_id)
-            outcomes[pid] = "passed" if e.event_type == "proposal.passed" else "failed"
-
-        # Get confirmed proposals to identify pending ones
-        confirmed_events = await self.get_events_by_type(
-            season_id=season_id,
-            event_types=["proposal.confirmed"],
-        )
         confirmed_ids: set[str] = set()
-        for e in confirmed_events:
-            pid = e.payload.get("proposal_id", e.aggregate_id)
-            confirmed_ids.add(pid)
-
-        # Get pending_review, rejected, and vetoed proposals
-        review_events = await self.get_events_by_type(
-            season_id=season_id,
-            event_types=["proposal.pending_review", "proposal.rejected", "proposal.vetoed"],
-        )
         pending_review_ids: set[str] = set()
         rejected_ids: set[str] = set()
         vetoed_ids: set[str] = set()
-        for e in review_events:
-            pid = e.payload.get("id", e.aggregate_id)
-            if e.event_type == "proposal.pending_review":
+        for e in lifecycle_events:
+            pid = e.proposal_id or e.aggregate_id
+            if e.event_type in ("proposal.passed", "proposal.failed"):
+                outcomes[pid] = "passed" if e.event_type == "proposal.passed" else "failed"
+            elif e.event_type == "proposal.confirmed":
+                confirmed_ids.add(pid)
+            elif e.event_type == "proposal.pending_review":
                 pending_review_ids.add(pid)
             elif e.event_type == "proposal.vetoed":
                 vetoed_ids.add(pid)
@@ -659,37 +934,33 @@ class Repository:
         Returns a list of dicts with id, raw_text, status, governor_id,
         team_id, parameter, tier, round_number.
         """
-        submitted_events = await self.get_events_by_type(
-            season_id=season_id,
-            event_types=["proposal.submitted"],
-        )
-        outcome_events = await self.get_events_by_type(
+        events = await self.get_events_by_type(
             season_id=season_id,
-            event_types=["proposal.passed", "proposal.failed"],
+            event_types=[
+                "proposal.submitted",
+                "proposal.passed",
+                "proposal.failed",
+                "proposal.confirmed",
+                "proposal.pending_review",
+                "proposal.rejected",
+                "proposal.vetoed",
+            ],
         )
+        submitted_events: list[GovernanceEventRow] = []
         outcomes: dict[str, str] = {}
-        for e in outcome_events:
-            pid = e.payload.get("proposal_id", e.aggregate_id)
-            outcomes[pid] = "passed" if e.event_type == "proposal.passed" else "failed"
-
-        confirmed_events = await self.get_events_by_type(
-            season_id=season_id,
-            event_types=["proposal.confirmed"],
-        )
-        confirmed_ids = {
-            e.payload.get("proposal_id", e.aggregate_id) for e in confirmed_events
-        }
-
-        review_events = await self.get_events_by_type(
-            season_id=season_id,
-            event_types=["proposal.pending_review", "proposal.rejected", "proposal.vetoed"],
-        )
+        confirmed_ids: set[str] = set()
         pending_review_ids: set[str] = set()
         rejected_ids: set[str] = set()
         vetoed_ids: set[str] = set()
-        for e in review_events:
-            pid = e.payload.get("id", e.aggregate_id)
-            if e.event_type == "proposal.pending_review":
+        for e in events:
+            pid = e.proposal_id or e.aggregate_id
+            if e.event_type == "proposal.submitted":
+                submitted_events.append(e)
+            elif e.event_type in ("proposal.passed", "proposal.failed"):
+                outcomes[pid] = "passed" if e.event_type == "proposal.passed" else "failed"
+            elif e.event_type == "proposal.confirmed":
+                confirmed_ids.add(pid)
+            elif e.event_type == "proposal.pending_review":
                 pending_review_ids.add(pid)
             elif e.event_type == "proposal.vetoed":
                 vetoed_ids.add(pid)
@@ -845,7 +1116,17 @@ class Repository:
             stmt = stmt.where(ReportRow.report_type == report_type)
         stmt = stmt.order_by(ReportRow.created_at.desc())
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return await self._merge_archived(
+            season_id,
+            "reports",
+            list(result.scalars().all()),
+            lambda r: (
+                r.round_number == round_number
+                and (not report_type or r.report_type == report_type)
+            ),
+            sort_key=_created_key,
+            reverse=True,
+        )
 
     async def get_game_commentary(
         self,
@@ -880,7 +1161,18 @@ class Repository:
             stmt = stmt.where(ReportRow.round_number == round_number)
         stmt = stmt.order_by(ReportRow.created_at.desc())
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return await self._merge_archived(
+            season_id,
+            "reports",
+            list(result.scalars().all()),
+            lambda r: (
+                r.governor_id == governor_id
+                and r.report_type == "private"
+                and (round_number is None or r.round_number == round_number)
+            ),
+            sort_key=_created_key,
+            reverse=True,
+        )
 
     async def update_report_content(
         self,
@@ -911,7 +1203,14 @@ class Repository:
             .order_by(ReportRow.created_at.desc())
         )
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return await self._merge_archived(
+            season_id,
+            "reports",
+            list(result.scalars().all()),
+            lambda r: r.report_type == "series",
+            sort_key=_created_key,
+            reverse=True,
+        )
 
     async def get_latest_report(
         self,
@@ -928,7 +1227,42 @@ class Repository:
             .limit(1)
         )
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none()
+        rows = await self._merge_archived(
+            season_id,
+            "reports",
+            [row] if (row := result.scalar_one_or_none()) else [],
+            lambda r: r.report_type == report_type,
+            sort_key=_created_key,
+            reverse=True,
+        )
+        return rows[0] if rows else None
+
+    async def get_report_ids(
+        self,
+        season_id: str,
+        round_number: int | None = None,
+        report_types: list[str] | None = None,
+    ) -> list[str]:
+        """Return report IDs (newest first) without loading report content."""
+        stmt = select(ReportRow.id).where(ReportRow.season_id == season_id)
+        if round_number is not None:
+            stmt = stmt.where(ReportRow.round_number == round_number)
+        if report_types:
+            stmt = stmt.where(ReportRow.report_type.in_(report_types))
+        stmt = stmt.order_by(ReportRow.created_at.desc(), ReportRow.id)
+        result = await self.session.execute(stmt)
+        report_ids = list(result.scalars().all())
+        archived = [
+            r
+            for r in await self.get_archived_log_rows(season_id, "reports")
+            if (round_number is None or r.round_number == round_number)
+            and (not report_types or r.report_type in report_types)
+        ]
+        if archived:
+            archived.sort(key=lambda r: r.id)
+            archived.sort(key=_created_key, reverse=True)
+            report_ids += [r.id for r in archived]
+        return report_ids
 
     async def get_public_reports_for_season(
         self,
@@ -944,7 +1278,13 @@ class Repository:
             .order_by(ReportRow.round_number.asc(), ReportRow.report_type.asc())
         )
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return await self._merge_archived(
+            season_id,
+            "reports",
+            list(result.scalars().all()),
+            lambda r: r.report_type in ("simulation", "governance", "series"),
+            sort_key=lambda r: (r.round_number, r.report_type),
+        )
 
     async def get_all_game_results_for_season(self, season_id: str) -> list[GameResultRow]:
         """Get all game results for a season, ordered by round."""
@@ -957,6 +1297,31 @@ class Repository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_games_between_teams(
+        self,
+        season_id: str,
+        team_a_id: str,
+        team_b_id: str,
+        round_numbers: Iterable[int],
+    ) -> list[GameResultRow]:
+        """Games between two teams (either home) in the given rounds, no box scores."""
+        stmt = (
+            select(GameResultRow)
+            .where(
+                GameResultRow.season_id == season_id,
+                GameResultRow.round_number.in_(list(round_numbers)),
+                or_(
+                    (GameResultRow.home_team_id == team_a_id)
+                    & (GameResultRow.away_team_id == team_b_id),
+                    (GameResultRow.home_team_id == team_b_id)
+                    & (GameResultRow.away_team_id == team_a_id),
+                ),
+            )
+            .order_by(GameResultRow.round_number, GameResultRow.matchup_index)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     # --- Players (Discord OAuth) ---
 
     async def get_player(self, player_id: str) -> PlayerRow | None:
@@ -1005,8 +1370,11 @@ class Repository:
         """Set a player's team enrollment for a season.
 
         Raises ValueError if the player is already enrolled on a different
-        team this season (season-lock).
+        team this season (season-lock).  Drops the cached membership of the
+        season joined and any season left, now and again after commit.
         """
+        from pinwheel.core.membership import membership_cache
+
         player = await self.session.get(PlayerRow, player_id)
         if player is None:
             msg = f"Player {player_id} not found"
@@ -1020,9 +1388,15 @@ class Repository:
             msg = f"Player already enrolled on team {player.team_id} for season {season_id}"
             raise ValueError(msg)
 
+        changed = {season_id}
+        if player.enrolled_season_id:
+            changed.add(player.enrolled_season_id)
         player.team_id = team_id
         player.enrolled_season_id = season_id
         await self.session.flush()
+        for changed_season in changed:
+            membership_cache.invalidate(changed_season)
+            self.after_commit(lambda s=changed_season: membership_cache.invalidate(s))
         return player
 
     async def get_players_for_team(self, team_id: str) -> list[PlayerRow]:
@@ -1104,6 +1478,17 @@ class Repository:
         Returns:
             List of dicts with hooper_id and total.
         """
+        if stat in HOOPER_SEASON_TOTALS:
+            total_col = getattr(HooperSeasonStatsRow, stat)
+            leaders_stmt = (
+                select(HooperSeasonStatsRow.hooper_id, total_col)
+                .where(HooperSeasonStatsRow.season_id == season_id)
+                .order_by(total_col.desc())
+                .limit(limit)
+            )
+            result = await self.session.execute(leaders_stmt)
+            return [{"hooper_id": row[0], "total": row[1]} for row in result.all()]
+
         stat_col = getattr(BoxScoreRow, stat, None)
         if stat_col is None:
             return []
@@ -1280,15 +1665,11 @@ class Repository:
         Returns a dict mapping stat name to the maximum value achieved in any single game.
         Used to identify and bold league-high performances on the hooper page.
         """
-        stmt = (
-            select(
-                func.max(BoxScoreRow.points).label("points"),
-                func.max(BoxScoreRow.assists).label("assists"),
-                func.max(BoxScoreRow.steals).label("steals"),
-            )
-            .join(GameResultRow, BoxScoreRow.game_id == GameResultRow.id)
-            .where(GameResultRow.season_id == season_id)
-        )
+        stmt = select(
+            func.max(HooperSeasonStatsRow.max_points).label("points"),
+            func.max(HooperSeasonStatsRow.max_assists).label("assists"),
+            func.max(HooperSeasonStatsRow.max_steals).label("steals"),
+        ).where(HooperSeasonStatsRow.season_id == season_id)
         result = await self.session.execute(stmt)
         row = result.one_or_none()
         if not row:
@@ -1304,8 +1685,8 @@ class Repository:
     ) -> dict[str, dict[str, float]]:
         """For each season, return the league-best season average for each core stat.
 
-        Uses a subquery that computes per-hooper per-season averages, then takes
-        the MAX across all hoopers per season. Handles ties naturally — callers can
+        Computes per-hooper averages from ``hooper_season_stats`` rows, then
+        takes the MAX across all hoopers per season. Handles ties naturally — callers can
         bold any hooper whose rounded value matches the rounded league max.
 
         Returns {season_id: {"ppg": float, "apg": float, "spg": float, "topg": float,
@@ -1314,32 +1695,25 @@ class Repository:
         if not season_ids:
             return {}
 
+        h = HooperSeasonStatsRow
         sub = (
             select(
-                GameResultRow.season_id.label("season_id"),
-                (func.sum(BoxScoreRow.points) * 1.0 / func.count()).label("ppg"),
-                (func.sum(BoxScoreRow.assists) * 1.0 / func.count()).label("apg"),
-                (func.sum(BoxScoreRow.steals) * 1.0 / func.count()).label("spg"),
-                (func.sum(BoxScoreRow.turnovers) * 1.0 / func.count()).label("topg"),
-                (
-                    func.sum(BoxScoreRow.field_goals_made)
-                    * 100.0
-                    / func.nullif(func.sum(BoxScoreRow.field_goals_attempted), 0)
-                ).label("fg_pct"),
+                h.season_id.label("season_id"),
+                (h.points * 1.0 / h.games).label("ppg"),
+                (h.assists * 1.0 / h.games).label("apg"),
+                (h.steals * 1.0 / h.games).label("spg"),
+                (h.turnovers * 1.0 / h.games).label("topg"),
+                (h.field_goals_made * 100.0 / func.nullif(h.field_goals_attempted, 0)).label(
+                    "fg_pct"
+                ),
                 (
-                    func.sum(BoxScoreRow.three_pointers_made)
-                    * 100.0
-                    / func.nullif(func.sum(BoxScoreRow.three_pointers_attempted), 0)
+                    h.three_pointers_made * 100.0 / func.nullif(h.three_pointers_attempted, 0)
                 ).label("three_pct"),
-                (
-                    func.sum(BoxScoreRow.free_throws_made)
-                    * 100.0
-                    / func.nullif(func.sum(BoxScoreRow.free_throws_attempted), 0)
-                ).label("ft_pct"),
+                (h.free_throws_made * 100.0 / func.nullif(h.free_throws_attempted, 0)).label(
+                    "ft_pct"
+                ),
             )
-            .join(GameResultRow, BoxScoreRow.game_id == GameResultRow.id)
-            .where(GameResultRow.season_id.in_(season_ids))
-            .group_by(GameResultRow.season_id, BoxScoreRow.hooper_id)
+            .where(h.season_id.in_(season_ids), h.games > 0)
         ).subquery()
 
         stmt = select(
@@ -1383,35 +1757,20 @@ class Repository:
         Returns a dict mapping stat name to cumulative total, e.g.:
             {"points": 120, "assists": 34, "steals": 12, ...}
         """
-        stat_columns = {
-            "points": BoxScoreRow.points,
-            "field_goals_made": BoxScoreRow.field_goals_made,
-            "field_goals_attempted": BoxScoreRow.field_goals_attempted,
-            "three_pointers_made": BoxScoreRow.three_pointers_made,
-            "three_pointers_attempted": BoxScoreRow.three_pointers_attempted,
-            "free_throws_made": BoxScoreRow.free_throws_made,
-            "free_throws_attempted": BoxScoreRow.free_throws_attempted,
-            "assists": BoxScoreRow.assists,
-            "steals": BoxScoreRow.steals,
-            "turnovers": BoxScoreRow.turnovers,
-        }
-        aggregates = [
-            func.coalesce(func.sum(col), 0).label(name)
-            for name, col in stat_columns.items()
-        ]
-        stmt = (
-            select(*aggregates)
-            .join(GameResultRow, BoxScoreRow.game_id == GameResultRow.id)
-            .where(
-                BoxScoreRow.hooper_id == hooper_id,
-                GameResultRow.season_id == season_id,
-            )
-        )
-        result = await self.session.execute(stmt)
-        row = result.one_or_none()
+        row = await self.session.get(HooperSeasonStatsRow, (season_id, hooper_id))
         if row is None:
-            return {name: 0 for name in stat_columns}
-        return dict(zip(stat_columns.keys(), row, strict=True))
+            return dict.fromkeys(HOOPER_SEASON_TOTALS, 0)
+        return {name: getattr(row, name) for name in HOOPER_SEASON_TOTALS}
+
+    async def get_hooper_season_stat_rows(
+        self, hooper_ids: list[str]
+    ) -> list[HooperSeasonStatsRow]:
+        """Season aggregate rows for any of *hooper_ids* (one per season played)."""
+        if not hooper_ids:
+            return []
+        stmt = select(HooperSeasonStatsRow).where(HooperSeasonStatsRow.hooper_id.in_(hooper_ids))
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
 
     async def add_hooper_move(self, hooper_id: str, move_data: dict) -> None:
         """Append a move to a hooper's moves JSON array.
@@ -1467,6 +1826,86 @@ class Repository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    # --- Eval Jobs ---
+
+    async def enqueue_eval_job(
+        self,
+        season_id: str,
+        round_number: int,
+        eval_type: str,
+        payload: dict | None = None,
+    ) -> bool:
+        """Queue an eval job unless one exists for the key. Returns True if added."""
+        stmt = select(EvalJobRow.id).where(
+            EvalJobRow.season_id == season_id,
+            EvalJobRow.round_number == round_number,
+            EvalJobRow.eval_type == eval_type,
+        )
+        if (await self.session.execute(stmt)).first() is not None:
+            return False
+        self.session.add(
+            EvalJobRow(
+                season_id=season_id,
+                round_number=round_number,
+                eval_type=eval_type,
+                payload=payload,
+            )
+        )
+        await self.session.flush()
+        return True
+
+    async def claim_eval_jobs(self, limit: int, stale_before: datetime) -> list[EvalJobRow]:
+        """Mark up to *limit* runnable jobs as running and return them, oldest first.
+
+        Runnable means pending, or running but started before *stale_before*
+        (its worker died mid-job).
+        """
+        from datetime import UTC
+
+        stmt = (
+            select(EvalJobRow)
+            .where(
+                or_(
+                    EvalJobRow.status == "pending",
+                    (EvalJobRow.status == "running") & (EvalJobRow.started_at < stale_before),
+                )
+            )
+            .order_by(EvalJobRow.created_at, EvalJobRow.round_number)
+            .limit(limit)
+        )
+        jobs = list((await self.session.execute(stmt)).scalars().all())
+        now = datetime.now(UTC)
+        for job in jobs:
+            job.status = "running"
+            job.started_at = now
+            job.attempts += 1
+        await self.session.flush()
+        return jobs
+
+    async def finish_eval_job(self, job_id: str, status: str, error: str = "") -> None:
+        """Record a job's outcome (``done``, ``pending`` to retry, or ``failed``)."""
+        from datetime import UTC
+
+        job = await self.session.get(EvalJobRow, job_id)
+        if job is None:
+            return
+        job.status = status
+        job.last_error = error
+        if status != "pending":
+            job.finished_at = datetime.now(UTC)
+        await self.session.flush()
+
+    async def get_eval_jobs(
+        self, season_id: str, round_number: int | None = None
+    ) -> list[EvalJobRow]:
+        """Eval jobs for a season (optionally one round), in queue order."""
+        stmt = select(EvalJobRow).where(EvalJobRow.season_id == season_id)
+        if round_number is not None:
+            stmt = stmt.where(EvalJobRow.round_number == round_number)
+        stmt = stmt.order_by(EvalJobRow.created_at, EvalJobRow.round_number)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     # --- Bot State (key-value persistence) ---
 
     async def get_bot_state(self, key: str) -> str | None:
@@ -1542,6 +1981,107 @@ class Repository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    # --- Season log archives (see db/log_archive.py) ---
+
+    async def _get_log_archive(self, season_id: str, log_type: str) -> SeasonLogArchiveRow | None:
+        stmt = select(SeasonLogArchiveRow).where(
+            SeasonLogArchiveRow.season_id == season_id,
+            SeasonLogArchiveRow.log_type == log_type,
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def _log_archive_seasons(self) -> set[str]:
+        """Compacted season ids, reloaded every ``log_archives.refresh_seconds``."""
+        if log_archives.needs_refresh():
+            result = await self.session.execute(
+                select(
+                    SeasonLogArchiveRow.season_id,
+                    SeasonLogArchiveRow.log_type,
+                    SeasonLogArchiveRow.row_count,
+                )
+            )
+            log_archives.load(
+                {(season_id, log_type): count for season_id, log_type, count in result.all()}
+            )
+        return log_archives.seasons or set()
+
+    async def has_log_archive(self, season_id: str) -> bool:
+        """Whether *season_id* has been compacted (answered from memory between reloads)."""
+        return season_id in await self._log_archive_seasons()
+
+    async def compact_season_logs(self, season_id: str) -> dict[str, int]:
+        """Move a season's events, reports and AI usage rows into compressed archives.
+
+        Idempotent: rows written after an earlier compaction are merged
+        into the existing archive. Returns the number of rows moved per
+        log type.
+        """
+        moved: dict[str, int] = {}
+        for log_type, model in ARCHIVED_LOGS.items():
+            season_column: Any = model.season_id  # type: ignore[attr-defined]
+            result = await self.session.execute(select(model).where(season_column == season_id))
+            rows: list[Any] = list(result.scalars().all())
+            if not rows:
+                continue
+            archive = await self._get_log_archive(season_id, log_type)
+            if archive is None:
+                archive = SeasonLogArchiveRow(season_id=season_id, log_type=log_type)
+                self.session.add(archive)
+                records = rows
+            else:
+                records = [*self._hydrate(model, decode_rows(model, archive.data)), *rows]
+            archive.data = encode_rows(model, records)
+            archive.row_count = len(records)
+            if log_type == "governance_events":
+                archive.max_sequence = max(r.sequence_number for r in records)
+            await self.session.execute(delete(model).where(season_column == season_id))
+            moved[log_type] = len(rows)
+        await self.session.flush()
+        log_archives.mark(season_id)
+        return moved
+
+    @staticmethod
+    def _hydrate(model: type, records: list[dict]) -> list[Any]:
+        columns = set(model.__table__.columns.keys())
+        return [model(**{k: v for k, v in rec.items() if k in columns}) for rec in records]
+
+    async def get_archived_log_rows(
+        self, season_id: str, log_type: str, *, compacted: bool = False
+    ) -> list[Any]:
+        """Archived rows of one log table as transient (session-less) ORM objects.
+
+        Empty for seasons that were never compacted.  ``compacted=True``
+        skips the in-memory index check for callers that just read the
+        season from ``season_log_archives``.
+        """
+        if not compacted and not await self.has_log_archive(season_id):
+            return []
+        model = ARCHIVED_LOGS[log_type]
+        records = log_archives.get_decoded(season_id, log_type)
+        if records is None:
+            archive = await self._get_log_archive(season_id, log_type)
+            records = decode_rows(model, archive.data) if archive else []
+            log_archives.put_decoded(season_id, log_type, records)
+        return self._hydrate(model, records)
+
+    async def _merge_archived(
+        self,
+        season_id: str,
+        log_type: str,
+        rows: list[Any],
+        keep: Callable[[Any], bool],
+        sort_key: Callable[[Any], Any],
+        reverse: bool = False,
+        compacted: bool = False,
+    ) -> list[Any]:
+        """Add a compacted season's archived rows matching *keep* to *rows*."""
+        archived_rows = await self.get_archived_log_rows(season_id, log_type, compacted=compacted)
+        archived = [r for r in archived_rows if keep(r)]
+        if not archived:
+            return rows
+        return sorted([*rows, *archived], key=sort_key, reverse=reverse)
+
     # --- Meta Column Helpers ---
 
     async def update_team_meta(self, team_id: str, meta: dict) -> None:
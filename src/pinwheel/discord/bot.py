@@ -1258,9 +1258,11 @@ class PinwheelBot(commands.Bot):
 
                         # No team specified → show team list with governor counts
                         if not team_name.strip():
+                            from pinwheel.core.membership import membership_cache
                             from pinwheel.discord.embeds import build_team_list_embed
 
-                            counts = await repo.get_governor_counts_by_team(season.id)
+                            membership = await membership_cache.get(repo, season.id)
+                            counts = membership.counts_by_team()
                             team_data = [
                                 {
                                     "name": t.name,
@@ -2280,18 +2282,28 @@ class PinwheelBot(commands.Bot):
                     )
                     return
 
-            # Let the player know their proposal was received before the slow AI call
-            thinking_msg = await interaction.followup.send(
-                "**Received your proposal.** The Constitutional Interpreter "
-                "is reviewing it \u2014 this usually takes 15\u201330 seconds...",
-                ephemeral=True,
-            )
+                # A near-duplicate of a proposal already interpreted this season
+                # reuses that interpretation — no model call.
+                similar = None
+                if self.settings.anthropic_api_key:
+                    from pinwheel.ai.similar_proposals import proposal_index
+
+                    similar = await proposal_index.lookup(repo, gov.season_id, text, ruleset)
 
             api_key = self.settings.anthropic_api_key
+            if similar is None:
+                # Let the player know their proposal was received before the slow AI call
+                thinking_msg = await interaction.followup.send(
+                    "**Received your proposal.** The Constitutional Interpreter "
+                    "is reviewing it \u2014 this usually takes 15\u201330 seconds...",
+                    ephemeral=True,
+                )
+
             interpretation_v2 = None
             if api_key:
-                # Fire classifier and interpreter in parallel —
-                # total time = max(classifier, interpreter) instead of sum.
+                # Every proposal is screened, including near-duplicates. Fire
+                # classifier and interpreter in parallel — total time =
+                # max(classifier, interpreter) instead of sum.
                 import asyncio
 
                 from pinwheel.ai.classifier import classify_injection
@@ -2303,10 +2315,14 @@ class PinwheelBot(commands.Bot):
                     RuleInterpretation as RI,
                 )
 
-                classification, interpretation_v2 = await asyncio.gather(
-                    classify_injection(text, api_key),
-                    interpret_proposal_v2(text, ruleset, api_key),
-                )
+                if similar is not None:
+                    classification = await classify_injection(text, api_key)
+                    interpretation_v2 = similar.interpretation
+                else:
+                    classification, interpretation_v2 = await asyncio.gather(
+                        classify_injection(text, api_key),
+                        interpret_proposal_v2(text, ruleset, api_key),
+                    )
 
                 # Store classification result for dashboard visibility
                 async with get_session(self.engine) as session:
@@ -2386,6 +2402,27 @@ class PinwheelBot(commands.Bot):
             # Record cooldown timestamp
             self._proposal_cooldowns[gov.player_id] = time.monotonic()
 
+            # Simulated next-round deltas. A slow run finishes in the
+            # background and is reused once the proposal is confirmed.
+            from pinwheel.core.impact_preview import impact_previews, prepare_preview
+
+            impact = None
+            if impact_previews.enabled:
+                try:
+                    async with get_session(self.engine) as preview_session:
+                        prepared = await prepare_preview(
+                            Repository(preview_session),
+                            gov.season_id,
+                            interpretation,
+                            interpretation_v2.effects if interpretation_v2 else None,
+                        )
+                    if prepared is not None:
+                        impact = await impact_previews.preview(
+                            *prepared, timeout=self.settings.pinwheel_preview_wait_seconds
+                        )
+                except Exception:  # Last-resort handler — DB and simulation setup errors
+                    logger.exception("impact_preview_start_failed governor=%s", gov.player_id)
+
             from pinwheel.discord.views import ProposalConfirmView
 
             view = ProposalConfirmView(
@@ -2410,12 +2447,16 @@ class PinwheelBot(commands.Bot):
                 tokens_remaining=balance.propose - cost,
                 governor_name=interaction.user.display_name,
                 interpretation_v2=interpretation_v2,
+                impact=impact,
             )
-            await thinking_msg.edit(
-                content=None,
-                embed=embed,
-                view=view,
-            )
+            if "thinking_msg" in locals():
+                await thinking_msg.edit(
+                    content=None,
+                    embed=embed,
+                    view=view,
+                )
+            else:
+                await interaction.followup.send(embed=embed, view=view, ephemeral=True)
         except Exception:  # Last-resort handler — DB, AI interpreter, and Discord errors
             logger.exception("discord_propose_failed")
             # If the thinking message was sent, edit it with the error;
@@ -3144,10 +3185,8 @@ class PinwheelBot(commands.Bot):
             return
 
         try:
-            from pinwheel.core.governance import (
-                cast_vote,
-                compute_vote_weight,
-            )
+            from pinwheel.core.governance import cast_vote
+            from pinwheel.core.membership import membership_cache
             from pinwheel.core.tokens import has_token
             from pinwheel.db.engine import get_session
             from pinwheel.db.repository import Repository
@@ -3246,14 +3285,14 @@ class PinwheelBot(commands.Bot):
                     season_id=gov.season_id,
                     governor_id=gov.player_id,
                     event_types=["vote.cast"],
+                    proposal_ids=[proposal_id],
                 )
-                for v in my_votes:
-                    if v.payload.get("proposal_id") == proposal_id:
-                        await interaction.followup.send(
-                            "You've already voted on this proposal.",
-                            ephemeral=True,
-                        )
-                        return
+                if my_votes:
+                    await interaction.followup.send(
+                        "You've already voted on this proposal.",
+                        ephemeral=True,
+                    )
+                    return
 
                 # Check boost token if requested
                 if boost and not await has_token(
@@ -3270,12 +3309,9 @@ class PinwheelBot(commands.Bot):
                     )
                     return
 
-                # Compute vote weight
-                team_players = await repo.get_players_for_team(
-                    gov.team_id,
-                )
-                active_count = len(team_players) or 1
-                weight = compute_vote_weight(active_count)
+                # Compute vote weight from the season's cached team membership
+                membership = await membership_cache.get(repo, gov.season_id)
+                weight = membership.vote_weight(gov.team_id)
 
                 await cast_vote(
                     repo=repo,
@@ -3998,6 +4034,11 @@ class PinwheelBot(commands.Bot):
                 teams = await repo.get_teams_for_season(new_season.id)
                 await session.commit()
 
+            # Closing the previous season tallied its last proposals
+            from pinwheel.core.fragment_cache import invalidate_season
+
+            invalidate_season(latest_season.id)
+
             rules_note = "carried forward" if carry_rules else "default"
             embed = discord.Embed(
                 title=f"New Season: {name}",
@@ -4303,7 +4344,7 @@ class PinwheelBot(commands.Bot):
 
         await interaction.response.defer(ephemeral=True)
 
-        from pinwheel.core.effects import load_effect_registry
+        from pinwheel.core.effects import effect_registry_cache, load_effect_registry
         from pinwheel.db.engine import get_session
         from pinwheel.db.repository import Repository
 
@@ -4343,6 +4384,7 @@ class PinwheelBot(commands.Bot):
                     },
                 )
                 await session.commit()
+                effect_registry_cache.invalidate(season.id)
 
             desc = effect.description or effect_id
             embed = discord.Embed(
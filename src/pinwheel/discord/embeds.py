@@ -14,6 +14,7 @@ import discord
 
 if TYPE_CHECKING:
     from pinwheel.core.hooks import RegisteredEffect
+    from pinwheel.core.impact_preview import ImpactPreview
     from pinwheel.core.onboarding import LeagueContext
     from pinwheel.models.governance import (
         Proposal,
@@ -623,6 +624,25 @@ def build_schedule_embed(
     return embed
 
 
+def format_impact_preview(impact: ImpactPreview) -> str:
+    """Scoring, pace and the largest win-probability swing, one per line."""
+    lines = [
+        f"Scoring: {impact.points_before:.1f} -> {impact.points_after:.1f} pts/game "
+        f"({impact.points_delta:+.1f})",
+        f"Pace: {impact.possessions_before:.1f} -> {impact.possessions_after:.1f} "
+        f"possessions ({impact.pace_delta:+.1f})",
+    ]
+    swing = impact.biggest_swing
+    if swing is not None and swing.win_shift:
+        lines.append(
+            f"Biggest swing: {swing.home_team} vs {swing.away_team}, home wins "
+            f"{swing.home_win_before:.0%} -> {swing.home_win_after:.0%}"
+        )
+    else:
+        lines.append("Win odds: no matchup changes")
+    return "\n".join(lines)
+
+
 def build_interpretation_embed(
     raw_text: str,
     interpretation: RuleInterpretation,
@@ -631,12 +651,14 @@ def build_interpretation_embed(
     tokens_remaining: int,
     governor_name: str = "",
     interpretation_v2: ProposalInterpretation | None = None,
+    impact: ImpactPreview | None = None,
 ) -> discord.Embed:
     """Build an embed showing AI interpretation of a proposal.
 
     Displayed ephemeral with confirm/revise/cancel buttons.
     When interpretation_v2 is provided, shows rich V2 effects instead of
-    the legacy single-parameter view.
+    the legacy single-parameter view. ``impact`` adds the simulated
+    next-round deltas.
     """
     embed = discord.Embed(
         title="Proposal Interpretation",
@@ -723,6 +745,13 @@ def build_interpretation_embed(
             inline=False,
         )
 
+    if impact is not None:
+        embed.add_field(
+            name=f"Simulated Impact (round {impact.round_number}, {impact.games} games)",
+            value=format_impact_preview(impact),
+            inline=False,
+        )
+
     embed.add_field(name="Tier", value=str(tier), inline=True)
     embed.add_field(
         name="Cost",
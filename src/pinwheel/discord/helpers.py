@@ -9,6 +9,7 @@ from dataclasses import dataclass
 
 from sqlalchemy.ext.asyncio import AsyncEngine
 
+from pinwheel.core.membership import membership_cache
 from pinwheel.db.engine import get_session
 from pinwheel.db.repository import Repository
 
@@ -47,6 +48,39 @@ async def get_current_season_id(engine: AsyncEngine) -> str | None:
         return season.id if season else None
 
 
+async def _resolve_governor(
+    repo: Repository, season_id: str, discord_id: str
+) -> GovernorInfo | None:
+    """Governor for *discord_id* in *season_id*, served from the membership cache.
+
+    A cache miss is re-checked against the DB (the user may have enrolled
+    since the cache loaded) and drops the stale season entry if so.
+    """
+    membership = await membership_cache.get(repo, season_id)
+    governor = membership.by_discord.get(discord_id)
+    if governor is not None:
+        player_id, team_id = governor.player_id, governor.team_id
+    else:
+        player = await repo.get_player_by_discord_id(discord_id)
+        if player is None or player.team_id is None or player.enrolled_season_id != season_id:
+            return None
+        membership_cache.invalidate(season_id)
+        player_id, team_id = player.id, player.team_id
+
+    team_name = membership.team_names.get(team_id)
+    if team_name is None:
+        team = await repo.get_team(team_id)
+        team_name = team.name if team else team_id
+
+    return GovernorInfo(
+        player_id=player_id,
+        discord_id=discord_id,
+        team_id=team_id,
+        team_name=team_name,
+        season_id=season_id,
+    )
+
+
 async def get_governor(engine: AsyncEngine, discord_id: str) -> GovernorInfo:
     """Look up a governor by Discord user ID.
 
@@ -61,23 +95,13 @@ async def get_governor(engine: AsyncEngine, discord_id: str) -> GovernorInfo:
                 "Ask an admin to start one with `/new-season`."
             )
 
-        player = await repo.get_player_by_discord_id(discord_id)
-        if player is None or player.team_id is None or player.enrolled_season_id != season.id:
+        governor = await _resolve_governor(repo, season.id, discord_id)
+        if governor is None:
             raise GovernorNotFound(
                 "You're not enrolled as a governor this season. "
                 "Use `/join` to pick a team and get started."
             )
-
-        team = await repo.get_team(player.team_id)
-        team_name = team.name if team else player.team_id
-
-        return GovernorInfo(
-            player_id=player.id,
-            discord_id=discord_id,
-            team_id=player.team_id,
-            team_name=team_name,
-            season_id=season.id,
-        )
+        return governor
 
 
 async def get_governor_info(repo: Repository, discord_id: str) -> GovernorInfo | None:
@@ -90,18 +114,4 @@ async def get_governor_info(repo: Repository, discord_id: str) -> GovernorInfo |
     season = await repo.get_active_season()
     if not season:
         return None
-
-    player = await repo.get_player_by_discord_id(discord_id)
-    if player is None or player.team_id is None or player.enrolled_season_id != season.id:
-        return None
-
-    team = await repo.get_team(player.team_id)
-    team_name = team.name if team else player.team_id
-
-    return GovernorInfo(
-        player_id=player.id,
-        discord_id=discord_id,
-        team_id=player.team_id,
-        team_name=team_name,
-        season_id=season.id,
-    )
+    return await _resolve_governor(repo, season.id, discord_id)
@@ -130,6 +130,7 @@ class ProposalConfirmView(discord.ui.View):
             confirm_proposal,
             submit_proposal,
         )
+        from pinwheel.core.impact_preview import impact_previews, prepare_preview
         from pinwheel.db.engine import get_session
         from pinwheel.db.repository import Repository
         from pinwheel.models.rules import RuleSet
@@ -160,6 +161,22 @@ class ProposalConfirmView(discord.ui.View):
                 )
                 await session.commit()
 
+            # Same run as the /propose preview; now cached under the proposal ID.
+            # Best-effort: the proposal is already committed either way.
+            if impact_previews.enabled:
+                try:
+                    async with get_session(self.engine) as preview_session:
+                        prepared = await prepare_preview(
+                            Repository(preview_session),
+                            self.governor_info.season_id,
+                            self.interpretation,
+                            self.interpretation_v2.effects if self.interpretation_v2 else None,
+                        )
+                    if prepared is not None:
+                        impact_previews.start(*prepared, proposal_id=proposal.id)
+                except Exception:  # Last-resort handler — DB and simulation setup errors
+                    logger.exception("impact_preview_start_failed proposal=%s", proposal.id)
+
             # Publish governance event for instrumentation
             if self.event_bus is not None:
                 await self.event_bus.publish(
@@ -0,0 +1,351 @@
+"""Incremental season aggregates for the per-round evals.
+
+The scenario flags, GQI, behavioral shift, joy alarms and the rule
+evaluator all used to re-read the season's full governance log every round
+and recount it from scratch. ``SeasonEvalAggregates`` holds the running
+counts those detectors actually need, and ``EvalAggregateIndex`` keeps one
+per season up to date from only the events (and games) it has not seen:
+
+* **Governors** — actions (proposals + votes) per round per governor and
+  each governor's last active round.
+* **Proposals** — targeted-parameter histogram and proposal words per
+  round, proposals per governor, outcomes, passed ids, proposing team.
+* **Votes** — vote tallies per proposal and time-to-vote after
+  confirmation.
+* **Economy** — trade/boost actions per round.
+* **Rules and games** — enacted rules, last change per parameter, team
+  win/loss per round and per-round game stats.
+
+Events are consumed by sequence number (one indexed query per refresh).
+Game results are read round by round; the newest round is re-read on the
+next refresh in case its games land after the evals ran.
+
+The inline evals refresh inside the round's still-open session, so the
+warm copy can hold events that are not committed yet. If that transaction
+ends without committing, the season's entry is dropped and rebuilt from
+committed rows on the next ``get`` — otherwise a retried round would
+reuse those sequence numbers below the watermark and they would never be
+applied.
+
+Detectors take an optional ``aggregates`` argument; without one they build
+a cold copy with ``load_aggregates`` (the same code path, from sequence 0).
+
+Usage:
+    aggregates = await eval_aggregates.get(repo, season_id, round_number)
+    flags = await detect_all_flags(repo, season_id, round_number, games,
+                                   aggregates=aggregates)
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event as orm_event
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session, SessionTransaction
+
+    from pinwheel.db.models import GameResultRow, GovernanceEventRow
+    from pinwheel.db.repository import Repository
+
+logger = logging.getLogger(__name__)
+
+GOVERNANCE_ACTIONS = ("proposal.submitted", "vote.cast")
+
+_EVENT_TYPES = [
+    "proposal.submitted",
+    "proposal.confirmed",
+    "proposal.passed",
+    "proposal.failed",
+    "vote.cast",
+    "rule.enacted",
+    "trade.offered",
+    "trade.accepted",
+    "token.spent",
+]
+
+
+@dataclass
+class GameStat:
+    """The per-game numbers the rule evaluator summarizes."""
+
+    total_score: int
+    possessions: int
+    elam: bool
+
+
+@dataclass
+class SeasonEvalAggregates:
+    """Running per-season counts for the eval detectors."""
+
+    season_id: str = ""
+    watermark: int = 0
+    games_through_round: int = 0
+
+    event_counts: Counter[str] = field(default_factory=Counter)
+
+    # Governors: round -> governor -> proposals + votes
+    actions_by_round: dict[int, Counter[str]] = field(default_factory=dict)
+    last_active: dict[str, int] = field(default_factory=dict)
+    governor_names: dict[str, str] = field(default_factory=dict)
+
+    # Proposals
+    params_by_round: dict[int, Counter[str]] = field(default_factory=dict)
+    proposal_words_by_round: dict[int, set[str]] = field(default_factory=dict)
+    proposals_by_governor: dict[str, list[str]] = field(default_factory=dict)
+    proposal_team: dict[str, str] = field(default_factory=dict)
+    outcomes: dict[str, str] = field(default_factory=dict)
+    passed_ids: set[str] = field(default_factory=set)
+
+    # Votes: proposal -> vote value -> count (in first-vote order)
+    votes_by_proposal: dict[str, Counter[str]] = field(default_factory=dict)
+    confirmed_at: dict[str, datetime] = field(default_factory=dict)
+    unconfirmed_votes: dict[str, list[datetime]] = field(default_factory=dict)
+    vote_delays_seconds: list[float] = field(default_factory=list)
+
+    economy_by_round: Counter[int] = field(default_factory=Counter)
+
+    # Rules and games
+    enacted: list[tuple[str, int]] = field(default_factory=list)
+    param_last_changed: dict[str, int] = field(default_factory=dict)
+    team_results: dict[str, dict[int, list[int]]] = field(default_factory=dict)
+    games_by_round: dict[int, list[GameStat]] = field(default_factory=dict)
+    _seen_games: set[str] = field(default_factory=set)
+
+    # --- Updates ---
+
+    def apply_event(self, event: GovernanceEventRow) -> None:
+        """Fold one governance event into the running counts."""
+        self.watermark = max(self.watermark, event.sequence_number)
+        self.event_counts[event.event_type] += 1
+        payload = event.payload or {}
+        gid = event.governor_id
+        rn = event.round_number
+
+        if event.event_type in GOVERNANCE_ACTIONS and gid and rn is not None:
+            self.actions_by_round.setdefault(rn, Counter())[gid] += 1
+            self.last_active[gid] = max(self.last_active.get(gid, 0), rn)
+
+        if event.event_type.startswith("proposal.") and event.team_id:
+            self.proposal_team.setdefault(event.aggregate_id, event.team_id)
+
+        if event.event_type == "proposal.submitted":
+            if rn is not None:
+                param = (payload.get("interpretation") or {}).get("parameter")
+                if param:
+                    self.params_by_round.setdefault(rn, Counter())[param] += 1
+                raw_text = payload.get("raw_text", "")
+                self.proposal_words_by_round.setdefault(rn, set()).update(
+                    raw_text.lower().split()
+                )
+            if gid:
+                pid = payload.get("id", event.aggregate_id)
+                self.proposals_by_governor.setdefault(gid, []).append(pid)
+                self.governor_names[gid] = payload.get("governor_name", gid)
+        elif event.event_type in ("proposal.passed", "proposal.failed"):
+            pid = payload.get("proposal_id", event.aggregate_id)
+            passed = event.event_type == "proposal.passed"
+            self.outcomes[pid] = "passed" if passed else "failed"
+            if passed:
+                self.passed_ids.add(pid)
+        elif event.event_type == "proposal.confirmed":
+            pid = payload.get("proposal_id", event.aggregate_id)
+            self.confirmed_at[pid] = event.created_at
+            for cast_at in self.unconfirmed_votes.pop(pid, []):
+                self.vote_delays_seconds.append((cast_at - event.created_at).total_seconds())
+        elif event.event_type == "vote.cast":
+            pid = payload.get("proposal_id", "")
+            vote = payload.get("vote", "")
+            if pid and vote:
+                self.votes_by_proposal.setdefault(pid, Counter())[vote] += 1
+            confirmed = self.confirmed_at.get(pid)
+            if confirmed is not None:
+                self.vote_delays_seconds.append((event.created_at - confirmed).total_seconds())
+            elif pid:
+                self.unconfirmed_votes.setdefault(pid, []).append(event.created_at)
+        elif event.event_type == "rule.enacted":
+            param = payload.get("parameter", "")
+            enact_round = payload.get("round_enacted", 0)
+            if param:
+                self.param_last_changed[param] = max(
+                    self.param_last_changed.get(param, 0), enact_round
+                )
+            proposal_id = payload.get("source_proposal_id", "")
+            if proposal_id:
+                self.enacted.append((proposal_id, enact_round))
+        elif event.event_type in ("trade.offered", "trade.accepted"):
+            if rn is not None:
+                self.economy_by_round[rn] += 1
+        elif event.event_type == "token.spent":
+            reason = payload.get("reason", "")
+            is_boost = "boost" in reason.lower() or payload.get("token_type") == "boost"
+            if is_boost and rn is not None:
+                self.economy_by_round[rn] += 1
+
+    def apply_game(self, game: GameResultRow) -> None:
+        """Fold one game result into the team records and game stats."""
+        if game.id in self._seen_games:
+            return
+        self._seen_games.add(game.id)
+        for team_id in (game.home_team_id, game.away_team_id):
+            record = self.team_results.setdefault(team_id, {}).setdefault(
+                game.round_number, [0, 0]
+            )
+            record[0] += 1 if game.winner_team_id == team_id else 0
+            record[1] += 1
+        self.games_by_round.setdefault(game.round_number, []).append(
+            GameStat(
+                total_score=game.home_score + game.away_score,
+                possessions=game.total_possessions,
+                elam=bool(game.elam_target),
+            )
+        )
+
+    def is_past(self, round_number: int, through_sequence: int) -> bool:
+        """Whether events after *through_sequence* or games after *round_number* are folded in."""
+        return (
+            self.watermark > through_sequence
+            or max(self.games_by_round, default=0) > round_number
+        )
+
+    async def refresh(
+        self, repo: Repository, round_number: int, through_sequence: int | None = None
+    ) -> None:
+        """Apply events after the watermark and games up to *round_number*.
+
+        ``through_sequence`` stops at that event, for an eval that must see
+        the log as it was when its round finished.
+        """
+        events = await repo.get_events_by_type(
+            self.season_id, _EVENT_TYPES, after_sequence=self.watermark
+        )
+        for event in events:
+            if through_sequence is not None and event.sequence_number > through_sequence:
+                break
+            self.apply_event(event)
+        if round_number - self.games_through_round > 2:
+            # Cold start: one season query beats a query per round
+            for game in await repo.get_all_game_results_for_season(self.season_id):
+                if self.games_through_round < game.round_number <= round_number:
+                    self.apply_game(game)
+        else:
+            for rn in range(self.games_through_round + 1, round_number + 1):
+                for game in await repo.get_games_for_round(self.season_id, rn):
+                    self.apply_game(game)
+        self.games_through_round = max(self.games_through_round, round_number - 1)
+
+    # --- Reads ---
+
+    def actions_in_round(self, round_number: int) -> Counter[str]:
+        """Governor -> proposals + votes in *round_number*."""
+        return self.actions_by_round.get(round_number, Counter())
+
+    def window_actions(self, start: int, end: int) -> tuple[int, int]:
+        """(total actions, distinct active governors) over rounds start..end."""
+        total = 0
+        active: set[str] = set()
+        for rn in range(start, end + 1):
+            counts = self.actions_by_round.get(rn)
+            if counts:
+                total += sum(counts.values())
+                active.update(gid for gid, n in counts.items() if n > 0)
+        return total, len(active)
+
+    def team_record(self, team_id: str, rounds: range) -> tuple[int, int]:
+        """(wins, games) for *team_id* over *rounds*."""
+        wins = games = 0
+        by_round = self.team_results.get(team_id, {})
+        for rn, (w, g) in by_round.items():
+            if rn in rounds:
+                wins += w
+                games += g
+        return wins, games
+
+
+async def load_aggregates(
+    repo: Repository, season_id: str, round_number: int, through_sequence: int | None = None
+) -> SeasonEvalAggregates:
+    """Build aggregates from scratch (for one-off detector calls)."""
+    aggregates = SeasonEvalAggregates(season_id=season_id)
+    await aggregates.refresh(repo, round_number, through_sequence)
+    return aggregates
+
+
+class EvalAggregateIndex:
+    """Per-season ``SeasonEvalAggregates`` kept warm across rounds."""
+
+    def __init__(self) -> None:
+        self._seasons: dict[str, SeasonEvalAggregates] = {}
+
+    def clear(self) -> None:
+        self._seasons.clear()
+
+    def invalidate(self, season_id: str) -> None:
+        self._seasons.pop(season_id, None)
+
+    def _drop_unless_committed(self, repo: Repository, season_id: str) -> None:
+        """Invalidate *season_id* if the transaction that was just read rolls back."""
+        session = repo.session.sync_session
+        transaction = session.get_transaction()
+        committed = False
+
+        def on_commit(_session: Session) -> None:
+            nonlocal committed
+            committed = True
+
+        def on_end(_session: Session, ended: SessionTransaction) -> None:
+            # Flushes end subtransactions; only the one that was read counts
+            if ended is transaction and not committed:
+                self.invalidate(season_id)
+
+        orm_event.listen(session, "after_commit", on_commit, once=True)
+        orm_event.listen(session, "after_transaction_end", on_end)
+
+    async def get(
+        self,
+        repo: Repository,
+        season_id: str,
+        round_number: int,
+        through_sequence: int | None = None,
+    ) -> SeasonEvalAggregates:
+        """Aggregates for *season_id*, refreshed with anything new.
+
+        With ``through_sequence`` the result holds nothing after that event
+        or after *round_number*'s games. A late eval job whose round the
+        warm copy has already moved past gets a cold copy built to that
+        bound instead.
+        """
+        cached = self._seasons.get(season_id)
+        if (
+            through_sequence is not None
+            and cached is not None
+            and cached.is_past(round_number, through_sequence)
+        ):
+            logger.info(
+                "eval_aggregates_cold_load season=%s round=%d through_sequence=%d",
+                season_id,
+                round_number,
+                through_sequence,
+            )
+            return await load_aggregates(repo, season_id, round_number, through_sequence)
+        aggregates = self._seasons.setdefault(
+            season_id, SeasonEvalAggregates(season_id=season_id)
+        )
+        before = aggregates.watermark
+        await aggregates.refresh(repo, round_number, through_sequence)
+        self._drop_unless_committed(repo, season_id)
+        logger.info(
+            "eval_aggregates_refreshed season=%s round=%d events_applied_through=%d->%d",
+            season_id,
+            round_number,
+            before,
+            aggregates.watermark,
+        )
+        return aggregates
+
+
+eval_aggregates = EvalAggregateIndex()
@@ -9,6 +9,7 @@ from __future__ import annotations
 import random
 from typing import TYPE_CHECKING
 
+from pinwheel.evals.aggregates import load_aggregates
 from pinwheel.evals.behavioral import detect_behavioral_shift
 
 if TYPE_CHECKING:
@@ -39,15 +40,20 @@ async def compute_attribution(
 
     Returns aggregate delta only — no individual governor data.
     """
+    aggregates = await load_aggregates(repo, season_id, round_number)
     treatment_shifts = 0
     for gov_id in treatment_ids:
-        result = await detect_behavioral_shift(repo, season_id, gov_id, round_number)
+        result = await detect_behavioral_shift(
+            repo, season_id, gov_id, round_number, aggregates=aggregates
+        )
         if result.shifted:
             treatment_shifts += 1
 
     control_shifts = 0
     for gov_id in control_ids:
-        result = await detect_behavioral_shift(repo, season_id, gov_id, round_number)
+        result = await detect_behavioral_shift(
+            repo, season_id, gov_id, round_number, aggregates=aggregates
+        )
         if result.shifted:
             control_shifts += 1
 
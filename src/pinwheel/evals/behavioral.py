@@ -2,17 +2,19 @@
 
 For each governor who got a private report, compare this round's governance
 actions to a rolling baseline. Never reads ReportRow.content — only queries
-GovernanceEventRow and ReportRow.governor_id.
+GovernanceEventRow (via ``SeasonEvalAggregates``) and ReportRow.governor_id.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from pinwheel.evals.aggregates import load_aggregates
 from pinwheel.evals.models import BehavioralShiftResult
 
 if TYPE_CHECKING:
     from pinwheel.db.repository import Repository
+    from pinwheel.evals.aggregates import SeasonEvalAggregates
 
 
 async def get_governor_action_count(
@@ -20,14 +22,12 @@ async def get_governor_action_count(
     season_id: str,
     governor_id: str,
     round_number: int,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> int:
     """Count governance actions (proposals + votes) for a governor in a specific round."""
-    events = await repo.get_events_by_type_and_governor(
-        season_id=season_id,
-        governor_id=governor_id,
-        event_types=["proposal.submitted", "vote.cast"],
-    )
-    return sum(1 for e in events if e.round_number == round_number)
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
+    return agg.actions_in_round(round_number)[governor_id]
 
 
 async def compute_baseline(
@@ -36,19 +36,13 @@ async def compute_baseline(
     governor_id: str,
     current_round: int,
     window: int = 3,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> float:
     """Compute rolling average of governance actions over previous rounds."""
-    events = await repo.get_events_by_type_and_governor(
-        season_id=season_id,
-        governor_id=governor_id,
-        event_types=["proposal.submitted", "vote.cast"],
-    )
-
+    agg = aggregates or await load_aggregates(repo, season_id, current_round)
     start_round = max(1, current_round - window)
-    counts = []
-    for rn in range(start_round, current_round):
-        count = sum(1 for e in events if e.round_number == rn)
-        counts.append(count)
+    counts = [agg.actions_in_round(rn)[governor_id] for rn in range(start_round, current_round)]
 
     if not counts:
         return 0.0
@@ -61,14 +55,19 @@ async def detect_behavioral_shift(
     governor_id: str,
     round_number: int,
     threshold: float = 1.5,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> BehavioralShiftResult:
     """Detect if a governor's actions shifted after receiving a private report.
 
     A 'shift' means this round's action count differs from baseline by more
     than the threshold ratio. Never reads report content.
     """
-    actions = await get_governor_action_count(repo, season_id, governor_id, round_number)
-    baseline = await compute_baseline(repo, season_id, governor_id, round_number)
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
+    actions = await get_governor_action_count(
+        repo, season_id, governor_id, round_number, aggregates=agg
+    )
+    baseline = await compute_baseline(repo, season_id, governor_id, round_number, aggregates=agg)
 
     shifted = False
     if baseline > 0:
@@ -89,6 +88,8 @@ async def compute_report_impact_rate(
     repo: Repository,
     season_id: str,
     round_number: int,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> float:
     """Compute Report Impact Rate = shifted / total governors with private reports.
 
@@ -100,9 +101,12 @@ async def compute_report_impact_rate(
     if not governor_ids:
         return 0.0
 
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
     shifted_count = 0
     for gov_id in governor_ids:
-        result = await detect_behavioral_shift(repo, season_id, gov_id, round_number)
+        result = await detect_behavioral_shift(
+            repo, season_id, gov_id, round_number, aggregates=agg
+        )
         if result.shifted:
             shifted_count += 1
 
@@ -2,16 +2,22 @@
 
 Pure functions that scan game results and governance events. Each flag returns
 a ScenarioFlag. Flags are surfaced to admin, never to players.
+
+The governance detectors read ``SeasonEvalAggregates`` (see
+``evals/aggregates.py``); pass the game loop's warm copy as ``aggregates``,
+or omit it to build one from the event store.
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from pinwheel.evals.aggregates import load_aggregates
 from pinwheel.evals.models import ScenarioFlag
 
 if TYPE_CHECKING:
     from pinwheel.db.repository import Repository
+    from pinwheel.evals.aggregates import SeasonEvalAggregates
 
 
 def detect_blowout(
@@ -50,25 +56,16 @@ async def detect_suspicious_unanimity(
     season_id: str,
     round_number: int,
     consecutive_threshold: int = 3,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> list[ScenarioFlag]:
     """Flag when all governors vote identically on consecutive proposals."""
-    events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["vote.cast"],
-    )
-
-    # Group votes by proposal (in round order)
-    votes_by_proposal: dict[str, list[str]] = {}
-    for e in events:
-        pid = (e.payload or {}).get("proposal_id", "")
-        vote = (e.payload or {}).get("vote", "")
-        if pid and vote:
-            votes_by_proposal.setdefault(pid, []).append(vote)
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
 
     # Check for consecutive unanimity
     unanimous_streak = 0
-    for _pid, votes in votes_by_proposal.items():
-        if len(votes) >= 2 and len(set(votes)) == 1:
+    for votes in agg.votes_by_proposal.values():
+        if votes.total() >= 2 and len(votes) == 1:
             unanimous_streak += 1
         else:
             unanimous_streak = 0
@@ -94,27 +91,16 @@ async def detect_governance_stagnation(
     season_id: str,
     round_number: int,
     stagnation_threshold: int = 3,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> list[ScenarioFlag]:
     """Flag when the same parameter is targeted 3+ rounds in a row."""
-    events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["proposal.submitted"],
-    )
-
-    # Track parameter targets per round
-    params_by_round: dict[int, list[str]] = {}
-    for e in events:
-        rn = e.round_number
-        if rn is not None:
-            interp = (e.payload or {}).get("interpretation") or {}
-            param = interp.get("parameter")
-            if param:
-                params_by_round.setdefault(rn, []).append(param)
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
 
     # Check recent rounds for repeated parameter
     recent_params: list[set[str]] = []
     for rn in range(max(1, round_number - stagnation_threshold + 1), round_number + 1):
-        recent_params.append(set(params_by_round.get(rn, [])))
+        recent_params.append(set(agg.params_by_round.get(rn, ())))
 
     if len(recent_params) >= stagnation_threshold:
         # Find params that appear in all recent rounds
@@ -140,17 +126,14 @@ async def detect_participation_collapse(
     season_id: str,
     round_number: int,
     min_participation_rate: float = 0.5,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> list[ScenarioFlag]:
     """Flag when < 50% of known governors are active."""
-    # Get all governors who have ever acted
-    all_events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["proposal.submitted", "vote.cast"],
-    )
-    all_governors = {e.governor_id for e in all_events if e.governor_id}
-    active_this_round = {
-        e.governor_id for e in all_events if e.governor_id and e.round_number == round_number
-    }
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
+    # Governors who have ever acted vs. those who acted this round
+    all_governors = agg.last_active
+    active_this_round = agg.actions_in_round(round_number)
 
     if not all_governors:
         return []
@@ -178,51 +161,26 @@ async def detect_rule_backfire(
     repo: Repository,
     season_id: str,
     round_number: int,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> list[ScenarioFlag]:
     """Flag when a team's win rate drops after their proposal passes."""
-    # Get enacted rules
-    enacted = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["rule.enacted"],
-    )
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
 
     flags = []
-    for e in enacted:
-        # Find the original proposal to get team_id
-        proposal_id = (e.payload or {}).get("source_proposal_id", "")
-        if not proposal_id:
-            continue
-
-        proposal_events = await repo.get_events_for_aggregate("proposal", proposal_id)
-        team_id = None
-        for pe in proposal_events:
-            if pe.team_id:
-                team_id = pe.team_id
-                break
-
+    for proposal_id, enact_round in agg.enacted:
+        team_id = agg.proposal_team.get(proposal_id)
         if not team_id:
             continue
 
-        enact_round = (e.payload or {}).get("round_enacted", 0)
         if enact_round == 0 or round_number <= enact_round + 1:
             continue
 
         # Compare win rates before and after enactment
-        all_games = await repo.get_all_game_results_for_season(season_id)
-        wins_before = 0
-        games_before = 0
-        wins_after = 0
-        games_after = 0
-
-        for g in all_games:
-            if g.home_team_id == team_id or g.away_team_id == team_id:
-                won = g.winner_team_id == team_id
-                if g.round_number < enact_round:
-                    games_before += 1
-                    wins_before += 1 if won else 0
-                elif g.round_number > enact_round:
-                    games_after += 1
-                    wins_after += 1 if won else 0
+        wins_before, games_before = agg.team_record(team_id, range(enact_round))
+        wins_after, games_after = agg.team_record(
+            team_id, range(enact_round + 1, round_number + 1)
+        )
 
         if games_before >= 2 and games_after >= 2:
             rate_before = wins_before / games_before
@@ -251,17 +209,22 @@ async def detect_all_flags(
     season_id: str,
     round_number: int,
     game_summaries: list[dict],
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> list[ScenarioFlag]:
     """Run all flag detectors and return combined results."""
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
     flags: list[ScenarioFlag] = []
 
     # Blowout detection (pure function)
     flags.extend(detect_blowout(game_summaries, round_number, season_id))
 
-    # Async detectors
-    flags.extend(await detect_suspicious_unanimity(repo, season_id, round_number))
-    flags.extend(await detect_governance_stagnation(repo, season_id, round_number))
-    flags.extend(await detect_participation_collapse(repo, season_id, round_number))
-    flags.extend(await detect_rule_backfire(repo, season_id, round_number))
+    # Aggregate-backed detectors
+    flags.extend(await detect_suspicious_unanimity(repo, season_id, round_number, aggregates=agg))
+    flags.extend(await detect_governance_stagnation(repo, season_id, round_number, aggregates=agg))
+    flags.extend(
+        await detect_participation_collapse(repo, season_id, round_number, aggregates=agg)
+    )
+    flags.extend(await detect_rule_backfire(repo, season_id, round_number, aggregates=agg))
 
     return flags
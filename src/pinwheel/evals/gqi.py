@@ -5,18 +5,21 @@ Four sub-metrics, each weighted 25%:
 - Participation Breadth: Inverted Gini of per-governor action counts
 - Consequence Awareness: Keyword overlap between PUBLIC report content and next proposals
 - Vote Deliberation: Normalized time-to-vote after proposal confirmation
+
+Governance counts come from ``SeasonEvalAggregates`` (``evals/aggregates.py``).
 """
 
 from __future__ import annotations
 
 import math
-from collections import Counter
 from typing import TYPE_CHECKING
 
+from pinwheel.evals.aggregates import load_aggregates
 from pinwheel.evals.models import GQIResult
 
 if TYPE_CHECKING:
     from pinwheel.db.repository import Repository
+    from pinwheel.evals.aggregates import SeasonEvalAggregates
 
 
 def _shannon_entropy(counts: list[int]) -> float:
@@ -51,40 +54,27 @@ async def compute_proposal_diversity(
     repo: Repository,
     season_id: str,
     round_number: int,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> float:
     """Shannon entropy of targeted parameters in proposals this round."""
-    events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["proposal.submitted"],
-    )
-    params: list[str] = []
-    for e in events:
-        if e.round_number == round_number:
-            interp = (e.payload or {}).get("interpretation") or {}
-            param = interp.get("parameter")
-            if param:
-                params.append(param)
-
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
+    params = agg.params_by_round.get(round_number)
     if not params:
         return 0.0
-    counter = Counter(params)
-    return _shannon_entropy(list(counter.values()))
+    return _shannon_entropy(list(params.values()))
 
 
 async def compute_participation_breadth(
     repo: Repository,
     season_id: str,
     round_number: int,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> float:
     """Inverted Gini of per-governor action counts. 1 = equal, 0 = one person does everything."""
-    events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["proposal.submitted", "vote.cast"],
-    )
-    gov_counts: Counter[str] = Counter()
-    for e in events:
-        if e.round_number == round_number and e.governor_id:
-            gov_counts[e.governor_id] += 1
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
+    gov_counts = agg.actions_in_round(round_number)
 
     if not gov_counts:
         return 0.0
@@ -96,6 +86,8 @@ async def compute_consequence_awareness(
     repo: Repository,
     season_id: str,
     round_number: int,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> float:
     """Keyword overlap between PUBLIC report content and next proposals.
 
@@ -112,16 +104,8 @@ async def compute_consequence_awareness(
         return 0.0
 
     # Get proposals from the next round
-    next_round = round_number + 1
-    events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["proposal.submitted"],
-    )
-    proposal_words: set[str] = set()
-    for e in events:
-        if e.round_number == next_round:
-            raw_text = (e.payload or {}).get("raw_text", "")
-            proposal_words.update(raw_text.lower().split())
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
+    proposal_words = agg.proposal_words_by_round.get(round_number + 1, set())
 
     if not proposal_words:
         return 0.0
@@ -142,39 +126,24 @@ async def compute_vote_deliberation(
     season_id: str,
     round_number: int,
     window_duration_seconds: float = 120.0,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> float:
     """Normalized time-to-vote after proposal confirmation. Higher = more deliberation.
 
     Measures the delay between when each proposal was confirmed (available for
     voting) and when each vote was cast, normalized by window_duration_seconds.
     """
-    events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["vote.cast", "proposal.confirmed"],
-    )
-
-    # Build map of proposal_id -> confirmed_at timestamp
-    confirmed_at: dict[str, object] = {}
-    for e in events:
-        if e.event_type == "proposal.confirmed":
-            pid = e.payload.get("proposal_id", e.aggregate_id)
-            confirmed_at[pid] = e.created_at
-
-    if not confirmed_at:
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
+    if not agg.confirmed_at:
         return 0.5  # No proposals confirmed
 
     vote_delays: list[float] = []
-    for e in events:
-        if e.event_type == "vote.cast":
-            pid = e.payload.get("proposal_id", "")
-            proposal_confirmed = confirmed_at.get(pid)
-            if proposal_confirmed is not None:
-                delay = (e.created_at - proposal_confirmed).total_seconds()
-                if window_duration_seconds > 0:
-                    normalized = min(delay / window_duration_seconds, 1.0)
-                else:
-                    normalized = 0.5
-                vote_delays.append(normalized)
+    for delay in agg.vote_delays_seconds:
+        if window_duration_seconds > 0:
+            vote_delays.append(min(delay / window_duration_seconds, 1.0))
+        else:
+            vote_delays.append(0.5)
 
     if not vote_delays:
         return 0.5
@@ -185,12 +154,19 @@ async def compute_gqi(
     repo: Repository,
     season_id: str,
     round_number: int,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> GQIResult:
     """Compute the full Governance Quality Index."""
-    diversity = await compute_proposal_diversity(repo, season_id, round_number)
-    breadth = await compute_participation_breadth(repo, season_id, round_number)
-    awareness = await compute_consequence_awareness(repo, season_id, round_number)
-    deliberation = await compute_vote_deliberation(repo, season_id, round_number)
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
+    diversity = await compute_proposal_diversity(repo, season_id, round_number, aggregates=agg)
+    breadth = await compute_participation_breadth(repo, season_id, round_number, aggregates=agg)
+    awareness = await compute_consequence_awareness(
+        repo, season_id, round_number, aggregates=agg
+    )
+    deliberation = await compute_vote_deliberation(
+        repo, season_id, round_number, aggregates=agg
+    )
 
     composite = 0.25 * diversity + 0.25 * breadth + 0.25 * awareness + 0.25 * deliberation
 
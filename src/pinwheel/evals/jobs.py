@@ -0,0 +1,354 @@
+"""Out-of-band eval jobs.
+
+Round finalization used to run every eval inline — report checks, flags,
+GQI, joy alarms and the AI rule evaluator — before the round could return.
+With ``defer_evals`` the round instead enqueues one ``eval_jobs`` row per
+eval type and returns; ``tick_eval_jobs`` (an APScheduler interval job,
+like the codegen pipeline tick) claims pending rows and runs them.
+
+* **Idempotent** — jobs are keyed by (season, round, eval_type); enqueueing
+  the same round twice is a no-op.
+* **Atomic** — a job's results and its ``done`` mark commit in one session,
+  so a crash mid-job leaves no partial results and the retry starts clean.
+* **Retried** — a failing job goes back to ``pending`` until it has used
+  ``max_attempts``, then stays ``failed``. A job left ``running`` by a dead
+  worker is reclaimed after ``stale_after_seconds``.
+
+The payload carries what the eval cannot re-read from the database (report
+text, team/hooper names, game scores) plus ``through_sequence``, the
+season's latest event when the round finished, so a job claimed late or
+retried scores the round as the inline path would have, without later
+rounds' events or games. ``_run_evals`` runs the same per-type runners
+inline.
+
+Usage:
+    await enqueue_round_evals(repo, season_id, round_number, reports,
+                              game_summaries, teams_cache)
+    await tick_eval_jobs(engine, api_key=settings.anthropic_api_key)
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from pinwheel.db.engine import get_session
+from pinwheel.db.repository import Repository
+from pinwheel.evals.aggregates import SeasonEvalAggregates, eval_aggregates
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from pinwheel.models.report import Report
+
+logger = logging.getLogger(__name__)
+
+EVAL_JOB_TYPES = (
+    "report_checks",
+    "behavioral",
+    "flags",
+    "gqi",
+    "joy_alarms",
+    "rule_evaluation",
+)
+
+EvalRunner = Callable[
+    [Repository, str, int, dict, str, SeasonEvalAggregates], Awaitable[None]
+]
+
+
+def build_eval_payloads(
+    reports: list[Report], game_summaries: list[dict], teams_cache: dict
+) -> dict[str, dict]:
+    """Per-type job payloads: the round inputs each eval cannot re-read."""
+    return {
+        "report_checks": {
+            "reports": [
+                {"id": r.id, "report_type": r.report_type, "content": r.content}
+                for r in reports
+            ],
+            "team_names": [t.name for t in teams_cache.values()],
+            "hooper_names": [h.name for t in teams_cache.values() for h in t.hoopers],
+        },
+        "flags": {
+            "games": [
+                {
+                    "home_team": g.get("home_team", ""),
+                    "away_team": g.get("away_team", ""),
+                    "home_score": g.get("home_score", 0),
+                    "away_score": g.get("away_score", 0),
+                }
+                for g in game_summaries
+            ],
+        },
+    }
+
+
+# --- Runners ---
+
+
+async def _run_report_checks(
+    repo: Repository,
+    season_id: str,
+    round_number: int,
+    payload: dict,
+    api_key: str,
+    aggregates: SeasonEvalAggregates,
+) -> None:
+    from pinwheel.evals.grounding import GroundingContext, check_grounding
+    from pinwheel.evals.prescriptive import scan_prescriptive
+
+    season = await repo.get_season(season_id)
+    ruleset_dict = (season.current_ruleset if season else None) or {}
+    context = GroundingContext(
+        team_names=payload.get("team_names", []),
+        agent_names=payload.get("hooper_names", []),
+        rule_params=list(ruleset_dict.keys()),
+    )
+
+    for report in payload.get("reports", []):
+        report_id = report["id"]
+        report_type = report["report_type"]
+        presc = scan_prescriptive(report["content"], report_id, report_type)
+        await repo.store_eval_result(
+            season_id=season_id,
+            round_number=round_number,
+            eval_type="prescriptive",
+            eval_subtype=report_type,
+            score=float(presc.prescriptive_count),
+            details_json={
+                "report_id": report_id,
+                "report_type": report_type,
+                "count": presc.prescriptive_count,
+                "flagged": presc.flagged,
+            },
+        )
+
+        grounding = check_grounding(report["content"], context, report_id, report_type)
+        await repo.store_eval_result(
+            season_id=season_id,
+            round_number=round_number,
+            eval_type="grounding",
+            eval_subtype=report_type,
+            score=float(grounding.entities_found),
+            details_json={
+                "report_id": report_id,
+                "report_type": report_type,
+                "entities_expected": grounding.entities_expected,
+                "entities_found": grounding.entities_found,
+                "grounded": grounding.grounded,
+            },
+        )
+
+
+async def _run_behavioral(
+    repo: Repository,
+    season_id: str,
+    round_number: int,
+    payload: dict,
+    api_key: str,
+    aggregates: SeasonEvalAggregates,
+) -> None:
+    from pinwheel.evals.behavioral import compute_report_impact_rate
+
+    impact_rate = await compute_report_impact_rate(
+        repo, season_id, round_number, aggregates=aggregates
+    )
+    await repo.store_eval_result(
+        season_id=season_id,
+        round_number=round_number,
+        eval_type="behavioral",
+        eval_subtype="report_impact_rate",
+        score=impact_rate,
+        details_json={"report_impact_rate": impact_rate},
+    )
+
+
+async def _run_flags(
+    repo: Repository,
+    season_id: str,
+    round_number: int,
+    payload: dict,
+    api_key: str,
+    aggregates: SeasonEvalAggregates,
+) -> None:
+    from pinwheel.evals.flags import detect_all_flags
+
+    flags = await detect_all_flags(
+        repo, season_id, round_number, payload.get("games", []), aggregates=aggregates
+    )
+    for flag in flags:
+        await repo.store_eval_result(
+            season_id=season_id,
+            round_number=round_number,
+            eval_type="flag",
+            eval_subtype=flag.flag_type,
+            score=1.0 if flag.severity == "critical" else 0.5,
+            details_json=flag.model_dump(mode="json"),
+        )
+
+
+async def _run_gqi(
+    repo: Repository,
+    season_id: str,
+    round_number: int,
+    payload: dict,
+    api_key: str,
+    aggregates: SeasonEvalAggregates,
+) -> None:
+    from pinwheel.evals.gqi import compute_gqi, store_gqi
+
+    gqi_result = await compute_gqi(repo, season_id, round_number, aggregates=aggregates)
+    await store_gqi(repo, season_id, round_number, gqi_result)
+    logger.info(
+        "gqi_computed season=%s round=%d composite=%.3f",
+        season_id,
+        round_number,
+        gqi_result.composite,
+    )
+
+
+async def _run_joy_alarms(
+    repo: Repository,
+    season_id: str,
+    round_number: int,
+    payload: dict,
+    api_key: str,
+    aggregates: SeasonEvalAggregates,
+) -> None:
+    from pinwheel.evals.joy_alarms import check_joy_alarms
+
+    # Logged only; each detector guards its own failures
+    await check_joy_alarms(repo, season_id, round_number, aggregates=aggregates)
+
+
+async def _run_rule_evaluation(
+    repo: Repository,
+    season_id: str,
+    round_number: int,
+    payload: dict,
+    api_key: str,
+    aggregates: SeasonEvalAggregates,
+) -> None:
+    from pinwheel.evals.rule_evaluator import evaluate_rules, store_rule_evaluation
+
+    rule_eval = await evaluate_rules(
+        repo, season_id, round_number, api_key=api_key, aggregates=aggregates
+    )
+    await store_rule_evaluation(repo, season_id, round_number, rule_eval)
+    logger.info(
+        "rule_evaluation_complete season=%s round=%d experiments=%d",
+        season_id,
+        round_number,
+        len(rule_eval.suggested_experiments),
+    )
+
+
+EVAL_RUNNERS: dict[str, EvalRunner] = {
+    "report_checks": _run_report_checks,
+    "behavioral": _run_behavioral,
+    "flags": _run_flags,
+    "gqi": _run_gqi,
+    "joy_alarms": _run_joy_alarms,
+    "rule_evaluation": _run_rule_evaluation,
+}
+
+
+async def run_eval(
+    repo: Repository,
+    season_id: str,
+    round_number: int,
+    eval_type: str,
+    payload: dict | None = None,
+    api_key: str = "",
+    aggregates: SeasonEvalAggregates | None = None,
+) -> None:
+    """Run one eval type for a round. Raises on failure."""
+    runner = EVAL_RUNNERS.get(eval_type)
+    if runner is None:
+        raise ValueError(f"Unknown eval job type: {eval_type}")
+    payload = payload or {}
+    if aggregates is None:
+        aggregates = await eval_aggregates.get(
+            repo, season_id, round_number, through_sequence=payload.get("through_sequence")
+        )
+    await runner(repo, season_id, round_number, payload, api_key, aggregates)
+
+
+# --- Queue ---
+
+
+async def enqueue_round_evals(
+    repo: Repository,
+    season_id: str,
+    round_number: int,
+    reports: list[Report],
+    game_summaries: list[dict],
+    teams_cache: dict,
+) -> int:
+    """Queue every eval type for a round. Returns how many jobs were new."""
+    payloads = build_eval_payloads(reports, game_summaries, teams_cache)
+    through_sequence = await repo.get_latest_event_sequence(season_id)
+    added = 0
+    for eval_type in EVAL_JOB_TYPES:
+        payload = {**payloads.get(eval_type, {}), "through_sequence": through_sequence}
+        if await repo.enqueue_eval_job(season_id, round_number, eval_type, payload):
+            added += 1
+    logger.info(
+        "eval_jobs_enqueued season=%s round=%d added=%d", season_id, round_number, added
+    )
+    return added
+
+
+async def tick_eval_jobs(
+    engine: AsyncEngine,
+    api_key: str = "",
+    batch_size: int = 20,
+    max_attempts: int = 3,
+    stale_after_seconds: int = 600,
+) -> int:
+    """Claim and run a batch of eval jobs. Returns how many finished.
+
+    Never raises — failures are recorded on the job for retry.
+    """
+    try:
+        stale_before = datetime.now(UTC) - timedelta(seconds=stale_after_seconds)
+        async with get_session(engine) as session:
+            claimed = await Repository(session).claim_eval_jobs(batch_size, stale_before)
+            jobs = [
+                (j.id, j.season_id, j.round_number, j.eval_type, j.payload, j.attempts)
+                for j in claimed
+            ]
+    except Exception:  # Last-resort handler — DB errors must not kill the scheduler
+        logger.exception("eval_jobs_claim_failed")
+        return 0
+
+    finished = 0
+    for job_id, season_id, round_number, eval_type, payload, attempts in jobs:
+        try:
+            async with get_session(engine) as session:
+                repo = Repository(session)
+                await run_eval(repo, season_id, round_number, eval_type, payload, api_key)
+                await repo.finish_eval_job(job_id, "done")
+            finished += 1
+        except Exception as exc:  # Last-resort handler — AI (Anthropic) and DB errors
+            status = "failed" if attempts >= max_attempts else "pending"
+            logger.exception(
+                "eval_job_failed season=%s round=%d type=%s attempt=%d status=%s",
+                season_id,
+                round_number,
+                eval_type,
+                attempts,
+                status,
+            )
+            try:
+                async with get_session(engine) as session:
+                    await Repository(session).finish_eval_job(job_id, status, str(exc)[:500])
+            except Exception:  # Last-resort handler — leave the job to the stale reclaim
+                logger.exception("eval_job_status_failed job=%s", job_id)
+
+    if jobs:
+        logger.info("eval_jobs_tick claimed=%d finished=%d", len(jobs), finished)
+    return finished
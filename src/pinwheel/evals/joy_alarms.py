@@ -8,8 +8,10 @@ Five alarm conditions from INSTRUMENTATION.md (Section A, Joy Alarms):
 4. Reports not resonating — governor activity (proposals + votes) used as proxy for engagement.
 5. Power concentration — one governor's proposals pass disproportionately (>60%).
 
-Each alarm function queries the repository and returns a list of JoyAlarm instances.
-``check_joy_alarms()`` orchestrates all checks, publishes to the event bus, and logs results.
+Each alarm function reads ``SeasonEvalAggregates`` (``evals/aggregates.py``,
+built from the repository when not passed in) and returns a list of JoyAlarm
+instances. ``check_joy_alarms()`` orchestrates all checks, publishes to the
+event bus, and logs results.
 """
 
 from __future__ import annotations
@@ -18,9 +20,12 @@ import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Literal
 
+from pinwheel.evals.aggregates import load_aggregates
+
 if TYPE_CHECKING:
     from pinwheel.core.event_bus import EventBus
     from pinwheel.db.repository import Repository
+    from pinwheel.evals.aggregates import SeasonEvalAggregates
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +58,8 @@ async def detect_disengagement(
     season_id: str,
     round_number: int,
     inactive_threshold: int = 2,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> list[JoyAlarm]:
     """Alarm 1: A governor hasn't taken a governance action in N+ rounds.
 
@@ -64,19 +71,9 @@ async def detect_disengagement(
     if not governors:
         return []
 
-    # Get all governance actions (proposals + votes) for the season
-    events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["proposal.submitted", "vote.cast"],
-    )
-
-    # Map governor_id -> max round_number of activity
-    last_active: dict[str, int] = {}
-    for e in events:
-        gid = e.governor_id
-        rn = e.round_number
-        if gid and rn is not None:
-            last_active[gid] = max(last_active.get(gid, 0), rn)
+    # governor_id -> max round_number of activity (proposals + votes)
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
+    last_active = agg.last_active
 
     alarms: list[JoyAlarm] = []
     for gov in governors:
@@ -117,42 +114,19 @@ async def detect_political_exclusion(
     season_id: str,
     round_number: int,
     min_proposals: int = 3,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> list[JoyAlarm]:
     """Alarm 2: A governor's proposals never pass (0% success over N+ proposals).
 
     Only fires when a governor has submitted at least ``min_proposals`` proposals
     and none have passed. This avoids flagging new governors who submitted once.
     """
-    # All submitted proposals
-    submitted = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["proposal.submitted"],
-    )
-
-    # All outcome events
-    outcomes = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["proposal.passed", "proposal.failed"],
-    )
-
-    # Build outcome lookup: proposal_id -> "passed" | "failed"
-    outcome_map: dict[str, str] = {}
-    for e in outcomes:
-        pid = (e.payload or {}).get("proposal_id", e.aggregate_id)
-        outcome_map[pid] = "passed" if e.event_type == "proposal.passed" else "failed"
-
-    # Group proposals by governor
-    proposals_by_gov: dict[str, list[str]] = {}
-    gov_usernames: dict[str, str] = {}
-    for e in submitted:
-        gid = e.governor_id
-        if not gid:
-            continue
-        pid = (e.payload or {}).get("id", e.aggregate_id)
-        proposals_by_gov.setdefault(gid, []).append(pid)
-        # Try to capture username from payload
-        username = (e.payload or {}).get("governor_name", gid)
-        gov_usernames[gid] = username
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
+    # proposal_id -> "passed" | "failed"
+    outcome_map = agg.outcomes
+    proposals_by_gov = agg.proposals_by_governor
+    gov_usernames = agg.governor_names
 
     alarms: list[JoyAlarm] = []
     for gov_id, proposal_ids in proposals_by_gov.items():
@@ -197,6 +171,8 @@ async def detect_economy_stalling(
     round_number: int,
     lookback_window: int = 3,
     drop_threshold: float = 0.5,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> list[JoyAlarm]:
     """Alarm 3: Token velocity drops below threshold.
 
@@ -205,33 +181,9 @@ async def detect_economy_stalling(
     activity, fire an alarm. Uses trade.offered, trade.accepted, and token.spent
     (boost) events as signals.
     """
-    # Fetch all trade and boost events for the season
-    trade_events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["trade.offered", "trade.accepted"],
-    )
-    boost_events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["token.spent"],
-    )
-    # Filter boost events to only actual boosts
-    boost_rounds: list[int] = []
-    for e in boost_events:
-        reason = (e.payload or {}).get("reason", "")
-        if (
-            "boost" in reason.lower()
-            or (e.payload or {}).get("token_type") == "boost"
-        ) and e.round_number is not None:
-            boost_rounds.append(e.round_number)
-
-    # Count activity per round
-    activity_by_round: dict[int, int] = {}
-    for e in trade_events:
-        rn = e.round_number
-        if rn is not None:
-            activity_by_round[rn] = activity_by_round.get(rn, 0) + 1
-    for rn in boost_rounds:
-        activity_by_round[rn] = activity_by_round.get(rn, 0) + 1
+    # Trade and boost actions per round
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
+    activity_by_round = agg.economy_by_round
 
     # Need at least 2 windows of data
     if round_number < 2 * lookback_window:
@@ -323,6 +275,8 @@ async def detect_reports_not_resonating(
     round_number: int,
     low_engagement_threshold: float = 0.2,
     lookback_rounds: int = 3,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> list[JoyAlarm]:
     """Alarm 4: Reports not resonating (proxy: governor activity drops).
 
@@ -335,40 +289,20 @@ async def detect_reports_not_resonating(
     if not governors:
         return []
 
-    events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["proposal.submitted", "vote.cast"],
-    )
-
-    # Count actions per governor per round
-    actions_per_gov_round: dict[str, dict[int, int]] = {}
-    for e in events:
-        gid = e.governor_id
-        rn = e.round_number
-        if gid and rn is not None:
-            actions_per_gov_round.setdefault(gid, {})
-            actions_per_gov_round[gid][rn] = actions_per_gov_round[gid].get(rn, 0) + 1
-
     # Need enough history
     if round_number < 2 * lookback_rounds:
         return []
 
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
     recent_start = round_number - lookback_rounds + 1
     baseline_start = max(1, recent_start - lookback_rounds)
 
     # Compute average actions per active governor in each window
     def window_avg(start: int, end: int) -> float:
-        total_actions = 0
-        active_govs: set[str] = set()
-        for gid, rounds in actions_per_gov_round.items():
-            for r in range(start, end + 1):
-                count = rounds.get(r, 0)
-                if count > 0:
-                    total_actions += count
-                    active_govs.add(gid)
+        total_actions, active_govs = agg.window_actions(start, end)
         if not active_govs:
             return 0.0
-        return total_actions / len(active_govs)
+        return total_actions / active_govs
 
     baseline_avg = window_avg(baseline_start, recent_start - 1)
     recent_avg = window_avg(recent_start, round_number)
@@ -410,45 +344,26 @@ async def detect_power_concentration(
     round_number: int,
     concentration_threshold: float = 0.6,
     min_passed: int = 3,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> list[JoyAlarm]:
     """Alarm 5: One governor's proposals pass disproportionately (>60%).
 
     If a single governor accounts for more than ``concentration_threshold``
     of all passed proposals (minimum ``min_passed`` total), fire an alarm.
     """
-    # Get all passed proposals
-    passed_events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["proposal.passed"],
-    )
-
-    if len(passed_events) < min_passed:
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
+    if agg.event_counts["proposal.passed"] < min_passed:
         return []
-
-    # Map passed proposal_id -> True
-    passed_ids: set[str] = set()
-    for e in passed_events:
-        pid = (e.payload or {}).get("proposal_id", e.aggregate_id)
-        passed_ids.add(pid)
-
-    # Get all submitted proposals to find who submitted the passed ones
-    submitted_events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["proposal.submitted"],
-    )
+    passed_ids = agg.passed_ids
 
     # Count passed proposals per governor
     passed_by_gov: dict[str, int] = {}
-    gov_usernames: dict[str, str] = {}
-    for e in submitted_events:
-        gid = e.governor_id
-        if not gid:
-            continue
-        pid = (e.payload or {}).get("id", e.aggregate_id)
-        if pid in passed_ids:
-            passed_by_gov[gid] = passed_by_gov.get(gid, 0) + 1
-            username = (e.payload or {}).get("governor_name", gid)
-            gov_usernames[gid] = username
+    for gid, proposal_ids in agg.proposals_by_governor.items():
+        count = sum(1 for pid in proposal_ids if pid in passed_ids)
+        if count:
+            passed_by_gov[gid] = count
+    gov_usernames = agg.governor_names
 
     total_passed = len(passed_ids)
     if total_passed < min_passed:
@@ -493,12 +408,15 @@ async def check_joy_alarms(
     season_id: str,
     round_number: int,
     event_bus: EventBus | None = None,
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> list[JoyAlarm]:
     """Run all joy alarm checks and return combined results.
 
     Publishes ``joy.alarm`` events to the event bus for each triggered alarm.
     Logs each alarm with structured logging.
     """
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
     alarms: list[JoyAlarm] = []
 
     detectors = [
@@ -511,7 +429,7 @@ async def check_joy_alarms(
 
     for name, detector in detectors:
         try:
-            results = await detector(repo, season_id, round_number)
+            results = await detector(repo, season_id, round_number, aggregates=agg)
             alarms.extend(results)
         except Exception:
             logger.exception(
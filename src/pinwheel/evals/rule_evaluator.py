@@ -13,10 +13,12 @@ import json
 import logging
 from typing import TYPE_CHECKING
 
+from pinwheel.evals.aggregates import load_aggregates
 from pinwheel.evals.models import RuleEvaluation
 
 if TYPE_CHECKING:
     from pinwheel.db.repository import Repository
+    from pinwheel.evals.aggregates import SeasonEvalAggregates
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +62,8 @@ async def evaluate_rules(
     season_id: str,
     round_number: int,
     api_key: str = "",
+    *,
+    aggregates: SeasonEvalAggregates | None = None,
 ) -> RuleEvaluation:
     """Run the AI rule evaluator. Uses Opus for deeper reasoning."""
     if not api_key:
@@ -69,32 +73,31 @@ async def evaluate_rules(
     season = await repo.get_season(season_id)
     ruleset = (season.current_ruleset if season else None) or {}
 
+    agg = aggregates or await load_aggregates(repo, season_id, round_number)
+
     # Recent game stats
-    all_games = await repo.get_all_game_results_for_season(season_id)
-    recent_games = [g for g in all_games if g.round_number >= max(1, round_number - 3)]
+    recent_games = [
+        g
+        for rn, games in agg.games_by_round.items()
+        if rn >= max(1, round_number - 3)
+        for g in games
+    ]
     game_stats = {
         "total_games": len(recent_games),
         "avg_score": (
-            sum(g.home_score + g.away_score for g in recent_games) / max(len(recent_games), 1) / 2
+            sum(g.total_score for g in recent_games) / max(len(recent_games), 1) / 2
         ),
         "avg_possessions": (
-            sum(g.total_possessions for g in recent_games) / max(len(recent_games), 1)
+            sum(g.possessions for g in recent_games) / max(len(recent_games), 1)
         ),
-        "elam_rate": (sum(1 for g in recent_games if g.elam_target) / max(len(recent_games), 1)),
+        "elam_rate": (sum(1 for g in recent_games if g.elam) / max(len(recent_games), 1)),
     }
 
     # Governance trends
-    gov_events = await repo.get_events_by_type(
-        season_id=season_id,
-        event_types=["proposal.submitted", "vote.cast", "rule.enacted"],
-    )
-    proposals_count = sum(1 for e in gov_events if e.event_type == "proposal.submitted")
-    votes_count = sum(1 for e in gov_events if e.event_type == "vote.cast")
-    enacted_count = sum(1 for e in gov_events if e.event_type == "rule.enacted")
     governance_trends = {
-        "total_proposals": proposals_count,
-        "total_votes": votes_count,
-        "rules_enacted": enacted_count,
+        "total_proposals": agg.event_counts["proposal.submitted"],
+        "total_votes": agg.event_counts["vote.cast"],
+        "rules_enacted": agg.event_counts["rule.enacted"],
     }
 
     # Active flags
@@ -106,13 +109,13 @@ async def evaluate_rules(
     flags = [r.details_json for r in flag_results if r.details_json]
 
     # Parameter staleness
-    staleness = _compute_staleness(gov_events, ruleset or {}, round_number)
+    staleness = _compute_staleness(agg.param_last_changed, ruleset or {}, round_number)
 
     # Call Opus
     try:
-        import anthropic
+        from pinwheel.ai.client import get_ai_client
 
-        client = anthropic.AsyncAnthropic(api_key=api_key)
+        client = get_ai_client(api_key, "eval")
         prompt = RULE_EVALUATOR_PROMPT.format(
             ruleset=json.dumps(ruleset, indent=2),
             game_stats=json.dumps(game_stats, indent=2),
@@ -138,19 +141,11 @@ async def evaluate_rules(
 
 
 def _compute_staleness(
-    gov_events: list,
+    last_changed: dict[str, int],
     ruleset: dict,
     current_round: int,
 ) -> dict[str, int]:
     """Compute rounds since last change per parameter."""
-    last_changed: dict[str, int] = {}
-    for e in gov_events:
-        if e.event_type == "rule.enacted":
-            param = (e.payload or {}).get("parameter", "")
-            rn = (e.payload or {}).get("round_enacted", 0)
-            if param:
-                last_changed[param] = max(last_changed.get(param, 0), rn)
-
     staleness = {}
     for param in ruleset:
         if param in last_changed:
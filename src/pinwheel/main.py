@@ -6,8 +6,11 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, Response
-from fastapi.staticfiles import StaticFiles
 
+from pinwheel.ai.client import ai_clients
+from pinwheel.ai.jobs import JobPriority, ai_jobs
+from pinwheel.ai.response_cache import resolve_cache_path, response_cache
+from pinwheel.ai.usage import usage_recorder
 from pinwheel.api.admin_costs import router as admin_costs_router
 from pinwheel.api.admin_perf import router as admin_perf_router
 from pinwheel.api.admin_review import router as admin_review_router
@@ -24,12 +27,17 @@ from pinwheel.api.pages import router as pages_router
 from pinwheel.api.reports import router as reports_router
 from pinwheel.api.seasons import router as seasons_router
 from pinwheel.api.standings import router as standings_router
+from pinwheel.api.static_assets import FingerprintedStaticFiles, get_manifest
 from pinwheel.api.teams import router as teams_router
 from pinwheel.auth.oauth import router as auth_router
 from pinwheel.config import PROJECT_ROOT, Settings
+from pinwheel.core.effects import effect_registry_cache
 from pinwheel.core.event_bus import EventBus
+from pinwheel.core.impact_preview import impact_previews
+from pinwheel.core.membership import membership_cache
 from pinwheel.core.presenter import PresentationState
 from pinwheel.db.engine import create_engine
+from pinwheel.db.log_archive import log_archives
 from pinwheel.db.models import Base
 
 logger = logging.getLogger(__name__)
@@ -50,6 +58,34 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             logger.info("auto-migration: added %d column(s)", added)
     app.state.engine = engine
     app.state.event_bus = EventBus()
+    ai_clients.configure(
+        max_concurrency=settings.pinwheel_ai_max_concurrency,
+        base_url=settings.pinwheel_ai_base_url,
+    )
+    ai_jobs.configure(
+        initial_window=settings.pinwheel_ai_job_initial_window,
+        max_window=settings.pinwheel_ai_max_concurrency,
+        deadlines={
+            JobPriority.COMMENTARY: settings.pinwheel_ai_commentary_deadline_seconds,
+            JobPriority.LEAGUE_REPORT: settings.pinwheel_ai_league_report_deadline_seconds,
+            JobPriority.PRIVATE_REPORT: settings.pinwheel_ai_private_report_deadline_seconds,
+        },
+    )
+    response_cache.configure(
+        path=resolve_cache_path(settings.pinwheel_ai_cache_path, settings.database_url),
+        ttl_seconds=settings.pinwheel_ai_cache_ttl_seconds,
+        max_bytes=settings.pinwheel_ai_cache_max_bytes,
+    )
+    usage_recorder.start(engine, flush_interval=settings.pinwheel_ai_usage_flush_seconds)
+    effect_registry_cache.configure(
+        verify_interval=settings.pinwheel_effect_cache_verify_interval,
+    )
+    membership_cache.configure(ttl_seconds=settings.pinwheel_membership_cache_ttl_seconds)
+    log_archives.configure(refresh_seconds=settings.pinwheel_log_archive_refresh_seconds)
+    impact_previews.configure(
+        seeds=settings.pinwheel_preview_seeds,
+        workers=settings.pinwheel_preview_workers,
+    )
     app.state.presentation_state = PresentationState()
 
     # Startup recovery: try to resume an interrupted presentation, otherwise
@@ -61,6 +97,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         event_bus=app.state.event_bus,
         presentation_state=app.state.presentation_state,
         quarter_replay_seconds=settings.pinwheel_quarter_replay_seconds,
+        presentation_tick_seconds=settings.pinwheel_presentation_tick_seconds,
     )
 
     if not resumed:
@@ -120,6 +157,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 "game_interval_seconds": settings.pinwheel_game_interval_seconds,
                 "quarter_replay_seconds": settings.pinwheel_quarter_replay_seconds,
                 "governance_interval": settings.pinwheel_governance_interval,
+                "presentation_tick_seconds": settings.pinwheel_presentation_tick_seconds,
+                "pipelined_rounds": settings.pinwheel_pipelined_rounds,
+                "defer_evals": settings.pinwheel_eval_jobs,
             },
             id="tick_round",
             name="Advance game round",
@@ -168,6 +208,35 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         )
         logger.info("deferred_interpreter_scheduler_registered")
 
+    # Eval jobs — runs the evals that round finalization queued instead of
+    # running inline. Unconditional like the deferred interpreter, so a
+    # manually advanced round still gets its evals.
+    if settings.pinwheel_evals_enabled and settings.pinwheel_eval_jobs:
+        from apscheduler.schedulers.asyncio import AsyncIOScheduler
+        from apscheduler.triggers.interval import IntervalTrigger
+
+        from pinwheel.evals.jobs import tick_eval_jobs
+
+        if scheduler is None:
+            scheduler = AsyncIOScheduler()
+            scheduler.start()
+            app.state.scheduler = scheduler
+
+        scheduler.add_job(
+            tick_eval_jobs,
+            trigger=IntervalTrigger(seconds=60),
+            kwargs={
+                "engine": engine,
+                "api_key": settings.anthropic_api_key,
+                "batch_size": settings.pinwheel_eval_job_batch_size,
+                "max_attempts": settings.pinwheel_eval_job_max_attempts,
+            },
+            id="tick_eval_jobs",
+            name="Run queued round evals",
+            replace_existing=True,
+        )
+        logger.info("eval_jobs_scheduler_registered")
+
     # Codegen pipeline — re-drives crashed council runs, consumes
     # /rerun-council requests, and DMs the admin about pending effects.
     if settings.pinwheel_codegen_enabled:
@@ -236,6 +305,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await discord_bot.close()
         logger.info("discord_bot_integration_stopped")
 
+    await usage_recorder.stop()
+    impact_previews.shutdown()
+    await ai_clients.aclose()
+    response_cache.close()
     await engine.dispose()
 
 
@@ -281,7 +354,8 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     # Static files
     static_dir = PROJECT_ROOT / "static"
     if static_dir.exists():
-        app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+        static_app = FingerprintedStaticFiles(directory=str(static_dir), manifest=get_manifest())
+        app.mount("/static", static_app, name="static")
 
     # Auth routes
     app.include_router(auth_router)
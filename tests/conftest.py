@@ -9,3 +9,11 @@ from pinwheel.config import Settings
 def settings() -> Settings:
     """Test settings with defaults."""
     return Settings(pinwheel_env="development", database_url="sqlite+aiosqlite:///:memory:")
+
+
+@pytest.fixture(autouse=True)
+def _reset_log_archives() -> None:
+    """Each test gets its own database, so drop the process-wide archive index."""
+    from pinwheel.db.log_archive import log_archives
+
+    log_archives.clear()
@@ -0,0 +1,138 @@
+"""Tests for the shared, pooled Anthropic client manager."""
+
+import asyncio
+import contextlib
+
+import anthropic
+
+from pinwheel.ai.client import CALL_PROFILES, AIClientManager
+
+
+class TestAIClientManager:
+    async def test_clients_cached_per_key_and_call_type(self):
+        manager = AIClientManager()
+        report = manager.client("k", "report")
+        assert manager.client("k", "report") is report
+        assert manager.client("k2", "report") is not report
+        assert manager.client("k", "interpreter") is not report
+        await manager.aclose()
+
+    async def test_call_profiles_applied(self):
+        manager = AIClientManager()
+        interpreter = manager.client("k", "interpreter")
+        classifier = manager.client("k", "classifier")
+        assert interpreter.max_retries == 0
+        assert interpreter.timeout == CALL_PROFILES["interpreter"].timeout
+        assert classifier.timeout == CALL_PROFILES["classifier"].timeout
+        # Unknown call types fall back to a default profile.
+        assert manager.client("k", "something_new").max_retries == 2
+        await manager.aclose()
+
+    async def test_all_clients_share_one_http_pool(self):
+        manager = AIClientManager()
+        a = manager.client("k", "report")
+        b = manager.client("k2", "commentary")
+        assert a.raw._client is b.raw._client
+        await manager.aclose()
+
+    async def test_aclose_and_configure_reset_pool(self):
+        manager = AIClientManager(max_concurrency=4)
+        first = manager.client("k", "report")
+        await manager.aclose()
+        assert manager.client("k", "report") is not first
+
+        second = manager.client("k", "report")
+        manager.configure(max_concurrency=2)
+        assert manager.max_concurrency == 2
+        assert manager.client("k", "report") is not second
+        await manager.aclose()
+
+    def test_loop_switch_closes_replaced_client(self):
+        manager = AIClientManager()
+        pools = []
+
+        async def use_pool() -> None:
+            pools.append(manager.client("k", "report").raw._client)
+            await asyncio.sleep(0.01)  # let the previous pool's close run
+
+        for _ in range(3):
+            asyncio.run(use_pool())
+
+        assert len({id(pool) for pool in pools}) == 3
+        assert pools[0].is_closed
+        assert pools[1].is_closed
+        assert not pools[2].is_closed
+        asyncio.run(manager.aclose())
+        assert pools[2].is_closed
+
+    async def test_patched_sdk_class_is_honoured(self, monkeypatch):
+        class _Fake:
+            def __init__(self, **kwargs: object) -> None:
+                self.kwargs = kwargs
+                self.messages = None
+
+        manager = AIClientManager()
+        real = manager.client("k", "report")
+        monkeypatch.setattr(anthropic, "AsyncAnthropic", _Fake)
+        fake = manager.client("k", "report")
+        assert fake is not real
+        assert isinstance(fake.raw, _Fake)
+        await manager.aclose()
+
+
+class TestConcurrencyLimit:
+    async def test_in_flight_calls_capped(self, monkeypatch):
+        release = asyncio.Event()
+        active = 0
+        peak = 0
+
+        class _Messages:
+            async def create(self, **kwargs: object) -> str:
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await release.wait()
+                active -= 1
+                return "ok"
+
+        class _Fake:
+            def __init__(self, **kwargs: object) -> None:
+                self.messages = _Messages()
+
+        monkeypatch.setattr(anthropic, "AsyncAnthropic", _Fake)
+        manager = AIClientManager(max_concurrency=2)
+        report = manager.client("k", "report")
+        commentary = manager.client("k", "commentary")
+
+        tasks = [
+            asyncio.create_task(client.messages.create(model="m"))
+            for client in (report, commentary, report, commentary, report)
+        ]
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert peak == 2
+        assert manager.in_flight == 2
+
+        release.set()
+        assert await asyncio.gather(*tasks) == ["ok"] * 5
+        assert peak == 2
+        assert manager.in_flight == 0
+        await manager.aclose()
+
+    async def test_slot_released_on_error(self, monkeypatch):
+        class _Messages:
+            async def create(self, **kwargs: object) -> str:
+                raise RuntimeError("boom")
+
+        class _Fake:
+            def __init__(self, **kwargs: object) -> None:
+                self.messages = _Messages()
+
+        monkeypatch.setattr(anthropic, "AsyncAnthropic", _Fake)
+        manager = AIClientManager(max_concurrency=1)
+        client = manager.client("k", "interpreter")
+        for _ in range(2):
+            with contextlib.suppress(RuntimeError):
+                await client.messages.create(model="m")
+        assert manager.in_flight == 0
+        await manager.aclose()
@@ -355,3 +355,39 @@ def test_pricing_dict_has_known_models() -> None:
         assert "input_per_mtok" in rates
         assert "output_per_mtok" in rates
         assert "cache_read_per_mtok" in rates
+
+
+@pytest.mark.asyncio
+async def test_costs_dashboard_hit_rate_per_call_type(app_client: tuple) -> None:
+    """Spend by Call Type shows the prompt-cache hit rate of each call type."""
+    client, engine = app_client
+
+    from pinwheel.db.engine import get_session
+    from pinwheel.db.models import LeagueRow, SeasonRow
+
+    async with get_session(engine) as session:
+        league = LeagueRow(name="Test League")
+        session.add(league)
+        await session.flush()
+        season = SeasonRow(league_id=league.id, name="Season 1", status="active")
+        session.add(season)
+        await session.flush()
+        for call_type, cache_read in (("report.private", 3000), ("commentary.game", 0)):
+            session.add(
+                AIUsageLogRow(
+                    call_type=call_type,
+                    model="claude-sonnet-4-5-20250929",
+                    input_tokens=1000,
+                    output_tokens=100,
+                    cache_read_tokens=cache_read,
+                    latency_ms=100.0,
+                    cost_usd=0.01,
+                    season_id=season.id,
+                    round_number=1,
+                )
+            )
+
+    resp = await client.get("/admin/costs")
+    assert resp.status_code == 200
+    assert "Cache Hit" in resp.text
+    assert "75.0%" in resp.text
@@ -0,0 +1,203 @@
+"""Tests for the round AI job scheduler (priorities, AIMD window, deadlines)."""
+
+import asyncio
+
+import anthropic
+
+from pinwheel.ai.client import AIClientManager
+from pinwheel.ai.jobs import AIJob, AIJobScheduler, JobPriority, is_overload
+
+
+class _Overloaded(Exception):
+    status_code = 529
+
+
+def _job(name, priority, coro_fn, **kwargs) -> AIJob:
+    return AIJob(name, priority, coro_fn, **kwargs)
+
+
+class TestPriorities:
+    async def test_jobs_start_in_priority_order(self):
+        started: list[str] = []
+
+        def make(name):
+            async def run():
+                started.append(name)
+                await asyncio.sleep(0)
+                return name
+
+            return run
+
+        scheduler = AIJobScheduler(initial_window=1)
+        jobs = [
+            _job("private", JobPriority.PRIVATE_REPORT, make("private")),
+            _job("league", JobPriority.LEAGUE_REPORT, make("league")),
+            _job("commentary-1", JobPriority.COMMENTARY, make("commentary-1")),
+            _job("commentary-2", JobPriority.COMMENTARY, make("commentary-2")),
+        ]
+        results = await scheduler.run(jobs)
+        # Results come back in submission order, execution in priority order.
+        assert results == ["private", "league", "commentary-1", "commentary-2"]
+        assert started == ["commentary-1", "commentary-2", "league", "private"]
+
+    async def test_failures_returned_in_place(self):
+        async def ok():
+            return 1
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        scheduler = AIJobScheduler()
+        results = await scheduler.run(
+            [_job("a", JobPriority.COMMENTARY, ok), _job("b", JobPriority.COMMENTARY, boom)]
+        )
+        assert results[0] == 1
+        assert isinstance(results[1], RuntimeError)
+        assert scheduler.running == 0
+
+
+class TestWindow:
+    async def test_window_caps_concurrency_and_grows(self):
+        active = 0
+        peak = 0
+
+        async def run():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+
+        scheduler = AIJobScheduler(initial_window=2, max_window=3)
+        await scheduler.run([_job(f"j{i}", JobPriority.LEAGUE_REPORT, run) for i in range(20)])
+        assert peak <= 3
+        assert scheduler.window == 3
+
+    async def test_overload_from_client_halves_window_once_per_burst(self, monkeypatch):
+        class _Messages:
+            async def create(self, **kwargs: object) -> str:
+                await asyncio.sleep(0)
+                raise _Overloaded("overloaded")
+
+        class _Fake:
+            def __init__(self, **kwargs: object) -> None:
+                self.messages = _Messages()
+
+        monkeypatch.setattr(anthropic, "AsyncAnthropic", _Fake)
+        manager = AIClientManager()
+        client = manager.client("k", "report")
+
+        async def call_api():
+            # Generators swallow API errors and fall back to mock content, so
+            # the scheduler must learn about the overload from the client layer.
+            try:
+                await client.messages.create(model="m")
+            except _Overloaded:
+                return "mock"
+
+        scheduler = AIJobScheduler(initial_window=8, max_window=8)
+        results = await scheduler.run(
+            [_job(f"j{i}", JobPriority.PRIVATE_REPORT, call_api) for i in range(8)]
+        )
+        assert results == ["mock"] * 8
+        # Eight concurrent overloads in one burst shrink the window once.
+        assert scheduler.window == 4
+        await manager.aclose()
+
+    def test_is_overload(self):
+        assert is_overload(_Overloaded())
+        assert not is_overload(RuntimeError())
+
+
+class TestDeadlines:
+    async def test_running_job_past_deadline_uses_fallback(self):
+        async def slow():
+            await asyncio.sleep(10)
+            return "live"
+
+        scheduler = AIJobScheduler()
+        results = await scheduler.run(
+            [
+                _job("slow", JobPriority.COMMENTARY, slow, fallback=lambda: "mock", deadline=0.01),
+                _job("bare", JobPriority.COMMENTARY, slow, deadline=0.01),
+            ]
+        )
+        assert results[0] == "mock"
+        assert isinstance(results[1], TimeoutError)
+        assert scheduler.running == 0
+
+    async def test_queued_job_expires_without_starting(self):
+        started: list[str] = []
+        release = asyncio.Event()
+
+        async def blocker():
+            started.append("blocker")
+            await release.wait()
+            return "done"
+
+        async def never():
+            started.append("never")
+            return "live"
+
+        scheduler = AIJobScheduler(initial_window=1, max_window=1)
+        task = asyncio.create_task(
+            scheduler.run(
+                [
+                    _job("blocker", JobPriority.COMMENTARY, blocker),
+                    _job(
+                        "private",
+                        JobPriority.PRIVATE_REPORT,
+                        never,
+                        fallback=lambda: "mock",
+                        deadline=0.01,
+                    ),
+                ]
+            )
+        )
+        await asyncio.sleep(0.05)
+        release.set()
+        assert await task == ["done", "mock"]
+        assert started == ["blocker"]
+
+
+class TestCancellation:
+    async def test_cancelled_run_cancels_running_and_drops_queued(self):
+        started: list[str] = []
+        cancelled: list[str] = []
+
+        def make(name):
+            async def run():
+                started.append(name)
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(name)
+                    raise
+                return name
+
+            return run
+
+        scheduler = AIJobScheduler(initial_window=1, max_window=1)
+        task = asyncio.create_task(
+            scheduler.run(
+                [
+                    _job("running", JobPriority.COMMENTARY, make("running")),
+                    _job("queued", JobPriority.PRIVATE_REPORT, make("queued")),
+                ]
+            )
+        )
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0.01)
+
+        assert cancelled == ["running"]
+        assert started == ["running"]
+        assert scheduler.running == 0
+        assert scheduler._queue == []
+
+        async def quick():
+            return "next"
+
+        # The freed slot serves the next round
+        assert await scheduler.run([_job("next", JobPriority.COMMENTARY, quick)]) == ["next"]
@@ -193,6 +193,8 @@ async def seeded_engine():
         )
         session.add_all([bs1, bs2, bs3, bs4, bs5])
         await session.flush()
+        # Rows were added directly, bypassing store_box_score's aggregates.
+        await Repository(session).rebuild_stat_aggregates("season-1")
 
     yield engine
     await engine.dispose()
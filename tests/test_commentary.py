@@ -2703,7 +2703,7 @@ class _FailingMessages:
 
 
 class _FailingClient:
-    def __init__(self, api_key: str = "") -> None:
+    def __init__(self, api_key: str = "", **kwargs: object) -> None:
         self.messages = _FailingMessages()
 
 
@@ -2767,7 +2767,7 @@ class TestCommentaryErrorFallback:
         )
 
         class _Client:
-            def __init__(self, api_key: str = "") -> None:
+            def __init__(self, api_key: str = "", **kwargs: object) -> None:
                 self.messages = captured
 
         monkeypatch.setattr(anthropic, "AsyncAnthropic", _Client)
@@ -2804,3 +2804,105 @@ class TestCommentaryPersistence:
         assert row.content in {g["commentary"] for g in result.games}
         missing = await repo.get_game_commentary(season_id, 1, "nonexistent")
         assert missing is None
+
+
+# ---------------------------------------------------------------------------
+# Streaming commentary
+# ---------------------------------------------------------------------------
+
+
+class _StreamingMessages:
+    """``messages.stream`` fake that yields the text in small deltas."""
+
+    def __init__(self, deltas: list[str]) -> None:
+        self._deltas = deltas
+        self.kwargs: dict[str, object] = {}
+
+    def stream(self, **kwargs: object) -> object:
+        from contextlib import asynccontextmanager
+        from types import SimpleNamespace
+
+        self.kwargs = kwargs
+        deltas = self._deltas
+
+        async def _text_stream():
+            for delta in deltas:
+                yield delta
+
+        async def _final():
+            return SimpleNamespace(
+                content=[SimpleNamespace(text="".join(deltas))],
+                stop_reason="end_turn",
+            )
+
+        @asynccontextmanager
+        async def _manager():
+            yield SimpleNamespace(text_stream=_text_stream(), get_final_message=_final)
+
+        return _manager()
+
+
+class TestStreamingCommentary:
+    def test_completed_sentences(self) -> None:
+        from pinwheel.ai.commentary import completed_sentences
+
+        assert completed_sentences("No end yet") == ""
+        assert completed_sentences("Done. Not do") == "Done."
+        # A trailing period is not final until whitespace follows (3.5, "Dr.").
+        assert completed_sentences("One! Two is 3.") == "One!"
+        assert completed_sentences('He said "wow." Then') == 'He said "wow."'
+
+    async def test_partials_published_per_sentence(self, monkeypatch) -> None:
+        import anthropic
+
+        from pinwheel.ai.commentary import generate_game_commentary
+        from pinwheel.models.rules import RuleSet
+
+        messages = _StreamingMessages(
+            ["The Thorns", " won. The crowd", " roared! What", " a night."]
+        )
+
+        class _Client:
+            def __init__(self, api_key: str = "", **kwargs: object) -> None:
+                self.messages = messages
+
+        monkeypatch.setattr(anthropic, "AsyncAnthropic", _Client)
+        partials: list[str] = []
+
+        async def on_partial(text: str) -> None:
+            partials.append(text)
+
+        text = await generate_game_commentary(
+            _make_game_result(), _make_home_team(), _make_away_team(), RuleSet(),
+            api_key="k", on_partial=on_partial,
+        )
+        assert text == "The Thorns won. The crowd roared! What a night."
+        assert partials == ["The Thorns won.", "The Thorns won. The crowd roared!"]
+        assert messages.kwargs["max_tokens"] == 800
+
+    async def test_failing_callback_does_not_break_generation(self, monkeypatch) -> None:
+        import anthropic
+
+        from pinwheel.ai.commentary import generate_game_commentary
+        from pinwheel.models.rules import RuleSet
+
+        messages = _StreamingMessages(["One. ", "Two. ", "Three."])
+
+        class _Client:
+            def __init__(self, api_key: str = "", **kwargs: object) -> None:
+                self.messages = messages
+
+        monkeypatch.setattr(anthropic, "AsyncAnthropic", _Client)
+        calls = 0
+
+        async def on_partial(text: str) -> None:
+            nonlocal calls
+            calls += 1
+            raise RuntimeError("subscriber gone")
+
+        text = await generate_game_commentary(
+            _make_game_result(), _make_home_team(), _make_away_team(), RuleSet(),
+            api_key="k", on_partial=on_partial,
+        )
+        assert text == "One. Two. Three."
+        assert calls == 1
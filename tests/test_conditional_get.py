@@ -0,0 +1,179 @@
+"""Tests for ETag / conditional GET support on the JSON API."""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from pinwheel.api.conditional import _etag_matches, compute_etag
+from pinwheel.config import Settings
+from pinwheel.db.engine import create_engine, get_session
+from pinwheel.db.models import Base
+from pinwheel.db.repository import Repository
+from pinwheel.main import create_app
+from pinwheel.models.rules import DEFAULT_RULESET
+
+
+@pytest.fixture
+async def app_and_engine():
+    """Create test app with in-memory database."""
+    settings = Settings(database_url="sqlite+aiosqlite:///:memory:")
+    application = create_app(settings)
+    engine = create_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    application.state.engine = engine
+    yield application, engine
+    await engine.dispose()
+
+
+async def _seed(engine) -> dict[str, str]:
+    """Create a season with two teams and one stored game."""
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        league = await repo.create_league("ETag League")
+        season = await repo.create_season(
+            league.id, "Season 1", starting_ruleset=DEFAULT_RULESET.model_dump()
+        )
+        home = await repo.create_team(season.id, "Home", venue={"name": "H", "capacity": 1})
+        away = await repo.create_team(season.id, "Away", venue={"name": "A", "capacity": 1})
+        game = await repo.store_game_result(
+            season_id=season.id,
+            round_number=1,
+            matchup_index=0,
+            home_team_id=home.id,
+            away_team_id=away.id,
+            home_score=40,
+            away_score=30,
+            winner_team_id=home.id,
+            seed=1,
+            total_possessions=60,
+        )
+        return {"season_id": season.id, "home_id": home.id, "away_id": away.id, "game_id": game.id}
+
+
+class TestEtagHelpers:
+    def test_compute_etag_is_weak_and_stable(self):
+        tag = compute_etag("a", 1)
+        assert tag.startswith('W/"')
+        assert tag == compute_etag("a", 1)
+        assert tag != compute_etag("a", 2)
+
+    def test_etag_matching(self):
+        tag = compute_etag("x")
+        assert _etag_matches(tag, tag)
+        assert _etag_matches(tag.removeprefix("W/"), tag)
+        assert _etag_matches(f'"other", {tag}', tag)
+        assert _etag_matches("*", tag)
+        assert not _etag_matches(None, tag)
+        assert not _etag_matches('"other"', tag)
+
+
+class TestConditionalRoutes:
+    async def test_game_returns_304_when_current(self, app_and_engine):
+        application, engine = app_and_engine
+        ids = await _seed(engine)
+        transport = ASGITransport(app=application)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            url = f"/api/games/{ids['game_id']}"
+            resp = await client.get(url)
+            assert resp.status_code == 200
+            etag = resp.headers["etag"]
+            assert "max-age" in resp.headers["cache-control"]
+
+            resp = await client.get(url, headers={"If-None-Match": etag})
+            assert resp.status_code == 304
+            assert resp.content == b""
+            assert resp.headers["etag"] == etag
+
+            # Boxscore on the same game gets a distinct tag (path is part of it).
+            resp = await client.get(f"{url}/boxscore")
+            assert resp.status_code == 200
+            assert resp.headers["etag"] != etag
+
+    async def test_missing_game_still_404(self, app_and_engine):
+        application, _ = app_and_engine
+        transport = ASGITransport(app=application)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            resp = await client.get("/api/games/nope", headers={"If-None-Match": "*"})
+            assert resp.status_code == 404
+
+    async def test_standings_etag_changes_with_new_game(self, app_and_engine):
+        application, engine = app_and_engine
+        ids = await _seed(engine)
+        transport = ASGITransport(app=application)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            url = f"/api/standings?season_id={ids['season_id']}"
+            first = await client.get(url)
+            assert first.status_code == 200
+            etag = first.headers["etag"]
+
+            resp = await client.get(url, headers={"If-None-Match": etag})
+            assert resp.status_code == 304
+
+            async with get_session(engine) as session:
+                await Repository(session).store_game_result(
+                    season_id=ids["season_id"],
+                    round_number=2,
+                    matchup_index=0,
+                    home_team_id=ids["away_id"],
+                    away_team_id=ids["home_id"],
+                    home_score=50,
+                    away_score=20,
+                    winner_team_id=ids["away_id"],
+                    seed=2,
+                    total_possessions=60,
+                )
+
+            resp = await client.get(url, headers={"If-None-Match": etag})
+            assert resp.status_code == 200
+            assert resp.headers["etag"] != etag
+
+    async def test_governance_etag_tracks_event_sequence(self, app_and_engine):
+        application, engine = app_and_engine
+        ids = await _seed(engine)
+        transport = ASGITransport(app=application)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            url = f"/api/governance/rules/history?season_id={ids['season_id']}"
+            etag = (await client.get(url)).headers["etag"]
+            resp = await client.get(url, headers={"If-None-Match": etag})
+            assert resp.status_code == 304
+
+            async with get_session(engine) as session:
+                await Repository(session).append_event(
+                    event_type="proposal.submitted",
+                    aggregate_id="p-1",
+                    aggregate_type="proposal",
+                    season_id=ids["season_id"],
+                    payload={"id": "p-1"},
+                )
+
+            resp = await client.get(url, headers={"If-None-Match": etag})
+            assert resp.status_code == 200
+
+    async def test_teams_payload_etag(self, app_and_engine):
+        application, engine = app_and_engine
+        ids = await _seed(engine)
+        transport = ASGITransport(app=application)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            url = f"/api/teams?season_id={ids['season_id']}"
+            etag = (await client.get(url)).headers["etag"]
+            resp = await client.get(url, headers={"If-None-Match": etag})
+            assert resp.status_code == 304
+
+
+class TestVersionMarkers:
+    async def test_repository_markers(self, app_and_engine):
+        _, engine = app_and_engine
+        ids = await _seed(engine)
+        async with get_session(engine) as session:
+            repo = Repository(session)
+            assert await repo.get_game_created_at(ids["game_id"]) is not None
+            assert await repo.get_game_created_at("missing") is None
+
+            count, latest = await repo.get_games_version(ids["season_id"])
+            assert count == 1
+            assert latest is not None
+
+            assert await repo.get_latest_event_sequence(ids["season_id"]) == 0
+            report = await repo.store_report(ids["season_id"], "simulation", 1, "text")
+            assert await repo.get_report_ids(ids["season_id"], round_number=1) == [report.id]
+            assert await repo.get_report_ids(ids["season_id"], round_number=2) == []
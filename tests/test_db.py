@@ -110,6 +110,16 @@ class TestTeamHooperRoundTrip:
         assert len(teams) == 1
         assert len(teams[0].hoopers) == 4
 
+    async def test_get_hooper_names_batched(self, repo: Repository):
+        league = await repo.create_league("L")
+        season = await repo.create_season(league.id, "S1")
+        team = await repo.create_team(season.id, "Team A")
+        a = await repo.create_hooper(team.id, season.id, "Alpha", "sharpshooter", {})
+        b = await repo.create_hooper(team.id, season.id, "Beta", "sharpshooter", {})
+        names = await repo.get_hooper_names([a.id, b.id, "missing"])
+        assert names == {a.id: "Alpha", b.id: "Beta"}
+        assert await repo.get_hooper_names([]) == {}
+
 
 class TestGameResultRoundTrip:
     async def test_store_and_retrieve_game(self, repo: Repository):
@@ -344,6 +354,102 @@ class TestLeagueSeasonHighs:
         assert result["assists"] == 7
         assert result["steals"] == 2
 
+    async def test_season_aggregates_match_rebuild(self, repo: Repository):
+        """Incremental hooper_season_stats rows equal a rebuild from box scores."""
+        league = await repo.create_league("L")
+        season = await repo.create_season(league.id, "S1")
+        team_a = await repo.create_team(season.id, "Team A")
+        team_b = await repo.create_team(season.id, "Team B")
+        hooper = await repo.create_hooper(team_a.id, season.id, "Alice", "sharpshooter", {})
+
+        for round_number, points in ((1, 12), (2, 30)):
+            game = await repo.store_game_result(
+                season_id=season.id,
+                round_number=round_number,
+                matchup_index=0,
+                home_team_id=team_a.id,
+                away_team_id=team_b.id,
+                home_score=points,
+                away_score=10,
+                winner_team_id=team_a.id,
+                seed=round_number,
+                total_possessions=60,
+            )
+            await repo.store_box_score(
+                game_id=game.id,
+                hooper_id=hooper.id,
+                team_id=team_a.id,
+                points=points,
+                field_goals_made=points // 2,
+                field_goals_attempted=points,
+                rebounds=round_number,
+            )
+
+        def snapshot(rows: list) -> list[tuple]:
+            return [
+                (r.games, r.points, r.field_goals_made, r.field_goals_attempted, r.max_points)
+                for r in rows
+            ]
+
+        incremental = snapshot(await repo.get_hooper_season_stat_rows([hooper.id]))
+        assert incremental == [(2, 42, 21, 42, 30)]
+
+        written = await repo.rebuild_stat_aggregates(season.id)
+        assert written == {"round_stats": 2, "hooper_season_stats": 1}
+        assert snapshot(await repo.get_hooper_season_stat_rows([hooper.id])) == incremental
+
+        leaders = await repo.get_stat_leaders(season.id, "points", limit=1)
+        assert leaders[0]["total"] == 42
+        assert (await repo.get_hooper_season_stats(hooper.id, season.id))["points"] == 42
+
+    async def test_concurrent_box_scores_keep_both_increments(self, tmp_path):
+        """A writer holding a stale aggregate row doesn't overwrite another's increment."""
+        eng = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'stats.db'}")
+        async with eng.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with get_session(eng) as session:
+            repo = Repository(session)
+            league = await repo.create_league("L")
+            season = await repo.create_season(league.id, "S1")
+            team_a = await repo.create_team(season.id, "Team A")
+            team_b = await repo.create_team(season.id, "Team B")
+            hooper = await repo.create_hooper(team_a.id, season.id, "Alice", "sharpshooter", {})
+            game = await repo.store_game_result(
+                season_id=season.id,
+                round_number=1,
+                matchup_index=0,
+                home_team_id=team_a.id,
+                away_team_id=team_b.id,
+                home_score=20,
+                away_score=10,
+                winner_team_id=team_a.id,
+                seed=1,
+                total_possessions=60,
+            )
+            await repo.store_box_score(
+                game_id=game.id, hooper_id=hooper.id, team_id=team_a.id, points=10
+            )
+            ids = {"game_id": game.id, "hooper_id": hooper.id, "team_id": team_a.id}
+            season_id, hooper_id = season.id, hooper.id
+
+        try:
+            async with get_session(eng) as session_a:
+                repo_a = Repository(session_a)
+                (loaded,) = await repo_a.get_hooper_season_stat_rows([hooper_id])
+                assert loaded.points == 10
+                async with get_session(eng) as session_b:
+                    await Repository(session_b).store_box_score(**ids, points=7)
+                await repo_a.store_box_score(**ids, points=5)
+                # The loaded copy is expired, so the session re-reads the sums
+                stats = await repo_a.get_hooper_season_stats(hooper_id, season_id)
+                assert stats["points"] == 22
+
+            async with get_session(eng) as session:
+                rows = await Repository(session).get_hooper_season_stat_rows([hooper_id])
+                assert [(r.games, r.points, r.max_points) for r in rows] == [(3, 22, 10)]
+        finally:
+            await eng.dispose()
+
 
 class TestGovernorActivity:
     """Tests for get_governor_activity and get_all_proposals."""
@@ -568,3 +674,59 @@ class TestAutoMigrateSchema:
             added = await auto_migrate_schema(conn)
             assert added == 0
         await eng.dispose()
+
+    async def test_backfills_payload_columns_and_creates_indexes(self, engine: AsyncEngine):
+        """Old event rows get their payload-extracted columns and indexes on upgrade."""
+        async with get_session(engine) as session:
+            repo = Repository(session)
+            league = await repo.create_league("L")
+            season = await repo.create_season(league.id, "S")
+            await repo.append_event(
+                event_type="vote.cast",
+                aggregate_id="vote-1",
+                aggregate_type="vote",
+                season_id=season.id,
+                payload={"proposal_id": "p-1", "team_id": "t-1"},
+            )
+            await repo.append_event(
+                event_type="effect.expired",
+                aggregate_id="e-1",
+                aggregate_type="effect",
+                season_id=season.id,
+                payload={},
+            )
+
+        columns = ("proposal_id", "effect_id", "payload_team_id")
+        async with engine.begin() as conn:
+            for index in (
+                "ix_gov_events_season_proposal",
+                "ix_gov_events_season_effect",
+                "ix_gov_events_season_payload_team",
+                "ix_gov_events_season_type_seq",
+            ):
+                await conn.execute(text(f"DROP INDEX {index}"))
+            for column in columns:
+                await conn.execute(text(f"ALTER TABLE governance_events DROP COLUMN {column}"))
+
+            assert await auto_migrate_schema(conn) == 3
+
+            rows = await conn.execute(
+                text(
+                    "SELECT event_type, proposal_id, effect_id, payload_team_id "
+                    "FROM governance_events ORDER BY sequence_number"
+                )
+            )
+            assert [tuple(r) for r in rows] == [
+                ("vote.cast", "p-1", None, "t-1"),
+                ("effect.expired", None, "e-1", None),
+            ]
+            index_rows = await conn.execute(text("PRAGMA index_list(governance_events)"))
+            indexes = {r[1] for r in index_rows}
+            assert "ix_gov_events_season_type_seq" in indexes
+            assert "ix_gov_events_season_proposal" in indexes
+
+        async with get_session(engine) as session:
+            events = await Repository(session).get_events_by_type(
+                season.id, ["vote.cast"], proposal_ids=["p-1"]
+            )
+            assert len(events) == 1
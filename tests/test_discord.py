@@ -918,6 +918,52 @@ class TestJoinCommand:
 
         await engine.dispose()
 
+    async def test_join_refreshes_membership_cache(
+        self, settings_discord_enabled: Settings, event_bus: EventBus
+    ) -> None:
+        """A /join is visible to the warmed membership cache straight away."""
+        from pinwheel.core.membership import membership_cache
+        from pinwheel.db.engine import create_engine, get_session
+        from pinwheel.db.models import Base
+        from pinwheel.db.repository import Repository
+
+        engine = create_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with get_session(engine) as session:
+            repo = Repository(session)
+            league = await repo.create_league("Test League")
+            season = await repo.create_season(league.id, "Season 1")
+            team = await repo.create_team(season.id, "Rose City Thorns", color="#e94560")
+            first = await repo.get_or_create_player("111000111", "FirstGovernor")
+            await repo.enroll_player(first.id, team.id, season.id)
+            await session.commit()
+            team_id = team.id
+            season_id = season.id
+
+            membership = await membership_cache.get(repo, season_id)
+            assert membership.governors_on(team_id) == [first.id]
+            assert membership.vote_weight(team_id) == 1.0
+
+        bot = PinwheelBot(settings=settings_discord_enabled, event_bus=event_bus, engine=engine)
+        interaction = make_interaction(
+            user_id=222000222,
+            display_name="SecondGovernor",
+            display_avatar_url="https://example.com/avatar.png",
+        )
+        interaction.guild = MagicMock(spec=discord.Guild)
+        interaction.guild.roles = []
+
+        await bot._handle_join(interaction, "Rose City Thorns")
+
+        async with get_session(engine) as session:
+            membership = await membership_cache.get(Repository(session), season_id)
+        assert len(membership.governors_on(team_id)) == 2
+        assert membership.vote_weight(team_id) == 0.5
+        membership_cache.clear()
+        await engine.dispose()
+
     async def test_join_season_lock(
         self, settings_discord_enabled: Settings, event_bus: EventBus
     ) -> None:
@@ -1375,6 +1421,61 @@ class TestProposeGovernance:
         assert view is not None
         await engine.dispose()
 
+    async def test_propose_near_duplicate_still_classified(
+        self,
+        settings_discord_enabled: Settings,
+        event_bus: EventBus,
+    ) -> None:
+        """A reused interpretation skips the interpreter, not the injection screen."""
+        from pinwheel.ai.classifier import ClassificationResult
+        from pinwheel.ai.interpreter import interpret_proposal_v2_mock
+        from pinwheel.ai.similar_proposals import SimilarProposal
+        from pinwheel.db.engine import get_session
+        from pinwheel.db.repository import Repository
+        from pinwheel.evals.injection import get_injection_classifications
+        from pinwheel.models.rules import RuleSet
+
+        settings = settings_discord_enabled.model_copy(update={"anthropic_api_key": "test-key"})
+        bot, interaction, gov_data, engine = await _make_enrolled_bot_and_interaction(
+            settings,
+            event_bus,
+        )
+        text = "Make three-pointers worth 5 points"
+        match = SimilarProposal("p-earlier", 1.0, interpret_proposal_v2_mock(text, RuleSet()))
+        classification = ClassificationResult(
+            classification="injection", confidence=0.95, reason="override attempt"
+        )
+
+        with (
+            patch(
+                "pinwheel.ai.similar_proposals.proposal_index.lookup",
+                AsyncMock(return_value=match),
+            ),
+            patch(
+                "pinwheel.ai.classifier.classify_injection",
+                AsyncMock(return_value=classification),
+            ) as classify,
+            patch("pinwheel.ai.interpreter.interpret_proposal_v2", AsyncMock()) as interpret,
+        ):
+            await bot._handle_propose(interaction, text)
+
+        classify.assert_awaited_once()
+        interpret.assert_not_awaited()
+        # No interpreter call, so no "15-30 seconds" notice — just the result
+        interaction.followup.send.assert_called_once()
+        send_kwargs = interaction.followup.send.call_args.kwargs
+        assert send_kwargs.get("ephemeral") is True
+        assert send_kwargs.get("view") is not None
+        fields = " ".join(f.value for f in send_kwargs["embed"].fields)
+        assert "prompt injection" in fields
+
+        async with get_session(engine) as session:
+            stored = await get_injection_classifications(
+                Repository(session), gov_data["season_id"]
+            )
+        assert [c.classification for c in stored] == ["injection"]
+        await engine.dispose()
+
     async def test_propose_no_tokens(
         self,
         settings_discord_enabled: Settings,
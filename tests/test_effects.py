@@ -24,10 +24,13 @@ from pinwheel.ai.interpreter import (
 )
 from pinwheel.core.effects import (
     EffectRegistry,
+    EffectRegistryCache,
+    effect_registry_cache,
     effect_spec_to_registered,
     load_effect_registry,
     persist_expired_effects,
     register_effects_for_proposal,
+    repeal_effect,
 )
 from pinwheel.core.governance import (
     cast_vote,
@@ -929,6 +932,98 @@ class TestEffectPersistence:
         assert registry.count == 0
 
 
+class TestEffectRegistryCache:
+    async def _register_two(self, repo: Repository, season_id: str) -> list[str]:
+        specs = [
+            EffectSpec(
+                effect_type="narrative",
+                narrative_instruction="Cache narrative",
+                description="Narrative",
+                duration="n_rounds",
+                duration_rounds=3,
+            ),
+            EffectSpec(
+                effect_type="meta_mutation",
+                target_type="team",
+                target_selector="winning_team",
+                meta_field="swagger",
+                meta_value=1,
+                meta_operation="increment",
+                description="Win swagger",
+            ),
+        ]
+        registered = await register_effects_for_proposal(
+            repo, EffectRegistry(), "p-cache", specs, season_id, 1
+        )
+        return [e.effect_id for e in registered]
+
+    async def test_refresh_reads_only_new_events(
+        self, repo: Repository, season_id: str, monkeypatch
+    ):
+        cache = EffectRegistryCache()
+        effect_ids = await self._register_two(repo, season_id)
+        assert (await cache.get(repo, season_id)).count == 2
+
+        seen: list[int] = []
+        original = repo.get_events_by_type
+
+        async def spy(season_id, event_types, after_sequence=0):
+            seen.append(after_sequence)
+            return await original(season_id, event_types, after_sequence=after_sequence)
+
+        monkeypatch.setattr(repo, "get_events_by_type", spy)
+        await persist_expired_effects(repo, season_id, [effect_ids[0]])
+        registry = await cache.get(repo, season_id)
+        assert registry.count == 1
+        assert registry.get_effect(effect_ids[0]) is None
+        assert seen == [2]  # one query, starting after the two registrations
+
+    async def test_round_mutations_do_not_leak_into_cache(
+        self, repo: Repository, season_id: str
+    ):
+        cache = EffectRegistryCache()
+        effect_ids = await self._register_two(repo, season_id)
+        first = await cache.get(repo, season_id)
+        first.tick_round(1)
+        first.remove_effect(effect_ids[1])
+
+        second = await cache.get(repo, season_id)
+        assert second.count == 2
+        assert second.get_effect(effect_ids[0]).rounds_remaining == 3
+
+    async def test_warm_state_matches_cold_rebuild(self, repo: Repository, season_id: str):
+        cache = EffectRegistryCache()
+        effect_ids = await self._register_two(repo, season_id)
+        await cache.get(repo, season_id)
+        await repo.append_event(
+            event_type="effect.repealed",
+            aggregate_id=effect_ids[1],
+            aggregate_type="effect",
+            season_id=season_id,
+            payload={"effect_id": effect_ids[1], "reason": "governance_repeal"},
+        )
+        assert await cache.verify(repo, season_id)
+
+        # A drifted cache is detected and replaced by the cold state
+        cache._seasons[season_id].registry.remove_effect(effect_ids[0])
+        assert not await cache.verify(repo, season_id)
+        registry = await cache.get(repo, season_id)
+        assert [e.effect_id for e in registry.get_all_active()] == [effect_ids[0]]
+
+    async def test_repeal_invalidates_shared_cache(self, repo: Repository, season_id: str):
+        effect_ids = await self._register_two(repo, season_id)
+        registry = await effect_registry_cache.get(repo, season_id)
+        assert season_id in effect_registry_cache
+
+        await repeal_effect(repo, registry, effect_ids[0], season_id, "p-repeal")
+        # Dropped once the repeal commits, so a concurrent get can't re-cache the old state
+        assert season_id in effect_registry_cache
+        await repo.session.commit()
+        assert season_id not in effect_registry_cache
+        assert (await effect_registry_cache.get(repo, season_id)).count == 1
+        effect_registry_cache.invalidate(season_id)
+
+
 # ============================================================================
 # tally_governance_with_effects Tests
 # ============================================================================
@@ -0,0 +1,126 @@
+"""Tests for incremental eval aggregates."""
+
+import pytest
+
+from pinwheel.evals.aggregates import EvalAggregateIndex, load_aggregates
+from pinwheel.evals.flags import detect_all_flags
+from pinwheel.evals.gqi import compute_gqi
+from pinwheel.evals.joy_alarms import check_joy_alarms
+
+
+async def _round_of_governance(repo, season_id: str, rn: int) -> None:
+    pid = f"p-{rn}"
+    await repo.append_event(
+        event_type="proposal.submitted",
+        aggregate_id=pid,
+        aggregate_type="proposal",
+        season_id=season_id,
+        payload={
+            "id": pid,
+            "interpretation": {"parameter": "elam_margin"},
+            "raw_text": f"Raise the elam margin again {rn}",
+        },
+        round_number=rn,
+        governor_id="gov-1",
+        team_id="team-1",
+    )
+    await repo.append_event(
+        event_type="proposal.confirmed",
+        aggregate_id=pid,
+        aggregate_type="proposal",
+        season_id=season_id,
+        payload={"proposal_id": pid},
+        round_number=rn,
+    )
+    for gid in ("gov-1", "gov-2"):
+        await repo.append_event(
+            event_type="vote.cast",
+            aggregate_id=pid,
+            aggregate_type="proposal",
+            season_id=season_id,
+            payload={"proposal_id": pid, "vote": "yes"},
+            round_number=rn,
+            governor_id=gid,
+        )
+    await repo.append_event(
+        event_type="proposal.passed",
+        aggregate_id=pid,
+        aggregate_type="proposal",
+        season_id=season_id,
+        payload={"proposal_id": pid},
+        round_number=rn,
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_applies_only_new_events(repo, monkeypatch):
+    league = await repo.create_league("Test")
+    season = await repo.create_season(league.id, "S1")
+    index = EvalAggregateIndex()
+
+    await _round_of_governance(repo, season.id, 1)
+    first = await index.get(repo, season.id, 1)
+    assert first.watermark == 5
+
+    seen: list[int] = []
+    original = repo.get_events_by_type
+
+    async def spy(season_id, event_types, after_sequence=0):
+        seen.append(after_sequence)
+        return await original(season_id, event_types, after_sequence=after_sequence)
+
+    monkeypatch.setattr(repo, "get_events_by_type", spy)
+    await _round_of_governance(repo, season.id, 2)
+    warm = await index.get(repo, season.id, 2)
+
+    assert seen == [5]
+    assert warm.actions_in_round(2) == {"gov-1": 2, "gov-2": 1}
+    assert warm.last_active == {"gov-1": 2, "gov-2": 2}
+    assert warm.passed_ids == {"p-1", "p-2"}
+    assert len(warm.vote_delays_seconds) == 4
+
+
+@pytest.mark.asyncio
+async def test_warm_detectors_match_cold_rebuild(repo):
+    league = await repo.create_league("Test")
+    season = await repo.create_season(league.id, "S1")
+    index = EvalAggregateIndex()
+
+    for rn in range(1, 5):
+        await _round_of_governance(repo, season.id, rn)
+        warm = await index.get(repo, season.id, rn)
+        cold = await load_aggregates(repo, season.id, rn)
+
+        assert await compute_gqi(repo, season.id, rn, aggregates=warm) == await compute_gqi(
+            repo, season.id, rn, aggregates=cold
+        )
+        warm_flags = await detect_all_flags(repo, season.id, rn, [], aggregates=warm)
+        cold_flags = await detect_all_flags(repo, season.id, rn, [], aggregates=cold)
+        assert [f.flag_type for f in warm_flags] == [f.flag_type for f in cold_flags]
+        warm_alarms = await check_joy_alarms(repo, season.id, rn, aggregates=warm)
+        cold_alarms = await check_joy_alarms(repo, season.id, rn, aggregates=cold)
+        assert warm_alarms == cold_alarms
+
+    # Same parameter four rounds running, every vote unanimous
+    flag_types = {f.flag_type for f in warm_flags}
+    assert {"governance_stagnation", "suspicious_unanimity"} <= flag_types
+    assert any(a.alarm_type == "power_concentration" for a in warm_alarms)
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_refresh_drops_the_season(repo):
+    league = await repo.create_league("Test")
+    season_id = (await repo.create_season(league.id, "S1")).id
+    await repo.session.commit()
+    index = EvalAggregateIndex()
+
+    await _round_of_governance(repo, season_id, 1)
+    assert (await index.get(repo, season_id, 1)).watermark == 5
+    await repo.session.rollback()
+
+    # The retry writes different events under the rolled-back sequence numbers
+    await _round_of_governance(repo, season_id, 2)
+    retried = await index.get(repo, season_id, 2)
+    await repo.session.commit()
+    assert retried.passed_ids == {"p-2"}
+    assert (await index.get(repo, season_id, 2)) is retried
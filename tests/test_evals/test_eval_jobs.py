@@ -0,0 +1,129 @@
+"""Tests for out-of-band eval jobs (enqueue, tick worker, retries)."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from pinwheel.core.game_loop import step_round_multisession
+from pinwheel.db.engine import create_engine, get_session
+from pinwheel.db.models import Base
+from pinwheel.db.repository import Repository
+from pinwheel.evals import jobs
+from pinwheel.evals.aggregates import eval_aggregates
+from pinwheel.evals.jobs import EVAL_JOB_TYPES, enqueue_round_evals, tick_eval_jobs
+from pinwheel.models.report import Report
+
+
+@pytest.fixture
+async def engine() -> AsyncEngine:
+    eng = create_engine("sqlite+aiosqlite:///:memory:")
+    async with eng.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    eval_aggregates.clear()
+    yield eng
+    await eng.dispose()
+
+
+async def _season(engine: AsyncEngine) -> str:
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        league = await repo.create_league("Test")
+        season = await repo.create_season(league.id, "S1")
+        return season.id
+
+
+async def _enqueue(engine: AsyncEngine, season_id: str) -> int:
+    report = Report(
+        id="r-1",
+        report_type="simulation",
+        round_number=1,
+        content="You should vote for Team 1.",
+    )
+    async with get_session(engine) as session:
+        return await enqueue_round_evals(Repository(session), season_id, 1, [report], [], {})
+
+
+async def test_enqueue_is_idempotent_and_tick_runs_jobs(engine):
+    season_id = await _season(engine)
+
+    assert await _enqueue(engine, season_id) == len(EVAL_JOB_TYPES)
+    assert await _enqueue(engine, season_id) == 0
+
+    assert await tick_eval_jobs(engine) == len(EVAL_JOB_TYPES)
+    assert await tick_eval_jobs(engine) == 0
+
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        statuses = {j.eval_type: j.status for j in await repo.get_eval_jobs(season_id)}
+        assert statuses == dict.fromkeys(EVAL_JOB_TYPES, "done")
+        assert await repo.get_eval_results(season_id, eval_type="gqi", round_number=1)
+        assert await repo.get_eval_results(season_id, eval_type="prescriptive", round_number=1)
+
+
+async def test_failing_job_retries_then_fails(engine, monkeypatch):
+    season_id = await _season(engine)
+    await _enqueue(engine, season_id)
+
+    async def broken(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(jobs.EVAL_RUNNERS, "gqi", broken)
+    for _ in range(3):
+        await tick_eval_jobs(engine, max_attempts=2)
+
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        by_type = {j.eval_type: j for j in await repo.get_eval_jobs(season_id)}
+        assert by_type["gqi"].status == "failed"
+        assert by_type["gqi"].attempts == 2
+        assert "boom" in by_type["gqi"].last_error
+        assert by_type["flags"].status == "done"
+        assert not await repo.get_eval_results(season_id, eval_type="gqi")
+
+
+async def test_deferred_round_enqueues_instead_of_running(engine):
+    from tests.test_scheduler_runner import _setup_season
+
+    season_id = await _setup_season(engine)
+    await step_round_multisession(engine, season_id, 1, defer_evals=True)
+
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        queued = await repo.get_eval_jobs(season_id, round_number=1)
+        assert {j.eval_type for j in queued} == set(EVAL_JOB_TYPES)
+        assert not await repo.get_eval_results(season_id, eval_type="gqi")
+
+    await tick_eval_jobs(engine)
+
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        assert await repo.get_eval_results(season_id, eval_type="gqi", round_number=1)
+        assert await repo.get_eval_results(season_id, eval_type="grounding", round_number=1)
+
+
+async def test_late_job_ignores_later_rounds(engine, monkeypatch):
+    season_id = await _season(engine)
+    await _enqueue(engine, season_id)
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        await repo.append_event(
+            event_type="proposal.submitted",
+            aggregate_id="p-2",
+            aggregate_type="proposal",
+            season_id=season_id,
+            payload={"id": "p-2", "raw_text": "later round"},
+            round_number=2,
+            governor_id="gov-1",
+        )
+        await session.commit()
+        # The warm copy has already moved on to round 2
+        warm = await eval_aggregates.get(repo, season_id, 2)
+        assert warm.event_counts["proposal.submitted"] == 1
+
+    seen: list[int] = []
+
+    async def capture(repo, season_id, round_number, payload, api_key, aggregates):
+        seen.append(aggregates.event_counts["proposal.submitted"])
+
+    monkeypatch.setitem(jobs.EVAL_RUNNERS, "gqi", capture)
+    await tick_eval_jobs(engine)
+    assert seen == [0]
@@ -117,13 +117,13 @@ class TestGQIWiring:
         ]
 
         # Load teams into cache
-        from pinwheel.core.game_loop import _row_to_team
+        from pinwheel.core.game_loop import row_to_team
 
         teams_cache = {}
         for tid in team_ids:
             row = await repo.get_team(tid)
             if row:
-                teams_cache[tid] = _row_to_team(row)
+                teams_cache[tid] = row_to_team(row)
 
         await _run_evals(
             repo, season_id, 1, reports, game_summaries, teams_cache,
@@ -206,13 +206,13 @@ class TestRuleEvaluatorWiring:
             },
         ]
 
-        from pinwheel.core.game_loop import _row_to_team
+        from pinwheel.core.game_loop import row_to_team
 
         teams_cache = {}
         for tid in team_ids:
             row = await repo.get_team(tid)
             if row:
-                teams_cache[tid] = _row_to_team(row)
+                teams_cache[tid] = row_to_team(row)
 
         await _run_evals(
             repo, season_id, 1, reports, game_summaries, teams_cache,
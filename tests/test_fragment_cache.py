@@ -0,0 +1,165 @@
+"""Tests for the server-side page fragment cache."""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from pinwheel.core.fragment_cache import FragmentCache
+from pinwheel.db.engine import create_engine, get_session
+from pinwheel.db.models import Base
+from pinwheel.db.repository import Repository
+
+
+@pytest.fixture
+async def engine() -> AsyncEngine:
+    """Create an in-memory SQLite engine with all tables."""
+    eng = create_engine("sqlite+aiosqlite:///:memory:")
+    async with eng.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield eng
+    await eng.dispose()
+
+
+def _counting_builder(value: str = "ctx"):
+    calls: list[int] = []
+
+    async def build() -> dict:
+        calls.append(1)
+        return {"value": value, "n": len(calls)}
+
+    return build, calls
+
+
+class TestFragmentCache:
+    async def test_hit_after_first_build(self):
+        cache = FragmentCache()
+        build, calls = _counting_builder()
+
+        first = await cache.get_or_build("s-1", (3, 8), "pages/standings.html", build)
+        second = await cache.get_or_build("s-1", (3, 8), "pages/standings.html", build)
+
+        assert first is second
+        assert len(calls) == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    async def test_marker_change_rebuilds(self):
+        cache = FragmentCache()
+        build, calls = _counting_builder()
+
+        await cache.get_or_build("s-1", (3, 8), "pages/home.html", build)
+        await cache.get_or_build("s-1", (3, 10), "pages/home.html", build)
+        await cache.get_or_build("s-1", (4, 10), "pages/home.html", build)
+
+        assert len(calls) == 3
+
+    async def test_template_and_variant_are_separate_keys(self):
+        cache = FragmentCache()
+        build, calls = _counting_builder()
+
+        await cache.get_or_build("s-1", (1, 2), "pages/team.html", build, ("t-1",))
+        await cache.get_or_build("s-1", (1, 2), "pages/team.html", build, ("t-2",))
+        await cache.get_or_build("s-1", (1, 2), "pages/arena.html", build)
+
+        assert len(calls) == 3
+
+    async def test_invalidate_season_forces_rebuild(self):
+        cache = FragmentCache()
+        build, calls = _counting_builder()
+
+        await cache.get_or_build("s-1", (1, 2), "pages/home.html", build)
+        await cache.get_or_build("s-2", (1, 2), "pages/home.html", build)
+        cache.invalidate_season("s-1")
+        await cache.get_or_build("s-1", (1, 2), "pages/home.html", build)
+        await cache.get_or_build("s-2", (1, 2), "pages/home.html", build)
+
+        # s-1 rebuilt, s-2 still cached
+        assert len(calls) == 3
+
+    async def test_ttl_expiry(self):
+        cache = FragmentCache(ttl_seconds=0.0)
+        build, calls = _counting_builder()
+
+        await cache.get_or_build("s-1", (1, 2), "pages/home.html", build)
+        await cache.get_or_build("s-1", (1, 2), "pages/home.html", build)
+
+        assert len(calls) == 2
+
+    async def test_concurrent_misses_single_flight(self):
+        cache = FragmentCache()
+        calls: list[int] = []
+
+        async def slow_build() -> str:
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return "<div>fragment</div>"
+
+        results = await asyncio.gather(
+            *[
+                cache.get_or_build("s-1", (1, 2), "partials/what-changed", slow_build)
+                for _ in range(10)
+            ]
+        )
+
+        assert len(calls) == 1
+        assert set(results) == {"<div>fragment</div>"}
+
+    async def test_invalidation_during_build_is_not_stored(self):
+        cache = FragmentCache()
+        build_calls: list[int] = []
+
+        async def build() -> int:
+            build_calls.append(1)
+            cache.invalidate_season("s-1")
+            return len(build_calls)
+
+        await cache.get_or_build("s-1", (1, 2), "pages/home.html", build)
+        await cache.get_or_build("s-1", (1, 2), "pages/home.html", build)
+
+        assert len(build_calls) == 2
+
+    async def test_build_error_propagates_and_is_not_cached(self):
+        cache = FragmentCache()
+        attempts: list[int] = []
+
+        async def failing() -> dict:
+            attempts.append(1)
+            raise RuntimeError("db went away")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_build("s-1", (1, 2), "pages/home.html", failing)
+        with pytest.raises(RuntimeError):
+            await cache.get_or_build("s-1", (1, 2), "pages/home.html", failing)
+
+        assert len(attempts) == 2
+
+    async def test_lru_bound(self):
+        cache = FragmentCache(max_entries=2)
+        build, calls = _counting_builder()
+
+        for team in ("t-1", "t-2", "t-3"):
+            await cache.get_or_build("s-1", (1, 2), "pages/team.html", build, (team,))
+        # t-1 was evicted
+        await cache.get_or_build("s-1", (1, 2), "pages/team.html", build, ("t-1",))
+
+        assert len(calls) == 4
+
+
+class TestRoundMarker:
+    async def test_marker_tracks_latest_round_and_presented_games(self, engine: AsyncEngine):
+        async with get_session(engine) as session:
+            repo = Repository(session)
+            league = await repo.create_league("L")
+            season = await repo.create_season(league.id, "S1")
+            t1 = await repo.create_team(season.id, "T1")
+            t2 = await repo.create_team(season.id, "T2")
+
+            assert await repo.get_round_marker(season.id) == (0, 0)
+
+            g1 = await repo.store_game_result(season.id, 1, 0, t1.id, t2.id, 40, 35, t1.id, 1, 75)
+            await repo.store_game_result(season.id, 2, 0, t2.id, t1.id, 42, 38, t2.id, 2, 80)
+            assert await repo.get_round_marker(season.id) == (2, 0)
+
+            await repo.mark_game_presented(g1.id)
+            assert await repo.get_round_marker(season.id) == (2, 1)
@@ -1221,6 +1221,111 @@ class TestPhaseAI:
         assert gov_id in gov_ids
 
 
+    async def test_live_commentary_streams_to_event_bus(self, repo: Repository, monkeypatch):
+        import anthropic
+
+        season_id, _ = await _setup_season_with_teams(repo)
+        sim = await _phase_simulate_and_govern(repo, season_id, round_number=1)
+        assert sim is not None
+
+        async def fake_commentary(*args, on_partial=None, **kwargs) -> str:
+            await on_partial("First.")
+            await on_partial("First. Second!")
+            return "First. Second! Third."
+
+        monkeypatch.setattr(
+            "pinwheel.core.game_loop.generate_game_commentary", fake_commentary
+        )
+        # Reports fall back to their mocks.
+        monkeypatch.setattr(anthropic, "AsyncAnthropic", _NoAPIClient)
+
+        bus = EventBus()
+        async with bus.subscribe("game.commentary") as sub:
+            ai = await _phase_ai(sim, api_key="k", event_bus=bus)
+            events = []
+            while (event := await sub.get(timeout=0.1)) is not None:
+                events.append(event["data"])
+
+        assert len(events) == 3 * GAMES_PER_TICK
+        first_game = [e for e in events if e["game_index"] == 0]
+        assert [e["commentary"] for e in first_game] == [
+            "First.", "First. Second!", "First. Second! Third.",
+        ]
+        assert [e["final"] for e in first_game] == [False, False, True]
+        assert first_game[0]["game_row_id"] == sim.game_summaries[0]["game_row_id"]
+        assert set(ai.commentaries.values()) == {"First. Second! Third."}
+
+    async def test_replay_mode_does_not_stream_commentary(
+        self, repo: Repository, monkeypatch
+    ):
+        import anthropic
+
+        season_id, _ = await _setup_season_with_teams(repo)
+        sim = await _phase_simulate_and_govern(repo, season_id, round_number=1)
+        assert sim is not None
+        monkeypatch.setattr(anthropic, "AsyncAnthropic", _NoAPIClient)
+
+        bus = EventBus()
+        async with bus.subscribe("game.commentary") as sub:
+            await _phase_ai(sim, api_key="k", event_bus=bus, suppress_spoiler_events=True)
+            assert await sub.get(timeout=0.05) is None
+
+    async def test_replay_mode_streams_commentary_to_presentation(
+        self, repo: Repository, monkeypatch
+    ):
+        import anthropic
+
+        season_id, _ = await _setup_season_with_teams(repo)
+        sim = await _phase_simulate_and_govern(repo, season_id, round_number=1)
+        assert sim is not None
+
+        async def fake_commentary(*args, on_partial=None, **kwargs) -> str:
+            await on_partial("First.")
+            return "First. Second."
+
+        monkeypatch.setattr(
+            "pinwheel.core.game_loop.generate_game_commentary", fake_commentary
+        )
+        monkeypatch.setattr(anthropic, "AsyncAnthropic", _NoAPIClient)
+
+        received: list[dict] = []
+
+        async def on_commentary(event: dict) -> None:
+            received.append(event)
+
+        bus = EventBus()
+        async with bus.subscribe("game.commentary") as sub:
+            await _phase_ai(
+                sim,
+                api_key="k",
+                event_bus=bus,
+                suppress_spoiler_events=True,
+                on_commentary=on_commentary,
+            )
+            assert await sub.get(timeout=0.05) is None
+
+        assert len(received) == 2 * GAMES_PER_TICK
+        assert {e["final"] for e in received if e["commentary"] == "First. Second."} == {True}
+
+
+class _NoAPIMessages:
+    async def create(self, **kwargs: object) -> object:
+        import anthropic
+        import httpx
+
+        raise anthropic.APIConnectionError(
+            request=httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        )
+
+    def stream(self, **kwargs: object) -> object:
+        raise NotImplementedError
+
+
+class _NoAPIClient:
+    def __init__(self, api_key: str = "", **kwargs: object) -> None:
+        self.messages = _NoAPIMessages()
+
+
 class TestPhasePersistAndFinalize:
     """Tests for the extracted _phase_persist_and_finalize function."""
 
@@ -2336,11 +2441,11 @@ class TestEffectsGameLoopIntegration:
 
 
 class TestRowToTeam:
-    """Tests for _row_to_team deserialization."""
+    """Tests for row_to_team deserialization."""
 
     async def test_deserializes_moves_from_db_row(self, repo: Repository) -> None:
-        """Verify _row_to_team properly deserializes moves stored as JSON in the DB."""
-        from pinwheel.core.game_loop import _row_to_team
+        """Verify row_to_team properly deserializes moves stored as JSON in the DB."""
+        from pinwheel.core.game_loop import row_to_team
         from pinwheel.models.team import Move
 
         league = await repo.create_league("Test League")
@@ -2381,7 +2486,7 @@ class TestRowToTeam:
         team_row = await repo.get_team(team.id)
         assert team_row is not None
 
-        domain_team = _row_to_team(team_row)
+        domain_team = row_to_team(team_row)
         hooper = domain_team.hoopers[0]
 
         assert len(hooper.moves) == 2
@@ -2393,8 +2498,8 @@ class TestRowToTeam:
         assert hooper.moves[1].source == "earned"
 
     async def test_handles_empty_moves(self, repo: Repository) -> None:
-        """Verify _row_to_team handles hoopers with no moves."""
-        from pinwheel.core.game_loop import _row_to_team
+        """Verify row_to_team handles hoopers with no moves."""
+        from pinwheel.core.game_loop import row_to_team
 
         league = await repo.create_league("Test League")
         season = await repo.create_season(league.id, "Season 1")
@@ -2412,7 +2517,7 @@ class TestRowToTeam:
         )
 
         team_row = await repo.get_team(team.id)
-        domain_team = _row_to_team(team_row)
+        domain_team = row_to_team(team_row)
         assert domain_team.hoopers[0].moves == []
 
 
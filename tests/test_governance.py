@@ -828,6 +828,62 @@ class TestTallyGovernance:
         assert tallies[0].passed is True
         assert new_ruleset.three_point_value == 5
 
+    async def test_tally_appends_all_events_in_one_write(
+        self, repo: Repository, season_id: str, monkeypatch
+    ):
+        """Many proposals tally with one bulk append, events in proposal order."""
+        proposals = [
+            Proposal(
+                id=f"p-{i}",
+                season_id=season_id,
+                governor_id="gov-001",
+                team_id="team-1",
+                raw_text=f"Shot clock {20 + i}",
+                interpretation=RuleInterpretation(
+                    parameter="shot_clock_seconds", new_value=20 + i
+                ),
+                status="confirmed",
+            )
+            for i in range(6)
+        ]
+        votes = {
+            p.id: [
+                Vote(proposal_id=p.id, governor_id="gov-001", vote="yes" if i % 2 else "no")
+            ]
+            for i, p in enumerate(proposals)
+        }
+
+        async def no_single_appends(**kwargs):
+            raise AssertionError("tally should not append events one at a time")
+
+        bulk_calls: list[int] = []
+        original_bulk = repo.append_events
+
+        async def spy_bulk(events):
+            bulk_calls.append(len(events))
+            return await original_bulk(events)
+
+        monkeypatch.setattr(repo, "append_event", no_single_appends)
+        monkeypatch.setattr(repo, "append_events", spy_bulk)
+
+        new_ruleset, tallies = await tally_governance(
+            repo=repo,
+            season_id=season_id,
+            proposals=proposals,
+            votes_by_proposal=votes,
+            current_ruleset=RuleSet(),
+            round_number=2,
+        )
+
+        assert [t.passed for t in tallies] == [False, True] * 3
+        assert new_ruleset.shot_clock_seconds == 25
+        assert bulk_calls == [9]  # 6 pass/fail + 3 rule.enacted
+        events = await repo.get_events_by_type(
+            season_id, ["rule.enacted", "proposal.passed", "proposal.failed"]
+        )
+        assert [e.aggregate_id for e in events][:3] == ["p-0", "p-1", "p-1"]
+        assert [e.event_type for e in events][1:3] == ["rule.enacted", "proposal.passed"]
+
 
 # --- Admin Review / Veto Tests ---
 
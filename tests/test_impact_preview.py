@@ -0,0 +1,200 @@
+"""Tests for simulated proposal impact previews."""
+
+import asyncio
+
+import pytest
+
+from pinwheel.core import impact_preview
+from pinwheel.core.impact_preview import (
+    ImpactPreview,
+    ImpactPreviewService,
+    MatchupImpact,
+    Scenario,
+    candidate_rules,
+    load_scenario,
+    previewable,
+)
+from pinwheel.core.scheduler import generate_round_robin
+from pinwheel.core.seeding import generate_league
+from pinwheel.db.engine import create_engine, get_session
+from pinwheel.db.models import Base
+from pinwheel.db.repository import Repository
+from pinwheel.discord.embeds import build_interpretation_embed
+from pinwheel.models.governance import EffectSpec, RuleInterpretation
+from pinwheel.models.rules import DEFAULT_RULESET
+
+_ATTRS = {
+    "scoring": 50,
+    "passing": 40,
+    "defense": 35,
+    "speed": 45,
+    "stamina": 40,
+    "iq": 50,
+    "ego": 30,
+    "chaotic_alignment": 40,
+    "fate": 30,
+}
+
+
+def _change(parameter: str, value: int) -> RuleInterpretation:
+    return RuleInterpretation(parameter=parameter, new_value=value, confidence=0.9)
+
+
+@pytest.fixture
+def scenario() -> Scenario:
+    teams = generate_league(num_teams=4).teams
+    return Scenario(
+        season_id="s-1",
+        round_number=3,
+        ruleset=DEFAULT_RULESET,
+        matchups=((teams[0], teams[1]), (teams[2], teams[3])),
+        key="scenario",
+    )
+
+
+def test_candidate_rules_applies_and_skips():
+    candidate = candidate_rules(DEFAULT_RULESET, _change("three_point_value", 5))
+    assert candidate is not None
+    assert candidate.ruleset.three_point_value == 5
+    assert DEFAULT_RULESET.three_point_value == 3
+
+    # Out of range -> skipped -> nothing left to simulate
+    assert candidate_rules(DEFAULT_RULESET, _change("three_point_value", 99)) is None
+
+    narrative = [EffectSpec(effect_type="narrative", description="Rename the league")]
+    assert not previewable(_change("three_point_value", 5), narrative)
+    assert candidate_rules(DEFAULT_RULESET, None, narrative) is None
+
+
+async def test_preview_shares_baseline_and_caches_per_proposal(scenario, monkeypatch):
+    calls: list[int] = []
+    simulate = impact_preview._simulate_seeds
+
+    def counting(*args):
+        calls.append(1)
+        return simulate(*args)
+
+    monkeypatch.setattr(impact_preview, "_simulate_seeds", counting)
+    service = ImpactPreviewService(seeds=4, workers=0)
+
+    threes = candidate_rules(scenario.ruleset, _change("three_point_value", 6))
+    preview = await service.preview(scenario, threes, proposal_id="p-1")
+    assert preview.games == 8
+    assert preview.round_number == 3
+    assert preview.points_after > preview.points_before
+    assert len(preview.matchups) == 2
+    assert len(calls) == 4  # baseline + candidate arm, one chunk per matchup
+
+    clock = candidate_rules(scenario.ruleset, _change("shot_clock_seconds", 30))
+    await service.preview(scenario, clock, proposal_id="p-2")
+    assert len(calls) == 6  # baseline reused
+
+    same = candidate_rules(scenario.ruleset, _change("three_point_value", 6))
+    assert await service.preview(scenario, same, proposal_id="p-3") == preview
+    assert len(calls) == 6
+    assert service.get("p-1") == preview
+    assert service.get("p-3") == preview
+    assert service.get("unknown") is None
+    service.shutdown()
+
+
+async def test_process_pool_matches_in_thread_run(scenario):
+    threes = candidate_rules(scenario.ruleset, _change("three_point_value", 5))
+    in_thread = ImpactPreviewService(seeds=4, workers=0)
+    pooled = ImpactPreviewService(seeds=4, workers=2)
+    try:
+        expected = await in_thread.preview(scenario, threes)
+        # Spawned workers, seeds split across two chunks: same games, same result
+        assert await pooled.preview(scenario, threes, timeout=120) == expected
+        assert pooled._executor is not None
+    finally:
+        in_thread.shutdown()
+        pooled.shutdown()
+    assert pooled._executor is None
+
+
+async def test_proposal_links_are_bounded_and_forgotten(scenario):
+    service = ImpactPreviewService(seeds=2, workers=0, max_entries=2)
+    threes = candidate_rules(scenario.ruleset, _change("three_point_value", 5))
+    for pid in ("p-1", "p-2", "p-3"):
+        await service.preview(scenario, threes, proposal_id=pid)
+    assert service.get("p-1") is None  # oldest link evicted
+    assert service.get("p-3") is not None
+
+    service.forget(["p-3"])
+    assert service.get("p-3") is None
+    assert service.get("p-2") is not None
+    service.shutdown()
+
+
+async def test_in_flight_runs_are_bounded(scenario):
+    service = ImpactPreviewService(seeds=2, workers=0, max_entries=1)
+    fives = candidate_rules(scenario.ruleset, _change("three_point_value", 5))
+    sixes = candidate_rules(scenario.ruleset, _change("three_point_value", 6))
+    waiting = asyncio.create_task(service.preview(scenario, fives, proposal_id="p-1"))
+    await asyncio.sleep(0)  # p-1's run is in flight
+
+    service.start(scenario, sixes, proposal_id="p-2")
+    assert await waiting is None  # evicted and cancelled, not raised
+    await service.wait_idle()
+    assert service.get("p-1") is None
+    assert service.get("p-2") is not None
+    service.shutdown()
+
+
+async def test_load_scenario_next_round():
+    engine = create_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        league = await repo.create_league("L")
+        season = await repo.create_season(league.id, "S1", starting_ruleset={"quarter_minutes": 3})
+        team_ids = []
+        for i in range(4):
+            team = await repo.create_team(
+                season.id, f"Team {i}", venue={"name": f"Arena {i}", "capacity": 5000}
+            )
+            team_ids.append(team.id)
+            await repo.create_hooper(team.id, season.id, f"H{i}", "sharpshooter", _ATTRS)
+        for m in generate_round_robin(team_ids):
+            await repo.create_schedule_entry(
+                season_id=season.id,
+                round_number=m.round_number,
+                matchup_index=m.matchup_index,
+                home_team_id=m.home_team_id,
+                away_team_id=m.away_team_id,
+            )
+
+        scenario = await load_scenario(repo, season.id)
+        assert scenario.round_number == 1
+        assert len(scenario.matchups) == 2
+        assert scenario.ruleset.quarter_minutes == 3
+        assert (await load_scenario(repo, season.id)).key == scenario.key
+        assert await load_scenario(repo, "missing") is None
+    await engine.dispose()
+
+
+def test_interpretation_embed_shows_impact():
+    impact = ImpactPreview(
+        round_number=4,
+        games=64,
+        points_before=120.0,
+        points_after=131.5,
+        possessions_before=100.0,
+        possessions_after=98.0,
+        matchups=(MatchupImpact("Thorns", "Breakers", 0.5, 0.625),),
+    )
+    embed = build_interpretation_embed(
+        raw_text="Make threes worth 4",
+        interpretation=_change("three_point_value", 4),
+        tier=1,
+        token_cost=1,
+        tokens_remaining=2,
+        impact=impact,
+    )
+    field = next(f for f in embed.fields if f.name.startswith("Simulated Impact"))
+    assert "round 4, 64 games" in field.name
+    assert "+11.5" in field.value
+    assert "-2.0" in field.value
+    assert "Thorns vs Breakers, home wins 50% -> 62%" in field.value
@@ -545,6 +545,30 @@ class TestGetGameStatsForRounds:
         assert "three_point_pct" in stats
         assert "elam_activation_rate" in stats
 
+    async def test_round_stats_match_backfill(self, repo: Repository):
+        """Incrementally maintained round_stats equal a from-scratch rebuild."""
+        from sqlalchemy import text
+
+        from pinwheel.core.game_loop import step_round
+        from pinwheel.db.engine import _backfill_empty_tables
+
+        season_id, _ = await _setup_season_with_teams(repo)
+        await step_round(repo, season_id, round_number=1)
+        await step_round(repo, season_id, round_number=2)
+
+        query = text("SELECT * FROM round_stats ORDER BY round_number")
+        incremental = [tuple(r) for r in await repo.session.execute(query)]
+        assert [r[1] for r in incremental] == [1, 2]
+
+        await repo.session.execute(text("DELETE FROM round_stats"))
+        await _backfill_empty_tables(await repo.session.connection())
+        assert [tuple(r) for r in await repo.session.execute(query)] == incremental
+
+        games = await repo.get_games_for_round(season_id, 1)
+        stats = await repo.get_game_stats_for_rounds(season_id, 1, 1)
+        scores = [g.home_score for g in games] + [g.away_score for g in games]
+        assert stats["avg_score"] == sum(scores) / len(scores)
+
 
 # ---------------------------------------------------------------------------
 # Integration: Impact validation in game loop
@@ -0,0 +1,116 @@
+"""Tests for the season-scoped governor membership cache."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from pinwheel.core.membership import MembershipCache, membership_cache
+from pinwheel.db.engine import create_engine, get_session
+from pinwheel.db.models import Base
+from pinwheel.db.repository import Repository
+from pinwheel.discord.helpers import GovernorNotFound, get_governor
+
+
+@pytest.fixture
+async def engine() -> AsyncEngine:
+    eng = create_engine("sqlite+aiosqlite:///:memory:")
+    async with eng.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    membership_cache.clear()
+    yield eng
+    await eng.dispose()
+
+
+async def _seed(repo: Repository) -> tuple[str, list[str]]:
+    league = await repo.create_league("Test")
+    season = await repo.create_season(league.id, "S1")
+    team_ids = []
+    for name in ("Thorns", "Breakers"):
+        team = await repo.create_team(season.id, name)
+        team_ids.append(team.id)
+    for i, team_id in enumerate([team_ids[0], team_ids[0], team_ids[1]]):
+        player = await repo.get_or_create_player(f"d-{i}", f"gov{i}")
+        await repo.enroll_player(player.id, team_id, season.id)
+    return season.id, team_ids
+
+
+async def test_counts_and_vote_weight(engine):
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        season_id, (thorns, breakers) = await _seed(repo)
+        membership = await MembershipCache().get(repo, season_id)
+
+    assert membership.counts_by_team() == {thorns: 2, breakers: 1}
+    assert membership.vote_weight(thorns) == 0.5
+    assert membership.vote_weight(breakers) == 1.0
+    assert membership.by_discord["d-2"].team_id == breakers
+    assert membership.team_names[thorns] == "Thorns"
+
+
+async def test_cached_until_invalidated(engine):
+    cache = MembershipCache()
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        season_id, (thorns, _) = await _seed(repo)
+        first = await cache.get(repo, season_id)
+
+        player = await repo.get_or_create_player("d-new", "late")
+        await repo.enroll_player(player.id, thorns, season_id)
+        assert await cache.get(repo, season_id) is first
+        assert first.active_count(thorns) == 2
+
+        cache.invalidate(season_id)
+        assert (await cache.get(repo, season_id)).active_count(thorns) == 3
+
+
+async def test_expires_after_ttl(engine):
+    cache = MembershipCache(ttl_seconds=0)
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        season_id, _ = await _seed(repo)
+        first = await cache.get(repo, season_id)
+        assert await cache.get(repo, season_id) is not first
+
+
+async def test_get_governor_rechecks_db_on_miss(engine):
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        await repo.update_season_status((await _seed(repo))[0], "active")
+
+    gov = await get_governor(engine, "d-0")
+    assert gov.team_name == "Thorns"
+
+    with pytest.raises(GovernorNotFound):
+        await get_governor(engine, "d-late")
+
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        season = await repo.get_active_season()
+        player = await repo.get_or_create_player("d-late", "late")
+        await repo.enroll_player(player.id, gov.team_id, season.id)
+
+    late = await get_governor(engine, "d-late")
+    assert late.team_id == gov.team_id
+    membership = await _membership(engine)
+    assert membership.active_count(gov.team_id) == 3
+
+
+async def _membership(engine: AsyncEngine):
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        season = await repo.get_active_season()
+        return await membership_cache.get(repo, season.id)
+
+
+async def test_enroll_invalidates_again_after_commit(engine):
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        season_id, (thorns, _) = await _seed(repo)
+    async with get_session(engine) as session:
+        repo = Repository(session)
+        player = await repo.get_or_create_player("d-new", "late")
+        await repo.enroll_player(player.id, thorns, season_id)
+        # A reader repopulates the cache before the enrollment commits
+        await membership_cache.get(repo, season_id)
+        assert season_id in membership_cache._seasons
+
+    assert season_id not in membership_cache._seasons
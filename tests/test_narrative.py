@@ -17,12 +17,12 @@ from pinwheel.ai.report import (
 from pinwheel.core.game_loop import step_round
 from pinwheel.core.narrative import (
     NarrativeContext,
-    _build_bedrock_facts,
     _build_rules_narrative,
     _compute_head_to_head,
     _compute_phase,
     _compute_season_arc,
     _compute_streaks,
+    build_bedrock_facts,
     compute_narrative_context,
     format_narrative_for_prompt,
 )
@@ -812,12 +812,12 @@ class TestNarrativeContextDataclass:
 
 
 class TestBuildBedrockFacts:
-    """Tests for _build_bedrock_facts()."""
+    """Tests for build_bedrock_facts()."""
 
     def test_default_ruleset(self) -> None:
         from pinwheel.models.rules import RuleSet
 
-        facts = _build_bedrock_facts(RuleSet())
+        facts = build_bedrock_facts(RuleSet())
         assert "8 teams" in facts
         assert "3v3" in facts
         assert "No byes" in facts
@@ -846,7 +846,7 @@ class TestBuildBedrockFacts:
             elam_trigger_quarter=4,
             elam_margin=20,
         )
-        facts = _build_bedrock_facts(rs)
+        facts = build_bedrock_facts(rs)
         assert "6 teams" in facts
         assert "best-of-5" in facts
         assert "first to 3 wins" in facts
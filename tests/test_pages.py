@@ -41,6 +41,16 @@ async def app_client():
     await engine.dispose()
 
 
+@pytest.fixture
+def impact_previews():
+    """The shared preview service, enabled in-thread and reset afterwards."""
+    from pinwheel.core.impact_preview import impact_previews as service
+
+    service.configure(seeds=2, workers=0)
+    yield service
+    service.configure(seeds=0, workers=0)
+
+
 def _hooper_attrs():
     return {
         "scoring": 50,
@@ -187,6 +197,32 @@ class TestPopulatedPages:
         assert r.status_code == 200
         assert "Courtside Commentary" in r.text
 
+    async def test_game_detail_streams_play_by_play(self, app_client):
+        """The game page streams: flush markers are consumed, plays are narrated."""
+        client, engine = app_client
+        season_id, team_ids = await _seed_season(engine)
+
+        async with get_session(engine) as session:
+            repo = Repository(session)
+            games = await repo.get_games_for_round(season_id, 1)
+            game_id = games[0].id
+
+        r = await client.get(f"/games/{game_id}")
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("text/html")
+        assert "stream-flush" not in r.text
+        assert 'class="pbp-item"' in r.text
+        assert r.text.rstrip().endswith("</html>")
+
+    async def test_render_chunks_flushes_at_markers(self):
+        from pinwheel.api.pages import _render_chunks, _stream_env
+
+        template = _stream_env.from_string(
+            "head{{ stream_flush }}{% for x in xs %}{{ x }}{% endfor %}"
+        )
+        chunks = [c async for c in _render_chunks(template, {"xs": iter("abc")})]
+        assert chunks == ["head", "abc"]
+
     async def test_game_404(self, app_client):
         client, _ = app_client
         r = await client.get("/games/nonexistent")
@@ -1082,6 +1118,44 @@ class TestGovernancePhaseContext:
         assert r.status_code == 200
         assert "CHAMPIONSHIP" in r.text
 
+    async def test_governance_shows_simulated_impact(self, app_client, impact_previews):
+        """Open proposals get a background impact preview, shown once ready."""
+        client, engine = app_client
+        season_id, team_ids = await _seed_season(engine)
+        async with get_session(engine) as session:
+            repo = Repository(session)
+            await repo.append_event(
+                event_type="proposal.submitted",
+                aggregate_id="prop-1",
+                aggregate_type="proposal",
+                season_id=season_id,
+                governor_id="gov-1",
+                team_id=team_ids[0],
+                payload={
+                    "id": "prop-1",
+                    "raw_text": "Make three-pointers worth 5 points",
+                    "governor_id": "gov-1",
+                    "team_id": team_ids[0],
+                    "tier": 1,
+                    "status": "submitted",
+                    "interpretation": {
+                        "parameter": "three_point_value",
+                        "old_value": 3,
+                        "new_value": 5,
+                        "confidence": 0.9,
+                    },
+                },
+            )
+            await session.commit()
+
+        r = await client.get("/governance")
+        assert "Simulated Impact" not in r.text
+        await impact_previews.wait_idle()
+
+        r = await client.get("/governance")
+        assert "Simulated Impact" in r.text
+        assert "(round 2, 4 games)" in r.text
+
 
 class TestStandingsCallouts:
     """Tests for narrative callouts on the standings page."""
@@ -255,6 +255,43 @@ async def test_present_round_on_game_finished_callback():
     assert sorted(callback_indices) == [0, 1]
 
 
+@pytest.mark.asyncio
+async def test_slow_game_finished_callback_does_not_stall_other_games():
+    """A blocked callback for one game must not hold up the other timelines."""
+    other_finished = asyncio.Event()
+
+    class SignallingBus(MockEventBus):
+        async def publish(self, event_type: str, data: dict) -> int:
+            if event_type == "presentation.game_finished" and data["game_index"] == 1:
+                other_finished.set()
+            return await super().publish(event_type, data)
+
+    bus = SignallingBus()
+    state = PresentationState()
+    done: list[int] = []
+
+    async def slow_callback(game_index: int) -> None:
+        if game_index == 0:
+            await other_finished.wait()
+        done.append(game_index)
+
+    short = _make_game([_make_possession(quarter=1, home_score=2)])
+    await asyncio.wait_for(
+        present_round(
+            [short, _make_game()],
+            bus,
+            state,
+            quarter_replay_seconds=0.01,
+            on_game_finished=slow_callback,
+        ),
+        timeout=5,
+    )
+
+    assert sorted(done) == [0, 1]
+    assert bus.events[-1][0] == "presentation.round_finished"
+    assert not state.callback_tasks
+
+
 @pytest.mark.asyncio
 async def test_present_round_callback_error_does_not_break():
     """If on_game_finished raises, presentation should continue."""
@@ -556,3 +593,63 @@ async def test_possession_events_include_drama_metadata():
         assert "drama_level" in p[1]
         assert "drama_tags" in p[1]
         assert p[1]["drama_level"] in ("routine", "elevated", "high", "peak")
+
+
+@pytest.mark.asyncio
+async def test_merged_timeline_orders_games_deterministically():
+    """Same-time possessions across games are emitted in game-index order."""
+    bus = MockEventBus()
+    state = PresentationState()
+
+    games = [_make_game(), _make_game(), _make_game()]
+
+    await present_round(games, bus, state, quarter_replay_seconds=0.01)
+
+    possessions = [e[1]["game_index"] for e in bus.events if e[0] == "presentation.possession"]
+    assert possessions == [0, 1, 2, 0, 1, 2, 0, 1, 2]
+    starting = [e[1]["game_index"] for e in bus.events if e[0] == "presentation.game_starting"]
+    assert starting == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_merged_timeline_tick_batches_events():
+    """With a coarse tick, events from every game that land in one tick go out together."""
+    from pinwheel.core.presenter import _run_merged_timelines
+
+    state = PresentationState()
+    emitted: list[tuple[int, int]] = []
+
+    async def timeline(game_idx: int, delays: list[float]):
+        for step, delay in enumerate(delays):
+            emitted.append((game_idx, step))
+            yield delay
+
+    # Game 0 wants steps at 0.00 / 0.01 / 0.02; game 1 at 0.00 / 0.015.
+    # A 0.05s tick collapses all of them into two batches.
+    timelines = [timeline(0, [0.01, 0.01, 0.0]), timeline(1, [0.015, 0.0])]
+    await _run_merged_timelines(timelines, state, tick_seconds=0.05)
+
+    assert emitted == [(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)]
+
+
+@pytest.mark.asyncio
+async def test_merged_timeline_cancel_wakes_scheduler():
+    """Cancellation interrupts a long scheduler sleep promptly."""
+    from pinwheel.core.presenter import _run_merged_timelines
+
+    state = PresentationState()
+    steps: list[int] = []
+
+    async def slow_timeline():
+        steps.append(0)
+        yield 60.0
+        steps.append(1)
+
+    async def cancel_soon():
+        await asyncio.sleep(0.02)
+        state.cancel_event.set()
+
+    asyncio.create_task(cancel_soon())
+    await asyncio.wait_for(_run_merged_timelines([slow_timeline()], state), timeout=2.0)
+
+    assert steps == [0]
@@ -0,0 +1,138 @@
+"""Tests for layered, cache-ordered prompts (ai/prompt_prefix.py)."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import anthropic
+import pytest
+
+from pinwheel.ai.commentary import generate_highlight_reel
+from pinwheel.ai.prompt_prefix import LEAGUE_PRIMER, build_layered_prompt
+from pinwheel.ai.report import (
+    generate_governance_report,
+    generate_private_report,
+    generate_simulation_report,
+)
+from pinwheel.ai.usage import UsageTotals, cache_hit_rate
+from pinwheel.core.narrative import (
+    NarrativeContext,
+    build_bedrock_facts,
+    format_narrative_layers,
+)
+from pinwheel.models.rules import RuleSet
+
+
+def _narrative(round_number: int, leader_wins: int) -> NarrativeContext:
+    return NarrativeContext(
+        round_number=round_number,
+        total_rounds=9,
+        standings=[
+            {"team_id": "t1", "team_name": "Thorns", "wins": leader_wins, "losses": 0, "rank": 1},
+            {"team_id": "t2", "team_name": "Breakers", "wins": 0, "losses": leader_wins, "rank": 2},
+        ],
+        rules_narrative="Three Point Value set to 4 (changed Round 2)",
+        active_rule_changes=[{"parameter": "three_point_value", "round_enacted": 2}],
+        pending_proposals=round_number,
+        bedrock_facts=build_bedrock_facts(RuleSet(three_point_value=4)),
+    )
+
+
+class _Captured:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, object]] = []
+
+    async def create(self, **kwargs: object) -> object:
+        self.calls.append(kwargs)
+        return SimpleNamespace(
+            content=[SimpleNamespace(text="Fine. Done.")], stop_reason="end_turn"
+        )
+
+
+@pytest.fixture
+def captured(monkeypatch) -> _Captured:
+    messages = _Captured()
+
+    class _Client:
+        def __init__(self, api_key: str = "", **kwargs: object) -> None:
+            self.messages = messages
+
+    monkeypatch.setattr(anthropic, "AsyncAnthropic", _Client)
+    return messages
+
+
+class TestLayers:
+    def test_narrative_split_by_volatility(self):
+        season, round_ = format_narrative_layers(_narrative(3, 3))
+        assert "Three Point Value set to 4" in season
+        assert "Thorns" not in season
+        assert "Thorns" in round_
+        assert "3 proposal(s) pending" in round_
+        assert "LEAGUE FACTS" not in season + round_
+
+    def test_system_layers_ordered_with_one_breakpoint_each(self):
+        prompt = build_layered_prompt(
+            "PERSONA", narrative=_narrative(3, 3), round_context="ROUND DATA"
+        )
+        blocks = prompt.system_blocks()
+        assert [b["cache_control"] for b in blocks] == [{"type": "ephemeral"}] * 3
+        assert blocks[0]["text"].startswith(LEAGUE_PRIMER)
+        assert "3pt=4" in blocks[0]["text"]
+        assert "Three Point Value" in blocks[1]["text"]
+        assert blocks[2]["text"] == "PERSONA"
+        user = prompt.user_message("Go.")
+        assert user.startswith("Go.\n\nROUND DATA")
+        assert "Thorns" in user
+
+    def test_round_changes_leave_system_prefix_untouched(self):
+        early = build_layered_prompt("PERSONA", narrative=_narrative(3, 3))
+        later = build_layered_prompt("PERSONA", narrative=_narrative(4, 4))
+        assert early.system_blocks() == later.system_blocks()
+        assert early.user_message("Go.") != later.user_message("Go.")
+
+    def test_ruleset_supplies_facts_without_narrative(self):
+        prompt = build_layered_prompt("PERSONA", ruleset=RuleSet(shot_clock_seconds=20))
+        blocks = prompt.system_blocks()
+        assert len(blocks) == 2
+        assert "Shot clock: 20 seconds" in blocks[0]["text"]
+
+
+class TestSharedPrefixAcrossCallTypes:
+    async def test_reports_and_commentary_share_leading_layers(self, captured):
+        narrative = _narrative(3, 3)
+        round_data = {
+            "games": [
+                {"home_team": "Thorns", "away_team": "Breakers", "home_score": 50,
+                 "away_score": 40},
+            ]
+        }
+        await generate_simulation_report(round_data, "s1", 3, "k", narrative=narrative)
+        await generate_governance_report(
+            {"proposals": [], "votes": []}, "s1", 3, "k", narrative=narrative
+        )
+        await generate_private_report({"votes_cast": 1}, "gov-a", "s1", 3, "k",
+                                      narrative=narrative)
+        await generate_private_report({"votes_cast": 2}, "gov-b", "s1", 3, "k",
+                                      narrative=narrative)
+        await generate_highlight_reel(
+            [{"home_team": "Thorns", "away_team": "Breakers", "home_score": 50,
+              "away_score": 40}],
+            3, "k", narrative=narrative,
+        )
+
+        systems = [call["system"] for call in captured.calls]
+        # Bedrock and season layers are byte-identical for every call type.
+        assert all(s[:2] == systems[0][:2] for s in systems)
+        # Private reports differ only in the (uncached) user message.
+        assert systems[2] == systems[3]
+        private_user = captured.calls[2]["messages"][0]["content"]
+        assert "gov-a" in private_user
+        assert "gov-a" not in str(systems[2])
+
+
+class TestHitRate:
+    def test_hit_rate_counts_every_prompt_token(self):
+        assert cache_hit_rate(0, 0) == 0.0
+        assert cache_hit_rate(100, 300, 100) == pytest.approx(0.6)
+        totals = UsageTotals(input_tokens=250, cache_read_tokens=750)
+        assert totals.cache_hit_rate == pytest.approx(0.75)
@@ -2398,7 +2398,7 @@ class _ReportFailingMessages:
 
 
 class _ReportFailingClient:
-    def __init__(self, api_key: str = "") -> None:
+    def __init__(self, api_key: str = "", **kwargs: object) -> None:
         self.messages = _ReportFailingMessages()
 
 
@@ -2453,7 +2453,7 @@ class TestSimulationReportGeneration:
         captured = _ReportCapturedMessages()
 
         class _Client:
-            def __init__(self, api_key: str = "") -> None:
+            def __init__(self, api_key: str = "", **kwargs: object) -> None:
                 self.messages = captured
 
         monkeypatch.setattr(anthropic, "AsyncAnthropic", _Client)
@@ -0,0 +1,139 @@
+"""Tests for the content-addressed AI response cache (ai/response_cache.py).
+
+All tests mock the Anthropic API — no real API calls are made.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pinwheel.ai.classifier import classify_injection
+from pinwheel.ai.response_cache import (
+    cached_create,
+    request_key,
+    resolve_cache_path,
+    response_cache,
+)
+
+
+def _response(text: str) -> MagicMock:
+    block = MagicMock()
+    block.text = text
+    response = MagicMock()
+    response.content = [block]
+    response.stop_reason = "end_turn"
+    response.model = "claude-test"
+    return response
+
+
+def _client(*texts: str) -> AsyncMock:
+    client = AsyncMock()
+    client.messages.create = AsyncMock(side_effect=[_response(t) for t in texts])
+    return client
+
+
+@pytest.fixture
+def cache(tmp_path):
+    response_cache.configure(path=str(tmp_path / "cache.db"))
+    yield response_cache
+    response_cache.configure(path=None)
+
+
+REQUEST = {
+    "model": "claude-test",
+    "max_tokens": 100,
+    "system": "be brief",
+    "messages": [{"role": "user", "content": "hi"}],
+}
+
+
+class TestCachedCreate:
+    async def test_disabled_cache_passes_through(self):
+        client = _client("a", "b")
+        first = await cached_create(client, "report", **REQUEST)
+        second = await cached_create(client, "report", **REQUEST)
+        assert first.content[0].text == "a"
+        assert second.content[0].text == "b"
+
+    async def test_identical_request_served_from_cache(self, cache):
+        client = _client("fresh", "unused")
+        first = await cached_create(client, "report", **REQUEST)
+        second = await cached_create(client, "report", **REQUEST)
+        assert first.content[0].text == "fresh"
+        assert second.content[0].text == "fresh"
+        assert second.stop_reason == "end_turn"
+        # A hit reports no usage, so it is recorded at zero token cost.
+        assert second.usage is None
+        assert client.messages.create.await_count == 1
+
+    async def test_any_change_is_a_miss(self, cache):
+        client = _client("a", "b")
+        await cached_create(client, "report", **REQUEST)
+        changed = {**REQUEST, "system": "be verbose"}
+        assert request_key(changed) != request_key(REQUEST)
+        result = await cached_create(client, "report", **changed)
+        assert result.content[0].text == "b"
+
+    async def test_bypass_forces_fresh_call_and_refreshes(self, cache):
+        client = _client("old", "new")
+        await cached_create(client, "report", **REQUEST)
+        fresh = await cached_create(client, "report", bypass=True, **REQUEST)
+        assert fresh.content[0].text == "new"
+        cached = await cached_create(client, "report", **REQUEST)
+        assert cached.content[0].text == "new"
+
+    async def test_invalid_response_not_cached(self, cache):
+        client = _client("not json", '{"ok": true}')
+        await cached_create(client, "classifier", validate=json.loads, **REQUEST)
+        second = await cached_create(client, "classifier", validate=json.loads, **REQUEST)
+        assert second.content[0].text == '{"ok": true}'
+        assert client.messages.create.await_count == 2
+
+    async def test_ttl_expiry(self, cache, monkeypatch):
+        client = _client("a", "b")
+        await cached_create(client, "report", **REQUEST)
+        monkeypatch.setattr(cache, "ttl_seconds", -1)
+        result = await cached_create(client, "report", **REQUEST)
+        assert result.content[0].text == "b"
+
+    async def test_size_bound_evicts_least_recently_used(self, cache, monkeypatch):
+        client = _client("x" * 100, "y" * 100, "z" * 100)
+        first = {**REQUEST, "messages": [{"role": "user", "content": "1"}]}
+        second = {**REQUEST, "messages": [{"role": "user", "content": "2"}]}
+        third = {**REQUEST, "messages": [{"role": "user", "content": "3"}]}
+        await cached_create(client, "report", **first)
+        await cached_create(client, "report", **second)
+        # Room for roughly two entries.
+        monkeypatch.setattr(cache, "max_bytes", 350)
+        await cached_create(client, "report", **third)
+        assert await cache.get(request_key(first)) is None
+        assert await cache.get(request_key(second)) is not None
+        assert await cache.get(request_key(third)) is not None
+
+
+class TestWrappedCallSites:
+    async def test_classifier_repeat_is_a_cache_hit(self, cache):
+        payload = json.dumps(
+            {"classification": "legitimate", "confidence": 0.9, "reason": "rule change"}
+        )
+        client = _client(payload)
+        with patch("pinwheel.ai.classifier._get_client", return_value=client):
+            first = await classify_injection("Make threes worth 4", "fake-key")
+            second = await classify_injection("Make threes worth 4", "fake-key")
+        assert first == second
+        assert client.messages.create.await_count == 1
+
+
+class TestResolvePath:
+    def test_defaults_next_to_sqlite_database(self):
+        path = resolve_cache_path("", "sqlite+aiosqlite:////data/pinwheel.db")
+        assert path == "/data/ai_response_cache.db"
+
+    def test_disabled_for_memory_and_off(self):
+        assert resolve_cache_path("", "sqlite+aiosqlite:///:memory:") is None
+        assert resolve_cache_path("", "postgresql+asyncpg://u@h/db") is None
+        assert resolve_cache_path("off", "sqlite+aiosqlite:///x.db") is None
+        assert resolve_cache_path("/tmp/c.db", "sqlite+aiosqlite:///x.db") == "/tmp/c.db"
@@ -1,5 +1,6 @@
 """Tests for the scheduler_runner tick_round function."""
 
+import asyncio
 import json
 import logging
 from datetime import UTC, datetime, timedelta
@@ -17,6 +18,7 @@ from pinwheel.core.scheduler_runner import (
     _clear_presentation_state,
     _persist_presentation_start,
     _release_tick_lock,
+    _ReportSchedule,
     _try_acquire_tick_lock,
     resume_presentation,
     tick_round,
@@ -509,7 +511,7 @@ class TestMultisessionLockRelease:
 
         original_phase_ai = real_phase_ai
 
-        async def phase_ai_with_concurrent_write(sim, api_key=""):
+        async def phase_ai_with_concurrent_write(sim, api_key="", **kwargs):
             nonlocal concurrent_write_succeeded
             # While AI phase is running (no DB session held),
             # try a concurrent DB write to prove the lock is released
@@ -522,7 +524,7 @@ class TestMultisessionLockRelease:
             except Exception:
                 concurrent_write_succeeded = False
 
-            return await original_phase_ai(sim, api_key)
+            return await original_phase_ai(sim, api_key, **kwargs)
 
         with unittest.mock.patch(
             "pinwheel.core.game_loop._phase_ai",
@@ -536,6 +538,162 @@ class TestMultisessionLockRelease:
         )
 
 
+class TestPipelinedRounds:
+    """Pipelined replay starts presenting before the AI phase finishes."""
+
+    async def _wait_for_presentation(self, engine: AsyncEngine, state: PresentationState):
+        for _ in range(200):
+            async with get_session(engine) as session:
+                active = await Repository(session).get_bot_state(PRESENTATION_STATE_KEY)
+            if not state.is_active and active is None:
+                return
+            await asyncio.sleep(0.05)
+        raise AssertionError("presentation did not finish")
+
+    async def test_presentation_overlaps_ai_phase(self, engine: AsyncEngine):
+        import unittest.mock
+
+        from pinwheel.core.game_loop import _phase_ai as real_phase_ai
+
+        await _setup_season(engine)
+        event_bus = EventBus()
+        state = PresentationState()
+        seen_during_ai: list[str | None] = []
+
+        async def slow_phase_ai(sim, api_key="", **kwargs):
+            # Let the presentation task get going before the AI "finishes"
+            await asyncio.sleep(0.1)
+            async with get_session(engine) as session:
+                seen_during_ai.append(
+                    await Repository(session).get_bot_state(PRESENTATION_STATE_KEY)
+                )
+            return await real_phase_ai(sim, api_key, **kwargs)
+
+        received: list[dict] = []
+        # Drained only after the tick, so the queue must hold the whole round
+        async with event_bus.subscribe(None, max_size=10_000) as sub:
+            with unittest.mock.patch(
+                "pinwheel.core.game_loop._phase_ai", side_effect=slow_phase_ai
+            ):
+                await tick_round(
+                    engine,
+                    event_bus,
+                    presentation_state=state,
+                    presentation_mode="replay",
+                    quarter_replay_seconds=0,
+                    pipelined_rounds=True,
+                )
+            await self._wait_for_presentation(engine, state)
+            while (event := await sub.get(timeout=0.1)) is not None:
+                received.append(event)
+
+        assert seen_during_ai and seen_during_ai[0] is not None
+        types = [e["type"] for e in received]
+        assert "report.generated" in types
+        assert types.index("presentation.round_finished") < types.index("report.generated")
+
+    async def test_failed_round_still_ends_presentation(self, engine: AsyncEngine):
+        import unittest.mock
+
+        await _setup_season(engine)
+        event_bus = EventBus()
+        state = PresentationState()
+
+        async def failing_phase_ai(sim, api_key="", **kwargs):
+            raise RuntimeError("boom")
+
+        async with event_bus.subscribe(None, max_size=10_000) as sub:
+            with unittest.mock.patch(
+                "pinwheel.core.game_loop._phase_ai", side_effect=failing_phase_ai
+            ):
+                await tick_round(
+                    engine,
+                    event_bus,
+                    presentation_state=state,
+                    presentation_mode="replay",
+                    quarter_replay_seconds=0,
+                    pipelined_rounds=True,
+                )
+            await self._wait_for_presentation(engine, state)
+            types = []
+            while (event := await sub.get(timeout=0.1)) is not None:
+                types.append(event["type"])
+
+        assert "presentation.round_finished" in types
+        assert "report.generated" not in types
+
+
+    async def test_reports_publish_when_replay_reaches_their_game(self):
+        from types import SimpleNamespace
+
+        event_bus = EventBus()
+        games = [
+            SimpleNamespace(home_team_id="a", away_team_id="b"),
+            SimpleNamespace(home_team_id="c", away_team_id="d"),
+        ]
+        schedule = _ReportSchedule(event_bus, games)
+        round_report = {"report_type": "simulation", "round": 3}
+        series_ab = {"report_type": "series", "winner_id": "b", "loser_id": "a"}
+        series_cd = {"report_type": "series", "winner_id": "c", "loser_id": "d"}
+
+        published: list[dict] = []
+
+        async def drain(sub) -> None:
+            while (event := await sub.get(timeout=0.05)) is not None:
+                published.append(event["data"])
+
+        async with event_bus.subscribe("report.generated") as sub:
+            # Game 1 finishes before the AI phase hands over its reports
+            await schedule.game_finished(1)
+            await schedule.add([round_report, series_ab, series_cd])
+            await drain(sub)
+            assert published == [series_cd]
+
+            await schedule.game_finished(0)
+            await drain(sub)
+            assert published == [series_cd, series_ab]
+
+            await schedule.round_finished()
+            await drain(sub)
+            assert published == [series_cd, series_ab, round_report]
+
+    async def test_commentary_held_until_its_game_is_presented(self):
+        from types import SimpleNamespace
+
+        event_bus = EventBus()
+        games = [
+            SimpleNamespace(home_team_id="a", away_team_id="b"),
+            SimpleNamespace(home_team_id="c", away_team_id="d"),
+        ]
+        schedule = _ReportSchedule(event_bus, games)
+
+        def partial(game_index: int, text: str) -> dict:
+            return {"game_index": game_index, "commentary": text, "final": False}
+
+        published: list[tuple[int, str]] = []
+
+        async def drain(sub) -> None:
+            while (event := await sub.get(timeout=0.05)) is not None:
+                published.append((event["data"]["game_index"], event["data"]["commentary"]))
+
+        async with event_bus.subscribe("game.commentary") as sub:
+            await schedule.add_commentary(partial(0, "One."))
+            await schedule.add_commentary(partial(0, "One. Two."))
+            await drain(sub)
+            assert published == []
+
+            # Only the latest text goes out when the game is shown, then it streams
+            await schedule.game_finished(0)
+            await schedule.add_commentary(partial(0, "One. Two. Three."))
+            await schedule.add_commentary(partial(1, "Other."))
+            await drain(sub)
+            assert published == [(0, "One. Two."), (0, "One. Two. Three.")]
+
+            await schedule.round_finished()
+            await drain(sub)
+            assert published[-1] == (1, "Other.")
+
+
 class TestTickRoundLock:
     """Verify the distributed tick_round lock prevents duplicate execution."""
 
@@ -335,3 +335,116 @@ class TestArchivePages:
         client, _ = app_client
         r = await client.get("/seasons/archive/nonexistent")
         assert r.status_code == 404
+
+
+class TestLogCompaction:
+    """archive_season moves log rows into compressed archives; reads still see them."""
+
+    async def _hot_count(self, repo: Repository, model, season_id: str) -> int:
+        from sqlalchemy import func, select
+
+        stmt = select(func.count()).select_from(model).where(model.season_id == season_id)
+        return (await repo.session.execute(stmt)).scalar_one()
+
+    async def test_archive_compacts_logs_and_reads_fall_back(self, repo: Repository):
+        from pinwheel.db.models import GovernanceEventRow, ReportRow
+
+        season_id, _ = await _seed_season_with_games(repo)
+        await repo.append_event(
+            event_type="proposal.submitted",
+            aggregate_id="p-1",
+            aggregate_type="proposal",
+            season_id=season_id,
+            payload={"id": "p-1", "raw_text": "faster games"},
+            governor_id="gov-1",
+        )
+        before_reports = [r.id for r in await repo.get_public_reports_for_season(season_id)]
+        before_round = [r.id for r in await repo.get_reports_for_round(season_id, 1)]
+        assert before_reports
+
+        await archive_season(repo, season_id)
+
+        assert await self._hot_count(repo, ReportRow, season_id) == 0
+        assert await self._hot_count(repo, GovernanceEventRow, season_id) == 0
+        assert await repo.has_log_archive(season_id)
+
+        after_reports = [r.id for r in await repo.get_public_reports_for_season(season_id)]
+        assert after_reports == before_reports
+        after_round = [r.id for r in await repo.get_reports_for_round(season_id, 1)]
+        assert sorted(after_round) == sorted(before_round)
+        assert set(await repo.get_report_ids(season_id, round_number=1)) == set(before_round)
+
+        proposals = await repo.get_all_proposals(season_id)
+        assert [p["id"] for p in proposals] == ["p-1"]
+        events = await repo.get_events_by_type_and_governor(
+            season_id, "gov-1", ["proposal.submitted"], proposal_ids=["p-1"]
+        )
+        assert events[0].payload["raw_text"] == "faster games"
+
+    async def test_recompaction_merges_late_rows(self, repo: Repository):
+        season_id, _ = await _seed_season_with_games(repo)
+        await archive_season(repo, season_id)
+        archived = len(await repo.get_archived_log_rows(season_id, "reports"))
+
+        await repo.store_report(season_id, "series", 99, "late recap")
+        assert len(await repo.get_series_reports(season_id)) >= 1
+
+        moved = await repo.compact_season_logs(season_id)
+        assert moved == {"reports": 1}
+        assert len(await repo.get_archived_log_rows(season_id, "reports")) == archived + 1
+        latest = await repo.get_latest_report(season_id, "series")
+        assert latest is not None and latest.content == "late recap"
+
+    async def test_aggregate_events_include_archived(self, repo: Repository):
+        season_id, _ = await _seed_season_with_games(repo)
+        await repo.append_event(
+            event_type="proposal.submitted",
+            aggregate_id="p-1",
+            aggregate_type="proposal",
+            season_id=season_id,
+            payload={"id": "p-1", "raw_text": "faster games"},
+            governor_id="gov-1",
+        )
+        await archive_season(repo, season_id)
+
+        for scoped in (None, season_id):
+            events = await repo.get_events_for_aggregate("proposal", "p-1", season_id=scoped)
+            assert [e.event_type for e in events] == ["proposal.submitted"]
+
+    async def test_appends_after_compaction_keep_sequence_order(self, repo: Repository):
+        season_id, _ = await _seed_season_with_games(repo)
+        archived = await repo.append_event(
+            event_type="proposal.submitted",
+            aggregate_id="p-1",
+            aggregate_type="proposal",
+            season_id=season_id,
+            payload={"id": "p-1"},
+        )
+        await archive_season(repo, season_id)
+
+        later = await repo.append_event(
+            event_type="proposal.confirmed",
+            aggregate_id="p-1",
+            aggregate_type="proposal",
+            season_id=season_id,
+            payload={"proposal_id": "p-1"},
+        )
+        assert later.sequence_number > archived.sequence_number
+        events = await repo.get_events_for_aggregate("proposal", "p-1")
+        assert [e.event_type for e in events] == ["proposal.submitted", "proposal.confirmed"]
+
+    async def test_compaction_elsewhere_seen_after_refresh(self, repo: Repository, monkeypatch):
+        from pinwheel.db.log_archive import log_archives
+
+        season_id, _ = await _seed_season_with_games(repo)
+        before = [r.id for r in await repo.get_public_reports_for_season(season_id)]
+        await repo.compact_season_logs(season_id)
+
+        # The index another process loaded before the compaction ran
+        log_archives.load({})
+        monkeypatch.setattr(log_archives, "refresh_seconds", 3600.0)
+        assert not await repo.has_log_archive(season_id)
+
+        monkeypatch.setattr(log_archives, "refresh_seconds", 0.0)
+        assert await repo.has_log_archive(season_id)
+        assert [r.id for r in await repo.get_public_reports_for_season(season_id)] == before
@@ -0,0 +1,124 @@
+"""Tests for the near-duplicate proposal interpretation index."""
+
+import pytest
+
+from pinwheel.ai.similar_proposals import (
+    ProposalSimilarityIndex,
+    interpretation_from_payload,
+    normalize_proposal_text,
+)
+from pinwheel.db.engine import create_engine, get_session
+from pinwheel.db.models import Base
+from pinwheel.db.repository import Repository
+from pinwheel.models.governance import EffectSpec, ProposalInterpretation
+from pinwheel.models.rules import DEFAULT_RULESET, RuleSet
+
+
+def _threes_worth(value: int) -> ProposalInterpretation:
+    return ProposalInterpretation(
+        effects=[
+            EffectSpec(
+                effect_type="parameter_change",
+                parameter="three_point_value",
+                new_value=value,
+                old_value=3,
+                description=f"Three-pointers worth {value}",
+            )
+        ],
+        impact_analysis=f"Threes become worth {value}.",
+        confidence=0.95,
+    )
+
+
+@pytest.fixture
+async def engine():
+    eng = create_engine("sqlite+aiosqlite:///:memory:")
+    async with eng.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield eng
+    await eng.dispose()
+
+
+class TestNormalization:
+    def test_synonyms_and_filler_collapse(self):
+        assert normalize_proposal_text("Make threes worth 4") == "three 4"
+        assert normalize_proposal_text("3 pointers = 4 points") == "three 4"
+        assert normalize_proposal_text("Three-pointers should be worth four points!") == (
+            "three 4"
+        )
+
+
+class TestFind:
+    def test_exact_and_near_duplicates_match(self):
+        index = ProposalSimilarityIndex()
+        index.add("s1", "p1", "Make three pointers worth 4 points", _threes_worth(4))
+        exact = index.find("s1", "3 pointers = 4 points")
+        assert exact is not None
+        assert exact.proposal_id == "p1"
+        assert exact.similarity == 1.0
+
+        index.add(
+            "s1", "p2", "Shot clock should be 20 seconds during the elam ending", _threes_worth(4)
+        )
+        near = index.find("s1", "shot clock is 20 seconds during elam endings")
+        assert near is not None
+        assert near.proposal_id == "p2"
+        assert 0.8 <= near.similarity < 1.0
+
+    def test_different_numbers_or_direction_never_match(self):
+        index = ProposalSimilarityIndex()
+        index.add("s1", "p1", "Make threes worth 4", _threes_worth(4))
+        index.add("s1", "p2", "increase the shot clock by 5 seconds", _threes_worth(4))
+        assert index.find("s1", "Make threes worth 5") is None
+        assert index.find("s1", "decrease the shot clock by 5 seconds") is None
+        assert index.find("s1", "something else entirely") is None
+        assert index.find("other-season", "Make threes worth 4") is None
+
+
+class TestPayloads:
+    def test_only_confident_unflagged_v2_payloads_indexed(self):
+        effects = [e.model_dump(mode="json") for e in _threes_worth(4).effects]
+        good = {"raw_text": "x", "effects_v2": effects, "interpretation_v2_confidence": 0.9}
+        assert interpretation_from_payload(good) is not None
+        assert interpretation_from_payload({**good, "interpretation_v2_confidence": 0.4}) is None
+        assert interpretation_from_payload({**good, "effects_v2": []}) is None
+        assert interpretation_from_payload({**good, "proposal_type": "repeal"}) is None
+        flagged = {**good, "interpretation": {"injection_flagged": True}}
+        assert interpretation_from_payload(flagged) is None
+
+
+class TestLookupFromEventLog:
+    async def test_lookup_builds_from_submitted_events_incrementally(self, engine):
+        index = ProposalSimilarityIndex()
+        effects = [e.model_dump(mode="json") for e in _threes_worth(4).effects]
+        async with get_session(engine) as session:
+            repo = Repository(session)
+            league = await repo.create_league("L")
+            season = await repo.create_season(
+                league.id, "S1", starting_ruleset=DEFAULT_RULESET.model_dump()
+            )
+            ruleset = RuleSet(**{**DEFAULT_RULESET.model_dump(), "three_point_value": 5})
+            assert await index.lookup(repo, season.id, "threes worth 4", ruleset) is None
+
+            await repo.append_event(
+                event_type="proposal.submitted",
+                aggregate_id="p-1",
+                aggregate_type="proposal",
+                season_id=season.id,
+                payload={
+                    "id": "p-1",
+                    "raw_text": "Make threes worth 4",
+                    "effects_v2": effects,
+                    "interpretation_v2_confidence": 0.9,
+                    "interpretation_v2_impact": "Threes become worth 4.",
+                },
+            )
+            match = await index.lookup(repo, season.id, "3 pointers = 4 points", ruleset)
+
+        assert match is not None
+        assert match.proposal_id == "p-1"
+        reused = match.interpretation
+        assert reused.original_text_echo == "3 pointers = 4 points"
+        # old_value reflects the current ruleset, not the one at submission time.
+        assert reused.effects[0].old_value == 5
+        assert reused.effects[0].new_value == 4
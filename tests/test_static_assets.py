@@ -0,0 +1,141 @@
+"""Tests for fingerprinted, precompressed static asset serving."""
+
+import gzip
+import json
+import os
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from pinwheel.api.static_assets import (
+    CACHE_IMMUTABLE,
+    CACHE_REVALIDATE,
+    MANIFEST_NAME,
+    AssetManifest,
+    FingerprintedStaticFiles,
+    _accepted_encodings,
+    build_static_assets,
+    fingerprint_path,
+    make_templates,
+    split_fingerprint,
+    static_url,
+)
+
+CSS = "body { color: red; }\n" * 200
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "site.css").write_text(CSS)
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG not really")
+    return tmp_path
+
+
+def _client(static_dir) -> AsyncClient:
+    manifest = AssetManifest(static_dir)
+    app = Starlette(
+        routes=[
+            Mount(
+                "/static",
+                FingerprintedStaticFiles(directory=str(static_dir), manifest=manifest),
+            )
+        ]
+    )
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+class TestFingerprintNames:
+    def test_roundtrip(self):
+        name = fingerprint_path("css/site.css", "0123456789ab")
+        assert name == "css/site.0123456789ab.css"
+        assert split_fingerprint(name) == ("css/site.css", "0123456789ab")
+
+    def test_plain_name_is_not_fingerprinted(self):
+        assert split_fingerprint("js/htmx.min.js") == ("js/htmx.min.js", None)
+
+    def test_accept_encoding_parsing(self):
+        assert _accepted_encodings("gzip, deflate, br") == {"gzip", "deflate", "br"}
+        assert _accepted_encodings("br;q=0, gzip;q=0.5") == {"gzip"}
+        assert _accepted_encodings("") == set()
+
+
+class TestBuild:
+    def test_build_writes_manifest_and_gzip(self, static_dir):
+        manifest = build_static_assets(static_dir)
+        assert set(manifest) == {"css/site.css", "logo.png"}
+        assert json.loads((static_dir / MANIFEST_NAME).read_text()) == manifest
+
+        gz = static_dir / "css" / "site.css.gz"
+        assert gzip.decompress(gz.read_bytes()).decode() == CSS
+        # Binary assets are not compressed.
+        assert not (static_dir / "logo.png.gz").exists()
+
+        # Rebuilding does not pick up its own outputs.
+        assert build_static_assets(static_dir) == manifest
+
+    def test_dev_manifest_rehashes_on_change(self, static_dir):
+        manifest = AssetManifest(static_dir)
+        first = manifest.url("css/site.css")
+        assert first.startswith("/static/css/site.") and first.endswith(".css")
+        css = static_dir / "css" / "site.css"
+        css.write_text(CSS + "a {}\n")
+        stat = css.stat()
+        os.utime(css, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert manifest.url("css/site.css") != first
+
+    def test_unknown_asset_falls_back_to_plain_url(self, static_dir):
+        assert AssetManifest(static_dir).url("missing.js") == "/static/missing.js"
+
+    def test_static_url_for_project_assets(self):
+        url = static_url("css/pinwheel.css")
+        assert url.startswith("/static/css/pinwheel.")
+        assert split_fingerprint(url.removeprefix("/static/"))[1] is not None
+
+    def test_make_templates_registers_static_url(self):
+        env = make_templates().env
+        assert env.globals["static_url"] is static_url
+        rendered = env.from_string("{{ static_url('css/pinwheel.css') }}").render()
+        assert rendered == static_url("css/pinwheel.css")
+
+
+class TestServing:
+    async def test_fingerprinted_url_is_immutable(self, static_dir):
+        url = AssetManifest(static_dir).url("css/site.css")
+        async with _client(static_dir) as client:
+            resp = await client.get(url, headers={"Accept-Encoding": "identity"})
+            assert resp.status_code == 200
+            assert resp.text == CSS
+            assert resp.headers["cache-control"] == CACHE_IMMUTABLE
+            assert resp.headers["vary"] == "Accept-Encoding"
+
+    async def test_plain_and_stale_urls_revalidate(self, static_dir):
+        async with _client(static_dir) as client:
+            resp = await client.get("/static/css/site.css")
+            assert resp.status_code == 200
+            assert resp.headers["cache-control"] == CACHE_REVALIDATE
+
+            resp = await client.get("/static/css/site.000000000000.css")
+            assert resp.status_code == 200
+            assert resp.headers["cache-control"] == CACHE_REVALIDATE
+
+    async def test_gzip_variant_served_when_accepted(self, static_dir):
+        build_static_assets(static_dir)
+        async with _client(static_dir) as client:
+            resp = await client.get("/static/css/site.css", headers={"Accept-Encoding": "gzip"})
+            assert resp.status_code == 200
+            assert resp.headers["content-encoding"] == "gzip"
+            assert resp.headers["content-type"].startswith("text/css")
+            # httpx transparently decodes the body.
+            assert resp.text == CSS
+
+            resp = await client.get("/static/css/site.css", headers={"Accept-Encoding": "identity"})
+            assert "content-encoding" not in resp.headers
+            assert resp.text == CSS
+
+    async def test_missing_asset_404(self, static_dir):
+        async with _client(static_dir) as client:
+            resp = await client.get("/static/nope.css")
+            assert resp.status_code == 404
@@ -0,0 +1,130 @@
+"""Tests for the Anthropic-compatible stub LLM server used for load tests."""
+
+from __future__ import annotations
+
+import random
+import statistics
+
+import anthropic
+import pytest
+
+from pinwheel.ai.client import AIClientManager, ai_clients
+from pinwheel.ai.stub_server import StubConfig, serve_stub
+from pinwheel.core.game_loop import step_round
+from pinwheel.db.engine import create_engine, get_session
+from pinwheel.db.models import Base
+from pinwheel.db.repository import Repository
+
+_FAST = StubConfig(latency="fixed", latency_p50_ms=0, stream_tokens_per_second=0)
+
+
+def _request(text: str = "Describe the round.") -> dict:
+    return {
+        "model": "stub-model",
+        "max_tokens": 200,
+        "system": [
+            {"type": "text", "text": "League primer. " * 40, "cache_control": {"type": "ephemeral"}}
+        ],
+        "messages": [{"role": "user", "content": text}],
+    }
+
+
+class TestLatency:
+    @pytest.mark.parametrize("distribution", ["uniform", "lognormal"])
+    def test_samples_match_median_and_p95(self, distribution):
+        config = StubConfig(latency=distribution, latency_p50_ms=100, latency_p95_ms=400)
+        rng = random.Random(7)
+        samples = sorted(config.sample_latency_ms(rng) for _ in range(4000))
+        assert statistics.median(samples) == pytest.approx(100, rel=0.1)
+        assert samples[int(0.95 * len(samples))] == pytest.approx(400, rel=0.1)
+
+    def test_unknown_distribution_rejected(self):
+        with pytest.raises(ValueError):
+            StubConfig(latency="bimodal")
+
+
+class TestServer:
+    async def test_create_is_deterministic_and_reports_cache_usage(self):
+        manager = AIClientManager()
+        async with serve_stub(_FAST) as (base_url, stub):
+            manager.configure(max_concurrency=4, base_url=base_url)
+            client = manager.client("stub-key", "report")
+            first = await client.messages.create(**_request())
+            second = await client.messages.create(**_request())
+            other = await client.messages.create(**_request("Something else."))
+            await manager.aclose()
+
+        assert first.content[0].text == second.content[0].text
+        assert other.content[0].text != first.content[0].text
+        assert first.usage.cache_creation_input_tokens > 0
+        assert second.usage.cache_read_input_tokens == first.usage.cache_creation_input_tokens
+        assert stub.stats.requests == 3
+
+    async def test_stream_matches_create(self):
+        manager = AIClientManager()
+        async with serve_stub(_FAST) as (base_url, stub):
+            manager.configure(max_concurrency=4, base_url=base_url)
+            client = manager.client("stub-key", "commentary")
+            created = await client.messages.create(**_request())
+            async with client.messages.stream(**_request()) as stream:
+                chunks = [text async for text in stream.text_stream]
+                final = await stream.get_final_message()
+            await manager.aclose()
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == created.content[0].text
+        assert final.usage.output_tokens == created.usage.output_tokens
+        assert stub.stats.streamed == 1
+
+    async def test_injected_faults_surface_as_sdk_errors(self):
+        manager = AIClientManager()
+        limited = StubConfig(latency="fixed", latency_p50_ms=0, rate_limit_rate=1.0)
+        async with serve_stub(limited) as (base_url, stub):
+            manager.configure(max_concurrency=4, base_url=base_url)
+            # The interpreter profile has no SDK retries, so the 429 escapes.
+            with pytest.raises(anthropic.RateLimitError):
+                await manager.client("stub-key", "interpreter").messages.create(**_request())
+            await manager.aclose()
+        assert stub.stats.rate_limited == 1
+
+        overloaded = StubConfig(
+            latency="fixed", latency_p50_ms=0, overload_rate=1.0, retry_after_seconds=0
+        )
+        async with serve_stub(overloaded) as (base_url, stub):
+            manager.configure(max_concurrency=4, base_url=base_url)
+            with pytest.raises(anthropic.APIStatusError) as excinfo:
+                await manager.client("stub-key", "report").messages.create(**_request())
+            await manager.aclose()
+        assert excinfo.value.status_code == 529
+        assert stub.stats.overloaded == 3  # first try plus two SDK retries
+
+
+async def test_step_round_runs_real_ai_path_against_stub():
+    from tests.test_scheduler_runner import _setup_season
+
+    engine = create_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    season_id = await _setup_season(engine)
+
+    max_concurrency = ai_clients.max_concurrency
+    try:
+        async with serve_stub(_FAST) as (base_url, stub):
+            ai_clients.configure(max_concurrency=max_concurrency, base_url=base_url)
+            async with get_session(engine) as session:
+                result = await step_round(Repository(session), season_id, 1, api_key="stub-key")
+    finally:
+        await ai_clients.aclose()
+        ai_clients.configure(max_concurrency=max_concurrency)
+        await engine.dispose()
+
+    # Commentary per game, highlight reel, simulation and governance reports
+    assert stub.stats.requests >= len(result.games) + 3
+    sim_report = next(r for r in result.reports if r.report_type == "simulation")
+    assert sim_report.content.endswith(".")
+    assert set(result.phase_timings_ms) == {
+        "simulate_and_govern",
+        "ai_generation",
+        "persist_and_finalize",
+        "total",
+    }
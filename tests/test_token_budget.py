@@ -0,0 +1,138 @@
+"""Tests for token estimation and per-call-type context budgets."""
+
+from __future__ import annotations
+
+import json
+import logging
+
+from pinwheel.ai.commentary import _build_game_context
+from pinwheel.ai.report import PRIVATE_CONTEXT_PRIORITIES, fit_system_context
+from pinwheel.ai.token_budget import (
+    CALL_BUDGETS,
+    LIST_FLOOR,
+    REQUIRED,
+    Section,
+    estimate_tokens,
+    fit_mapping,
+    fit_sections,
+)
+from pinwheel.core.narrative import NarrativeContext
+from pinwheel.models.rules import RuleSet
+from tests.test_commentary import _make_away_team, _make_game_result, _make_home_team
+
+
+class TestEstimate:
+    def test_counts_words_numbers_punctuation_and_indentation(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("the shot clock") == 3
+        assert estimate_tokens("score 102-98") == 4
+        assert estimate_tokens('{\n  "a": 1\n}') == 9
+        # Long words cost more than one token
+        assert estimate_tokens("counterintuitively") > 1
+
+    def test_tracks_character_heuristic_on_real_context(self):
+        home, away = _make_home_team(), _make_away_team()
+        text = _build_game_context(_make_game_result(), home, away, RuleSet())
+        assert 0.6 < estimate_tokens(text) / (len(text) / 4) < 1.6
+
+
+class TestFitSections:
+    def test_under_budget_is_plain_join(self):
+        sections = [Section("a", "alpha"), Section("b", "beta", 3)]
+        assert fit_sections(sections, "commentary") == "alpha\nbeta"
+
+    def test_drops_lowest_priority_then_latest_first(self, caplog):
+        filler = "word " * 50
+        sections = [
+            Section("header", "header", REQUIRED),
+            Section("chains_early", filler, 4),
+            Section("box", filler, 1),
+            Section("chains_late", filler, 4),
+            Section("drama", filler, 3),
+        ]
+        with caplog.at_level(logging.INFO, logger="pinwheel.ai.token_budget"):
+            text = fit_sections(sections, "commentary", budget=120)
+        assert text == "\n".join(["header", filler, filler])
+        assert "trimmed=chains_early,chains_late" in caplog.text
+
+    def test_required_sections_survive_an_impossible_budget(self):
+        sections = [Section("header", "keep me", REQUIRED), Section("x", "drop me", 1)]
+        assert fit_sections(sections, "commentary", budget=1) == "keep me"
+
+
+class TestFitMapping:
+    def test_lists_cut_to_recent_before_keys_are_dropped(self, caplog):
+        data = {
+            "governor_id": "gov-1",
+            "voting_outcomes": [
+                {"proposal_text": f"proposal {i}", "vote": "yes"} for i in range(40)
+            ],
+            "league_proposal_categories": {"scoring": 12, "pace": 4},
+        }
+        full = estimate_tokens(json.dumps(data, indent=2))
+        with caplog.at_level(logging.INFO, logger="pinwheel.ai.token_budget"):
+            trimmed = fit_mapping(
+                data, PRIVATE_CONTEXT_PRIORITIES, "report.private", budget=full // 3
+            )
+        assert trimmed["governor_id"] == "gov-1"
+        assert trimmed["voting_outcomes"] == data["voting_outcomes"][-LIST_FLOOR:]
+        assert trimmed["league_proposal_categories"] == data["league_proposal_categories"]
+        assert len(data["voting_outcomes"]) == 40  # input untouched
+        assert f"trimmed=voting_outcomes[-{LIST_FLOOR}:]" in caplog.text
+
+        tiny = fit_mapping(data, PRIVATE_CONTEXT_PRIORITIES, "report.private", budget=10)
+        assert tiny == {"governor_id": "gov-1"}
+
+    def test_system_context_fixed_cost_is_only_untrimmed_payload(self, monkeypatch):
+        round_data = {
+            "round_number": 12,
+            "games": [{"home_score": 80 + i, "away_score": 70 + i} for i in range(8)],
+        }
+        sys_ctx = {
+            "round_avg_total": 160,
+            "round_avg_margin": 10,
+            "standings_gap": 4,
+            "streaks_summary": [{"team": f"Team {i}", "streak": 3 + i} for i in range(3)],
+        }
+        rendered = json.dumps({**round_data, "system_context": sys_ctx}, indent=2)
+
+        # A budget the whole rendered payload fits in keeps every key
+        monkeypatch.setitem(CALL_BUDGETS, "report.simulation", estimate_tokens(rendered))
+        assert fit_system_context(round_data, sys_ctx) == sys_ctx
+
+        # Round data and required keys alone: every optional key goes
+        untrimmed = {
+            **round_data,
+            "system_context": {"round_avg_total": 160, "round_avg_margin": 10},
+        }
+        fixed = estimate_tokens(json.dumps(untrimmed, indent=2))
+        monkeypatch.setitem(CALL_BUDGETS, "report.simulation", fixed)
+        assert fit_system_context(round_data, sys_ctx) == untrimmed["system_context"]
+
+
+def test_late_season_commentary_context_fits_budget():
+    home, away = _make_home_team(), _make_away_team()
+    narrative = NarrativeContext(
+        round_number=40,
+        total_rounds=45,
+        standings=[
+            {
+                "team_id": f"t{i}",
+                "team_name": f"Team {i}",
+                "wins": 40 - i,
+                "losses": i,
+                "rank": i + 1,
+            }
+            for i in range(30)
+        ],
+        head_to_head={
+            f"Team {i} vs Team {i + 1}": {"total_games": 3, "wins_a": 2, "wins_b": 1}
+            for i in range(100)
+        },
+        rules_narrative="; ".join(f"Rule {i} changed in round {i}" for i in range(300)),
+    )
+    text = _build_game_context(_make_game_result(), home, away, RuleSet(), narrative=narrative)
+    assert estimate_tokens(text) <= 2500
+    assert "Final:" in text
+    assert "Box scores:" in text
+    assert "Dramatic Context" not in text
@@ -0,0 +1,186 @@
+"""Tests for the buffered AI usage recorder and its rolling aggregates."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, select
+
+from pinwheel.ai.usage import (
+    UsageAggregates,
+    UsageRecorder,
+    record_ai_usage,
+    usage_recorder,
+)
+from pinwheel.config import Settings
+from pinwheel.core.event_bus import EventBus
+from pinwheel.db.engine import create_engine, get_session
+from pinwheel.db.models import AIUsageLogRow, Base
+from pinwheel.main import create_app
+
+
+@pytest.fixture
+async def engine():
+    eng = create_engine("sqlite+aiosqlite:///:memory:")
+    async with eng.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield eng
+    await eng.dispose()
+
+
+@pytest.fixture
+async def recorder(engine, monkeypatch):
+    """The module recorder, started against the test engine and reset afterwards."""
+    monkeypatch.setattr(usage_recorder, "batch_size", 100)
+    usage_recorder.aggregates.clear()
+    usage_recorder.start(engine, flush_interval=60)
+    yield usage_recorder
+    await usage_recorder.stop()
+    usage_recorder.aggregates.clear()
+
+
+async def _count(engine) -> int:
+    async with get_session(engine) as session:
+        return (await session.execute(select(func.count(AIUsageLogRow.id)))).scalar_one()
+
+
+def _row(call_type: str, cost: float = 0.01, latency: float = 100.0) -> AIUsageLogRow:
+    return AIUsageLogRow(
+        call_type=call_type,
+        model="claude-sonnet-4-5-20250929",
+        input_tokens=100,
+        output_tokens=50,
+        cache_read_tokens=0,
+        cache_creation_tokens=0,
+        latency_ms=latency,
+        cost_usd=cost,
+    )
+
+
+class TestRecorder:
+    async def test_running_recorder_buffers_instead_of_using_session(self, recorder, engine):
+        async with get_session(engine) as session:
+            row = await record_ai_usage(
+                session=session,
+                call_type="commentary",
+                model="claude-sonnet-4-5-20250929",
+                input_tokens=100,
+                output_tokens=20,
+            )
+            assert row not in session
+        assert recorder.pending == 1
+        assert await _count(engine) == 0
+
+        assert await recorder.flush() == 1
+        assert recorder.pending == 0
+        assert await _count(engine) == 1
+
+    async def test_batch_size_wakes_drain_task(self, recorder, engine, monkeypatch):
+        monkeypatch.setattr(recorder, "batch_size", 3)
+        for _ in range(3):
+            await record_ai_usage(
+                call_type="report.simulation",
+                model="claude-sonnet-4-5-20250929",
+                input_tokens=10,
+                output_tokens=10,
+            )
+        for _ in range(50):
+            if recorder.pending == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert await _count(engine) == 3
+
+    async def test_drain_task_survives_unexpected_flush_error(self, recorder, monkeypatch):
+        calls = 0
+        real_flush = recorder.flush
+
+        async def flaky_flush() -> int:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("boom")
+            return await real_flush()
+
+        monkeypatch.setattr(recorder, "flush", flaky_flush)
+        monkeypatch.setattr(recorder, "batch_size", 1)
+        recorder.enqueue(_row("commentary"))
+        for _ in range(50):
+            if calls:
+                break
+            await asyncio.sleep(0.01)
+        assert recorder.running
+
+        recorder.enqueue(_row("commentary"))
+        for _ in range(50):
+            if recorder.pending == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert calls == 2
+        assert recorder.pending == 0
+
+    async def test_stop_flushes_remaining_rows(self, engine):
+        recorder = UsageRecorder(flush_interval=60)
+        recorder.start(engine)
+        recorder.enqueue(_row("commentary"))
+        recorder.enqueue(_row("commentary"))
+        await recorder.stop()
+        assert not recorder.running
+        assert recorder.pending == 0
+        assert await _count(engine) == 2
+
+    async def test_without_recorder_or_session_row_is_only_aggregated(self):
+        assert not usage_recorder.running
+        usage_recorder.aggregates.clear()
+        row = await record_ai_usage(
+            call_type="classifier",
+            model="claude-haiku-4-5-20251001",
+            input_tokens=10,
+            output_tokens=5,
+        )
+        assert row.cost_usd > 0
+        assert usage_recorder.aggregates.snapshot()["classifier"].calls == 1
+        usage_recorder.aggregates.clear()
+
+
+class TestAggregates:
+    def test_snapshot_sums_per_call_type_and_drops_old_minutes(self):
+        aggregates = UsageAggregates(window_minutes=60)
+        start = 1_000_000.0
+        aggregates.add(_row("commentary", cost=0.5), now=start)
+        aggregates.add(_row("commentary", cost=0.25), now=start + 30 * 60)
+        aggregates.add(_row("classifier", cost=0.01), now=start + 30 * 60)
+
+        totals = aggregates.snapshot(now=start + 30 * 60)
+        assert totals["commentary"].calls == 2
+        assert totals["commentary"].cost_usd == pytest.approx(0.75)
+        assert totals["classifier"].input_tokens == 100
+
+        later = aggregates.snapshot(now=start + 75 * 60)
+        assert later["commentary"].calls == 1
+        assert later["commentary"].cost_usd == pytest.approx(0.25)
+
+
+async def test_costs_dashboard_shows_live_totals(engine):
+    settings = Settings(
+        database_url="sqlite+aiosqlite:///:memory:",
+        pinwheel_env="development",
+        discord_client_id="",
+        discord_client_secret="",
+    )
+    app = create_app(settings)
+    app.state.engine = engine
+    app.state.event_bus = EventBus()
+
+    usage_recorder.aggregates.clear()
+    usage_recorder.aggregates.add(_row("commentary", cost=0.1234))
+    try:
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            resp = await client.get("/admin/costs")
+    finally:
+        usage_recorder.aggregates.clear()
+    assert resp.status_code == 200
+    assert "Live &mdash; Last 60 Minutes" in resp.text
+    assert "$0.1234" in resp.text